@@ -0,0 +1,133 @@
+"""Add ticket_metrics_daily rollup table and backfill it from tickets.
+
+Creates the per-tenant/per-category/per-day counters table maintained by the
+after_flush hook in src/core/audit.py, then backfills it in a single
+INSERT ... SELECT so dashboards can switch to the rollup immediately.
+
+Revision ID: 20260303_ticket_metrics_rollup
+Revises: 20260302_risk_register
+Create Date: 2026-03-03 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260303_ticket_metrics_rollup"
+down_revision: Union[str, None] = "20260302_risk_register"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTER_COLUMNS = [
+    "ticket_count",
+    "open_count",
+    "resolved_count",
+    "sla_count",
+    "sla_met_count",
+    "breached_count",
+    "response_sla_count",
+    "responded_count",
+    "resolved_timed_count",
+]
+
+
+def upgrade() -> None:
+    """Create ticket_metrics_daily and backfill from existing tickets."""
+    op.create_table(
+        "ticket_metrics_daily",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+            primary_key=True,
+        ),
+        sa.Column("tenant_id", sa.String(), nullable=False),
+        sa.Column("category", sa.String(20), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column(
+            "is_sensitive",
+            sa.Boolean(),
+            nullable=False,
+            server_default="false",
+        ),
+        *[
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            for name in COUNTER_COLUMNS
+        ],
+        sa.Column("response_seconds_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("resolution_seconds_sum", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint(
+            "tenant_id", "category", "day", "is_sensitive",
+            name="uq_ticket_metrics_daily_bucket",
+        ),
+    )
+
+    op.create_index("ix_ticket_metrics_daily_tenant_id", "ticket_metrics_daily", ["tenant_id"])
+    op.create_index("ix_ticket_metrics_daily_day", "ticket_metrics_daily", ["day"])
+
+    # Backfill. Mirrors ticket_contribution() in
+    # src/services/ticket_metrics_service.py; resolved_at is stored without a
+    # time zone and is interpreted as UTC.
+    op.execute("""
+        INSERT INTO ticket_metrics_daily (
+            tenant_id, category, day, is_sensitive,
+            ticket_count, open_count, resolved_count,
+            sla_count, sla_met_count, breached_count, response_sla_count,
+            responded_count, response_seconds_sum,
+            resolved_timed_count, resolution_seconds_sum
+        )
+        SELECT
+            tenant_id,
+            category,
+            (created_at AT TIME ZONE 'UTC')::date,
+            is_sensitive,
+            COUNT(*),
+            COUNT(*) FILTER (WHERE status IN ('open', 'in_progress', 'escalated')),
+            COUNT(*) FILTER (WHERE status IN ('resolved', 'closed')),
+            COUNT(*) FILTER (WHERE sla_resolution_deadline IS NOT NULL),
+            COUNT(*) FILTER (
+                WHERE sla_resolution_deadline IS NOT NULL
+                  AND status IN ('resolved', 'closed')
+                  AND resolved_at AT TIME ZONE 'UTC' <= sla_resolution_deadline
+            ),
+            COUNT(*) FILTER (
+                WHERE sla_resolution_deadline IS NOT NULL
+                  AND (
+                    escalated_at IS NOT NULL
+                    OR (
+                        status IN ('resolved', 'closed')
+                        AND resolved_at AT TIME ZONE 'UTC' > sla_resolution_deadline
+                    )
+                  )
+            ),
+            COUNT(*) FILTER (WHERE sla_response_deadline IS NOT NULL),
+            COUNT(first_responded_at),
+            COALESCE(SUM(EXTRACT(EPOCH FROM first_responded_at - created_at)), 0),
+            COUNT(*) FILTER (
+                WHERE status IN ('resolved', 'closed') AND resolved_at IS NOT NULL
+            ),
+            COALESCE(
+                SUM(EXTRACT(EPOCH FROM (resolved_at AT TIME ZONE 'UTC') - created_at))
+                    FILTER (WHERE status IN ('resolved', 'closed')),
+                0
+            )
+        FROM tickets
+        GROUP BY tenant_id, category, (created_at AT TIME ZONE 'UTC')::date, is_sensitive
+    """)
+
+
+def downgrade() -> None:
+    """Drop ticket_metrics_daily."""
+    op.drop_index("ix_ticket_metrics_daily_day", table_name="ticket_metrics_daily")
+    op.drop_index("ix_ticket_metrics_daily_tenant_id", table_name="ticket_metrics_daily")
+    op.drop_table("ticket_metrics_daily")
@@ -0,0 +1,156 @@
+"""Maintain ticket_metrics_daily with a trigger on tickets and rebuild it.
+
+The rollup was maintained only by the ORM after_flush hook, so tickets the
+agent tools insert through Supabase (src/agents/tools/ticket_tool.py) were
+never counted, and a later ORM status change subtracted a contribution the
+bucket never had. On PostgreSQL the rollup is now maintained by an AFTER
+INSERT/UPDATE/DELETE row trigger, which sees every write path; the Python
+hook only runs on other dialects (SQLite tests).
+
+apply_ticket_metrics(t, sign) mirrors ticket_contribution() in
+src/services/ticket_metrics_service.py. The table is rebuilt from tickets
+at the end of the upgrade so existing drift is cleared.
+
+Revision ID: 20260304_ticket_metrics_trigger
+Revises: 20260304_ticket_search_index
+Create Date: 2026-03-04 12:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260304_ticket_metrics_trigger"
+down_revision: Union[str, None] = "20260304_ticket_search_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the rollup trigger and rebuild ticket_metrics_daily."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION apply_ticket_metrics(t tickets, sign integer)
+        RETURNS void AS $$
+        DECLARE
+            is_open boolean := t.status IN ('open', 'in_progress', 'escalated');
+            is_resolved boolean := t.status IN ('resolved', 'closed');
+            resolved_timed boolean := is_resolved AND t.resolved_at IS NOT NULL;
+            created timestamptz := coalesce(t.created_at, now());
+        BEGIN
+            INSERT INTO ticket_metrics_daily (
+                tenant_id, category, day, is_sensitive,
+                ticket_count, open_count, resolved_count,
+                sla_count, sla_met_count, breached_count, response_sla_count,
+                responded_count, response_seconds_sum,
+                resolved_timed_count, resolution_seconds_sum
+            ) VALUES (
+                t.tenant_id,
+                t.category,
+                (created AT TIME ZONE 'UTC')::date,
+                coalesce(t.is_sensitive, false),
+                sign,
+                sign * is_open::int,
+                sign * is_resolved::int,
+                sign * (t.sla_resolution_deadline IS NOT NULL)::int,
+                sign * coalesce(
+                    t.sla_resolution_deadline IS NOT NULL
+                    AND resolved_timed
+                    AND t.resolved_at AT TIME ZONE 'UTC' <= t.sla_resolution_deadline,
+                    false
+                )::int,
+                sign * coalesce(
+                    t.sla_resolution_deadline IS NOT NULL
+                    AND (
+                        t.escalated_at IS NOT NULL
+                        OR (
+                            resolved_timed
+                            AND t.resolved_at AT TIME ZONE 'UTC' > t.sla_resolution_deadline
+                        )
+                    ),
+                    false
+                )::int,
+                sign * (t.sla_response_deadline IS NOT NULL)::int,
+                sign * (t.first_responded_at IS NOT NULL)::int,
+                sign * coalesce(EXTRACT(EPOCH FROM t.first_responded_at - created), 0),
+                sign * resolved_timed::int,
+                sign * CASE
+                    WHEN resolved_timed THEN EXTRACT(EPOCH FROM (t.resolved_at AT TIME ZONE 'UTC') - created)
+                    ELSE 0
+                END
+            )
+            ON CONFLICT (tenant_id, category, day, is_sensitive) DO UPDATE SET
+                ticket_count = ticket_metrics_daily.ticket_count + EXCLUDED.ticket_count,
+                open_count = ticket_metrics_daily.open_count + EXCLUDED.open_count,
+                resolved_count = ticket_metrics_daily.resolved_count + EXCLUDED.resolved_count,
+                sla_count = ticket_metrics_daily.sla_count + EXCLUDED.sla_count,
+                sla_met_count = ticket_metrics_daily.sla_met_count + EXCLUDED.sla_met_count,
+                breached_count = ticket_metrics_daily.breached_count + EXCLUDED.breached_count,
+                response_sla_count =
+                    ticket_metrics_daily.response_sla_count + EXCLUDED.response_sla_count,
+                responded_count = ticket_metrics_daily.responded_count + EXCLUDED.responded_count,
+                response_seconds_sum =
+                    ticket_metrics_daily.response_seconds_sum + EXCLUDED.response_seconds_sum,
+                resolved_timed_count =
+                    ticket_metrics_daily.resolved_timed_count + EXCLUDED.resolved_timed_count,
+                resolution_seconds_sum =
+                    ticket_metrics_daily.resolution_seconds_sum + EXCLUDED.resolution_seconds_sum,
+                updated_at = now();
+        END;
+        $$ LANGUAGE plpgsql;
+
+        CREATE OR REPLACE FUNCTION maintain_ticket_metrics() RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                PERFORM apply_ticket_metrics(OLD, -1);
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM apply_ticket_metrics(NEW, 1);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+        DROP TRIGGER IF EXISTS trg_tickets_metrics_insert_delete ON tickets;
+        CREATE TRIGGER trg_tickets_metrics_insert_delete
+        AFTER INSERT OR DELETE ON tickets
+        FOR EACH ROW
+        EXECUTE FUNCTION maintain_ticket_metrics();
+
+        -- Only changes to attributes that affect a ticket's bucket or counters
+        DROP TRIGGER IF EXISTS trg_tickets_metrics_update ON tickets;
+        CREATE TRIGGER trg_tickets_metrics_update
+        AFTER UPDATE ON tickets
+        FOR EACH ROW
+        WHEN (
+            (OLD.tenant_id, OLD.category, OLD.is_sensitive, OLD.status, OLD.created_at,
+             OLD.first_responded_at, OLD.resolved_at, OLD.escalated_at,
+             OLD.sla_response_deadline, OLD.sla_resolution_deadline)
+            IS DISTINCT FROM
+            (NEW.tenant_id, NEW.category, NEW.is_sensitive, NEW.status, NEW.created_at,
+             NEW.first_responded_at, NEW.resolved_at, NEW.escalated_at,
+             NEW.sla_response_deadline, NEW.sla_resolution_deadline)
+        )
+        EXECUTE FUNCTION maintain_ticket_metrics();
+    """)
+
+    # Rebuild from scratch: agent-created tickets were never counted
+    op.execute("LOCK TABLE ticket_metrics_daily IN EXCLUSIVE MODE")
+    op.execute("DELETE FROM ticket_metrics_daily")
+    op.execute("""
+        SELECT apply_ticket_metrics(t, 1)
+        FROM tickets t
+    """)
+
+
+def downgrade() -> None:
+    """Drop the rollup triggers.
+
+    The after_flush hook skips PostgreSQL from this revision on, so the
+    application must be rolled back together with this migration.
+    """
+    op.execute("""
+        DROP TRIGGER IF EXISTS trg_tickets_metrics_update ON tickets;
+        DROP TRIGGER IF EXISTS trg_tickets_metrics_insert_delete ON tickets;
+        DROP FUNCTION IF EXISTS maintain_ticket_metrics();
+        DROP FUNCTION IF EXISTS apply_ticket_metrics(tickets, integer);
+    """)
@@ -0,0 +1,76 @@
+"""Add full-text and trigram search indexes on tickets.
+
+Replaces ILIKE '%term%' scans in ticket search (src/services/ticket_search.py):
+- tickets.search_vector: STORED generated tsvector over description, using
+  the ticket's language config, with a GIN index
+- ix_tickets_tracking_number_trgm: pg_trgm GIN index on tracking_number for
+  prefix and fuzzy tracking-number lookups
+
+PostgreSQL ships no Afrikaans stemmer, so an 'afrikaans' text search
+configuration is created as a copy of 'simple' (lower-casing, no stemming).
+Tickets and queries already reference it by name, so a proper Afrikaans
+dictionary can be plugged in later with ALTER TEXT SEARCH CONFIGURATION
+without touching the column or the application.
+
+Adding a STORED generated column rewrites the tickets table; run during a
+maintenance window on large tenants.
+
+Revision ID: 20260304_ticket_search_index
+Revises: 20260303_ticket_metrics_rollup
+Create Date: 2026-03-04 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260304_ticket_search_index"
+down_revision: Union[str, None] = "20260303_ticket_metrics_rollup"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create pg_trgm, the afrikaans config, search_vector and both indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_ts_config WHERE cfgname = 'afrikaans'
+            ) THEN
+                CREATE TEXT SEARCH CONFIGURATION afrikaans (COPY = simple);
+            END IF;
+        END
+        $$
+    """)
+
+    # Literal regconfig constants keep the expression immutable, as
+    # generated columns require
+    op.execute("""
+        ALTER TABLE tickets
+        ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            CASE language
+                WHEN 'en' THEN to_tsvector('english'::regconfig, coalesce(description, ''))
+                WHEN 'af' THEN to_tsvector('afrikaans'::regconfig, coalesce(description, ''))
+                ELSE to_tsvector('simple'::regconfig, coalesce(description, ''))
+            END
+        ) STORED
+    """)
+
+    op.execute(
+        "CREATE INDEX ix_tickets_search_vector ON tickets USING gin (search_vector)"
+    )
+    op.execute(
+        "CREATE INDEX ix_tickets_tracking_number_trgm "
+        "ON tickets USING gin (tracking_number gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the search indexes and column (extension and config are kept)."""
+    op.execute("DROP INDEX IF EXISTS ix_tickets_tracking_number_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_tickets_search_vector")
+    op.execute("ALTER TABLE tickets DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,160 @@
+"""Add ward boundaries and a stored ward_id on tickets.
+
+Replaces the interim ``address ILIKE '%ward%'`` ward filter:
+- wards: ward polygons per municipality (MULTIPOLYGON, SRID 4326) with a
+  GiST index, loaded via WardService.load_boundaries
+- tickets.ward_id: indexed together with tenant_id for ward dashboards
+- trg_tickets_ward_id: BEFORE INSERT / UPDATE OF location trigger that
+  resolves ward_id by point-in-polygon, so tickets inserted through
+  Supabase by the agent tools are attributed as well as API-created ones
+- trg_users_ward_id: rejects a users.ward_id that is not a ward_code of the
+  user's municipality once that municipality has boundaries loaded
+
+users.ward_id has held display labels such as "Ward 5" (migration
+a1b2c3d4e5f6); ward filtering now compares it with tickets.ward_id, so it
+must be a ward_code. WardService.load_boundaries remaps existing labels to
+codes through wards.ward_number when a municipality's boundaries are
+loaded; until then councillor ward filters match no tickets.
+
+Existing tickets are attributed by the ward_backfill_task Celery task once
+boundaries have been loaded; this migration does not backfill (no wards
+exist yet).
+
+Revision ID: 20260305_ward_boundaries
+Revises: 20260304_ticket_metrics_trigger
+Create Date: 2026-03-05 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from geoalchemy2 import Geometry
+
+# revision identifiers, used by Alembic.
+revision: str = "20260305_ward_boundaries"
+down_revision: Union[str, None] = "20260304_ticket_metrics_trigger"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create wards, tickets.ward_id and the ward resolution trigger."""
+    op.create_table(
+        "wards",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+            primary_key=True,
+        ),
+        sa.Column("tenant_id", sa.String(), nullable=False),
+        sa.Column("ward_code", sa.String(100), nullable=False),
+        sa.Column("ward_number", sa.Integer(), nullable=True),
+        sa.Column("name", sa.String(200), nullable=True),
+        sa.Column(
+            "boundary",
+            Geometry("MULTIPOLYGON", srid=4326, spatial_index=False),
+            nullable=True,
+        ),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", sa.String(), nullable=True),
+        sa.Column("updated_by", sa.String(), nullable=True),
+        sa.UniqueConstraint("tenant_id", "ward_code", name="uq_wards_tenant_ward_code"),
+    )
+    op.create_index("ix_wards_tenant_id", "wards", ["tenant_id"])
+    op.execute("CREATE INDEX ix_wards_boundary ON wards USING gist (boundary)")
+
+    op.execute("ALTER TABLE wards ENABLE ROW LEVEL SECURITY;")
+    op.execute("ALTER TABLE wards FORCE ROW LEVEL SECURITY;")
+    op.execute(
+        "CREATE POLICY wards_tenant_isolation ON wards "
+        "USING (tenant_id = current_setting('app.current_tenant', true));"
+    )
+
+    op.add_column("tickets", sa.Column("ward_id", sa.String(100), nullable=True))
+    op.create_index("ix_tickets_tenant_ward", "tickets", ["tenant_id", "ward_id"])
+
+    # SECURITY DEFINER so the lookup is not hidden by the wards RLS policy
+    # when the inserting session has no app.current_tenant (Supabase inserts);
+    # the function itself restricts to NEW.tenant_id
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_ticket_ward_id() RETURNS TRIGGER AS $$
+        BEGIN
+            IF NEW.location IS NULL THEN
+                IF TG_OP = 'UPDATE' THEN
+                    NEW.ward_id := NULL;
+                END IF;
+                RETURN NEW;
+            END IF;
+
+            IF TG_OP = 'INSERT' AND NEW.ward_id IS NOT NULL THEN
+                RETURN NEW;
+            END IF;
+
+            SELECT w.ward_code INTO NEW.ward_id
+            FROM wards w
+            WHERE w.tenant_id = NEW.tenant_id
+              AND ST_Contains(w.boundary, NEW.location)
+            ORDER BY w.ward_code
+            LIMIT 1;
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+        DROP TRIGGER IF EXISTS trg_tickets_ward_id ON tickets;
+        CREATE TRIGGER trg_tickets_ward_id
+        BEFORE INSERT OR UPDATE OF location ON tickets
+        FOR EACH ROW
+        EXECUTE FUNCTION set_ticket_ward_id();
+    """)
+
+    # Validate councillor ward assignments on every write path (API and the
+    # Supabase dashboard). Municipalities without boundaries are not checked
+    # so existing assignments keep working until boundaries are loaded.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION check_user_ward_id() RETURNS TRIGGER AS $$
+        BEGIN
+            IF NEW.ward_id IS NULL
+               OR NOT EXISTS (SELECT 1 FROM wards w WHERE w.tenant_id = NEW.tenant_id) THEN
+                RETURN NEW;
+            END IF;
+
+            IF NOT EXISTS (
+                SELECT 1 FROM wards w
+                WHERE w.tenant_id = NEW.tenant_id AND w.ward_code = NEW.ward_id
+            ) THEN
+                RAISE EXCEPTION 'users.ward_id % is not a ward_code of tenant %',
+                    NEW.ward_id, NEW.tenant_id
+                    USING ERRCODE = 'check_violation';
+            END IF;
+
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+        DROP TRIGGER IF EXISTS trg_users_ward_id ON users;
+        CREATE TRIGGER trg_users_ward_id
+        BEFORE INSERT OR UPDATE OF ward_id, tenant_id ON users
+        FOR EACH ROW
+        EXECUTE FUNCTION check_user_ward_id();
+    """)
+
+
+def downgrade() -> None:
+    """Drop the triggers, tickets.ward_id and the wards table."""
+    op.execute("""
+        DROP TRIGGER IF EXISTS trg_users_ward_id ON users;
+        DROP FUNCTION IF EXISTS check_user_ward_id();
+        DROP TRIGGER IF EXISTS trg_tickets_ward_id ON tickets;
+        DROP FUNCTION IF EXISTS set_ticket_ward_id();
+    """)
+    op.drop_index("ix_tickets_tenant_ward", table_name="tickets")
+    op.drop_column("tickets", "ward_id")
+
+    op.execute("DROP POLICY IF EXISTS wards_tenant_isolation ON wards;")
+    op.execute("DROP INDEX IF EXISTS ix_wards_boundary")
+    op.drop_index("ix_wards_tenant_id", table_name="wards")
+    op.drop_table("wards")
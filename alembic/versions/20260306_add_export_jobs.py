@@ -0,0 +1,91 @@
+"""Add export_jobs table and the exports storage bucket.
+
+Backs the background export job API (POST /api/v1/export/jobs):
+- export_jobs: one row per requested export, polled for status
+- exports: private Supabase Storage bucket for the generated files. No
+  authenticated-role policies: files are written by the service role and
+  downloaded only through signed URLs
+
+Revision ID: 20260306_export_jobs
+Revises: 20260305_ward_boundaries
+Create Date: 2026-03-06 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260306_export_jobs"
+down_revision: Union[str, None] = "20260305_ward_boundaries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create export_jobs and the exports bucket."""
+    op.create_table(
+        "export_jobs",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+            primary_key=True,
+        ),
+        sa.Column("tenant_id", sa.String(), nullable=False),
+        sa.Column("dataset", sa.String(20), nullable=False),
+        sa.Column("file_format", sa.String(10), nullable=False),
+        sa.Column(
+            "status",
+            sa.String(20),
+            nullable=False,
+            server_default="pending",
+        ),
+        sa.Column("filters", sa.Text(), nullable=True),
+        sa.Column("requested_by", sa.String(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=True),
+        sa.Column("storage_bucket", sa.String(), nullable=True),
+        sa.Column("storage_path", sa.String(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", sa.String(), nullable=True),
+        sa.Column("updated_by", sa.String(), nullable=True),
+    )
+    op.create_index("ix_export_jobs_tenant_id", "export_jobs", ["tenant_id"])
+    op.create_index("ix_export_jobs_requested_by", "export_jobs", ["requested_by"])
+
+    # RLS policy
+    op.execute("ALTER TABLE export_jobs ENABLE ROW LEVEL SECURITY;")
+    op.execute("ALTER TABLE export_jobs FORCE ROW LEVEL SECURITY;")
+    op.execute(
+        "CREATE POLICY export_jobs_tenant_isolation ON export_jobs "
+        "USING (tenant_id = current_setting('app.current_tenant', true));"
+    )
+
+    # Storage bucket (Supabase only; skipped where the storage schema is absent)
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM information_schema.schemata WHERE schema_name = 'storage') THEN
+                INSERT INTO storage.buckets (id, name, public)
+                VALUES ('exports', 'exports', false)
+                ON CONFLICT (id) DO NOTHING;
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    """Drop export_jobs (the bucket and its files are left in place)."""
+    op.execute("DROP POLICY IF EXISTS export_jobs_tenant_isolation ON export_jobs;")
+    op.drop_index("ix_export_jobs_requested_by", table_name="export_jobs")
+    op.drop_index("ix_export_jobs_tenant_id", table_name="export_jobs")
+    op.drop_table("export_jobs")
@@ -0,0 +1,62 @@
+"""Add audit_outbox staging table for asynchronous audit log writes.
+
+With AUDIT_OUTBOX_ENABLED the after_flush audit handler writes here and the
+Celery drainer (src/tasks/audit_outbox_task.py) moves entries into
+audit_logs in batches. Append-only; the seq primary key is the only index.
+No RLS: like audit_logs, the table sits above tenant scope and is only
+touched by the audit handler and the drainer.
+
+Revision ID: 20260307_audit_outbox
+Revises: 20260306_export_jobs
+Create Date: 2026-03-07 09:00:00.000000
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260307_audit_outbox"
+down_revision: Union[str, None] = "20260306_export_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create audit_outbox."""
+    op.create_table(
+        "audit_outbox",
+        sa.Column("seq", sa.BigInteger(), autoincrement=True, nullable=False, primary_key=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("tenant_id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=True),
+        sa.Column("operation", sa.String(32), nullable=False),
+        sa.Column("table_name", sa.String(), nullable=False),
+        sa.Column("record_id", sa.String(), nullable=False),
+        sa.Column("changes", sa.Text(), nullable=True),
+        sa.Column("ip_address", sa.String(), nullable=True),
+        sa.Column("user_agent", sa.String(), nullable=True),
+        sa.Column(
+            "timestamp",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop audit_outbox after moving any undrained entries into audit_logs."""
+    op.execute("""
+        INSERT INTO audit_logs (
+            id, tenant_id, user_id, operation, table_name, record_id,
+            changes, ip_address, user_agent, timestamp
+        )
+        SELECT
+            id, tenant_id, user_id, operation::operationtype, table_name, record_id,
+            changes, ip_address, user_agent, timestamp
+        FROM audit_outbox
+        ORDER BY seq
+        ON CONFLICT (id) DO NOTHING;
+    """)
+    op.drop_table("audit_outbox")
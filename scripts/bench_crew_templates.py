@@ -0,0 +1,133 @@
+"""Per-turn crew construction benchmark: YAML-per-instance vs template registry.
+
+Measures the CPU work IntakeFlow does for every citizen message before the
+LLM call: constructing the specialist crew and calling create_crew().
+
+- before: the previous path — yaml.safe_load() agents.yaml and tasks.yaml in
+  every BaseCrew.__init__, then resolve role/goal/backstory/expected_output
+  and build Agent + Task + Crew
+- after: crew_templates (src/agents/crews/templates.py) — configs parsed once
+  per process, template rendered once per (crew, language), per turn only
+  the task description and the CrewAI objects are built
+
+No network calls: the LLM is constructed but never invoked.
+
+Usage:
+    python scripts/bench_crew_templates.py [--turns 200] [--crew municipal]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("OPENAI_API_KEY", "fake-key-for-bench")
+os.environ.setdefault("DEEPSEEK_API_KEY", "fake-key-for-bench")
+
+CONTEXT = {
+    "message": "There is a water leak on Main Road",
+    "phone": "+27821234567",
+    "language": "zu",
+    "conversation_history": "(none)",
+    "user_id": "user-uuid-123",
+    "tenant_id": "tenant-uuid-123",
+}
+
+
+def _crew(name: str):
+    """Return (crew class, task description builder) for a crew name."""
+    if name == "auth":
+        from src.agents.crews.auth_crew import AuthCrew
+        from src.agents.prompts.auth import build_auth_task_description
+        return AuthCrew, build_auth_task_description
+    if name == "gbv":
+        from src.agents.crews.gbv_crew import GBVCrew
+        from src.agents.prompts.gbv import build_gbv_task_description
+        return GBVCrew, build_gbv_task_description
+    if name == "ticket_status":
+        from src.agents.crews.ticket_status_crew import TicketStatusCrew
+        from src.agents.prompts.ticket_status import build_ticket_status_task_description
+        return TicketStatusCrew, build_ticket_status_task_description
+    from src.agents.crews.municipal_crew import MunicipalIntakeCrew
+    from src.agents.prompts.municipal import build_municipal_task_description
+    return MunicipalIntakeCrew, build_municipal_task_description
+
+
+def legacy_turn(crew_cls, build_description, llm, context: dict):
+    """One turn the way BaseCrew/create_crew worked before the registry."""
+    import yaml
+    from crewai import Agent, Crew, Process, Task
+
+    from src.agents.crews.templates import CONFIG_DIR
+
+    with open(CONFIG_DIR / "agents.yaml", "r", encoding="utf-8") as f:
+        agents_config = yaml.safe_load(f) or {}
+    with open(CONFIG_DIR / "tasks.yaml", "r", encoding="utf-8") as f:
+        tasks_config = yaml.safe_load(f) or {}
+
+    crew = crew_cls(language=context["language"], llm=llm)
+    language = context["language"]
+    agent_config = agents_config.get(crew_cls.agent_key, {})
+    agent = Agent(
+        role=agent_config.get("role", crew_cls.default_role),
+        goal=agent_config.get("goal", crew_cls.default_goal),
+        backstory=crew_cls.prompts.get(language, crew_cls.prompts["en"]),
+        tools=crew.tools,
+        llm=llm,
+        allow_delegation=False,
+        max_iter=crew_cls.max_iter,
+        verbose=False,
+    )
+    task = Task(
+        description=build_description(context),
+        expected_output=tasks_config.get(crew_cls.task_key, {}).get(
+            "expected_output", crew_cls.default_expected_output
+        ),
+        agent=agent,
+    )
+    return Crew(agents=[agent], tasks=[task], process=Process.sequential, memory=False, verbose=False)
+
+
+def registry_turn(crew_cls, llm, context: dict):
+    """One turn with the template registry."""
+    return crew_cls(language=context["language"], llm=llm).create_crew(context)
+
+
+def bench(label: str, fn, turns: int) -> list[float]:
+    fn()  # warm-up (imports, first template render)
+    samples = []
+    for _ in range(turns):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    print(
+        f"{label:8} median {statistics.median(samples) * 1000:7.3f} ms   "
+        f"p95 {samples[int(len(samples) * 0.95) - 1] * 1000:7.3f} ms"
+    )
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument(
+        "--crew", default="municipal", choices=("auth", "municipal", "ticket_status", "gbv")
+    )
+    args = parser.parse_args()
+
+    from crewai import LLM
+
+    llm = LLM(model="gpt-4o-mini", api_key="fake-key-for-bench")
+    crew_cls, build_description = _crew(args.crew)
+
+    print(f"{args.turns} turns, crew={args.crew}, language={CONTEXT['language']}")
+    before = bench("before", lambda: legacy_turn(crew_cls, build_description, llm, CONTEXT), args.turns)
+    after = bench("after", lambda: registry_turn(crew_cls, llm, CONTEXT), args.turns)
+    print(f"speedup  {statistics.median(before) / statistics.median(after):.2f}x (median)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Guardrail throughput benchmark: pattern-by-pattern vs compiled pattern sets.
+
+Measures messages/second for the text guardrails every chat turn runs on
+the event loop:
+
+- validate_input (src/guardrails/input_filters.py) on citizen messages
+- sanitize_output (src/guardrails/output_filters.py) on replies
+- sanitize_reply and _validate_crew_output (src/api/v1/crew_server.py) on
+  raw crew output
+
+- before: the previous implementations — one re.search/re.sub/re.match call
+  per pattern (per line, for the reply sanitizers), reproduced below
+- after: the precompiled PatternSets (src/guardrails/compiled.py), one or
+  two scans per text
+
+Inputs come from the regression corpus (tests/guardrail_corpus.py); both
+sides must agree on every input before timing.
+
+Usage:
+    python scripts/bench_guardrails.py [--rounds 200]
+"""
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("OPENAI_API_KEY", "fake-key-for-bench")
+
+_INJECTION_PATTERNS = [
+    r"ignore\s+previous\s+instructions",
+    r"ignore\s+all\s+previous",
+    r"you\s+are\s+now",
+    r"new\s+instructions:",
+    r"system\s+prompt:",
+    r"forget\s+everything",
+    r"disregard\s+all",
+    r"act\s+as",
+    r"pretend\s+you\s+are",
+    r"jailbreak",
+]
+
+_SYSTEM_INFO_PATTERNS = [
+    (r'traceback[:\s].*?(?=\n|$)', 'TRACEBACK'),
+    (r'sqlalchemy\.[a-z.]+', 'SQLALCHEMY'),
+    (r'postgresql://[^\s]+', 'DATABASE_URL'),
+    (r'\bselect\s+\*\s+from\s+\w+', 'SQL_QUERY'),
+    (r'\binsert\s+into\s+\w+', 'SQL_QUERY'),
+    (r'\bdelete\s+from\s+\w+', 'SQL_QUERY'),
+    (r'\bupdate\s+\w+\s+set', 'SQL_QUERY'),
+    (r'django\.db\.[a-z.]+', 'DJANGO_DB'),
+    (r'psycopg[23]?\.[a-z.]+', 'PSYCOPG'),
+]
+
+
+def legacy_validate_input(message: str):
+    """validate_input() with the per-pattern injection loop."""
+    import nh3
+
+    from src.guardrails.input_filters import InputValidationResult
+
+    def _result(is_safe, flags, reason, sanitized=message):
+        return InputValidationResult(
+            is_safe=is_safe, original_message=message, sanitized_message=sanitized,
+            flags=flags, blocked_reason=reason,
+        )
+
+    if len(message) > 5000:
+        return _result(False, ["message_too_long"], "Message exceeds maximum length of 5000 characters")
+    if not message.strip():
+        return _result(False, ["empty_message"], "Message cannot be empty")
+    message_lower = message.lower()
+    for pattern in _INJECTION_PATTERNS:
+        if re.search(pattern, message_lower):
+            return _result(
+                False, ["prompt_injection_detected"],
+                "Message contains suspicious patterns that may be attempting to "
+                "manipulate the system. Please rephrase your message naturally.",
+            )
+    flags = []
+    sanitized = nh3.clean(message)
+    if sanitized != message:
+        flags.append("html_stripped")
+    alphanumeric_count = sum(c.isalnum() or c.isspace() for c in sanitized)
+    common_punctuation = set(".,!?;:'-\"")
+    valid_chars = alphanumeric_count + sum(1 for c in sanitized if c in common_punctuation)
+    if len(sanitized) > 0 and valid_chars / len(sanitized) < 0.5:
+        flags.append("suspicious_content")
+    return _result(True, flags, None, sanitized)
+
+
+def legacy_sanitize_output(response: str):
+    """sanitize_output() as a chain of re.search/re.sub calls."""
+    from src.guardrails.output_filters import OutputSanitizationResult
+
+    redactions = []
+    sanitized = response
+    sa_id_pattern = r'\b\d{2}[01]\d[0-3]\d\d{7}\b'
+    if re.search(sa_id_pattern, sanitized):
+        sanitized = re.sub(sa_id_pattern, "[ID REDACTED]", sanitized)
+        redactions.append("sa_id_number")
+    sanitized = sanitized.replace("10111", "___EMERGENCY_10111___")
+    sanitized = re.sub(r'0800\s*150\s*150', "___EMERGENCY_GBV___", sanitized, flags=re.IGNORECASE)
+    mobile_pattern = r'\b0[6-8]\d[\s-]?\d{3}[\s-]?\d{4}\b'
+    if re.search(mobile_pattern, sanitized):
+        sanitized = re.sub(mobile_pattern, "[PHONE REDACTED]", sanitized)
+        redactions.append("phone_number")
+    intl_pattern = r'\+27\d{9}\b'
+    if re.search(intl_pattern, sanitized):
+        sanitized = re.sub(intl_pattern, "[PHONE REDACTED]", sanitized)
+        if "phone_number" not in redactions:
+            redactions.append("phone_number")
+    sanitized = sanitized.replace("___EMERGENCY_10111___", "10111")
+    sanitized = sanitized.replace("___EMERGENCY_GBV___", "0800 150 150")
+    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    if re.search(email_pattern, sanitized):
+        sanitized = re.sub(email_pattern, "[EMAIL REDACTED]", sanitized)
+        redactions.append("email_address")
+    for pattern, label in _SYSTEM_INFO_PATTERNS:
+        if re.search(pattern, sanitized, re.IGNORECASE):
+            sanitized = re.sub(pattern, f"[{label} REDACTED]", sanitized, flags=re.IGNORECASE)
+            if "system_info" not in redactions:
+                redactions.append("system_info")
+    if not sanitized.strip():
+        sanitized = "I'm here to help. Could you please rephrase your request?"
+        redactions.append("empty_response_fallback")
+    return OutputSanitizationResult(
+        original_response=response, sanitized_response=sanitized, redactions=redactions
+    )
+
+
+def legacy_sanitize_reply(raw: str, agent_name: str = "auth_agent", language: str = "en") -> str:
+    """sanitize_reply() trying every artifact pattern on every line."""
+    from src.api.v1.crew_server import (
+        _DELEGATION_ARTIFACT_PATTERNS,
+        _LLM_ARTIFACT_PATTERNS,
+        _get_fallback,
+    )
+
+    if not raw or not raw.strip():
+        return _get_fallback(agent_name, language)
+    text = raw.strip()
+    final_match = re.search(r"Final Answer:?\s*(.+)", text, re.DOTALL | re.IGNORECASE)
+    if final_match:
+        text = final_match.group(1).strip()
+    text = re.sub(r'\{[^{}]*"(?:tracking_number|error|id|status)"[^{}]*\}', '', text)
+    clean_lines = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        skip = False
+        for pattern in _LLM_ARTIFACT_PATTERNS + _DELEGATION_ARTIFACT_PATTERNS:
+            if re.match(pattern, stripped, re.IGNORECASE):
+                if pattern == r"^Final Answer:?\s*":
+                    stripped = re.sub(r"^Final Answer:?\s*", "", stripped, flags=re.IGNORECASE)
+                    if stripped:
+                        clean_lines.append(stripped)
+                skip = True
+                break
+        if not skip:
+            clean_lines.append(line)
+    text = "\n".join(clean_lines).strip()
+    text = re.sub(r"Traceback \(most recent call last\):.*?(?=\n\n|\Z)", "", text, flags=re.DOTALL)
+    text = re.sub(r"(?:Error|Exception):.*?(?=\n\n|\Z)", "", text, flags=re.DOTALL)
+    if not text or len(text) < 10:
+        return _get_fallback(agent_name, language)
+    text = text.strip()
+    if agent_name in ("gbv_intake", "gbv") and "10111" not in text and "0800 150 150" not in text:
+        text = text.rstrip() + "\n\nIf you are in immediate danger, call SAPS: 10111 | GBV Helpline: 0800 150 150"
+    return text
+
+
+def legacy_validate_crew_output(agent_result: dict, agent_name: str, language: str) -> str:
+    """_validate_crew_output() matching each delegation pattern separately."""
+    from src.api.v1.crew_server import (
+        _DELEGATION_ARTIFACT_PATTERNS,
+        _LLM_ARTIFACT_PATTERNS,
+        _get_fallback,
+    )
+
+    message = agent_result.get("message", "")
+    if not message or len(message.strip()) < 5:
+        return _get_fallback(agent_name, language)
+    for pattern in _DELEGATION_ARTIFACT_PATTERNS:
+        if re.match(pattern, message.strip(), re.IGNORECASE):
+            citizen_lines = []
+            past_delegation = False
+            for line in message.strip().split("\n"):
+                stripped = line.strip()
+                if not stripped:
+                    continue
+                is_delegation = any(
+                    re.match(p, stripped, re.IGNORECASE)
+                    for p in _DELEGATION_ARTIFACT_PATTERNS + _LLM_ARTIFACT_PATTERNS
+                )
+                if not is_delegation:
+                    past_delegation = True
+                    citizen_lines.append(line)
+                elif past_delegation:
+                    break
+            if citizen_lines:
+                return "\n".join(citizen_lines).strip()
+            return _get_fallback(agent_name, language)
+    return message
+
+
+def bench(fn, inputs: list, rounds: int) -> list[float]:
+    """Messages/second per round."""
+    for args in inputs:  # warm-up
+        fn(*args)
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for args in inputs:
+            fn(*args)
+        samples.append(len(inputs) / (time.perf_counter() - started))
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    from src.api.v1.crew_server import _validate_crew_output, sanitize_reply
+    from src.guardrails.input_filters import validate_input
+    from src.guardrails.output_filters import sanitize_output
+    from tests.guardrail_corpus import CREW_OUTPUT_CASES, INPUT_CASES, OUTPUT_CASES, REPLY_CASES
+
+    cases = {
+        "validate_input": (
+            legacy_validate_input, validate_input, [(case[0],) for case in INPUT_CASES],
+        ),
+        "sanitize_output": (
+            legacy_sanitize_output, sanitize_output, [(case[0],) for case in OUTPUT_CASES],
+        ),
+        "sanitize_reply": (
+            legacy_sanitize_reply, sanitize_reply, [case[:3] for case in REPLY_CASES],
+        ),
+        "_validate_crew_output": (
+            legacy_validate_crew_output,
+            _validate_crew_output,
+            [({"message": case[0]}, case[1], case[2]) for case in CREW_OUTPUT_CASES],
+        ),
+    }
+
+    print(f"{args.rounds} rounds over the regression corpus, median messages/sec")
+    print(f"{'guardrail':22} {'before':>10} {'after':>10} {'speedup':>8}")
+    for name, (legacy, compiled, inputs) in cases.items():
+        for call in inputs:
+            assert legacy(*call) == compiled(*call), (name, call)
+        before = statistics.median(bench(legacy, inputs, args.rounds))
+        after = statistics.median(bench(compiled, inputs, args.rounds))
+        print(f"{name:22} {before:10.0f} {after:10.0f} {after / before:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Language detection benchmark: two-pass vs single-pass vs memo hit.
+
+Measures language_detector.detect() (src/core/language.py), which runs on
+every WhatsApp and web message before routing, for EN/ZU/AF short and long
+inputs.
+
+- before: the previous path — detect_language_of() and then
+  compute_language_confidence_values() on the same text (n-gram scoring
+  runs twice)
+- after: single pass, memo cleared before every call (first sighting of a
+  message)
+- memo: single pass with the text already in the LRU memo (repeated
+  message)
+
+Also reports the one-off model build (now deferred to first use or
+preload()) and detect_batch() throughput against a detect() loop.
+
+Usage:
+    python scripts/bench_language_detection.py [--iterations 300] [--batch 500]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+INPUTS = {
+    ("en", "short"): "There is a water pipe burst on Main Street",
+    ("en", "long"): (
+        "The municipal water services have been disrupted in our area for the past three "
+        "days and the pipe on the corner of Main Street is still leaking into the road. "
+        "Please send someone to fix it before the weekend."
+    ),
+    ("zu", "short"): "Amanzi ami ayaphuma endlini yami",
+    ("zu", "long"): (
+        "Umgwaqo udonakele kakhulu futhi kudingeka ukulungiswa ngokushesha. Amanzi "
+        "ayaphuma epayipini eduze nesitolo izinsuku ezintathu manje, sicela nithumele "
+        "umuntu ozolungisa le nkinga."
+    ),
+    ("af", "short"): "My water lek by die pyp naby die winkel",
+    ("af", "long"): (
+        "Die padtoestande in ons area is baie sleg en moet dringend aandag kry. Die pyp "
+        "naby die winkel lek al drie dae en die water loop in die straat af. Stuur asseblief "
+        "iemand om dit voor die naweek reg te maak."
+    ),
+}
+
+
+def legacy_detect(lingua, text: str, fallback: str = "en") -> str:
+    """detect() the way it worked before single-pass scoring."""
+    from src.core.language import LanguageDetector
+
+    if len(text.strip()) < LanguageDetector.MIN_TEXT_LENGTH:
+        return fallback
+    detected = lingua.detect_language_of(text)
+    if detected is None:
+        return fallback
+    confidence = 0.0
+    for lang_conf in lingua.compute_language_confidence_values(text):
+        if lang_conf.language == detected:
+            confidence = lang_conf.value
+            break
+    if confidence < LanguageDetector.MIN_CONFIDENCE:
+        return fallback
+    return LanguageDetector.LANGUAGE_MAP.get(detected, fallback)
+
+
+def bench(fn, iterations: int, before_each=None) -> list[float]:
+    fn()  # warm-up
+    samples = []
+    for _ in range(iterations):
+        if before_each is not None:
+            before_each()
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return samples
+
+
+def _ms(samples: list[float]) -> str:
+    return (
+        f"{statistics.median(samples) * 1000:7.3f} / "
+        f"{samples[int(len(samples) * 0.95) - 1] * 1000:7.3f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--batch", type=int, default=500)
+    args = parser.parse_args()
+
+    from src.core.language import LanguageDetector
+
+    detector = LanguageDetector()
+    started = time.perf_counter()
+    detector.preload()
+    print(f"model build + load (preload): {(time.perf_counter() - started) * 1000:.1f} ms")
+    lingua = detector._detector
+
+    print(f"\n{args.iterations} iterations, median / p95 ms")
+    print(f"{'input':10} {'before':>17} {'after':>17} {'memo':>17} {'speedup':>8}")
+    for (language, size), text in INPUTS.items():
+        assert legacy_detect(lingua, text) == detector.detect(text) == language
+        before = bench(lambda: legacy_detect(lingua, text), args.iterations)
+        after = bench(lambda: detector.detect(text), args.iterations, detector.cache_clear)
+        memo = bench(lambda: detector.detect(text), args.iterations)
+        print(
+            f"{language}/{size:6} {_ms(before)} {_ms(after)} {_ms(memo)} "
+            f"{statistics.median(before) / statistics.median(after):7.2f}x"
+        )
+
+    texts = [f"{text} ({i})" for i in range(args.batch) for text in INPUTS.values()][:args.batch]
+    detector.cache_clear()
+    started = time.perf_counter()
+    loop = [detector.detect(text) for text in texts]
+    loop_seconds = time.perf_counter() - started
+    detector.cache_clear()
+    started = time.perf_counter()
+    batch = detector.detect_batch(texts)
+    batch_seconds = time.perf_counter() - started
+    assert batch == loop
+    print(
+        f"\n{len(texts)} distinct texts: detect() loop {loop_seconds * 1000:.1f} ms, "
+        f"detect_batch() {batch_seconds * 1000:.1f} ms "
+        f"({loop_seconds / batch_seconds:.2f}x)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Import-time profile of the main API and Celery worker entry points.
+
+Runs each target in a fresh interpreter with `python -X importtime` and
+reports:
+
+- total import time and peak RSS of the process after the import
+- the slowest top-level packages (self time of all their modules)
+- whether the agent stack (crewai, litellm, src.agents.flows) was loaded
+
+The main API (src.main) and the Celery worker modules must not load the
+agent stack at import; src/agents/facade.py imports it on first use. The
+"agent stack" target shows what that avoids per process.
+
+Usage:
+    python scripts/profile_import_time.py [--top 15] [--target src.main]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CELERY_MODULES = [
+    "src.tasks.celery_app",
+    "src.tasks.sla_monitor",
+    "src.tasks.status_notify",
+    "src.tasks.pms_auto_populate_task",
+    "src.tasks.pa_notify_task",
+    "src.tasks.report_generation_task",
+    "src.tasks.statutory_deadline_task",
+    "src.tasks.risk_autoflag_task",
+    "src.tasks.ticket_metrics_task",
+    "src.tasks.ward_backfill_task",
+    "src.tasks.whatsapp_inbox_task",
+    "src.tasks.export_task",
+]
+
+TARGETS = {
+    "main API": ["src.main"],
+    "celery worker": CELERY_MODULES,
+    "agent stack": ["src.agents.flows.intake_flow"],
+}
+
+AGENT_STACK = ("crewai", "litellm", "src.agents.flows")
+
+# "import time:       123 |       4567 |   package.module"
+_LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+\d+ \| *(\S+)$")
+
+_PROBE = (
+    "import importlib, resource, sys\n"
+    "for name in sys.argv[1:]:\n"
+    "    importlib.import_module(name)\n"
+    "print('RSS_KB', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+)
+
+
+def profile(modules: list[str]) -> dict:
+    """Import modules in a fresh interpreter; return timings and loaded packages."""
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "fake-key-for-profile")
+    env.setdefault("DEEPSEEK_API_KEY", "fake-key-for-profile")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, *modules],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"import of {modules} failed:\n{result.stderr[-2000:]}")
+
+    packages: dict[str, int] = {}
+    loaded: set[str] = set()
+    for line in result.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if not match:
+            continue
+        self_us, name = int(match.group(1)), match.group(2)
+        loaded.add(name)
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+
+    rss_kb = int(re.search(r"RSS_KB (\d+)", result.stdout).group(1))
+    return {"packages": packages, "loaded": loaded, "rss_kb": rss_kb}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--target", action="append", help="Module(s) to profile instead")
+    args = parser.parse_args()
+
+    targets = {name: [name] for name in args.target} if args.target else TARGETS
+    for label, modules in targets.items():
+        report = profile(modules)
+        total_ms = sum(report["packages"].values()) / 1000
+        agent_modules = sorted(
+            prefix for prefix in AGENT_STACK
+            if any(name == prefix or name.startswith(prefix + ".") for name in report["loaded"])
+        )
+        print(f"\n== {label}: {total_ms:.0f} ms import, {report['rss_kb'] / 1024:.0f} MB peak RSS")
+        print(f"   agent stack loaded: {', '.join(agent_modules) or 'no'}")
+        slowest = sorted(report["packages"].items(), key=lambda item: item[1], reverse=True)
+        for package, self_us in slowest[:args.top]:
+            print(f"   {self_us / 1000:9.1f} ms  {package}")
+
+
+if __name__ == "__main__":
+    main()
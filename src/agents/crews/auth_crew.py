@@ -25,7 +25,7 @@ Key decisions:
 """
 from typing import Any
 
-from crewai import Agent, Crew, Process, Task
+from crewai import Crew
 
 from src.agents.crews.base_crew import BaseCrew, _repair_from_raw
 from src.agents.prompts.auth import AUTH_PROMPTS, AuthResult, build_auth_task_description
@@ -50,6 +50,13 @@ class AuthCrew(BaseCrew):
     tools = [lookup_user_tool, send_otp_tool, verify_otp_tool, create_supabase_user_tool]
     memory_enabled = False  # SEC-01: auth tools handle PII
 
+    # Template inputs — rendered once per language by crew_templates
+    prompts = AUTH_PROMPTS
+    default_role = "Citizen Authentication Assistant"
+    default_goal = "Help citizens register or log in to SALGA Trust Engine"
+    default_expected_output = "A warm, helpful response guiding the citizen through authentication"
+    max_iter = 15  # Registration is 6+ steps
+
     def __init__(self, language: str = "en", llm=None):
         """Initialise AuthCrew.
 
@@ -81,51 +88,13 @@ class AuthCrew(BaseCrew):
         Returns:
             Configured Crew ready for kickoff().
         """
-        language = context.get("language", self.language)
-        if language not in ("en", "zu", "af"):
-            language = self.language
-
-        # Load agent config from YAML for role/goal (backstory from AUTH_PROMPTS)
-        agent_config = self.agents_config.get(self.agent_key, {})
-        role = agent_config.get("role", "Citizen Authentication Assistant")
-        goal = agent_config.get(
-            "goal",
-            "Help citizens register or log in to SALGA Trust Engine",
-        )
-
-        # Backstory from AUTH_PROMPTS[language] — rich trilingual Gugu persona
-        backstory = AUTH_PROMPTS.get(language, AUTH_PROMPTS["en"])
-
-        agent = Agent(
-            role=role,
-            goal=goal,
-            backstory=backstory,
-            tools=self.tools,
-            llm=self.llm,
-            allow_delegation=False,
-            max_iter=15,  # Registration is 6+ steps
-            verbose=False,
-        )
-
-        task_description = build_auth_task_description(context)
-        expected_output = self.tasks_config.get(self.task_key, {}).get(
-            "expected_output",
-            "A warm, helpful response guiding the citizen through authentication",
-        )
-
-        task = Task(
-            description=task_description,
-            expected_output=expected_output,
-            agent=agent,
-            output_pydantic=AuthResult,
-        )
-
-        return Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential,
+        template = self.template(self.resolve_language(context))
+        return template.build_crew(
+            self.tools,
+            self.llm,
             memory=False,  # SEC-01: PII protection
-            verbose=False,
+            description=build_auth_task_description(context),
+            output_pydantic=AuthResult,
         )
 
     def build_kickoff_inputs(self, context: dict) -> dict:
@@ -13,17 +13,18 @@ handles its narrow task autonomously with no delegation.
 Sanitization patterns (_repair_from_raw, parse_result) preserved from
 agents_old/crews/base_crew.py with delegation-related code removed.
 """
-import asyncio
 import json
 import re
 from abc import ABC
-from pathlib import Path
 from typing import Any
 
-import yaml
-from crewai import Agent, Crew, Process, Task
+from crewai import Crew
 from pydantic import BaseModel, field_validator
 
+from src.agents.crews.templates import CrewTemplate, crew_templates
+from src.agents.llm_pool import LLMPoolBusy, llm_pool
+from src.agents.streaming import stream_llm
+
 
 # ---------------------------------------------------------------------------
 # Shared Pydantic output model
@@ -162,8 +163,10 @@ def validate_gbv_output(result) -> tuple[bool, Any]:
 class BaseCrew(ABC):
     """Abstract base for specialist crews.
 
-    Consolidates: YAML config loading, language validation, lazy LLM init,
-    agent/task construction from YAML, async kickoff pattern, result parsing.
+    Consolidates: language validation, lazy LLM init, template rendering,
+    async kickoff pattern, result parsing. YAML configs and rendered
+    templates come from the process-wide crew_templates registry
+    (src/agents/crews/templates.py), so constructing a crew is cheap.
 
     Subclasses MUST define:
         agent_key: str          — key in agents.yaml (e.g. "auth_agent")
@@ -171,6 +174,14 @@ class BaseCrew(ABC):
         tools: list             — CrewAI tool instances for the agent
         memory_enabled: bool    — False for PII-sensitive crews (auth, gbv)
 
+    Subclasses MAY define (read once per language by render_template):
+        prompts: dict           — language -> backstory, replaces YAML backstory
+        default_role / default_goal / default_expected_output
+                                — used when agents.yaml/tasks.yaml lack the key
+        max_iter: int           — overrides YAML max_iter
+        stream_tokens: bool     — False to never stream drafts to the citizen
+                                  (crews whose guardrail may reject an answer)
+
     Subclasses MAY override:
         build_task_description(context) — custom task description building
         build_task_kwargs(context) — extra Task() kwargs (e.g. output_pydantic)
@@ -185,16 +196,23 @@ class BaseCrew(ABC):
     tools: list
     memory_enabled: bool = False  # Safe default: disabled for all specialists
 
+    # --- Template inputs (optional) ---
+    prompts: dict[str, str] | None = None
+    default_role: str = ""
+    default_goal: str = ""
+    default_expected_output: str = ""
+    max_iter: int | None = None
+
+    # Forward LLM tokens to an active reply stream (src/agents/streaming.py)
+    stream_tokens: bool = True
+
     def __init__(self, language: str = "en", llm=None):
         self.language = language if language in ("en", "zu", "af") else "en"
         self._llm = llm  # Lazy: resolved in .llm property if None
 
-        # Load YAML configs ONCE at construction time
-        config_dir = Path(__file__).parent.parent / "config"
-        with open(config_dir / "agents.yaml", "r", encoding="utf-8") as f:
-            self.agents_config = yaml.safe_load(f) or {}
-        with open(config_dir / "tasks.yaml", "r", encoding="utf-8") as f:
-            self.tasks_config = yaml.safe_load(f) or {}
+        # Parsed once per process by the registry — shared, read-only
+        self.agents_config = crew_templates.agents_config
+        self.tasks_config = crew_templates.tasks_config
 
     @classmethod
     def _load_yaml(cls, filename: str) -> dict:
@@ -206,9 +224,7 @@ class BaseCrew(ABC):
         Returns:
             Parsed YAML content as dict, or empty dict if file is empty.
         """
-        config_dir = Path(__file__).parent.parent / "config"
-        with open(config_dir / filename, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return crew_templates.load_yaml(filename)
 
     @property
     def llm(self):
@@ -218,7 +234,8 @@ class BaseCrew(ABC):
             self._llm = get_deepseek_llm()
         return self._llm
 
-    def _get_backstory(self, agent_config: dict, language: str) -> str:
+    @staticmethod
+    def _get_backstory(agent_config: dict, language: str) -> str:
         """Get language-specific backstory from YAML config.
 
         Looks for backstory_zu/backstory_af keys; falls back to backstory (English).
@@ -229,6 +246,43 @@ class BaseCrew(ABC):
             return agent_config.get("backstory_af", agent_config["backstory"])
         return agent_config["backstory"]
 
+    @classmethod
+    def render_template(cls, agents_config: dict, tasks_config: dict, language: str) -> CrewTemplate:
+        """Render the static parts of this crew for one language.
+
+        Called by crew_templates once per (crew class, language); the result
+        is reused for every turn. Backstory comes from cls.prompts when set,
+        else from the YAML backstory/backstory_zu/backstory_af keys.
+        """
+        agent_config = agents_config.get(cls.agent_key, {})
+        task_config = tasks_config.get(cls.task_key, {})
+
+        if cls.prompts:
+            backstory = cls.prompts.get(language, cls.prompts["en"])
+        else:
+            backstory = cls._get_backstory(agent_config, language)
+
+        return CrewTemplate(
+            role=agent_config.get("role", cls.default_role),
+            goal=agent_config.get("goal", cls.default_goal).format(language=language),
+            backstory=backstory,
+            expected_output=task_config.get("expected_output", cls.default_expected_output),
+            agent_kwargs={
+                "allow_delegation": agent_config.get("allow_delegation", False),
+                "max_iter": cls.max_iter or agent_config.get("max_iter", 3),
+                "verbose": agent_config.get("verbose", False),
+            },
+        )
+
+    def resolve_language(self, context: dict) -> str:
+        """Per-turn language from context, falling back to the crew's language."""
+        language = context.get("language", self.language)
+        return language if language in ("en", "zu", "af") else self.language
+
+    def template(self, language: str) -> CrewTemplate:
+        """Cached template for this crew class in language."""
+        return crew_templates.get(type(self), language)
+
     def build_task_description(self, context: dict) -> str:
         """Build task description from YAML template + context.
 
@@ -251,38 +305,16 @@ class BaseCrew(ABC):
         return context
 
     def create_crew(self, context: dict) -> Crew:
-        """Build Agent + Task + Crew from YAML config + context.
+        """Build Agent + Task + Crew from the cached template + context.
 
-        Default implementation: loads YAML, creates single Agent + Task + Crew.
+        Default implementation: single Agent + Task + Crew; only the task
+        description and Task kwargs are computed per turn.
         Subclasses may override entirely for custom crew construction.
         """
-        language = context.get("language", self.language)
-        if language not in ("en", "zu", "af"):
-            language = self.language
-
-        agent_config = self.agents_config[self.agent_key]
-        role = agent_config["role"]
-        goal = agent_config["goal"].format(language=language)
-        backstory = self._get_backstory(agent_config, language)
-
-        agent = Agent(
-            role=role,
-            goal=goal,
-            backstory=backstory,
-            tools=self.tools,
-            llm=self.llm,
-            allow_delegation=agent_config.get("allow_delegation", False),
-            max_iter=agent_config.get("max_iter", 3),
-            verbose=agent_config.get("verbose", False),
-        )
-
-        task_description = self.build_task_description(context)
-        expected_output = self.tasks_config[self.task_key]["expected_output"]
+        template = self.template(self.resolve_language(context))
 
         task_kwargs = {
-            "description": task_description,
-            "expected_output": expected_output,
-            "agent": agent,
+            "description": self.build_task_description(context),
             **self.build_task_kwargs(context),
         }
 
@@ -291,15 +323,7 @@ class BaseCrew(ABC):
             task_kwargs["guardrail"] = guardrail
             task_kwargs["guardrail_max_retries"] = 2
 
-        task = Task(**task_kwargs)
-
-        return Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential,  # ALWAYS sequential — never hierarchical
-            memory=self.memory_enabled,
-            verbose=False,
-        )
+        return template.build_crew(self.tools, self.llm, self.memory_enabled, **task_kwargs)
 
     def parse_result(self, result) -> dict[str, Any]:
         """Parse CrewAI result. Tries Pydantic model first, then regex fallback."""
@@ -338,18 +362,24 @@ class BaseCrew(ABC):
         return {"error": str(error), "message": "Something went wrong. Please try again."}
 
     async def kickoff(self, context: dict) -> dict[str, Any]:
-        """Run crew asynchronously via thread pool executor.
+        """Run crew asynchronously on the LLM provider's bounded pool.
+
+        Creates Crew via create_crew(), calls crew.kickoff(inputs=context)
+        through llm_pool (src/agents/llm_pool.py), returns parsed result dict.
+        Inside a reply_stream() the LLM's tokens are forwarded as they arrive
+        unless stream_tokens is False.
 
-        Creates Crew via create_crew(), calls crew.kickoff(inputs=context),
-        returns parsed result dict.
+        Raises:
+            LLMPoolBusy: the provider pool refused the kickoff. Not turned
+                into an error response: callers answer "busy" instead.
         """
         try:
             crew = self.create_crew(context)
             inputs = self.build_kickoff_inputs(context)
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, lambda: crew.kickoff(inputs=inputs)
-            )
+            with stream_llm(self.llm, enabled=self.stream_tokens):
+                result = await llm_pool.run(self.llm, lambda: crew.kickoff(inputs=inputs))
             return self.parse_result(result)
+        except LLMPoolBusy:
+            raise
         except Exception as e:
             return self.get_error_response(e)
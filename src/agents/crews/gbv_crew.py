@@ -23,7 +23,7 @@ Key decisions (locked):
 """
 from typing import Any
 
-from crewai import Agent, Crew, Process, Task
+from crewai import Crew
 
 from src.agents.crews.base_crew import BaseCrew, _repair_from_raw, validate_gbv_output
 from src.agents.prompts.gbv import GBV_PROMPTS, GBVResponse, build_gbv_task_description
@@ -46,6 +46,20 @@ class GBVCrew(BaseCrew):
     tools = [notify_saps]
     memory_enabled = False  # SEC-05: PII protection — NEVER enable for GBV
 
+    # Template inputs — rendered once per language by crew_templates
+    prompts = GBV_PROMPTS
+    default_role = "GBV Support Specialist"
+    default_goal = "Support citizens reporting GBV with empathy, safety information, and SAPS notification"
+    default_expected_output = (
+        "A calm, empathetic response that includes emergency numbers 10111 and "
+        "0800 150 150, acknowledges the citizen's situation without judgment, "
+        "and confirms SAPS notification has been sent"
+    )
+    max_iter = 8  # Avoid over-questioning trauma victims (locked decision)
+
+    # The guardrail may reject and retry a draft: only the validated reply is sent
+    stream_tokens = False
+
     def __init__(self, language: str = "en", llm=None):
         """Initialise GBVCrew.
 
@@ -76,59 +90,17 @@ class GBVCrew(BaseCrew):
         Returns:
             Configured Crew ready for kickoff().
         """
-        language = context.get("language", self.language)
-        if language not in ("en", "zu", "af"):
-            language = self.language
-
-        # Load agent config from YAML for role/goal (backstory from GBV_PROMPTS)
-        agent_config = self.agents_config.get(self.agent_key, {})
-        role = agent_config.get("role", "GBV Support Specialist")
-        goal = agent_config.get(
-            "goal",
-            "Support citizens reporting GBV with empathy, safety information, and SAPS notification",
-        )
-
-        # Backstory from GBV_PROMPTS[language] — trauma-informed Gugu identity
-        backstory = GBV_PROMPTS.get(language, GBV_PROMPTS["en"])
-
-        agent = Agent(
-            role=role,
-            goal=goal,
-            backstory=backstory,
-            tools=self.tools,
-            llm=self.llm,
-            allow_delegation=False,
-            max_iter=8,   # Avoid over-questioning trauma victims (locked decision)
-            verbose=False,
-        )
-
-        task_description = build_gbv_task_description(context)
-        expected_output = self.tasks_config.get(self.task_key, {}).get(
-            "expected_output",
-            (
-                "A calm, empathetic response that includes emergency numbers 10111 and "
-                "0800 150 150, acknowledges the citizen's situation without judgment, "
-                "and confirms SAPS notification has been sent"
-            ),
-        )
-
-        task = Task(
-            description=task_description,
-            expected_output=expected_output,
-            agent=agent,
+        template = self.template(self.resolve_language(context))
+        return template.build_crew(
+            self.tools,
+            self.llm,
+            memory=False,  # CRITICAL: PII protection # SEC-05 # POPIA
+            description=build_gbv_task_description(context),
             output_pydantic=GBVResponse,
-            guardrail=validate_gbv_output,   # Enforce emergency numbers in output
+            guardrail=validate_gbv_output,  # Enforce emergency numbers in output
             guardrail_max_retries=2,
         )
 
-        return Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential,   # ALWAYS sequential — never hierarchical
-            memory=False,                 # CRITICAL: PII protection # SEC-05 # POPIA
-            verbose=False,
-        )
-
     def build_kickoff_inputs(self, context: dict) -> dict:
         """Map context fields to crew kickoff inputs."""
         return {
@@ -24,7 +24,7 @@ Key decisions:
 """
 from typing import Any
 
-from crewai import Agent, Crew, Process, Task
+from crewai import Crew
 
 from src.agents.crews.base_crew import BaseCrew, _repair_from_raw
 from src.agents.prompts.municipal import (
@@ -49,6 +49,13 @@ class MunicipalIntakeCrew(BaseCrew):
     tools = [create_municipal_ticket]
     memory_enabled = False  # Conversation history injected as string context
 
+    # Template inputs — rendered once per language by crew_templates
+    prompts = MUNICIPAL_PROMPTS
+    default_role = "Municipal Service Intake Assistant"
+    default_goal = "Help citizens report municipal service problems and create service tickets"
+    default_expected_output = "A warm, helpful response collecting issue details or confirming ticket creation"
+    max_iter = 10  # 3-5 turns to collect info + 1 tool call + confirmation
+
     def __init__(self, language: str = "en", llm=None):
         """Initialise MunicipalIntakeCrew.
 
@@ -79,51 +86,13 @@ class MunicipalIntakeCrew(BaseCrew):
         Returns:
             Configured Crew ready for kickoff().
         """
-        language = context.get("language", self.language)
-        if language not in ("en", "zu", "af"):
-            language = self.language
-
-        # Load agent config from YAML for role/goal (backstory from MUNICIPAL_PROMPTS)
-        agent_config = self.agents_config.get(self.agent_key, {})
-        role = agent_config.get("role", "Municipal Service Intake Assistant")
-        goal = agent_config.get(
-            "goal",
-            "Help citizens report municipal service problems and create service tickets",
-        )
-
-        # Backstory from MUNICIPAL_PROMPTS[language] — rich trilingual Gugu persona
-        backstory = MUNICIPAL_PROMPTS.get(language, MUNICIPAL_PROMPTS["en"])
-
-        agent = Agent(
-            role=role,
-            goal=goal,
-            backstory=backstory,
-            tools=self.tools,
-            llm=self.llm,
-            allow_delegation=False,
-            max_iter=10,  # 3-5 turns to collect info + 1 tool call + confirmation
-            verbose=False,
-        )
-
-        task_description = build_municipal_task_description(context)
-        expected_output = self.tasks_config.get(self.task_key, {}).get(
-            "expected_output",
-            "A warm, helpful response collecting issue details or confirming ticket creation",
-        )
-
-        task = Task(
-            description=task_description,
-            expected_output=expected_output,
-            agent=agent,
-            output_pydantic=MunicipalResponse,
-        )
-
-        return Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential,  # ALWAYS sequential
+        template = self.template(self.resolve_language(context))
+        return template.build_crew(
+            self.tools,
+            self.llm,
             memory=False,
-            verbose=False,
+            description=build_municipal_task_description(context),
+            output_pydantic=MunicipalResponse,
         )
 
     def build_kickoff_inputs(self, context: dict) -> dict:
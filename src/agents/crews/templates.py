@@ -0,0 +1,130 @@
+"""Crew template registry — per-process cache of everything static in a Crew.
+
+IntakeFlow creates a new specialist crew for every citizen message. Before
+this registry each instance re-read and yaml.safe_load()ed agents.yaml and
+tasks.yaml, and create_crew() re-resolved role/goal/backstory/expected_output
+on every turn — CPU work in the same executor thread that runs the LLM call.
+
+The registry parses the YAML once per process and renders one CrewTemplate
+per (crew class, language). A crew's create_crew() then only binds per-turn
+inputs (task description, context-dependent Task kwargs) and constructs the
+CrewAI objects.
+
+Key decisions:
+- Agent/Task/Crew objects are still built per turn. They carry per-run
+  executor state (agent_executor, task outputs), and concurrent turns share
+  nothing mutable; only immutable rendered strings and kwargs are cached.
+- Templates are keyed by crew class, so the subclass attributes that shape
+  them (prompts, default_*, max_iter) are read once per language.
+- Parsed configs are shared between instances; treat them as read-only.
+
+See scripts/bench_crew_templates.py for per-turn overhead before/after.
+"""
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+from crewai import Agent, Crew, Process, Task
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+@dataclass(frozen=True)
+class CrewTemplate:
+    """Pre-rendered, language-specific agent and task settings for one crew."""
+
+    role: str
+    goal: str
+    backstory: str
+    expected_output: str
+    agent_kwargs: dict[str, Any] = field(default_factory=dict)
+
+    def build_agent(self, tools: list, llm) -> Agent:
+        """Construct a fresh Agent bound to this turn's LLM and tools."""
+        return Agent(
+            role=self.role,
+            goal=self.goal,
+            backstory=self.backstory,
+            tools=tools,
+            llm=llm,
+            **self.agent_kwargs,
+        )
+
+    def build_crew(self, tools: list, llm, memory: bool, **task_kwargs) -> Crew:
+        """Construct Agent + Task + sequential Crew for one turn.
+
+        Args:
+            tools: CrewAI tool instances for the agent
+            llm: LLM instance for the agent
+            memory: Crew memory flag (False for all specialists)
+            **task_kwargs: Per-turn Task() kwargs; must include description.
+                expected_output defaults to the template's.
+        """
+        agent = self.build_agent(tools, llm)
+        task_kwargs.setdefault("expected_output", self.expected_output)
+        task = Task(agent=agent, **task_kwargs)
+        return Crew(
+            agents=[agent],
+            tasks=[task],
+            process=Process.sequential,  # ALWAYS sequential — never hierarchical
+            memory=memory,
+            verbose=False,
+        )
+
+
+class CrewTemplateRegistry:
+    """Parses agents.yaml/tasks.yaml once and memoises rendered templates."""
+
+    def __init__(self, config_dir: Path = CONFIG_DIR):
+        self._config_dir = config_dir
+        self._lock = threading.Lock()
+        self._agents_config: dict | None = None
+        self._tasks_config: dict | None = None
+        self._templates: dict[tuple[type, str], CrewTemplate] = {}
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._agents_config is None:
+                self._agents_config = self.load_yaml("agents.yaml")
+                self._tasks_config = self.load_yaml("tasks.yaml")
+
+    def load_yaml(self, filename: str) -> dict:
+        """Parse a YAML file from the config directory (uncached)."""
+        with open(self._config_dir / filename, "r", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+
+    @property
+    def agents_config(self) -> dict:
+        if self._agents_config is None:
+            self._load()
+        return self._agents_config
+
+    @property
+    def tasks_config(self) -> dict:
+        if self._tasks_config is None:
+            self._load()
+        return self._tasks_config
+
+    def get(self, crew_cls: type, language: str) -> CrewTemplate:
+        """Return the template for crew_cls in language, rendering it on first use."""
+        key = (crew_cls, language)
+        template = self._templates.get(key)
+        if template is None:
+            template = crew_cls.render_template(
+                self.agents_config, self.tasks_config, language
+            )
+            # setdefault: two threads racing on first use agree on one instance
+            template = self._templates.setdefault(key, template)
+        return template
+
+    def clear(self) -> None:
+        """Drop parsed configs and templates (tests, config reloads)."""
+        with self._lock:
+            self._agents_config = None
+            self._tasks_config = None
+            self._templates.clear()
+
+
+crew_templates = CrewTemplateRegistry()
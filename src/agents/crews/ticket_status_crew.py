@@ -28,7 +28,7 @@ Security:
 """
 from typing import Any
 
-from crewai import Agent, Crew, Process, Task
+from crewai import Crew
 
 from src.agents.crews.base_crew import BaseCrew, _repair_from_raw
 from src.agents.prompts.ticket_status import (
@@ -52,6 +52,13 @@ class TicketStatusCrew(BaseCrew):
     tools = [lookup_ticket_tool]
     memory_enabled = False  # Conversation history injected as string context
 
+    # Template inputs — rendered once per language by crew_templates
+    prompts = TICKET_STATUS_PROMPTS
+    default_role = "Ticket Status Specialist"
+    default_goal = "Help citizens check the status of their municipal service reports"
+    default_expected_output = "A clear status update for the citizen's service ticket"
+    max_iter = 8  # Ask for tracking number (if missing) + look up + report
+
     def __init__(self, language: str = "en", llm=None):
         """Initialise TicketStatusCrew.
 
@@ -82,51 +89,13 @@ class TicketStatusCrew(BaseCrew):
         Returns:
             Configured Crew ready for kickoff().
         """
-        language = context.get("language", self.language)
-        if language not in ("en", "zu", "af"):
-            language = self.language
-
-        # Load agent config from YAML for role/goal (backstory from TICKET_STATUS_PROMPTS)
-        agent_config = self.agents_config.get(self.agent_key, {})
-        role = agent_config.get("role", "Ticket Status Specialist")
-        goal = agent_config.get(
-            "goal",
-            "Help citizens check the status of their municipal service reports",
-        )
-
-        # Backstory from TICKET_STATUS_PROMPTS[language] — rich trilingual Gugu persona
-        backstory = TICKET_STATUS_PROMPTS.get(language, TICKET_STATUS_PROMPTS["en"])
-
-        agent = Agent(
-            role=role,
-            goal=goal,
-            backstory=backstory,
-            tools=self.tools,
-            llm=self.llm,
-            allow_delegation=False,
-            max_iter=8,  # Ask for tracking number (if missing) + look up + report
-            verbose=False,
-        )
-
-        task_description = build_ticket_status_task_description(context)
-        expected_output = self.tasks_config.get(self.task_key, {}).get(
-            "expected_output",
-            "A clear status update for the citizen's service ticket",
-        )
-
-        task = Task(
-            description=task_description,
-            expected_output=expected_output,
-            agent=agent,
-            output_pydantic=TicketStatusResponse,
-        )
-
-        return Crew(
-            agents=[agent],
-            tasks=[task],
-            process=Process.sequential,  # ALWAYS sequential
+        template = self.template(self.resolve_language(context))
+        return template.build_crew(
+            self.tools,
+            self.llm,
             memory=False,
-            verbose=False,
+            description=build_ticket_status_task_description(context),
+            output_pydantic=TicketStatusResponse,
         )
 
     def build_kickoff_inputs(self, context: dict) -> dict:
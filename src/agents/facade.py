@@ -0,0 +1,51 @@
+"""Lazy entry point into the agent stack for the main API process.
+
+src/main.py serves the core ticketing API, and only report submission
+without a category needs an agent (intent classification). reports.py used
+to import IntakeFlow at module level, so every Uvicorn worker (and anything
+else importing the app) loaded CrewAI, LiteLLM and the prompt modules at
+startup and carried them in memory.
+
+Code outside src/agents calls the functions here instead. This module
+imports nothing from CrewAI; the flow is imported on first call.
+
+Key decisions:
+- Modules on the main API's import path may import src.agents.llm_pool and
+  src.agents.streaming (no CrewAI at import) and this facade, nothing else
+  from src.agents; tests/test_import_time.py enforces it
+- Classification is a blocking LLM call, so it runs in a worker thread
+  instead of holding the event loop
+- scripts/profile_import_time.py measures the startup import cost
+"""
+import asyncio
+
+
+def _classify_intent_sync(message: str, language: str, user_id: str) -> str:
+    from src.agents.flows.intake_flow import IntakeFlow
+    from src.agents.flows.state import IntakeState
+
+    flow = IntakeFlow()
+    flow.state = IntakeState(
+        message=message,
+        language=language,
+        session_status="active",  # Web portal users are authenticated
+        user_id=user_id,
+        routing_phase="manager",  # Trigger fresh classification
+    )
+    # Single-shot classification: SAPS override, local classifier, then one
+    # gpt-4o-mini call -- no crew invocation
+    return flow._classify_raw_intent()
+
+
+async def classify_intent(message: str, language: str, user_id: str) -> str:
+    """Classify a citizen message with IntakeFlow's intent classifier.
+
+    Args:
+        message: Sanitized message text
+        language: ISO 639-1 language code
+        user_id: Authenticated user's ID
+
+    Returns:
+        Intent string: "auth" | "municipal" | "ticket_status" | "gbv"
+    """
+    return await asyncio.to_thread(_classify_intent_sync, message, language, user_id)
@@ -19,6 +19,9 @@ Routing rules (deterministic Python, no LLM):
 Key decisions:
 - Intent classification: direct get_routing_llm().call() — NOT a full Crew.
   gpt-4o-mini is reliable for this simple classification task.
+- Local intent classifier first (src/agents/flows/intent_classifier.py):
+  in "active" mode a confident local prediction skips the LLM call; in
+  "shadow" mode (default) it is only compared with the LLM's answer.
 - routing_phase short-circuit: if an active specialist session exists (e.g.
   citizen is mid-registration), skip classification and continue with that agent.
 - Auth gate: unauthenticated users ALWAYS go to auth first. Original intent
@@ -30,13 +33,19 @@ Key decisions:
 
 See:
 - src/agents/flows/state.py — IntakeState model
+- src/agents/flows/intent_classifier.py — local first-stage classifier
 - src/agents/llm.py — get_routing_llm(), get_deepseek_llm()
 - src/core/language.py — language_detector singleton
 """
+import time
+
 from crewai.flow.flow import Flow, listen, router, start
 
+from src.agents.flows.intent_classifier import accept, get_intent_classifier
 from src.agents.flows.state import IntakeState
+from src.core.config import settings
 from src.core.language import language_detector
+from src.core.metrics import metrics
 
 
 class IntakeFlow(Flow[IntakeState]):
@@ -65,7 +74,7 @@ class IntakeFlow(Flow[IntakeState]):
         Three routing paths:
         1. Short-circuit: routing_phase already set (active specialist session)
         2. Auth gate: unauthenticated users always route to auth first
-        3. LLM classification: direct gpt-4o-mini call for intent
+        3. Classification: local classifier and/or direct gpt-4o-mini call
 
         Returns:
             Intent string: "auth" | "municipal" | "ticket_status" | "gbv"
@@ -93,27 +102,66 @@ class IntakeFlow(Flow[IntakeState]):
             self.state.intent = "auth"
             return "auth"
 
-        # Step 4: Classify intent via direct LLM call (gpt-4o-mini)
+        # Step 4: Classify intent (local classifier, gpt-4o-mini fallback)
         intent = self._classify_raw_intent()
         self.state.intent = intent
         return intent
 
     def _classify_raw_intent(self) -> str:
-        """Direct LLM call for intent classification. NOT a full Crew.
+        """Classify intent: SAPS override, then local classifier, then LLM.
 
-        Uses get_routing_llm() (gpt-4o-mini) for reliable single-shot
-        classification. Returns one of the 4 known intent categories.
-        Defaults to "municipal" if LLM returns an unrecognized string.
+        INTENT_CLASSIFIER_MODE controls the local stage:
+        - "off": LLM only
+        - "shadow": LLM decides; the local prediction is recorded against it
+        - "active": a local prediction passing accept() is returned directly,
+          anything else falls back to the LLM (and is recorded as in shadow)
 
         Returns:
             Intent string: "auth" | "municipal" | "ticket_status" | "gbv"
         """
-        # SEC-05: Intercept adversarial GBV phrasing before LLM classification.
+        # SEC-05: Intercept adversarial GBV phrasing before any classifier.
         # Citizens describing a GBV case using police/SAPS language lack the abuse keywords
         # the LLM checks for, causing misrouting to ticket_status.
         if self._is_saps_context(self.state.message):
             return "gbv"
 
+        mode = settings.INTENT_CLASSIFIER_MODE
+        if mode not in ("shadow", "active"):
+            return self._classify_with_llm()
+
+        started = time.perf_counter()
+        prediction = get_intent_classifier().predict(self.state.message)
+        metrics.observe("intent_classifier_latency_seconds", time.perf_counter() - started)
+        confident = accept(
+            prediction,
+            settings.INTENT_CLASSIFIER_THRESHOLD,
+            settings.INTENT_CLASSIFIER_GBV_FLOOR,
+        )
+
+        if mode == "active" and confident:
+            metrics.inc("intent_classifications_total", source="local", intent=prediction.intent)
+            return prediction.intent
+
+        intent = self._classify_with_llm()
+        metrics.inc("intent_classifications_total", source="llm", intent=intent)
+        metrics.inc(
+            "intent_classifier_shadow_total",
+            local=prediction.intent,
+            llm=intent,
+            confident=str(confident).lower(),
+        )
+        return intent
+
+    def _classify_with_llm(self) -> str:
+        """Direct LLM call for intent classification. NOT a full Crew.
+
+        Uses get_routing_llm() (gpt-4o-mini) for reliable single-shot
+        classification. Returns one of the 4 known intent categories.
+        Defaults to "municipal" if LLM returns an unrecognized string.
+
+        Returns:
+            Intent string: "auth" | "municipal" | "ticket_status" | "gbv"
+        """
         from src.agents.llm import get_routing_llm
 
         llm = get_routing_llm()
@@ -0,0 +1,203 @@
+"""Local intent classifier — a sub-millisecond first stage ahead of the routing LLM.
+
+IntakeFlow._classify_raw_intent() asks this classifier first and only calls
+get_routing_llm() when the prediction is not confident enough (see
+INTENT_CLASSIFIER_MODE / INTENT_CLASSIFIER_THRESHOLD in src/core/config.py).
+
+Model: multinomial Naive Bayes over character n-grams (3-5, within word
+boundaries) plus whole-word features. Character n-grams carry the
+agglutinative isiZulu forms ("uyangishaya", "ngihlukunyezwa") and Afrikaans
+compounds ("waterlek", "verwysingsnommer") that word features alone miss.
+Pure Python, trained in a few milliseconds at first use, so there is no
+model artifact to ship or keep in sync.
+
+Training data:
+- src/agents/flows/intent_corpus.py — curated EN/ZU/AF seed examples
+- INTENT_CLASSIFIER_TRAINING_FILE — optional JSONL of logged conversations,
+  one {"message": ..., "intent": ...} object per line
+
+tests/evals/scenarios/ is NOT training data; it is the held-out check.
+
+Key decisions:
+- Scores are length-normalised before the softmax. Raw Naive Bayes
+  posteriors saturate to ~1.0 after a handful of features, which would make
+  any threshold meaningless; the normalised confidence degrades for short,
+  out-of-domain or mixed messages, which is where the LLM should decide.
+- accept() also requires p(gbv) below a floor before answering a non-GBV
+  label locally. A message with any real GBV signal always reaches the LLM.
+- The SEC-05 SAPS override in IntakeFlow runs before this classifier.
+"""
+import json
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+INTENTS = ("auth", "municipal", "ticket_status", "gbv")
+
+_TICKET_RE = re.compile(r"\btkt-[\w-]*", re.IGNORECASE)
+_TOKEN_RE = re.compile(r"[^\W\d_]+|\d+")
+
+
+class IntentPrediction(NamedTuple):
+    """Most likely intent, its confidence and the full distribution."""
+
+    intent: str
+    confidence: float
+    probabilities: dict[str, float]
+
+
+def _features(text: str) -> Counter:
+    """Word and character n-gram features for one message."""
+    text = _TICKET_RE.sub(" tktref ", text.lower())
+    features: Counter = Counter()
+    for token in _TOKEN_RE.findall(text):
+        if token.isdigit():
+            token = "<num>"
+            features["w:" + token] += 1
+            continue
+        features["w:" + token] += 1
+        padded = f" {token} "
+        for n in (3, 4, 5):
+            for i in range(len(padded) - n + 1):
+                features[padded[i:i + n]] += 1
+    return features
+
+
+class IntentClassifier:
+    """Multinomial Naive Bayes intent classifier over EN/ZU/AF features.
+
+    Args:
+        examples: (message, intent) pairs; intents outside INTENTS are skipped
+        alpha: Additive smoothing
+        sharpness: Multiplier on the length-normalised log-likelihood before
+            the softmax; higher values make confidences more extreme
+    """
+
+    def __init__(
+        self,
+        examples: Iterable[tuple[str, str]],
+        alpha: float = 0.1,
+        sharpness: float = 4.0,
+    ):
+        self._sharpness = sharpness
+        counts: dict[str, Counter] = {intent: Counter() for intent in INTENTS}
+        docs: Counter = Counter()
+        for message, intent in examples:
+            if intent not in counts:
+                continue
+            counts[intent].update(_features(message))
+            docs[intent] += 1
+
+        vocabulary = set().union(*counts.values())
+        total_docs = sum(docs.values())
+        self._log_prior = {
+            intent: math.log((docs[intent] + 1) / (total_docs + len(INTENTS)))
+            for intent in INTENTS
+        }
+        self._log_likelihood: dict[str, dict[str, float]] = {}
+        for intent in INTENTS:
+            denominator = sum(counts[intent].values()) + alpha * len(vocabulary)
+            self._log_likelihood[intent] = {
+                feature: math.log((counts[intent][feature] + alpha) / denominator)
+                for feature in vocabulary
+            }
+        self.size = total_docs
+
+    def predict(self, text: str) -> IntentPrediction:
+        """Classify one message.
+
+        Features never seen in training are ignored. A message with no known
+        features gets the prior distribution, which is never confident.
+        """
+        features = [
+            (feature, count)
+            for feature, count in _features(text).items()
+            if feature in self._log_likelihood[INTENTS[0]]
+        ]
+        observed = sum(count for _, count in features)
+
+        scores = {}
+        for intent in INTENTS:
+            table = self._log_likelihood[intent]
+            likelihood = sum(table[feature] * count for feature, count in features)
+            if observed:
+                likelihood = likelihood / observed * self._sharpness
+            scores[intent] = self._log_prior[intent] + likelihood
+
+        top = max(scores.values())
+        exp = {intent: math.exp(score - top) for intent, score in scores.items()}
+        total = sum(exp.values())
+        probabilities = {intent: value / total for intent, value in exp.items()}
+        intent = max(probabilities, key=probabilities.get)
+        return IntentPrediction(intent, probabilities[intent], probabilities)
+
+
+def accept(prediction: IntentPrediction, threshold: float, gbv_floor: float) -> bool:
+    """Whether a local prediction may be used without asking the LLM.
+
+    Requires confidence >= threshold and, for any label other than "gbv",
+    p(gbv) < gbv_floor so that possible GBV reports are never routed away
+    from the GBV specialist on the local model's say-so.
+    """
+    if prediction.confidence < threshold:
+        return False
+    return prediction.intent == "gbv" or prediction.probabilities["gbv"] < gbv_floor
+
+
+def load_training_file(path: str) -> list[tuple[str, str]]:
+    """Read logged conversations from a JSONL file of {"message", "intent"} lines.
+
+    Malformed lines and unknown intents are skipped with a warning.
+    """
+    examples = []
+    with Path(path).open(encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                message, intent = record["message"], record["intent"]
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Skipping malformed intent training line %d in %s", line_no, path)
+                continue
+            if intent in INTENTS and isinstance(message, str) and message.strip():
+                examples.append((message, intent))
+    return examples
+
+
+_classifier: IntentClassifier | None = None
+_classifier_lock = threading.Lock()
+
+
+def get_intent_classifier() -> IntentClassifier:
+    """Return the process-wide classifier, training it on first use."""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                from src.agents.flows.intent_corpus import INTENT_CORPUS
+                from src.core.config import settings
+
+                examples = list(INTENT_CORPUS)
+                if settings.INTENT_CLASSIFIER_TRAINING_FILE:
+                    try:
+                        examples.extend(load_training_file(settings.INTENT_CLASSIFIER_TRAINING_FILE))
+                    except OSError as e:
+                        logger.warning("Intent training file unavailable, using seed corpus only: %s", e)
+                _classifier = IntentClassifier(examples)
+                logger.info("Intent classifier trained on %d examples", _classifier.size)
+    return _classifier
+
+
+def reset_intent_classifier() -> None:
+    """Drop the trained classifier so the next call retrains (tests, reloads)."""
+    global _classifier
+    with _classifier_lock:
+        _classifier = None
@@ -0,0 +1,187 @@
+"""Seed training corpus for the local intent classifier (EN/ZU/AF).
+
+Each entry is (message, intent). Kept separate from the eval scenarios in
+tests/evals/scenarios/, which serve as the held-out check for the
+classifier (tests/agents/test_intent_classifier.py).
+
+Extend with logged conversations through INTENT_CLASSIFIER_TRAINING_FILE
+rather than by growing this module; entries here should stay short and
+representative of a single intent.
+"""
+
+INTENT_CORPUS: tuple[tuple[str, str], ...] = (
+    # auth — English
+    ("Hi", "auth"),
+    ("Hello", "auth"),
+    ("Good morning", "auth"),
+    ("I want to register", "auth"),
+    ("I need to create an account", "auth"),
+    ("How do I sign up?", "auth"),
+    ("I didn't receive the OTP", "auth"),
+    ("My OTP code is 123456", "auth"),
+    ("Send me a new verification code", "auth"),
+    ("I want to log in", "auth"),
+    ("I forgot my password", "auth"),
+    ("Verify my phone number", "auth"),
+    ("I'm new here", "auth"),
+    ("Can I register with my email address?", "auth"),
+    ("The code expired", "auth"),
+    ("Resend the code please", "auth"),
+    ("I want to sign in to my account", "auth"),
+    ("How do I verify my identity?", "auth"),
+    ("Please register me", "auth"),
+    ("I need to upload my proof of residence", "auth"),
+    # auth — isiZulu
+    ("Sawubona", "auth"),
+    ("Ngifuna ukubhalisa", "auth"),
+    ("Angiyitholanga ikhodi ye-OTP", "auth"),
+    ("Ngicela ikhodi entsha", "auth"),
+    ("Ngifuna ukungena ku-akhawunti yami", "auth"),
+    ("Ngikhohlwe iphasiwedi yami", "auth"),
+    ("Ngingabhalisa kanjani?", "auth"),
+    ("Ngicela ungibhalise", "auth"),
+    ("Ikhodi yami ithi 123456", "auth"),
+    ("Ngifuna ukuqinisekisa inombolo yami yocingo", "auth"),
+    # auth — Afrikaans
+    ("Goeie môre", "auth"),
+    ("Ek wil registreer", "auth"),
+    ("Ek het nie die OTP ontvang nie", "auth"),
+    ("Stuur asseblief 'n nuwe kode", "auth"),
+    ("Ek wil inteken", "auth"),
+    ("Ek het my wagwoord vergeet", "auth"),
+    ("Hoe registreer ek?", "auth"),
+    ("My kode is 123456", "auth"),
+    ("Ek wil my foonnommer verifieer", "auth"),
+    ("Ek wil 'n rekening skep", "auth"),
+    # municipal — English
+    ("There is a water leak on Main Road", "municipal"),
+    ("A pipe burst outside my house", "municipal"),
+    ("My electricity has been off since yesterday", "municipal"),
+    ("There's a big pothole in our street", "municipal"),
+    ("The streetlights are not working", "municipal"),
+    ("Rubbish has not been collected for two weeks", "municipal"),
+    ("Sewage is overflowing into the street", "municipal"),
+    ("No water in our area since yesterday", "municipal"),
+    ("The traffic light is broken at the intersection", "municipal"),
+    ("Illegal dumping next to the park", "municipal"),
+    ("The drain is blocked and the road is flooding", "municipal"),
+    ("Power outage in my area", "municipal"),
+    ("The road is full of potholes", "municipal"),
+    ("My water meter is leaking", "municipal"),
+    ("I want to report a broken water main", "municipal"),
+    ("The garbage bins were not emptied", "municipal"),
+    ("A transformer exploded in our area", "municipal"),
+    ("The public toilets at the taxi rank are broken", "municipal"),
+    ("There is a sewer smell near the school", "municipal"),
+    ("The stormwater drain is blocked", "municipal"),
+    ("I'd like to report a burst pipe", "municipal"),
+    # municipal — isiZulu
+    ("Amanzi ayachichima emgwaqweni", "municipal"),
+    ("Awekho amanzi endaweni yethu kusukela izolo", "municipal"),
+    ("Ugesi ucimile kusukela ekuseni", "municipal"),
+    ("Kunomgodi omkhulu emgwaqweni", "municipal"),
+    ("Izibani zasemgwaqweni azisebenzi", "municipal"),
+    ("Udoti awuthathwanga amasonto amabili", "municipal"),
+    ("Ipayipi liqhekekile phambi kwendlu yami", "municipal"),
+    ("Indle ichichima emgwaqweni", "municipal"),
+    ("Irobhothi alisebenzi empambanweni yemigwaqo", "municipal"),
+    ("Kulahlwa udoti eduze nepaki", "municipal"),
+    # municipal — Afrikaans
+    ("Daar is 'n waterlek in Hoofstraat", "municipal"),
+    ("Ons het geen water sedert gister nie", "municipal"),
+    ("Die krag is af sedert vanoggend", "municipal"),
+    ("Daar is 'n groot slaggat in die pad", "municipal"),
+    ("Die straatligte werk nie", "municipal"),
+    ("Die vullis is al twee weke nie verwyder nie", "municipal"),
+    ("Die pyp het voor my huis gebars", "municipal"),
+    ("Die riool loop oor in die straat", "municipal"),
+    ("Die verkeerslig by die kruising is stukkend", "municipal"),
+    ("Onwettige storting langs die park", "municipal"),
+    ("Ek wil 'n waterlek aanmeld", "municipal"),
+    # ticket_status — English
+    ("What is the status of my ticket?", "ticket_status"),
+    ("Check ticket TKT-20260225-ABC123", "ticket_status"),
+    ("Any update on my report?", "ticket_status"),
+    ("Has my complaint been resolved?", "ticket_status"),
+    ("When will my pothole report be fixed?", "ticket_status"),
+    ("I reported a leak last week, what is happening with it?", "ticket_status"),
+    ("Track my report", "ticket_status"),
+    ("What's the progress on TKT-20260301-XYZ789?", "ticket_status"),
+    ("Status update please", "ticket_status"),
+    ("My reference number is TKT-20260110-AB12CD", "ticket_status"),
+    ("Has a team been assigned to my report?", "ticket_status"),
+    ("Why is my ticket still open?", "ticket_status"),
+    ("Follow up on my water complaint", "ticket_status"),
+    ("How long until my report is resolved?", "ticket_status"),
+    ("Show me my open tickets", "ticket_status"),
+    ("Please check my reference number", "ticket_status"),
+    ("Did you fix the streetlight I reported?", "ticket_status"),
+    ("I want to know the status of my complaint", "ticket_status"),
+    ("Where is my report at?", "ticket_status"),
+    ("Is there any news on ticket 4821?", "ticket_status"),
+    # ticket_status — isiZulu
+    ("Sithini isimo sethikithi lami?", "ticket_status"),
+    ("Ngicela ukubheka i-TKT-20260225-ABC123", "ticket_status"),
+    ("Ingabe isikhalazo sami sesixazululiwe?", "ticket_status"),
+    ("Ngibike ukuvuza kwamanzi ngesonto eledlule, kwenzekani manje?", "ticket_status"),
+    ("Ngicela isibuyekezo ngombiko wami", "ticket_status"),
+    ("Inombolo yami yereferensi ngu-TKT-20260110-AB12CD", "ticket_status"),
+    ("Sekukhona yini othunyelwe embikweni wami?", "ticket_status"),
+    ("Kuzothatha isikhathi esingakanani ukulungisa umbiko wami?", "ticket_status"),
+    ("Ngifuna ukwazi isimo sesikhalazo sami", "ticket_status"),
+    ("Ithikithi lami lisavulekile yini?", "ticket_status"),
+    # ticket_status — Afrikaans
+    ("Wat is die status van my kaartjie?", "ticket_status"),
+    ("Kyk asseblief na TKT-20260225-ABC123", "ticket_status"),
+    ("Is my klagte al opgelos?", "ticket_status"),
+    ("Enige nuus oor my verslag?", "ticket_status"),
+    ("Ek het verlede week 'n lek aangemeld, wat gebeur daarmee?", "ticket_status"),
+    ("My verwysingsnommer is TKT-20260110-AB12CD", "ticket_status"),
+    ("Is daar al 'n span aan my verslag toegewys?", "ticket_status"),
+    ("Hoe lank gaan dit neem om my verslag af te handel?", "ticket_status"),
+    ("Ek wil die vordering van my klagte weet", "ticket_status"),
+    ("Hoekom is my kaartjie nog oop?", "ticket_status"),
+    # gbv — English
+    ("My partner is threatening me and I need help", "gbv"),
+    ("My husband beats me", "gbv"),
+    ("I was assaulted by my boyfriend", "gbv"),
+    ("I am scared to go home because he hits me", "gbv"),
+    ("Someone is abusing my sister", "gbv"),
+    ("I was raped", "gbv"),
+    ("My ex keeps stalking me and threatens to kill me", "gbv"),
+    ("I need a protection order", "gbv"),
+    ("My father hurts my mother every night", "gbv"),
+    ("I am being sexually harassed at home", "gbv"),
+    ("He locked me in the house and took my phone", "gbv"),
+    ("There is domestic violence at my neighbour's house", "gbv"),
+    ("My partner forces me to have sex", "gbv"),
+    ("I want to report abuse", "gbv"),
+    ("I am not safe at home", "gbv"),
+    ("He threatened me with a knife", "gbv"),
+    ("My child is being abused", "gbv"),
+    ("Gender based violence", "gbv"),
+    ("My boyfriend hit me again last night", "gbv"),
+    ("I need a place of safety", "gbv"),
+    # gbv — isiZulu
+    ("Umyeni wami uyangishaya", "gbv"),
+    ("Ngihlukunyezwa ekhaya", "gbv"),
+    ("Isoka lami lisongela ukungibulala", "gbv"),
+    ("Ngidlwenguliwe", "gbv"),
+    ("Ngiyesaba ukuya ekhaya ngoba uyangishaya", "gbv"),
+    ("Udadewethu uyahlukunyezwa", "gbv"),
+    ("Ngidinga usizo, umlingani wami uyangihlukumeza", "gbv"),
+    ("Ubaba ushaya umama njalo ebusuku", "gbv"),
+    ("Angiphephile ekhaya", "gbv"),
+    ("Ngifuna ukubika udlame lwasekhaya", "gbv"),
+    # gbv — Afrikaans
+    ("My man slaan my", "gbv"),
+    ("My kêrel dreig om my dood te maak", "gbv"),
+    ("Ek word by die huis mishandel", "gbv"),
+    ("Ek is verkrag", "gbv"),
+    ("Ek is bang om huis toe te gaan want hy slaan my", "gbv"),
+    ("My suster word mishandel", "gbv"),
+    ("Ek het 'n beskermingsbevel nodig", "gbv"),
+    ("Ek is nie veilig by die huis nie", "gbv"),
+    ("Hy het my met 'n mes gedreig", "gbv"),
+    ("Ek wil gesinsgeweld aanmeld", "gbv"),
+)
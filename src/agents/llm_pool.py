@@ -0,0 +1,229 @@
+"""Bounded per-provider execution pool for blocking crew kickoffs.
+
+CrewAI's Crew.kickoff() is synchronous and spends almost all of its time
+waiting on the LLM provider. BaseCrew.kickoff used to hand it to the event
+loop's default executor, so every concurrent chat competed for the same
+unbounded pool with no queueing limit and no visibility; under a load spike
+(e.g. a metro-wide outage) threads piled up until latency collapsed for
+everyone.
+
+Each provider (DeepSeek, OpenAI) now gets its own ThreadPoolExecutor sized
+by settings, plus an admission check in front of it:
+- queue full (in-flight + waiting >= concurrency + LLM_POOL_MAX_QUEUE)
+  -> LLMPoolBusy(reason="full") immediately
+- deadline: callers set a turn deadline with llm_deadline(); a kickoff that
+  could not even start before it (estimated from the queue ahead and the
+  moving-average run time) is refused up front (reason="deadline"), and one
+  dequeued after its deadline is dropped without calling the provider
+  (reason="expired"). Run time alone never causes a refusal, so a slow
+  provider degrades to slow replies rather than refusing every turn
+
+Entry points turn LLMPoolBusy into a fast "busy" reply: 429 with
+Retry-After in crew_server.chat, a TwiML busy message in the inline WhatsApp
+webhook, and a deferred retry in the WhatsApp inbox worker.
+
+Metrics (src/core/metrics.py), all labelled by provider:
+- llm_pool_queue_depth, llm_pool_in_flight (gauges)
+- llm_pool_wait_seconds, llm_pool_run_seconds (summaries)
+- llm_pool_rejected_total{reason} (counter)
+
+Key decisions:
+- Accounting is thread-level (a lock, not an asyncio.Semaphore): the pool
+  is shared by the API event loop and the per-task loops Celery workers
+  create with asyncio.run()
+- The deadline travels in a ContextVar so IntakeFlow and the crews need no
+  extra parameter; Flow listener tasks inherit it from the caller
+"""
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from src.core.config import settings
+from src.core.metrics import metrics
+
+# Monotonic timestamp the current turn must finish by (None = no deadline)
+_deadline: ContextVar[float | None] = ContextVar("llm_deadline", default=None)
+
+# Weight of the newest sample in the run-time moving average
+_EWMA_ALPHA = 0.2
+
+
+class LLMPoolBusy(Exception):
+    """The provider pool cannot take this kickoff; answer "busy" and retry later."""
+
+    def __init__(self, provider: str, reason: str, retry_after: float):
+        self.provider = provider
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"LLM pool for {provider} is busy ({reason})")
+
+    @property
+    def retry_after_header(self) -> str:
+        """Whole seconds for a Retry-After header (at least 1)."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+@contextmanager
+def llm_deadline(seconds: float | None):
+    """Set the deadline for LLM work started inside the block (None clears it)."""
+    token = _deadline.set(time.monotonic() + seconds if seconds else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def provider_for(llm) -> str:
+    """Pool name for an LLM instance: "deepseek" or "openai"."""
+    model = str(getattr(llm, "model", "") or "")
+    return "deepseek" if model.startswith("deepseek") else "openai"
+
+
+class ProviderPool:
+    """Fixed worker threads plus a bounded, deadline-aware admission queue."""
+
+    def __init__(self, provider: str, max_concurrency: int, max_queue: int):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix=f"llm-{provider}"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._in_flight = 0
+        self._avg_run_seconds = 0.0
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _publish(self) -> None:
+        metrics.set_gauge("llm_pool_queue_depth", self._queued, provider=self.provider)
+        metrics.set_gauge("llm_pool_in_flight", self._in_flight, provider=self.provider)
+
+    def _estimated_wait(self) -> float:
+        """Queue wait for a new arrival, from the average run time (lock held)."""
+        if self._in_flight + self._queued < self.max_concurrency:
+            return 0.0
+        ahead = self._in_flight + self._queued - self.max_concurrency + 1
+        return math.ceil(ahead / self.max_concurrency) * self._avg_run_seconds
+
+    def _reject(self, reason: str, retry_after: float) -> LLMPoolBusy:
+        metrics.inc("llm_pool_rejected_total", provider=self.provider, reason=reason)
+        return LLMPoolBusy(self.provider, reason, retry_after)
+
+    async def run(self, fn: Callable[[], Any], deadline: float | None = None) -> Any:
+        """Run a blocking callable on this provider's threads.
+
+        Args:
+            fn: Zero-argument blocking callable (e.g. lambda: crew.kickoff(...))
+            deadline: Monotonic time the result is needed by; defaults to the
+                llm_deadline() in effect
+
+        Raises:
+            LLMPoolBusy: queue full, deadline unreachable, or expired in queue
+        """
+        if deadline is None:
+            deadline = _deadline.get()
+
+        with self._lock:
+            estimated_wait = self._estimated_wait()
+            if self._in_flight + self._queued >= self.max_concurrency + self.max_queue:
+                raise self._reject("full", estimated_wait or 1.0)
+            if deadline is not None and time.monotonic() + estimated_wait > deadline:
+                raise self._reject("deadline", estimated_wait or 1.0)
+            self._queued += 1
+            self._publish()
+
+        enqueued_at = time.monotonic()
+        state = {"started": False, "abandoned": False}
+
+        def _work():
+            with self._lock:
+                if state["abandoned"]:
+                    return None
+                state["started"] = True
+                self._queued -= 1
+                self._in_flight += 1
+                self._publish()
+            started = time.monotonic()
+            metrics.observe("llm_pool_wait_seconds", started - enqueued_at, provider=self.provider)
+            expired = deadline is not None and started > deadline
+            try:
+                if expired:
+                    raise self._reject("expired", self._avg_run_seconds or 1.0)
+                return fn()
+            finally:
+                elapsed = time.monotonic() - started
+                with self._lock:
+                    self._in_flight -= 1
+                    if not expired:
+                        self._avg_run_seconds = (
+                            elapsed if self._avg_run_seconds == 0.0
+                            else (1 - _EWMA_ALPHA) * self._avg_run_seconds + _EWMA_ALPHA * elapsed
+                        )
+                    self._publish()
+                if not expired:
+                    metrics.observe("llm_pool_run_seconds", elapsed, provider=self.provider)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, _work)
+        except asyncio.CancelledError:
+            # Caller went away while still queued: release the slot now
+            with self._lock:
+                if not state["started"]:
+                    state["abandoned"] = True
+                    self._queued -= 1
+                    self._publish()
+            raise
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LLMPool:
+    """Process-wide registry of provider pools, created lazily from settings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: dict[str, ProviderPool] = {}
+
+    def get(self, provider: str) -> ProviderPool:
+        pool = self._pools.get(provider)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(provider)
+                if pool is None:
+                    concurrency = (
+                        settings.LLM_POOL_DEEPSEEK_CONCURRENCY
+                        if provider == "deepseek"
+                        else settings.LLM_POOL_OPENAI_CONCURRENCY
+                    )
+                    pool = ProviderPool(provider, concurrency, settings.LLM_POOL_MAX_QUEUE)
+                    self._pools[provider] = pool
+        return pool
+
+    async def run(self, llm, fn: Callable[[], Any]) -> Any:
+        """Run fn on the pool of llm's provider (see ProviderPool.run)."""
+        return await self.get(provider_for(llm)).run(fn)
+
+    def reset(self) -> None:
+        """Shut down and forget all pools (tests, settings changes)."""
+        with self._lock:
+            for pool in self._pools.values():
+                pool.shutdown()
+            self._pools.clear()
+
+
+llm_pool = LLMPool()
@@ -0,0 +1,132 @@
+"""Forward LLM tokens of a crew run to a streaming HTTP response.
+
+POST /api/v1/chat/stream (src/api/v1/crew_server.py) opens a ReplyStream
+for the turn with reply_stream(). BaseCrew.kickoff runs its crew inside
+stream_llm(), which switches that turn's LLM to streaming and routes the
+LLMStreamChunkEvents CrewAI emits for it into the ReplyStream. The endpoint
+consumes the stream and passes every chunk through the incremental
+sanitizer before anything is sent.
+
+Key decisions:
+- Chunks are routed by LLM instance (the event source), not by thread: the
+  crew runs on an llm_pool worker and CrewAI may dispatch event handlers
+  on threads of its own. LLM instances are created per turn (src/agents/
+  llm.py), so one instance never serves two requests
+- Crews opt out with BaseCrew.stream_tokens = False (GBVCrew: its output
+  guardrail may reject and retry an answer, and a rejected draft must never
+  reach the citizen)
+- LLMCallStartedEvent marks call boundaries (tool rounds, conversion
+  calls), so the sanitizer can tell reasoning calls from the answer
+- Handlers are registered on the CrewAI event bus once, on first use
+- Streaming is best effort: a chunk pushed after the stream closed is
+  dropped, and the final "done" event always carries the full reply
+"""
+import asyncio
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Marker pushed between LLM calls of one crew run
+CALL_START = object()
+
+_current_stream: ContextVar["ReplyStream | None"] = ContextVar("reply_stream", default=None)
+
+# id(LLM instance) -> stream, while that LLM's crew is running
+_streams: dict[int, "ReplyStream"] = {}
+_handlers_lock = threading.Lock()
+_handlers_registered = False
+
+
+class ReplyStream:
+    """Thread-safe chunk queue feeding one streaming response.
+
+    push() may be called from any thread; iterate on the event loop that
+    created the stream. Iteration ends after close().
+    """
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._closed = False
+
+    def push(self, item) -> None:
+        """Queue a text chunk (or CALL_START); ignored once closed."""
+        if not self._closed:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, item)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self._queue.get()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+
+@contextmanager
+def reply_stream(stream: ReplyStream):
+    """Route tokens of crews kicked off inside the block into stream."""
+    token = _current_stream.set(stream)
+    try:
+        yield stream
+    finally:
+        _current_stream.reset(token)
+
+
+def _on_chunk(source, event) -> None:
+    stream = _streams.get(id(source))
+    if stream is not None and event.chunk:
+        stream.push(event.chunk)
+
+
+def _on_call_started(source, event) -> None:
+    stream = _streams.get(id(source))
+    if stream is not None:
+        stream.push(CALL_START)
+
+
+def _register_handlers() -> None:
+    global _handlers_registered
+    with _handlers_lock:
+        if _handlers_registered:
+            return
+        try:
+            from crewai.events import LLMCallStartedEvent, LLMStreamChunkEvent, crewai_event_bus
+        except ImportError:  # CrewAI < 1.0
+            from crewai.utilities.events import (
+                LLMCallStartedEvent,
+                LLMStreamChunkEvent,
+                crewai_event_bus,
+            )
+
+        crewai_event_bus.on(LLMStreamChunkEvent)(_on_chunk)
+        crewai_event_bus.on(LLMCallStartedEvent)(_on_call_started)
+        _handlers_registered = True
+
+
+@contextmanager
+def stream_llm(llm, enabled: bool = True):
+    """Stream llm's tokens into the current ReplyStream for the block, if any.
+
+    No-op when no reply_stream() is active or enabled is False.
+    """
+    stream = _current_stream.get()
+    if stream is None or not enabled:
+        yield
+        return
+
+    _register_handlers()
+    previous = getattr(llm, "stream", False)
+    llm.stream = True
+    _streams[id(llm)] = stream
+    try:
+        yield
+    finally:
+        _streams.pop(id(llm), None)
+        llm.stream = previous
@@ -9,6 +9,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.audit import set_audit_context
 from src.core.database import get_db
+from src.core.principal_cache import (
+    attach_cached_user,
+    principal_cache,
+    principal_values,
+    token_digest,
+)
 from src.core.security import verify_supabase_token
 from src.core.tenant import set_tenant_context
 from src.models.user import User, UserRole
@@ -88,20 +94,24 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Check Redis JWT blacklist (Phase 27 — force-logout on role change).
-    # Fail-open on Redis connection errors: a Redis outage must not lock out users.
+    # Check the JWT blacklist (Phase 27 — force-logout on role change).
+    # Answered from the in-process revocation mirror; fails closed when the
+    # mirror has lost sync with Redis (src/core/revocation.py).
+    from src.core.revocation import RevocationStateUnavailable  # noqa: PLC0415
+    from src.services.rbac_service import is_token_blacklisted  # noqa: PLC0415
     try:
-        from src.services.rbac_service import is_token_blacklisted  # noqa: PLC0415
-        if await is_token_blacklisted(token):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token has been revoked",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-    except HTTPException:
-        raise  # re-raise our own 401
-    except Exception as exc:  # noqa: BLE001 — Redis connection failure
-        logger.warning("Redis blacklist check failed (fail-open): %s", exc)
+        revoked = await is_token_blacklisted(token)
+    except RevocationStateUnavailable:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication temporarily unavailable",
+        )
+    if revoked:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     # Extract user_id from "sub" claim (Supabase Auth user ID)
     user_id: str | None = payload.get("sub")
@@ -121,9 +131,16 @@ async def get_current_user(
     if tenant_id:
         set_tenant_context(tenant_id)
 
-    # Query user from database
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # Reuse the user row cached for this token, else query and cache it
+    digest = token_digest(token)
+    cached = principal_cache.get(user_id, digest)
+    if cached is not None:
+        user = attach_cached_user(cached, db)
+    else:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if user is not None and user.is_active:
+            principal_cache.put(user_id, digest, principal_values(user))
 
     # Validate user exists and is active
     if user is None or not user.is_active:
@@ -11,13 +11,14 @@ Security:
 import logging
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
 from src.api.deps import get_current_user, get_db, require_role
+from src.core.pagination import count_total, keyset_page, resolve_total_mode
 from src.middleware.rate_limit import SENSITIVE_READ_RATE_LIMIT, limiter
 from src.models.audit_log import AuditLog
 from src.models.user import User, UserRole
@@ -47,11 +48,17 @@ class AuditLogEntry(BaseModel):
 
 
 class AuditLogListResponse(BaseModel):
-    """Paginated audit log list response."""
+    """Paginated audit log list response.
+
+    next_cursor is set in cursor mode (None on the last page). total is None
+    when counting was skipped (total_mode="none").
+    """
     logs: list[AuditLogEntry]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 @router.get("/", response_model=AuditLogListResponse)
@@ -64,11 +71,20 @@ async def list_audit_logs(
     page_size: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE, description="Records per page"),
     table_name: str | None = Query(default=None, description="Filter by table name"),
     operation: str | None = Query(default=None, description="Filter by operation (CREATE, READ, UPDATE, DELETE)"),
+    cursor: str | None = Query(default=None, description="Opaque cursor from a previous next_cursor"),
+    cursor_mode: bool = Query(default=False, description="Use keyset pagination (first page)"),
+    total_mode: str | None = Query(
+        default=None,
+        pattern="^(exact|estimate|none)$",
+        description="exact COUNT, planner estimate or none (default exact; none in cursor mode)",
+    ),
 ) -> AuditLogListResponse:
     """List audit logs for the current admin's tenant.
 
     Paginated, ordered by timestamp descending (most recent first).
     ADMIN role only — the most sensitive data access endpoint.
+    Cursor mode (cursor_mode=true or a cursor) pages by (timestamp, id)
+    instead of OFFSET, so deep pages cost the same as the first.
 
     Args:
         current_user: Authenticated ADMIN
@@ -77,12 +93,16 @@ async def list_audit_logs(
         page_size: Records per page (max 100)
         table_name: Optional filter by table name
         operation: Optional filter by operation type
+        cursor: Cursor for the next page (cursor mode)
+        cursor_mode: Start cursor pagination without a cursor
+        total_mode: "exact", "estimate" or "none" (default exact, none in
+            cursor mode so pages do not pay for a COUNT(*))
 
     Returns:
         Paginated audit log entries with total count
 
     Raises:
-        HTTPException: 403 if user not ADMIN
+        HTTPException: 400 if cursor invalid, 403 if user not ADMIN
     """
     tenant_id_str = str(current_user.tenant_id)
 
@@ -97,22 +117,31 @@ async def list_audit_logs(
     if operation:
         base_query = base_query.where(AuditLog.operation == operation)
 
-    # Count total matching records
-    count_query = select(func.count()).select_from(
-        base_query.subquery()
-    )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Fetch paginated results, most recent first
-    offset = (page - 1) * page_size
-    result = await db.execute(
-        base_query
-        .order_by(AuditLog.timestamp.desc())
-        .offset(offset)
-        .limit(page_size)
-    )
-    logs = result.scalars().all()
+    next_cursor = None
+    total_mode = resolve_total_mode(total_mode, cursor_mode or bool(cursor))
+    if cursor_mode or cursor:
+        # Keyset pagination, most recent first
+        try:
+            logs, next_cursor = await keyset_page(
+                db, base_query, AuditLog.timestamp, AuditLog.id,
+                "timestamp", True, page_size, cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        total, is_estimate = await count_total(db, base_query, total_mode)
+    else:
+        # Count total matching records
+        total, is_estimate = await count_total(db, base_query, total_mode)
+
+        # Fetch paginated results, most recent first
+        offset = (page - 1) * page_size
+        result = await db.execute(
+            base_query
+            .order_by(AuditLog.timestamp.desc())
+            .offset(offset)
+            .limit(page_size)
+        )
+        logs = result.scalars().all()
 
     # Convert model operation enum to string for serialization
     log_entries = []
@@ -137,4 +166,6 @@ async def list_audit_logs(
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
+        total_is_estimate=is_estimate,
     )
@@ -16,12 +16,13 @@ import logging
 from typing import Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import and_, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
 from src.api.deps import get_current_user, get_db, require_role
+from src.core.pagination import keyset_page
 from src.middleware.rate_limit import SENSITIVE_READ_RATE_LIMIT, limiter
 from src.models.assignment import TicketAssignment
 from src.models.team import Team
@@ -48,6 +49,8 @@ async def get_my_reports(
     status_filter: str | None = None,
     page: int = 0,
     page_size: int = 50,
+    cursor: str | None = None,
+    cursor_mode: bool = False,
 ) -> CitizenMyReportsResponse:
     """Get all tickets created by the current citizen.
 
@@ -60,6 +63,8 @@ async def get_my_reports(
         status_filter: Optional filter by status (open, in_progress, resolved, etc.)
         page: Page number (0-indexed)
         page_size: Number of results per page
+        cursor: Opaque cursor from a previous next_cursor (keyset pagination)
+        cursor_mode: Use keyset pagination for the first page
 
     Returns:
         List of tickets with appropriate field filtering based on sensitivity
@@ -76,14 +81,25 @@ async def get_my_reports(
     if status_filter:
         query = query.where(Ticket.status == status_filter)
 
-    # Order by newest first
-    query = query.order_by(Ticket.created_at.desc())
+    next_cursor = None
+    if cursor_mode or cursor:
+        # Keyset pagination over (created_at, id), newest first
+        try:
+            tickets, next_cursor = await keyset_page(
+                db, query, Ticket.created_at, Ticket.id,
+                "created_at", True, page_size, cursor,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    else:
+        # Order by newest first
+        query = query.order_by(Ticket.created_at.desc())
 
-    # Pagination
-    query = query.offset(page * page_size).limit(page_size)
+        # Pagination
+        query = query.offset(page * page_size).limit(page_size)
 
-    result = await db.execute(query)
-    tickets = result.scalars().all()
+        result = await db.execute(query)
+        tickets = result.scalars().all()
 
     # Format tickets based on sensitivity
     formatted_tickets: list[Union[CitizenTicketResponse, CitizenGBVTicketResponse]] = []
@@ -177,6 +193,7 @@ async def get_my_reports(
     return CitizenMyReportsResponse(
         tickets=formatted_tickets,
         total=total,
+        next_cursor=next_cursor,
     )
 
 
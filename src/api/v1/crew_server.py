@@ -12,6 +12,7 @@ Or:
 Endpoints:
     GET  /api/v1/health          — Server status check
     POST /api/v1/chat            — Main intake: phone detection + agent routing
+    POST /api/v1/chat/stream     — Same turn as /chat, reply streamed as SSE
     POST /api/v1/session/reset   — Clear conversation state for a phone number
 
 Security:
@@ -31,12 +32,16 @@ GBV safety:
     Only metadata: agent_name, turn_count, session_status (per Pitfall 6).
 
 Multi-turn state:
-    Full conversation history injected into each crew call as formatted string
-    (per Pitfall 3 — state injection is the correct CrewAI multi-turn pattern).
+    Conversation history injected into each crew call as formatted string
+    (per Pitfall 3 — state injection is the correct CrewAI multi-turn pattern):
+    recent turns verbatim within a per-agent token budget, older turns as a
+    rolling summary (src/core/history.py).
 """
 import asyncio
+import json
 import os
 import re
+from contextlib import asynccontextmanager
 
 # Load .env into os.environ BEFORE the setdefault below.
 # Pydantic Settings loads .env into the settings object but NOT os.environ,
@@ -56,12 +61,19 @@ from fastapi import FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, field_validator
 from sqlalchemy import create_engine
+from sse_starlette.sse import EventSourceResponse
 from sqlalchemy.orm import Session
 from starlette.requests import Request
 
+from src.agents.llm_pool import LLMPoolBusy, llm_deadline
+from src.agents.streaming import CALL_START, ReplyStream, reply_stream
 from src.core.config import settings
 from src.core.conversation import ConversationManager, ConversationState
+from src.core.history import build_history
 from src.core.language import language_detector
+from src.core.redis_pool import close_redis, get_redis, init_redis
+from src.guardrails.compiled import PatternSet
+from src.guardrails.output_filters import sanitize_output
 from src.middleware.rate_limit import (
     CREW_CHAT_RATE_LIMIT,
     CREW_RESET_RATE_LIMIT,
@@ -206,6 +218,22 @@ class HealthResponse(BaseModel):
 # FastAPI application
 # ---------------------------------------------------------------------------
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared Redis pool; without Redis, state falls back to memory.
+
+    Also loads the language models up front so the first chat turn does not
+    pay for them.
+    """
+    global _conversation_manager
+    if not await init_redis():
+        await close_redis()
+    await asyncio.to_thread(language_detector.preload)
+    yield
+    _conversation_manager = None
+    await close_redis()
+
+
 crew_app = FastAPI(
     title="SALGA Crew Server",
     description=(
@@ -213,6 +241,7 @@ crew_app = FastAPI(
         "Designed for Streamlit dashboard integration and local testing."
     ),
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS — matches main app security posture (explicit origins, no wildcard)
@@ -233,11 +262,15 @@ setup_rate_limiting(crew_app)
 
 _conversation_manager: ConversationManager | InMemoryConversationManager | None = None
 
+# Streamed turns outlive a disconnected client; keep them referenced until done
+_background_turns: set[asyncio.Task] = set()
+
 
 def _get_conversation_manager() -> ConversationManager | InMemoryConversationManager:
     """Lazy-initialise the shared ConversationManager.
 
-    Tries Redis first; falls back to in-memory dict if Redis is unavailable.
+    Uses the pooled Redis client opened (and pinged) in the lifespan handler;
+    falls back to an in-memory dict if Redis was unavailable at startup.
     In-memory mode is logged once and is suitable for local testing.
 
     Returns:
@@ -245,13 +278,12 @@ def _get_conversation_manager() -> ConversationManager | InMemoryConversationMan
     """
     global _conversation_manager
     if _conversation_manager is None:
-        try:
-            import redis as sync_redis
-            r = sync_redis.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=2)
-            r.ping()
-            r.close()
-            _conversation_manager = ConversationManager(settings.REDIS_URL)
-        except Exception:
+        redis_client = get_redis()
+        if redis_client is not None:
+            _conversation_manager = ConversationManager(
+                settings.REDIS_URL, redis_client=redis_client
+            )
+        else:
             import logging
             logging.getLogger(__name__).warning(
                 "Redis unavailable — using in-memory conversation state (testing mode)"
@@ -322,29 +354,23 @@ def _validate_api_key(x_api_key: str | None) -> None:
 # Conversation history formatting
 # ---------------------------------------------------------------------------
 
-def _format_history(turns: list[dict]) -> str:
-    """Format conversation turns as a human-readable string for crew injection.
+def _format_history(state: ConversationState, pending_turns: list[dict] | None = None) -> str:
+    """Format conversation history for crew injection within a token budget.
 
-    Each turn is displayed as "User: ..." or "Agent: ...".
-    This string is injected into crew task descriptions for multi-turn
-    state continuity (per research Pitfall 3).
+    The most recent turns are shown verbatim ("User: ..." / "Agent: ...");
+    older ones are compacted into the rolling summary on the state (see
+    src/core/history.py). This string is injected into crew task
+    descriptions for multi-turn state continuity (per research Pitfall 3).
 
     Args:
-        turns: List of turn dicts with keys: role, content, timestamp.
+        state: Conversation state; its summary fields may advance, so callers
+            persist it when state.summarized_turns changes.
+        pending_turns: Turns not yet persisted (e.g. the current message).
 
     Returns:
         Formatted conversation history string, or "(none)" if empty.
     """
-    if not turns:
-        return "(none)"
-
-    lines = []
-    for turn in turns:
-        role = turn.get("role", "user").capitalize()
-        content = turn.get("content", "")
-        lines.append(f"{role}: {content}")
-
-    return "\n".join(lines)
+    return build_history(state, pending_turns or ())
 
 
 # ---------------------------------------------------------------------------
@@ -383,6 +409,25 @@ _DELEGATION_ARTIFACT_PATTERNS = [
     r"^According to (?:my|the) (?:instructions|assignment).*$",  # Instructions narration
 ]
 
+# Both tables compiled once (src/guardrails/compiled.py): a line is matched
+# against all patterns in one call. "final_answer" lines keep their content.
+_FINAL_ANSWER_LINE = r"^Final Answer:?\s*"
+_LINE_ARTIFACTS = PatternSet(
+    [("final_answer" if p == _FINAL_ANSWER_LINE else "llm", p) for p in _LLM_ARTIFACT_PATTERNS]
+    + [("delegation", p) for p in _DELEGATION_ARTIFACT_PATTERNS],
+    re.IGNORECASE,
+)
+_DELEGATION_LINES = PatternSet(
+    [("delegation", p) for p in _DELEGATION_ARTIFACT_PATTERNS], re.IGNORECASE
+)
+_FINAL_ANSWER_TAIL_RE = re.compile(r"Final Answer:?\s*(.+)", re.DOTALL | re.IGNORECASE)
+_JSON_BLOB_RE = re.compile(r'\{[^{}]*"(?:tracking_number|error|id|status)"[^{}]*\}')
+# Raw exception traces and error text, up to the next blank line
+_ERROR_BLOCK_RE = re.compile(
+    r"Traceback \(most recent call last\):.*?(?=\n\n|\Z)|(?:Error|Exception):.*?(?=\n\n|\Z)",
+    re.DOTALL,
+)
+
 # GBV confirmation messages — shown before routing to GBVCrew/SAPS.
 # Citizen must explicitly confirm (YES) before their report is forwarded
 # to emergency services. Includes emergency numbers in all 3 languages.
@@ -468,12 +513,12 @@ def sanitize_reply(
     text = raw.strip()
 
     # 1. If "Final Answer:" marker exists, take everything AFTER it
-    final_match = re.search(r"Final Answer:?\s*(.+)", text, re.DOTALL | re.IGNORECASE)
+    final_match = _FINAL_ANSWER_TAIL_RE.search(text)
     if final_match:
         text = final_match.group(1).strip()
 
     # 2. Remove JSON blobs (tool call results embedded in text)
-    text = re.sub(r'\{[^{}]*"(?:tracking_number|error|id|status)"[^{}]*\}', '', text)
+    text = _JSON_BLOB_RE.sub('', text)
 
     # 3. Remove LLM artifact lines and delegation artifact lines
     lines = text.split("\n")
@@ -483,24 +528,19 @@ def sanitize_reply(
         if not stripped:
             continue
         # Skip lines matching artifact patterns (both LLM artifacts and delegation artifacts)
-        skip = False
-        for pattern in _LLM_ARTIFACT_PATTERNS + _DELEGATION_ARTIFACT_PATTERNS:
-            if re.match(pattern, stripped, re.IGNORECASE):
-                # Special case: "Final Answer:" prefix — keep content after it
-                if pattern == r"^Final Answer:?\s*":
-                    stripped = re.sub(r"^Final Answer:?\s*", "", stripped, flags=re.IGNORECASE)
-                    if stripped:
-                        clean_lines.append(stripped)
-                skip = True
-                break
-        if not skip:
+        artifact = _LINE_ARTIFACTS.match(stripped)
+        if artifact is None:
             clean_lines.append(line)
+        elif _LINE_ARTIFACTS.label(artifact) == "final_answer":
+            # Special case: "Final Answer:" prefix — keep content after it
+            stripped = stripped[artifact.end():]
+            if stripped:
+                clean_lines.append(stripped)
 
     text = "\n".join(clean_lines).strip()
 
     # 4. Remove any remaining raw Python exception traces
-    text = re.sub(r"Traceback \(most recent call last\):.*?(?=\n\n|\Z)", "", text, flags=re.DOTALL)
-    text = re.sub(r"(?:Error|Exception):.*?(?=\n\n|\Z)", "", text, flags=re.DOTALL)
+    text = _ERROR_BLOCK_RE.sub("", text)
 
     # 5. If nothing useful remains, use warm fallback
     if not text or len(text) < 10:
@@ -543,34 +583,258 @@ def _validate_crew_output(agent_result: dict, agent_name: str, language: str) ->
 
     # Quick check: if message starts with delegation text, try to extract useful part.
     # (This catches cases where parse_result passed through unsanitized delegation text.)
-    for pattern in _DELEGATION_ARTIFACT_PATTERNS:
-        if re.match(pattern, message.strip(), re.IGNORECASE):
-            # Try to find actual citizen-facing content after the delegation text
-            lines = message.strip().split("\n")
-            citizen_lines = []
-            past_delegation = False
-            for line in lines:
-                stripped = line.strip()
-                if not stripped:
-                    continue
-                is_delegation = any(
-                    re.match(p, stripped, re.IGNORECASE)
-                    for p in _DELEGATION_ARTIFACT_PATTERNS + _LLM_ARTIFACT_PATTERNS
-                )
-                if not is_delegation:
-                    past_delegation = True
-                    citizen_lines.append(line)
-                elif past_delegation:
-                    # Delegation text AFTER citizen text — stop
-                    break
+    if _DELEGATION_LINES.match(message.strip()):
+        # Try to find actual citizen-facing content after the delegation text
+        lines = message.strip().split("\n")
+        citizen_lines = []
+        past_delegation = False
+        for line in lines:
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if not _LINE_ARTIFACTS.match(stripped):
+                past_delegation = True
+                citizen_lines.append(line)
+            elif past_delegation:
+                # Delegation text AFTER citizen text — stop
+                break
 
-            if citizen_lines:
-                return "\n".join(citizen_lines).strip()
-            return _get_fallback(agent_name, language)
+        if citizen_lines:
+            return "\n".join(citizen_lines).strip()
+        return _get_fallback(agent_name, language)
 
     return message
 
 
+# ---------------------------------------------------------------------------
+# Incremental sanitization for streamed replies (POST /api/v1/chat/stream)
+# ---------------------------------------------------------------------------
+
+_FINAL_ANSWER_RE = re.compile(r"Final Answer:?", re.IGNORECASE)
+_REASONING_START_RE = re.compile(r"(?:Thought|Action)\b", re.IGNORECASE)
+_JSON_MESSAGE_RE = re.compile(r'"message"\s*:\s*"')
+# sanitize_reply() drops everything from these markers to the end of the reply
+_ERROR_TAIL_RE = re.compile(r"Traceback \(most recent call last\):|(?:Error|Exception):")
+# Output-guardrail matches that contain spaces: a release point never splits one
+_GUARDED_SPAN_RE = re.compile(
+    r"\b0[6-8]\d[\s-]?\d{3}[\s-]?\d{4}\b|0800\s*150\s*150"
+    r"|\bselect\s+\*\s+from\s+\w+|\binsert\s+into\s+\w+|\bdelete\s+from\s+\w+|\bupdate\s+\w+\s+set",
+    re.IGNORECASE,
+)
+# Matches that run to the end of the line: hold the rest of the line
+_HOLD_LINE_RE = re.compile(r"traceback[:\s]|\{", re.IGNORECASE)
+_JSON_ESCAPES = {"n": "\n", "t": "\t", "r": "", "b": "", "f": ""}
+
+
+class StreamingReplySanitizer:
+    """Incremental sanitize_reply() + output guardrails for streamed LLM tokens.
+
+    feed() takes raw chunks (and CALL_START markers) from a ReplyStream and
+    returns the text that is safe to send now; finish() flushes the rest.
+    Text is held back until it can be checked:
+    - A line is released only once its start can no longer match an artifact
+      or delegation pattern (or the line is complete). Matching lines are
+      dropped; a "Final Answer:" prefix is stripped
+    - Reasoning calls (Thought:/Action:) are skipped up to "Final Answer:";
+      JSON answers (output_pydantic) stream only their "message" value
+    - Within a released line the last _HOLD_CHARS stay buffered and a release
+      point never splits a phone number or SQL fragment, so sanitize_output()
+      masks what it would mask on the whole line
+    - An error/traceback marker ends the stream, as in sanitize_reply()
+
+    The first answer wins: once text was released, later LLM calls of the
+    turn (e.g. the output_pydantic conversion) are ignored. The complete
+    reply in the final "done" event is authoritative.
+    """
+
+    _HOLD_CHARS = 40
+    _DECIDE_CHARS = 80
+    # Artifact patterns that can still match far into the line
+    _LATE_MATCH_PREFIXES = ("i'll ",)
+
+    def __init__(self):
+        self._mode = "probe"  # probe | react | text | json | skip | done
+        self._raw = ""
+        self._in_message = False
+        self._line = ""
+        self._sent = 0
+        self._line_state: str | None = None  # None (undecided) | "clean" | "drop"
+        self._line_emitted = False
+        self._emitted = False
+
+    def feed(self, chunk) -> list[str]:
+        out: list[str] = []
+        if chunk is CALL_START:
+            self._end_call(out)
+            if self._mode != "done":
+                self._mode = "done" if self._emitted else "probe"
+                self._raw, self._in_message = "", False
+        elif self._mode not in ("skip", "done"):
+            self._raw += chunk
+            self._consume(out, final=False)
+        return out
+
+    def finish(self) -> list[str]:
+        out: list[str] = []
+        self._end_call(out)
+        self._mode = "done"
+        return out
+
+    def _end_call(self, out: list[str]) -> None:
+        if self._mode in ("probe", "text", "json"):
+            self._consume(out, final=True)
+            self._complete_line(out)
+        self._line, self._sent, self._line_state, self._line_emitted = "", 0, None, False
+
+    def _consume(self, out: list[str], final: bool) -> None:
+        while True:
+            if self._mode == "probe":
+                head = self._raw.lstrip()
+                if not head or (len(head) < 12 and "\n" not in head and not final):
+                    return
+                if head.startswith(("{", "```")):
+                    self._mode = "json"
+                elif _REASONING_START_RE.match(head):
+                    self._mode = "react"
+                else:
+                    self._mode = "text"
+            elif self._mode == "react":
+                marker = _FINAL_ANSWER_RE.search(self._raw)
+                if marker is None or marker.end() == len(self._raw):
+                    # The marker (or its colon) may straddle chunks
+                    self._raw = self._raw[marker.start():] if marker else self._raw[-16:]
+                    return
+                self._raw = self._raw[marker.end():]
+                self._mode = "probe"
+            elif self._mode == "text":
+                raw, self._raw = self._raw, ""
+                self._text(raw, out)
+                return
+            elif self._mode == "json":
+                self._json(out)
+                return
+            else:
+                return
+
+    def _json(self, out: list[str]) -> None:
+        """Decode the "message" string of a JSON answer as it arrives."""
+        raw = self._raw
+        if not self._in_message:
+            key = _JSON_MESSAGE_RE.search(raw)
+            if key is None:
+                self._raw = raw[-32:]
+                return
+            raw, self._in_message = raw[key.end():], True
+
+        decoded: list[str] = []
+        i = 0
+        while i < len(raw):
+            char = raw[i]
+            if char == '"':
+                self._text("".join(decoded), out)
+                self._complete_line(out)
+                self._raw = ""
+                if self._mode != "done":
+                    self._mode = "skip"
+                return
+            if char == "\\":
+                if i + 1 >= len(raw):
+                    break
+                escape = raw[i + 1]
+                if escape == "u":
+                    if i + 6 > len(raw):
+                        break
+                    try:
+                        decoded.append(chr(int(raw[i + 2:i + 6], 16)))
+                    except ValueError:
+                        pass
+                    i += 6
+                    continue
+                decoded.append(_JSON_ESCAPES.get(escape, escape))
+                i += 2
+                continue
+            decoded.append(char)
+            i += 1
+        self._raw = raw[i:]
+        self._text("".join(decoded), out)
+
+    def _text(self, text: str, out: list[str]) -> None:
+        for part in re.split(r"(\n)", text):
+            if self._mode == "done":
+                return
+            if part == "\n":
+                self._complete_line(out)
+            elif part:
+                self._line += part
+                self._release(out, complete=False)
+
+    def _complete_line(self, out: list[str]) -> None:
+        self._release(out, complete=True)
+        self._line, self._sent, self._line_state, self._line_emitted = "", 0, None, False
+
+    def _release(self, out: list[str], complete: bool) -> None:
+        if self._mode == "done":
+            return
+        line = self._line
+        if self._line_state is None:
+            stripped = line.lstrip()
+            if not stripped.strip():
+                return
+            match = _LINE_ARTIFACTS.match(stripped)
+            if match:
+                if _LINE_ARTIFACTS.label(match) == "final_answer":
+                    self._line_state = "clean"
+                    self._sent = len(line) - len(stripped) + match.end()
+                else:
+                    self._line_state = "drop"
+            else:
+                decided = len(stripped) >= self._DECIDE_CHARS and not stripped.lower().startswith(
+                    self._LATE_MATCH_PREFIXES
+                )
+                if not (complete or decided):
+                    return
+                self._line_state = "clean"
+        if self._line_state == "drop":
+            return
+
+        end = len(line)
+        error = _ERROR_TAIL_RE.search(line, self._sent)
+        if error:
+            end = error.start()
+        elif not complete:
+            hold = _HOLD_LINE_RE.search(line, self._sent)
+            limit = min(len(line) - self._HOLD_CHARS, hold.start() if hold else len(line))
+            end = line.rfind(" ", self._sent, max(limit, self._sent))
+            moved = True
+            while moved and end > self._sent:
+                moved = False
+                for span in _GUARDED_SPAN_RE.finditer(line):
+                    if span.start() < end < span.end():
+                        end, moved = span.start(), True
+            if end <= self._sent:
+                return
+
+        segment, self._sent = line[self._sent:end], end
+        if error:
+            self._emit(segment.rstrip(), out)
+            self._mode = "done"
+        else:
+            self._emit(segment, out)
+
+    def _emit(self, segment: str, out: list[str]) -> None:
+        text = _JSON_BLOB_RE.sub("", segment)
+        if text.strip():
+            text = sanitize_output(text).sanitized_response
+        if not self._emitted:
+            text = text.lstrip()
+        if not text.strip() and not self._line_emitted:
+            return
+        if self._emitted and not self._line_emitted:
+            text = "\n" + text
+        self._emitted = self._line_emitted = True
+        out.append(text)
+
+
 # ---------------------------------------------------------------------------
 # Language preference detection from citizen messages
 # ---------------------------------------------------------------------------
@@ -594,6 +858,11 @@ _LANGUAGE_PREFERENCE_PATTERNS = {
         r"\bek verkies afrikaans\b",
     ],
 }
+# One alternation per language; languages are still checked in table order
+_LANGUAGE_PREFERENCE_RES = {
+    lang_code: re.compile("|".join(patterns))
+    for lang_code, patterns in _LANGUAGE_PREFERENCE_PATTERNS.items()
+}
 
 
 def _detect_language_preference(message: str) -> str | None:
@@ -610,10 +879,9 @@ def _detect_language_preference(message: str) -> str | None:
         Language code ("en", "zu", "af") if explicit preference found, else None.
     """
     lower = message.lower()
-    for lang_code, patterns in _LANGUAGE_PREFERENCE_PATTERNS.items():
-        for pattern in patterns:
-            if re.search(pattern, lower):
-                return lang_code
+    for lang_code, pattern in _LANGUAGE_PREFERENCE_RES.items():
+        if pattern.search(lower):
+            return lang_code
     return None
 
 
@@ -701,7 +969,8 @@ async def chat(
     6. Return ChatResponse with reply, agent_name, session_status, debug.
 
     On any DeepSeek API failure: returns fail-fast error reply per locked
-    decision (no retry, no fallback model).
+    decision (no retry, no fallback model). When the LLM pool is saturated
+    (src/agents/llm_pool.py) returns 429 with Retry-After instead.
 
     Args:
         request: Starlette Request object (required by slowapi rate limiter).
@@ -713,7 +982,78 @@ async def chat(
         ChatResponse with reply, agent_name, session_status, debug.
     """
     _validate_api_key(x_api_key)
+    return await _run_chat_turn(body)
+
+
+@crew_app.post("/api/v1/chat/stream")
+@limiter.limit(CREW_CHAT_RATE_LIMIT)
+async def chat_stream(
+    request: Request,
+    body: ChatRequest,
+    x_api_key: str | None = Header(default=None),
+) -> EventSourceResponse:
+    """Streaming variant of /chat — Server-Sent Events.
+
+    Runs the same turn as chat() and forwards the specialist's LLM tokens as
+    they are generated, after StreamingReplySanitizer has checked them
+    against the artifact/delegation patterns and the output guardrails.
+
+    Events:
+        delta: {"text": str} — next piece of the reply (append to the previous)
+        done:  ChatResponse JSON — the complete reply. Authoritative: it
+               replaces the streamed text, which is a preview of it
+        error: {"status": 429, "detail": str, "retry_after": str} — LLM pool
+               saturated; retry after that many seconds
+
+    GBV turns stream no tokens (GBVCrew.stream_tokens is False): the
+    citizen only receives the guardrail-validated reply in "done".
+
+    If the client disconnects the turn still completes, so the conversation
+    state stays consistent with what the crew did (e.g. a created ticket).
+    """
+    _validate_api_key(x_api_key)
+    stream = ReplyStream()
 
+    async def run_turn() -> ChatResponse:
+        with reply_stream(stream):
+            try:
+                return await _run_chat_turn(body)
+            finally:
+                stream.close()
+
+    turn = asyncio.create_task(run_turn())
+    _background_turns.add(turn)
+    turn.add_done_callback(_background_turns.discard)
+
+    async def event_generator():
+        sanitizer = StreamingReplySanitizer()
+        async for chunk in stream:
+            for text in sanitizer.feed(chunk):
+                yield {"event": "delta", "data": json.dumps({"text": text})}
+        for text in sanitizer.finish():
+            yield {"event": "delta", "data": json.dumps({"text": text})}
+
+        try:
+            response = await turn
+        except HTTPException as e:
+            yield {
+                "event": "error",
+                "data": json.dumps({
+                    "status": e.status_code,
+                    "detail": e.detail,
+                    "retry_after": (e.headers or {}).get("Retry-After"),
+                }),
+            }
+            return
+
+        response.reply = sanitize_output(response.reply).sanitized_response
+        yield {"event": "done", "data": response.model_dump_json()}
+
+    return EventSourceResponse(event_generator())
+
+
+async def _run_chat_turn(body: ChatRequest) -> ChatResponse:
+    """Run one chat turn for chat() and chat_stream() (see chat() for the flow)."""
     phone = body.phone.strip()
     session_id = f"crew:{phone}"
     manager = _get_conversation_manager()
@@ -840,10 +1180,11 @@ async def chat(
     # Include the CURRENT user message in history so the agent can see it.
     # (Turns are only persisted to the store in Step 4, after the crew runs.
     #  Without this, the crew never sees what the user just typed.)
-    history_turns = list(conv_state.turns) + [
-        {"role": "user", "content": body.message}
-    ]
-    conversation_history = _format_history(history_turns)
+    # Older turns roll into conv_state.history_summary, persisted with the
+    # routing state below.
+    conversation_history = _format_history(
+        conv_state, [{"role": "user", "content": body.message}]
+    )
 
     # ------------------------------------------------------------------
     # Step 3: Route through IntakeFlow (deterministic @router dispatch)
@@ -920,8 +1261,9 @@ async def chat(
             flow.state.conversation_history = conversation_history
             flow.state.pending_intent = getattr(conv_state, 'pending_intent', '') or ''
 
-            # Kick off Flow asynchronously
-            await flow.kickoff_async()
+            # Kick off Flow asynchronously; crew kickoffs inherit the turn deadline
+            with llm_deadline(settings.CREW_CHAT_DEADLINE_SECONDS):
+                await flow.kickoff_async()
 
             # Extract result from Flow state
             agent_result = flow.state.result
@@ -986,6 +1328,13 @@ async def chat(
             except Exception:
                 pass  # Best-effort; Step 4 append_turn will persist turns anyway
 
+    except LLMPoolBusy as e:
+        # Saturated LLM pool: tell the caller to back off rather than queue
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="The assistant is busy right now. Please try again shortly.",
+            headers={"Retry-After": e.retry_after_header},
+        )
     except Exception as e:
         # Fail fast on LLM API errors — no retry, no fallback model
         error_str = str(e)
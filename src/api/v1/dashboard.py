@@ -5,6 +5,7 @@ Provides real-time metrics for municipal operations dashboard:
 - Volume breakdown by category
 - SLA compliance details
 - Team workload distribution
+- Combined bundle of all four panels (one request instead of four)
 
 RBAC: Accessible by MANAGER, ADMIN, WARD_COUNCILLOR only.
 SEC-05: All queries exclude GBV/sensitive tickets.
@@ -282,3 +283,79 @@ async def get_team_workload(
     )
 
     return workload
+
+
+@router.get("/bundle")
+@limiter.limit(SENSITIVE_READ_RATE_LIMIT)
+async def get_dashboard_bundle(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    ward_id: str | None = None,
+    start_date: str | None = Query(default=None, description="Start date filter (YYYY-MM-DD)"),
+    end_date: str | None = Query(default=None, description="End date filter (YYYY-MM-DD)"),
+) -> dict:
+    """Get metrics, volume, SLA and workload panels in a single request.
+
+    Equivalent to calling /metrics, /volume, /sla and /workload, but the
+    first three panels share one aggregation pass instead of one per panel.
+
+    Args:
+        current_user: Authenticated user (must be MANAGER, ADMIN, or WARD_COUNCILLOR)
+        db: Database session
+        ward_id: Optional ward filter for ward councillors
+        start_date: Optional start date in YYYY-MM-DD format for time-series filtering
+        end_date: Optional end date in YYYY-MM-DD format for time-series filtering
+
+    Returns:
+        dict with "metrics", "volume", "sla" and "workload" keys, each shaped
+        like the corresponding single-panel endpoint
+
+    Raises:
+        HTTPException: 403 if user not authorized
+        HTTPException: 400 if date params are invalid format
+    """
+    # RBAC check
+    if current_user.role not in [UserRole.MANAGER, UserRole.ADMIN, UserRole.WARD_COUNCILLOR]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view dashboard metrics"
+        )
+
+    # Ward councillor enforcement — use stored ward_id, ignore client-supplied
+    if current_user.role == UserRole.WARD_COUNCILLOR:
+        ward_id = current_user.ward_id
+        if ward_id is None:
+            # No ward assigned — return zeroed-out panels (fail-safe)
+            return {
+                "metrics": {
+                    "total_open": 0,
+                    "total_resolved": 0,
+                    "sla_compliance_percent": 0.0,
+                    "avg_response_hours": 0.0,
+                    "sla_breaches": 0,
+                },
+                "volume": [],
+                "sla": {
+                    "response_compliance_percent": 0.0,
+                    "resolution_compliance_percent": 0.0,
+                    "total_with_sla": 0,
+                    "response_breaches": 0,
+                    "resolution_breaches": 0,
+                },
+                "workload": [],
+            }
+
+    parsed_start = _parse_date_param(start_date, "start_date")
+    parsed_end = _parse_date_param(end_date, "end_date")
+
+    service = DashboardService()
+    bundle = await service.get_dashboard_bundle(
+        municipality_id=current_user.tenant_id,
+        db=db,
+        ward_id=ward_id,
+        start_date=parsed_start,
+        end_date=parsed_end,
+    )
+
+    return bundle
@@ -1,45 +1,64 @@
-"""Data export endpoints for CSV and Excel download.
+"""Data export endpoints: ticket CSV/Excel downloads and background export jobs.
 
 Provides server-side export of filtered ticket data. Supports both CSV
-and Excel (.xlsx) formats. Uses StreamingResponse for memory efficiency.
-SEC-05: GBV/sensitive tickets are always excluded from exports.
+and Excel (.xlsx) formats. SEC-05: GBV/sensitive tickets are always
+excluded from exports.
+
+Rows are read with a server-side cursor (AsyncSession.stream + yield_per),
+selecting only the exported columns, so memory stays constant regardless
+of row count and exports are not capped:
+- CSV is encoded and sent batch by batch as rows arrive
+- Excel rows go into a write-only openpyxl workbook (spooled to disk by
+  openpyxl), which is sent once complete
+
+Large or multi-year datasets (tickets, SDBIP actuals, audit logs) go
+through export jobs instead: POST /export/jobs queues a Celery task that
+writes XLSX, CSV.gz or Parquet to storage (src/services/export_service.py),
+and GET /export/jobs/{job_id} is polled until it returns a signed
+download URL.
 """
 import csv
 import io
+import json
 import logging
+import tempfile
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, timezone
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import desc, or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
-from src.api.deps import get_current_user, get_db
+from src.api.deps import TIER_ORDER, get_current_user, get_db
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.tenant import set_tenant_context
 from src.middleware.rate_limit import DATA_EXPORT_RATE_LIMIT, limiter
-from src.models.ticket import Ticket
+from src.models.export_job import ExportDataset, ExportJob, ExportJobStatus
 from src.models.user import User, UserRole
+from src.schemas.export import ExportJobCreate, ExportJobResponse
+from src.services.export_service import (
+    DATASET_FILTERS,
+    EXPORT_BATCH_SIZE,
+    TICKET_EXPORT_COLUMNS as EXPORT_COLUMNS,
+    format_available,
+    format_row,
+    stream_rows,
+    ticket_export_query,
+)
+from src.services.storage_service import StorageService, StorageServiceError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/export", tags=["export"])
 
+# Excel workbooks above this size spill from memory to a temp file
+EXCEL_SPOOL_MAX_BYTES = 8 * 1024 * 1024
 
-EXPORT_COLUMNS = [
-    ("Tracking Number", "tracking_number"),
-    ("Category", "category"),
-    ("Status", "status"),
-    ("Severity", "severity"),
-    ("Description", "description"),
-    ("Address", "address"),
-    ("Language", "language"),
-    ("Created", "created_at"),
-    ("SLA Response Deadline", "sla_response_deadline"),
-    ("SLA Resolution Deadline", "sla_resolution_deadline"),
-    ("First Responded", "first_responded_at"),
-    ("Resolved At", "resolved_at"),
-    ("Escalated At", "escalated_at"),
-]
+TICKET_EXPORT_ROLES = [UserRole.MANAGER, UserRole.ADMIN, UserRole.WARD_COUNCILLOR]
 
 
 @router.get("/tickets/csv")
@@ -57,45 +76,23 @@ async def export_tickets_csv(
 
     Applies same RBAC and filters as list_tickets endpoint.
     SEC-05: GBV/sensitive tickets always excluded.
-    Max 10,000 rows per export.
+    Streamed as rows are read; no row limit.
     """
-    allowed_roles = [UserRole.MANAGER, UserRole.ADMIN, UserRole.WARD_COUNCILLOR]
-    if current_user.role not in allowed_roles:
+    if current_user.role not in TICKET_EXPORT_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Export requires manager, admin, or ward councillor role"
         )
 
-    tickets = await _fetch_export_tickets(
+    batches = _stream_export_rows(
         db, current_user, status_filter, category, ward_id, search
     )
 
-    # Generate CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header row
-    writer.writerow([col[0] for col in EXPORT_COLUMNS])
-
-    # Data rows
-    for ticket in tickets:
-        row = []
-        for _, attr in EXPORT_COLUMNS:
-            value = getattr(ticket, attr, None)
-            if isinstance(value, datetime):
-                value = value.strftime("%Y-%m-%d %H:%M:%S")
-            elif value is None:
-                value = ""
-            row.append(str(value))
-        writer.writerow(row)
-
-    output.seek(0)
-
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
     filename = f"tickets_export_{timestamp}.csv"
 
     return StreamingResponse(
-        iter([output.getvalue()]),
+        _csv_chunks(batches),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -116,21 +113,20 @@ async def export_tickets_excel(
 
     Applies same RBAC and filters as list_tickets endpoint.
     SEC-05: GBV/sensitive tickets always excluded.
-    Max 10,000 rows per export. Uses openpyxl for .xlsx generation.
+    No row limit. Uses an openpyxl write-only workbook for .xlsx generation;
+    large exports should use a background job (POST /export/jobs).
     """
-    allowed_roles = [UserRole.MANAGER, UserRole.ADMIN, UserRole.WARD_COUNCILLOR]
-    if current_user.role not in allowed_roles:
+    if current_user.role not in TICKET_EXPORT_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Export requires manager, admin, or ward councillor role"
         )
 
-    tickets = await _fetch_export_tickets(
-        db, current_user, status_filter, category, ward_id, search
-    )
-
     try:
         from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        from openpyxl.utils import get_column_letter
     except ImportError:
         # Fallback: if openpyxl not installed, return 501
         raise HTTPException(
@@ -138,37 +134,29 @@ async def export_tickets_excel(
             detail="Excel export requires openpyxl. Use CSV export instead."
         )
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Tickets"
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Tickets")
 
-    # Header row
-    headers = [col[0] for col in EXPORT_COLUMNS]
-    ws.append(headers)
+    # Column widths must be set before the first row in write-only mode
+    for col_idx, (header, _) in enumerate(EXPORT_COLUMNS, 1):
+        ws.column_dimensions[get_column_letter(col_idx)].width = max(len(header) + 2, 15)
 
-    # Bold headers
-    from openpyxl.styles import Font
-    for cell in ws[1]:
+    # Bold header row
+    headers = []
+    for header, _ in EXPORT_COLUMNS:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = Font(bold=True)
+        headers.append(cell)
+    ws.append(headers)
 
     # Data rows
-    for ticket in tickets:
-        row = []
-        for _, attr in EXPORT_COLUMNS:
-            value = getattr(ticket, attr, None)
-            if isinstance(value, datetime):
-                value = value.strftime("%Y-%m-%d %H:%M:%S")
-            elif value is None:
-                value = ""
-            row.append(str(value))
-        ws.append(row)
-
-    # Auto-size columns (approximate)
-    for col_idx, (header, _) in enumerate(EXPORT_COLUMNS, 1):
-        ws.column_dimensions[chr(64 + col_idx) if col_idx <= 26 else "A"].width = max(len(header) + 2, 15)
+    async for batch in _stream_export_rows(
+        db, current_user, status_filter, category, ward_id, search
+    ):
+        for row in batch:
+            ws.append(format_row(row))
 
-    # Write to bytes buffer
-    output = io.BytesIO()
+    output = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_BYTES)
     wb.save(output)
     output.seek(0)
 
@@ -182,47 +170,167 @@ async def export_tickets_excel(
     )
 
 
-async def _fetch_export_tickets(
+async def _stream_export_rows(
     db: AsyncSession,
     current_user: User,
     status_filter: str | None,
     category: str | None,
     ward_id: str | None,
     search: str | None,
-    max_rows: int = 10000,
-) -> list:
-    """Fetch tickets for export with RBAC and filters.
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[Sequence]:
+    """Yield batches of ticket export rows from a server-side cursor.
 
-    SEC-05: Always excludes GBV/sensitive tickets.
+    Runs while the response is being sent, so the tenant context the
+    tenant filter relies on is (re)established here.
     """
-    query = select(Ticket).where(Ticket.is_sensitive == False)
+    set_tenant_context(str(current_user.tenant_id))
+    query = ticket_export_query(
+        str(current_user.tenant_id), status_filter, category, ward_id, search,
+        db.get_bind().dialect.name,
+    )
+
+    async for batch in stream_rows(db, query, batch_size):
+        metrics.inc("ticket_export_rows_total", len(batch))
+        yield batch
+
+
+async def _csv_chunks(batches: AsyncIterator[Sequence]) -> AsyncIterator[bytes]:
+    """Encode the header and then each batch of rows as one UTF-8 CSV chunk."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow([col[0] for col in EXPORT_COLUMNS])
+    async for batch in batches:
+        writer.writerows(format_row(row) for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Header only (no rows), or nothing left since the last batch
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
 
-    # Tenant filter
-    query = query.where(Ticket.tenant_id == current_user.tenant_id)
 
-    # Status filter
-    if status_filter:
-        query = query.where(Ticket.status == status_filter.lower())
+# ---------------------------------------------------------------------------
+# Background export jobs
+# ---------------------------------------------------------------------------
 
-    # Category filter
-    if category:
-        query = query.where(Ticket.category == category.lower())
 
-    # Ward filter
-    if ward_id:
-        query = query.where(Ticket.address.ilike(f"%{ward_id}%"))
+def _check_dataset_access(current_user: User, dataset: ExportDataset) -> None:
+    """Raise 403 unless the user may export the dataset.
 
-    # Search
-    if search:
-        query = query.where(
-            or_(
-                Ticket.tracking_number.ilike(f"%{search}%"),
-                Ticket.description.ilike(f"%{search}%"),
+    Tickets: same roles as the ticket downloads. SDBIP actuals: Tier 3+
+    (same as the PMS endpoints). Audit logs: ADMIN only (same as
+    GET /audit-logs).
+    """
+    if dataset == ExportDataset.TICKETS:
+        allowed = current_user.role in TICKET_EXPORT_ROLES
+    elif dataset == ExportDataset.SDBIP_ACTUALS:
+        allowed = TIER_ORDER.get(current_user.role.value, 99) <= 3
+    else:
+        allowed = current_user.role == UserRole.ADMIN
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Your role cannot export {dataset.value}",
+        )
+
+
+def _job_response(job: ExportJob) -> ExportJobResponse:
+    """Build the status response, signing a download URL for completed jobs."""
+    response = ExportJobResponse.model_validate(job)
+    if job.status == ExportJobStatus.COMPLETED and job.storage_path:
+        try:
+            response.download_url = StorageService().get_signed_url(
+                job.storage_bucket,
+                job.storage_path,
+                expiry=settings.EXPORT_DOWNLOAD_URL_TTL_SECONDS,
+            )
+        except StorageServiceError as e:
+            logger.error(f"Failed to sign export download URL for job {job.id}: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Export file storage is unavailable",
             )
+    return response
+
+
+@router.post("/jobs", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+@limiter.limit(DATA_EXPORT_RATE_LIMIT)
+async def create_export_job(
+    request: Request,
+    payload: ExportJobCreate,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> ExportJobResponse:
+    """Queue a background export of tickets, SDBIP actuals or audit logs.
+
+    Returns 202 with the pending job; poll GET /export/jobs/{job_id}.
+    SEC-05: ticket exports always exclude GBV/sensitive tickets.
+
+    Raises:
+        HTTPException: 403 if the role cannot export the dataset, 422 if a
+            filter does not apply to the dataset, 501 if the format's library
+            is not installed
+    """
+    _check_dataset_access(current_user, payload.dataset)
+
+    filters = payload.filters.model_dump(mode="json", exclude_none=True)
+    unsupported = set(filters) - DATASET_FILTERS[payload.dataset]
+    if unsupported:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Filters not supported for {payload.dataset.value}: {sorted(unsupported)}",
+        )
+
+    if not format_available(payload.file_format):
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail=f"{payload.file_format.value} export is not available on this server",
         )
 
-    # Order and limit
-    query = query.order_by(desc(Ticket.created_at)).limit(max_rows)
+    job = ExportJob(
+        tenant_id=str(current_user.tenant_id),
+        dataset=payload.dataset.value,
+        file_format=payload.file_format.value,
+        status=ExportJobStatus.PENDING,
+        filters=json.dumps(filters) if filters else None,
+        requested_by=str(current_user.id),
+        created_by=str(current_user.id),
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+
+    from src.tasks.export_task import run_export
+
+    run_export.delay(str(job.id), job.tenant_id)
+    metrics.inc("export_jobs_requested_total", dataset=job.dataset, format=job.file_format)
+
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> ExportJobResponse:
+    """Return an export job's status, with a signed download URL once completed.
 
-    result = await db.execute(query)
-    return result.scalars().all()
+    Only the user who requested the job can see it (404 otherwise).
+    """
+    result = await db.execute(
+        select(ExportJob).where(
+            ExportJob.id == job_id,
+            ExportJob.requested_by == str(current_user.id),
+        )
+    )
+    job = result.scalar_one_or_none()
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found",
+        )
+    return _job_response(job)
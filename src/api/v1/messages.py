@@ -165,7 +165,11 @@ async def send_message(
             )
 
         # Step 3: Build conversation history for IntakeFlow context
-        conversation_history = _format_history(conversation_state.turns)
+        summarized_turns = conversation_state.summarized_turns
+        conversation_history = _format_history(conversation_state)
+        if conversation_state.summarized_turns != summarized_turns:
+            # Older turns were rolled into the summary; keep it for later turns
+            await conversation_manager.save_state(conversation_state)
 
         # Step 4: Run IntakeFlow (deterministic @router dispatch to specialist crews)
         # Web portal users are always authenticated (session_status="active"), so
@@ -12,14 +12,20 @@ SEC-05: GBV/sensitive data filtering handled by PublicMetricsService layer.
 
 All queries are cross-tenant (aggregate across municipalities) with mandatory
 is_sensitive == False filters applied at the service layer.
+
+Responses are served through a Redis TTL cache (src/core/response_cache.py)
+keyed by endpoint and query parameters, with ETag/Cache-Control validators so
+the public site and any CDN can revalidate cheaply.
 """
 import logging
 
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
+from starlette.responses import Response
 
 from src.api.deps import get_db
+from src.core.response_cache import public_response_cache
 from src.middleware.rate_limit import PUBLIC_RATE_LIMIT, limiter
 from src.services.public_metrics_service import PublicMetricsService
 
@@ -27,13 +33,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/public", tags=["public"])
 
+# Per-endpoint cache TTLs in seconds. Municipality and SDBIP data change
+# rarely; ticket-derived metrics are refreshed more often.
+PUBLIC_CACHE_TTLS = {
+    "municipalities": 3600,
+    "response-times": 300,
+    "resolution-rates": 300,
+    "heatmap": 600,
+    "sdbip-performance": 900,
+    "summary": 120,
+}
+
 
-@router.get("/municipalities")
+@router.get("/municipalities", response_model=list[dict])
 @limiter.limit(PUBLIC_RATE_LIMIT)
 async def get_municipalities(
     request: Request,
     db: AsyncSession = Depends(get_db),
-) -> list[dict]:
+) -> Response:
     """Get list of active municipalities with basic public information.
 
     No authentication required (TRNS-04).
@@ -47,16 +64,21 @@ async def get_municipalities(
     Note: Excludes contact_email for privacy.
     """
     service = PublicMetricsService()
-    return await service.get_active_municipalities(db)
+    return await public_response_cache.respond(
+        request,
+        "municipalities",
+        ttl=PUBLIC_CACHE_TTLS["municipalities"],
+        compute=lambda: service.get_active_municipalities(db),
+    )
 
 
-@router.get("/response-times")
+@router.get("/response-times", response_model=list[dict])
 @limiter.limit(PUBLIC_RATE_LIMIT)
 async def get_response_times(
     request: Request,
     municipality_id: str | None = None,
     db: AsyncSession = Depends(get_db),
-) -> list[dict]:
+) -> Response:
     """Get average response times per municipality (TRNS-01).
 
     No authentication required (TRNS-04).
@@ -75,17 +97,23 @@ async def get_response_times(
         }
     """
     service = PublicMetricsService()
-    return await service.get_response_times(db, municipality_id=municipality_id)
+    return await public_response_cache.respond(
+        request,
+        "response-times",
+        ttl=PUBLIC_CACHE_TTLS["response-times"],
+        compute=lambda: service.get_response_times(db, municipality_id=municipality_id),
+        params={"municipality_id": municipality_id},
+    )
 
 
-@router.get("/resolution-rates")
+@router.get("/resolution-rates", response_model=list[dict])
 @limiter.limit(PUBLIC_RATE_LIMIT)
 async def get_resolution_rates(
     request: Request,
     municipality_id: str | None = None,
     months: int = 6,
     db: AsyncSession = Depends(get_db),
-) -> list[dict]:
+) -> Response:
     """Get resolution rates per municipality with monthly trends (TRNS-02).
 
     No authentication required (TRNS-04).
@@ -107,18 +135,24 @@ async def get_resolution_rates(
         }
     """
     service = PublicMetricsService()
-    return await service.get_resolution_rates(
-        db, municipality_id=municipality_id, months=months
+    return await public_response_cache.respond(
+        request,
+        "resolution-rates",
+        ttl=PUBLIC_CACHE_TTLS["resolution-rates"],
+        compute=lambda: service.get_resolution_rates(
+            db, municipality_id=municipality_id, months=months
+        ),
+        params={"municipality_id": municipality_id, "months": months},
     )
 
 
-@router.get("/heatmap")
+@router.get("/heatmap", response_model=list[dict])
 @limiter.limit(PUBLIC_RATE_LIMIT)
 async def get_heatmap(
     request: Request,
     municipality_id: str | None = None,
     db: AsyncSession = Depends(get_db),
-) -> list[dict]:
+) -> Response:
     """Get grid-aggregated heatmap data for geographic visualization (TRNS-03).
 
     No authentication required (TRNS-04).
@@ -135,17 +169,23 @@ async def get_heatmap(
     Note: Returns empty list when PostGIS unavailable (SQLite tests).
     """
     service = PublicMetricsService()
-    return await service.get_heatmap_data(db, municipality_id=municipality_id)
+    return await public_response_cache.respond(
+        request,
+        "heatmap",
+        ttl=PUBLIC_CACHE_TTLS["heatmap"],
+        compute=lambda: service.get_heatmap_data(db, municipality_id=municipality_id),
+        params={"municipality_id": municipality_id},
+    )
 
 
-@router.get("/sdbip-performance")
+@router.get("/sdbip-performance", response_model=list[dict])
 @limiter.limit(PUBLIC_RATE_LIMIT)
 async def get_sdbip_performance(
     request: Request,
     municipality_id: str | None = None,
     financial_year: str | None = None,
     db: AsyncSession = Depends(get_db),
-) -> list[dict]:
+) -> Response:
     """Get aggregate SDBIP achievement summary for public transparency.
 
     Returns per-municipality KPI achievement overview: total KPIs, traffic-light
@@ -173,17 +213,23 @@ async def get_sdbip_performance(
         }
     """
     service = PublicMetricsService()
-    return await service.get_sdbip_achievement(
-        db, municipality_id=municipality_id, financial_year=financial_year
+    return await public_response_cache.respond(
+        request,
+        "sdbip-performance",
+        ttl=PUBLIC_CACHE_TTLS["sdbip-performance"],
+        compute=lambda: service.get_sdbip_achievement(
+            db, municipality_id=municipality_id, financial_year=financial_year
+        ),
+        params={"municipality_id": municipality_id, "financial_year": financial_year},
     )
 
 
-@router.get("/summary")
+@router.get("/summary", response_model=dict)
 @limiter.limit(PUBLIC_RATE_LIMIT)
 async def get_summary(
     request: Request,
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> Response:
     """Get system-wide summary statistics.
 
     No authentication required (TRNS-04).
@@ -202,4 +248,9 @@ async def get_summary(
     Note: Sensitive tickets counted system-wide, never per-municipality.
     """
     service = PublicMetricsService()
-    return await service.get_system_summary(db)
+    return await public_response_cache.respond(
+        request,
+        "summary",
+        ttl=PUBLIC_CACHE_TTLS["summary"],
+        compute=lambda: service.get_system_summary(db),
+    )
@@ -15,8 +15,7 @@ from starlette.requests import Request
 
 from src.api.deps import get_current_user, get_db
 from src.middleware.rate_limit import REPORT_RATE_LIMIT, SENSITIVE_READ_RATE_LIMIT, limiter
-from src.agents.flows.intake_flow import IntakeFlow
-from src.agents.flows.state import IntakeState
+from src.agents.facade import classify_intent
 from src.guardrails.engine import guardrails_engine
 from src.models.media import MediaAttachment
 from src.models.ticket import Ticket, generate_tracking_number
@@ -88,18 +87,13 @@ async def submit_report(
         # Use IntakeFlow for single-shot AI intent classification.
         # IntakeFlow uses gpt-4o-mini via _classify_raw_intent() for reliable
         # classification. We only need the intent -- not a full crew conversation.
+        # The agent stack is imported on first use (src/agents/facade.py).
         try:
-            flow = IntakeFlow()
-            flow.state = IntakeState(
-                message=sanitized_description,
-                language=report.language or "en",
-                session_status="active",  # Web portal users are authenticated
-                user_id=str(current_user.id),
-                routing_phase="manager",  # Trigger fresh classification
+            intent = await classify_intent(
+                sanitized_description,
+                report.language or "en",
+                str(current_user.id),
             )
-            # Call _classify_raw_intent directly for lightweight single-shot classification.
-            # This makes one gpt-4o-mini LLM call -- no full crew invocation.
-            intent = flow._classify_raw_intent()
 
             # Map intent to ticket category
             _INTENT_TO_CATEGORY = {
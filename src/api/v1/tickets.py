@@ -18,11 +18,12 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
 
 from src.api.deps import get_current_user, get_db
+from src.core.pagination import count_total, keyset_page, resolve_total_mode
 from src.middleware.rate_limit import (
     SENSITIVE_READ_RATE_LIMIT,
     SENSITIVE_WRITE_RATE_LIMIT,
@@ -44,12 +45,20 @@ from src.schemas.ticket import (
 )
 from src.services.assignment_service import AssignmentService
 from src.services.sla_service import SLAService
+from src.services.ticket_search import apply_ticket_search
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/tickets", tags=["tickets"])
 
 
+def _page_count(total: int | None, page_size: int) -> int | None:
+    """Number of pages for a total (None when the total was not computed)."""
+    if total is None:
+        return None
+    return math.ceil(total / page_size) if page_size > 0 else 0
+
+
 def _compute_sla_status(ticket: Ticket) -> str | None:
     """Compute SLA status based on deadlines.
 
@@ -101,11 +110,22 @@ async def list_tickets(
     assigned_team_id: UUID | None = None,
     search: str | None = None,
     ward_id: str | None = None,
-    sort_by: str = "created_at",
+    sort_by: str | None = None,
     sort_order: str = "desc",
+    cursor: str | None = None,
+    cursor_mode: bool = False,
+    total_mode: str | None = None,
 ) -> PaginatedTicketResponse:
     """List tickets with server-side filtering, search, and pagination.
 
+    Two pagination modes:
+    - Offset (default): page/page_size with an exact total
+    - Cursor (cursor_mode=true, or any cursor supplied): keyset pagination
+      over (sort column, id). Pass the response's next_cursor to get the
+      following page; cost is independent of depth. No total is computed
+      unless total_mode is given (estimate = planner's row estimate,
+      exact = COUNT(*))
+
     Args:
         current_user: Authenticated user (must be MANAGER, ADMIN, SAPS_LIAISON, or WARD_COUNCILLOR)
         db: Database session
@@ -114,16 +134,22 @@ async def list_tickets(
         status_filter: Filter by status (optional)
         category: Filter by category (optional)
         assigned_team_id: Filter by assigned team (optional)
-        search: Free-text search on tracking_number and description (optional)
+        search: Free-text search on description (full-text) and tracking_number
+            (prefix/fuzzy), ranked on PostgreSQL (optional)
         ward_id: Filter by ward (optional)
-        sort_by: Sort field (created_at/status/severity/category, default created_at)
+        sort_by: Sort field (relevance/created_at/status/severity/category;
+            default relevance when searching, otherwise created_at)
         sort_order: Sort order (asc/desc, default desc)
+        cursor: Opaque cursor from a previous next_cursor (cursor mode)
+        cursor_mode: Use keyset pagination for the first page
+        total_mode: "exact" (COUNT), "estimate" (planner statistics) or
+            "none" (no total); default exact, or none in cursor mode
 
     Returns:
         PaginatedTicketResponse with tickets and pagination metadata
 
     Raises:
-        HTTPException: 403 if user not authorized
+        HTTPException: 400 if cursor or total_mode invalid, 403 if user not authorized
     """
     # RBAC check - allow WARD_COUNCILLOR and FIELD_WORKER
     if current_user.role not in [
@@ -179,32 +205,61 @@ async def list_tickets(
     if assigned_team_id:
         query = query.where(Ticket.assigned_team_id == assigned_team_id)
 
-    # Free-text search (tracking_number OR description)
+    # Free-text search (full-text description + tracking number, ranked)
+    search_rank = None
     if search:
-        search_pattern = f"%{search}%"
-        query = query.where(
-            or_(
-                Ticket.tracking_number.ilike(search_pattern),
-                Ticket.description.ilike(search_pattern)
-            )
+        query, search_rank = apply_ticket_search(
+            query, search, db.get_bind().dialect.name
         )
 
-    # Ward filtering (interim: address ILIKE match)
+    # Ward filtering (stored ward_id resolved from location at creation)
     if ward_id:
-        query = query.where(Ticket.address.ilike(f"%{ward_id}%"))
+        query = query.where(Ticket.ward_id == ward_id)
 
-    # Count total (before pagination)
-    count_query = select(func.count()).select_from(query.subquery())
-    count_result = await db.execute(count_query)
-    total = count_result.scalar() or 0
+    try:
+        total_mode = resolve_total_mode(total_mode, cursor_mode or bool(cursor))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Sorting (searches default to relevance when the dialect can rank)
+    if sort_by is None:
+        sort_by = "relevance" if search_rank is not None else "created_at"
 
-    # Sorting
     valid_sort_fields = ["created_at", "status", "severity", "category"]
+    by_relevance = sort_by == "relevance" and search_rank is not None
     if sort_by not in valid_sort_fields:
         sort_by = "created_at"
 
     sort_column = getattr(Ticket, sort_by)
-    if sort_order.lower() == "asc":
+
+    # Cursor mode: keyset pagination over (sort column, id). Relevance is
+    # not a stable keyset, so cursor mode always pages by a real column
+    if cursor_mode or cursor:
+        descending = sort_order.lower() != "asc"
+        try:
+            tickets, next_cursor = await keyset_page(
+                db, query, sort_column, Ticket.id, sort_by, descending, page_size, cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        total, is_estimate = await count_total(db, query, total_mode)
+        return PaginatedTicketResponse(
+            tickets=[TicketResponse.model_validate(ticket) for ticket in tickets],
+            total=total,
+            page=0,
+            page_size=page_size,
+            page_count=_page_count(total, page_size),
+            next_cursor=next_cursor,
+            total_is_estimate=is_estimate,
+        )
+
+    # Count total (before pagination)
+    total, is_estimate = await count_total(db, query, total_mode)
+
+    if by_relevance:
+        query = query.order_by(search_rank.desc(), Ticket.created_at.desc())
+    elif sort_order.lower() == "asc":
         query = query.order_by(sort_column.asc())
     else:
         query = query.order_by(sort_column.desc())
@@ -217,14 +272,15 @@ async def list_tickets(
     tickets = result.scalars().all()
 
     # Calculate page count
-    page_count = math.ceil(total / page_size) if page_size > 0 else 0
+    page_count = _page_count(total, page_size)
 
     return PaginatedTicketResponse(
         tickets=[TicketResponse.model_validate(ticket) for ticket in tickets],
         total=total,
         page=page,
         page_size=page_size,
-        page_count=page_count
+        page_count=page_count,
+        total_is_estimate=is_estimate,
     )
 
 
@@ -286,9 +342,8 @@ async def get_ticket_detail(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="No ward assigned to your account"
             )
-        # Address-based ward check (same pattern as list endpoint)
-        ticket_address = ticket.address or ""
-        if current_user.ward_id.lower() not in ticket_address.lower():
+        # Same stored ward_id the list endpoint filters on
+        if ticket.ward_id != current_user.ward_id:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Ticket is not in your assigned ward"
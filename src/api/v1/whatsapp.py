@@ -2,8 +2,14 @@
 
 This module provides webhook endpoints for incoming WhatsApp messages and status callbacks.
 Integrates with the existing Phase 2 intake pipeline (guardrails -> flow -> crew).
+
+With settings.WHATSAPP_ASYNC_PROCESSING the webhook only validates, dedupes
+on MessageSid and enqueues the message; it returns an empty TwiML response
+at once and a Celery worker (src/tasks/whatsapp_inbox_task.py) sends the
+reply, so LLM turns never run into Twilio's 15s webhook timeout.
 """
 import logging
+import time
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
@@ -11,10 +17,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from twilio.request_validator import RequestValidator
 from twilio.twiml.messaging_response import MessagingResponse
 
+from src.agents.llm_pool import LLMPoolBusy, llm_deadline
 from src.api.deps import get_db
 from src.core.config import settings
+from src.core.redis_pool import get_redis
 from src.models.user import User
 from src.schemas.whatsapp import WhatsAppMediaItem, WhatsAppWebhookPayload, WhatsAppResponse
+from src.services.whatsapp_inbox import WhatsAppInbox
 from src.services.whatsapp_service import WhatsAppService
 from src.services.storage_service import StorageService
 from sqlalchemy import select
@@ -24,6 +33,12 @@ logger = logging.getLogger(__name__)
 # Create router (no prefix here - added in main.py)
 router = APIRouter(prefix="/whatsapp", tags=["whatsapp"])
 
+# Sent when the LLM pool refuses an inline turn; the message was not processed
+BUSY_REPLY = (
+    "We're receiving a very high number of messages right now. "
+    "Please send your message again in a few minutes."
+)
+
 
 async def validate_twilio_request(request: Request) -> dict:
     """Validate Twilio webhook signature and parse form data.
@@ -101,6 +116,53 @@ async def lookup_user_by_phone(phone: str, db: AsyncSession) -> User | None:
     return user
 
 
+async def enqueue_for_worker(
+    user: User,
+    payload: WhatsAppWebhookPayload,
+    media_items: list[dict[str, Any]],
+    normalized_phone: str,
+    session_id: str,
+) -> None:
+    """Queue a message for the WhatsApp worker (async processing mode).
+
+    Duplicates (Twilio retries of an already queued MessageSid) are dropped.
+    The worker task is dispatched only for new messages.
+    """
+    inbox = WhatsAppInbox(settings.REDIS_URL, redis_client=get_redis())
+    try:
+        is_new = await inbox.enqueue(
+            payload.MessageSid,
+            normalized_phone,
+            {
+                "message_sid": payload.MessageSid,
+                "user_id": str(user.id),
+                "tenant_id": str(user.tenant_id),
+                "phone": normalized_phone,
+                "session_id": session_id,
+                "body": payload.Body,
+                "media_items": media_items,
+                "received_at": time.time(),
+            },
+        )
+    finally:
+        await inbox.close()
+
+    if not is_new:
+        return
+
+    try:
+        from src.tasks.whatsapp_inbox_task import process_whatsapp_inbox
+
+        process_whatsapp_inbox.delay(normalized_phone)
+    except Exception as e:
+        # The message is queued; the next dispatch for this phone drains it
+        logger.error(
+            f"Failed to dispatch WhatsApp worker: {e}",
+            exc_info=True,
+            extra={"message_sid": payload.MessageSid},
+        )
+
+
 @router.post("/webhook", response_class=Response)
 async def whatsapp_webhook(
     request: Request,
@@ -116,6 +178,9 @@ async def whatsapp_webhook(
     5. Processes message through WhatsAppService (reuses Phase 2 pipeline)
     6. Returns TwiML response with agent reply
 
+    In async processing mode step 5 is replaced by enqueueing the message
+    for the worker, and step 6 returns an empty TwiML response.
+
     Args:
         request: FastAPI request with form data
         db: Database session
@@ -177,6 +242,25 @@ async def whatsapp_webhook(
             }
         )
 
+        # Stable session per phone number (not per message) — supports multi-turn state
+        normalized_phone = sender_phone.replace("whatsapp:", "").strip()
+        session_id = f"wa-{normalized_phone}"
+
+        # Async mode: acknowledge now, the worker replies via the REST API
+        if settings.WHATSAPP_ASYNC_PROCESSING:
+            try:
+                await enqueue_for_worker(
+                    user, payload, media_items, normalized_phone, session_id
+                )
+                return Response(content=str(MessagingResponse()), media_type="application/xml")
+            except Exception as e:
+                # Queue unavailable: answer inline rather than drop the message
+                logger.error(
+                    f"Failed to enqueue WhatsApp message, processing inline: {e}",
+                    exc_info=True,
+                    extra={"message_sid": payload.MessageSid},
+                )
+
         # Step 6: Process message through WhatsAppService
         storage_service = StorageService()
         whatsapp_service = WhatsAppService(
@@ -184,17 +268,14 @@ async def whatsapp_webhook(
             storage_service=storage_service
         )
 
-        # Stable session per phone number (not per message) — supports multi-turn state
-        normalized_phone = sender_phone.replace("whatsapp:", "").strip()
-        session_id = f"wa-{normalized_phone}"
-
-        result = await whatsapp_service.process_incoming_message(
-            user=user,
-            message_body=payload.Body,
-            media_items=media_items,
-            session_id=session_id,
-            db=db
-        )
+        with llm_deadline(settings.WHATSAPP_WEBHOOK_DEADLINE_SECONDS):
+            result = await whatsapp_service.process_incoming_message(
+                user=user,
+                message_body=payload.Body,
+                media_items=media_items,
+                session_id=session_id,
+                db=db
+            )
 
         # Step 7: Return TwiML response
         resp = MessagingResponse()
@@ -214,6 +295,12 @@ async def whatsapp_webhook(
     except HTTPException:
         # Re-raise HTTP exceptions (like signature validation failure)
         raise
+    except LLMPoolBusy as e:
+        # Saturated LLM pool: answer at once instead of letting Twilio time out
+        logger.warning(f"WhatsApp turn refused, LLM pool busy: {e}")
+        resp = MessagingResponse()
+        resp.message(BUSY_REPLY)
+        return Response(content=str(resp), media_type="application/xml")
     except Exception as e:
         # Log unexpected errors and return graceful error message
         logger.error(f"Unexpected error in WhatsApp webhook: {e}", exc_info=True)
@@ -4,16 +4,25 @@ import logging
 from contextvars import ContextVar
 from datetime import datetime
 from typing import Any
+from uuid import uuid4
 
 from sqlalchemy import event, insert
 from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.attributes import get_history
 
+from src.core.config import settings
 from src.core.tenant import get_tenant_context
 from src.models.audit_log import AuditLog, OperationType
+from src.models.audit_outbox import AuditOutbox
 from src.models.base import NonTenantModel, TenantAwareModel
 from src.models.ticket import Ticket
+from src.services.ticket_metrics_service import (
+    apply_ticket_metric_deltas,
+    collect_ticket_metric_deltas,
+    prepare_ticket_metric_states,
+    rollup_maintained_by_trigger,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +78,9 @@ def _serialize_value(value: Any) -> Any:
 def _get_changes_dict(obj: Any) -> dict[str, dict[str, Any]] | None:
     """Extract changes from a modified object.
 
+    Only the attributes the unit of work recorded as modified (the instance
+    state's committed_state) are inspected, not every mapped attribute.
+
     Args:
         obj: SQLAlchemy model instance
 
@@ -77,22 +89,21 @@ def _get_changes_dict(obj: Any) -> dict[str, dict[str, Any]] | None:
     """
     from sqlalchemy import inspect as sqlalchemy_inspect
 
-    inspector = sqlalchemy_inspect(obj)
+    state = sqlalchemy_inspect(obj)
     changes = {}
 
-    for attr in inspector.attrs:
-        # Skip relationships and non-modified attributes
-        if attr.key.startswith("_") or not hasattr(attr, "history"):
+    for key in list(state.committed_state):
+        if key.startswith("_"):
             continue
 
-        history = get_history(obj, attr.key)
+        history = get_history(obj, key)
         if history.has_changes():
             old_value = history.deleted[0] if history.deleted else None
             new_value = history.added[0] if history.added else None
 
             # Only include if values actually differ
             if old_value != new_value:
-                changes[attr.key] = {
+                changes[key] = {
                     "old": _serialize_value(old_value),
                     "new": _serialize_value(new_value)
                 }
@@ -185,8 +196,7 @@ def _log_ticket_changes(ticket: Ticket, changes: dict[str, dict[str, Any]]) -> N
         )
 
 
-def _create_audit_log(
-    connection: Connection,
+def _audit_row(
     tenant_id: str | None,
     user_id: str | None,
     operation: OperationType,
@@ -195,13 +205,10 @@ def _create_audit_log(
     changes: dict[str, dict[str, Any]] | None = None,
     ip_address: str | None = None,
     user_agent: str | None = None
-) -> None:
-    """Create an audit log entry directly via connection.
-
-    Uses direct connection.execute to avoid triggering recursive audit events.
+) -> dict[str, Any]:
+    """Build the column values of one audit log entry.
 
     Args:
-        connection: Database connection
         tenant_id: Tenant ID (None for non-tenant models)
         user_id: User ID performing the operation
         operation: Type of operation (CREATE, UPDATE, DELETE)
@@ -210,23 +217,63 @@ def _create_audit_log(
         changes: Dictionary of changes for UPDATE operations
         ip_address: Client IP address
         user_agent: Client user agent string
+
+    Returns:
+        Column values for insert(AuditLog); the id is assigned here so an
+        outbox entry keeps it when drained
     """
-    # Serialize changes to JSON
-    changes_json = json.dumps(changes) if changes else None
+    return {
+        "id": uuid4(),
+        "tenant_id": tenant_id or "system",  # Use "system" for non-tenant operations
+        "user_id": user_id,
+        "operation": operation,
+        "table_name": table_name,
+        "record_id": record_id,
+        "changes": json.dumps(changes) if changes else None,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+    }
+
+
+def _insert_audit_rows(connection: Connection, rows: list[dict[str, Any]]) -> None:
+    """Write a flush's audit log entries in one multi-row insert.
 
-    # Insert audit log directly using connection to avoid session events
-    connection.execute(
-        insert(AuditLog).values(
-            tenant_id=tenant_id or "system",  # Use "system" for non-tenant operations
-            user_id=user_id,
-            operation=operation,
-            table_name=table_name,
-            record_id=record_id,
-            changes=changes_json,
-            ip_address=ip_address,
-            user_agent=user_agent
+    Uses direct connection.execute to avoid triggering recursive audit events.
+    A list of parameter sets runs as a single executemany, which SQLAlchemy
+    sends as batched multi-row INSERT ... VALUES where the driver supports it
+    (insertmanyvalues on psycopg). With AUDIT_OUTBOX_ENABLED the rows go to
+    the audit_outbox staging table instead, in the same transaction, and the
+    outbox drainer moves them into audit_logs.
+
+    Args:
+        connection: Database connection
+        rows: Column values from _audit_row()
+    """
+    if not rows:
+        return
+    if settings.AUDIT_OUTBOX_ENABLED:
+        connection.execute(
+            insert(AuditOutbox),
+            [{**row, "operation": row["operation"].value} for row in rows],
         )
-    )
+    else:
+        connection.execute(insert(AuditLog), rows)
+
+
+@event.listens_for(Session, "before_flush")
+def before_flush_metrics_handler(session: Session, flush_context: Any, instances: Any) -> None:
+    """Load the ticket attributes the metrics rollup needs before they are flushed.
+
+    Skipped where the rollup trigger maintains ticket_metrics_daily.
+
+    Args:
+        session: SQLAlchemy session
+        flush_context: Flush context (unused)
+        instances: Deprecated flush argument (unused)
+    """
+    if rollup_maintained_by_trigger(session.get_bind()):
+        return
+    prepare_ticket_metric_states(session)
 
 
 @event.listens_for(Session, "after_flush")
@@ -234,7 +281,10 @@ def after_flush_audit_handler(session: Session, flush_context: Any) -> None:
     """Capture all data changes after a flush event.
 
     This event listener captures INSERT, UPDATE, and DELETE operations
-    and creates audit log entries for each change.
+    and collects an audit log entry for each change; the entries are
+    written together in one multi-row insert per flush. Without the
+    PostgreSQL rollup trigger, ticket changes are also applied to the
+    ticket_metrics_daily rollup in the same transaction.
 
     Args:
         session: SQLAlchemy session
@@ -249,6 +299,13 @@ def after_flush_audit_handler(session: Session, flush_context: Any) -> None:
     # Get database connection for direct audit log insertion
     connection = session.connection()
 
+    # Maintain the ticket metrics rollup (status transitions, new/deleted
+    # tickets) where no database trigger does it
+    if not rollup_maintained_by_trigger(connection):
+        apply_ticket_metric_deltas(connection, collect_ticket_metric_deltas(session))
+
+    rows: list[dict[str, Any]] = []
+
     # Process new objects (INSERT)
     for obj in session.new:
         if not _should_audit(obj):
@@ -259,8 +316,7 @@ def after_flush_audit_handler(session: Session, flush_context: Any) -> None:
         if isinstance(obj, TenantAwareModel) and hasattr(obj, "tenant_id"):
             obj_tenant_id = obj.tenant_id
 
-        _create_audit_log(
-            connection=connection,
+        rows.append(_audit_row(
             tenant_id=obj_tenant_id,
             user_id=user_id,
             operation=OperationType.CREATE,
@@ -269,7 +325,7 @@ def after_flush_audit_handler(session: Session, flush_context: Any) -> None:
             changes=None,  # No changes for CREATE
             ip_address=ip_address,
             user_agent=user_agent
-        )
+        ))
 
     # Process modified objects (UPDATE)
     for obj in session.dirty:
@@ -286,8 +342,7 @@ def after_flush_audit_handler(session: Session, flush_context: Any) -> None:
         if isinstance(obj, TenantAwareModel) and hasattr(obj, "tenant_id"):
             obj_tenant_id = obj.tenant_id
 
-        _create_audit_log(
-            connection=connection,
+        rows.append(_audit_row(
             tenant_id=obj_tenant_id,
             user_id=user_id,
             operation=OperationType.UPDATE,
@@ -296,7 +351,7 @@ def after_flush_audit_handler(session: Session, flush_context: Any) -> None:
             changes=changes,
             ip_address=ip_address,
             user_agent=user_agent
-        )
+        ))
 
         # Enhanced ticket-specific logging
         if isinstance(obj, Ticket) and changes:
@@ -312,8 +367,7 @@ def after_flush_audit_handler(session: Session, flush_context: Any) -> None:
         if isinstance(obj, TenantAwareModel) and hasattr(obj, "tenant_id"):
             obj_tenant_id = obj.tenant_id
 
-        _create_audit_log(
-            connection=connection,
+        rows.append(_audit_row(
             tenant_id=obj_tenant_id,
             user_id=user_id,
             operation=OperationType.DELETE,
@@ -322,4 +376,7 @@ def after_flush_audit_handler(session: Session, flush_context: Any) -> None:
             changes=None,  # No changes for DELETE (object is gone)
             ip_address=ip_address,
             user_agent=user_agent
-        )
+        ))
+
+    # One statement for the whole flush instead of one per object
+    _insert_audit_rows(connection, rows)
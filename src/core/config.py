@@ -35,6 +35,29 @@ class Settings(BaseSettings):
 
     # Redis
     REDIS_URL: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
+    REDIS_POOL_MAX_CONNECTIONS: int = Field(
+        default=50,
+        description="Connections in the process-wide Redis pool (src/core/redis_pool.py)"
+    )
+    REDIS_POOL_TIMEOUT_SECONDS: float = Field(
+        default=5.0,
+        description="How long a caller waits for a free pooled Redis connection before failing"
+    )
+    PRINCIPAL_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        description=(
+            "How long get_current_user reuses a user row for the same token "
+            "(src/core/principal_cache.py); 0 disables the cache"
+        )
+    )
+    REVOCATION_MAX_STALENESS_SECONDS: float = Field(
+        default=30.0,
+        description=(
+            "Longest a worker trusts its token revocation mirror without a "
+            "successful Redis read (src/core/revocation.py); beyond it "
+            "authenticated requests get 503"
+        )
+    )
 
     # Celery
     CELERY_BROKER_URL: str = Field(
@@ -49,6 +72,29 @@ class Settings(BaseSettings):
         default=300,
         description="SLA check interval in seconds (default 5 minutes)"
     )
+    SLA_ESCALATION_CHUNK_SIZE: int = Field(
+        default=500,
+        description="Breached tickets escalated per transaction by the SLA monitor"
+    )
+    WARD_BACKFILL_CHUNK_SIZE: int = Field(
+        default=2000,
+        description="Tickets assigned a ward per transaction by the ward backfill task"
+    )
+
+    # Dashboard metrics
+    DASHBOARD_USE_METRICS_ROLLUP: bool = Field(
+        default=True,
+        description=(
+            "Serve municipal dashboard metrics from the ticket_metrics_daily "
+            "rollup instead of scanning the tickets table"
+        ),
+    )
+
+    # Public transparency API response cache
+    PUBLIC_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache /api/v1/public responses in Redis (ETag/Cache-Control are always sent)",
+    )
 
     # CORS
     ALLOWED_ORIGINS: list[str] = Field(
@@ -81,6 +127,28 @@ class Settings(BaseSettings):
         description="DeepSeek API base URL (OpenAI-compatible)"
     )
 
+    # LLM execution pool (src/agents/llm_pool.py)
+    LLM_POOL_DEEPSEEK_CONCURRENCY: int = Field(
+        default=16,
+        description="Concurrent crew kickoffs against DeepSeek per process"
+    )
+    LLM_POOL_OPENAI_CONCURRENCY: int = Field(
+        default=16,
+        description="Concurrent crew kickoffs against OpenAI per process"
+    )
+    LLM_POOL_MAX_QUEUE: int = Field(
+        default=32,
+        description="Kickoffs allowed to wait per provider; beyond it callers get a busy reply"
+    )
+    CREW_CHAT_DEADLINE_SECONDS: float = Field(
+        default=30.0,
+        description="Turn deadline for POST /api/v1/chat; kickoffs not expected to finish in time are refused"
+    )
+    WHATSAPP_WEBHOOK_DEADLINE_SECONDS: float = Field(
+        default=12.0,
+        description="Turn deadline for inline WhatsApp webhook processing (Twilio gives up after 15s)"
+    )
+
     # Crew Server
     CREW_SERVER_URL: str = Field(
         default="http://localhost:8001",
@@ -96,6 +164,99 @@ class Settings(BaseSettings):
     TWILIO_AUTH_TOKEN: str = Field(default="", description="Twilio auth token")
     TWILIO_WHATSAPP_NUMBER: str = Field(default="", description="Twilio WhatsApp sender number (whatsapp:+14155238886)")
     TWILIO_PHONE_NUMBER: str = Field(default="", description="Twilio phone number for SMS OTP (E.164 format, e.g. +1234567890)")
+    WHATSAPP_ASYNC_PROCESSING: bool = Field(
+        default=False,
+        description=(
+            "Acknowledge WhatsApp webhooks with empty TwiML and run the agent turn "
+            "in a Celery worker, replying through the Twilio REST API"
+        )
+    )
+    WHATSAPP_DEDUPE_TTL_SECONDS: int = Field(
+        default=86400,
+        description="How long a processed Twilio MessageSid is remembered to drop webhook retries"
+    )
+
+    # Local intent classifier (src/agents/flows/intent_classifier.py)
+    INTENT_CLASSIFIER_MODE: str = Field(
+        default="shadow",
+        description=(
+            "off: routing LLM only. shadow: routing LLM decides, local prediction "
+            "is recorded for comparison. active: confident local predictions "
+            "skip the routing LLM"
+        )
+    )
+    INTENT_CLASSIFIER_THRESHOLD: float = Field(
+        default=0.9,
+        description="Minimum local confidence to answer without the routing LLM (active mode)"
+    )
+    INTENT_CLASSIFIER_GBV_FLOOR: float = Field(
+        default=0.05,
+        description=(
+            "A non-GBV local prediction is only used while p(gbv) stays below this; "
+            "anything with more GBV signal goes to the routing LLM"
+        )
+    )
+    INTENT_CLASSIFIER_TRAINING_FILE: str = Field(
+        default="",
+        description=(
+            "Optional JSONL of labelled logged conversations ({\"message\", \"intent\"} "
+            "per line) added to the seed corpus at first use"
+        )
+    )
+
+    # Conversation history window (src/core/history.py)
+    HISTORY_TOKEN_BUDGETS: dict[str, int] = Field(
+        default={
+            "manager": 800,
+            "auth": 500,
+            "ticket_status": 500,
+            "municipal": 1200,
+            "gbv": 1000,
+        },
+        description=(
+            "Token budget for the conversation history injected into each agent's "
+            "prompt, keyed by routing phase; unknown phases use the manager budget"
+        )
+    )
+    HISTORY_VERBATIM_TURNS: int = Field(
+        default=6,
+        description="Most recent turns kept word for word (fewer if they exceed the budget)"
+    )
+    HISTORY_SUMMARY_TOKEN_BUDGET: int = Field(
+        default=200,
+        description="Cap on the rolling summary of older turns; its oldest lines are dropped first"
+    )
+
+    # Background exports (src/services/export_service.py)
+    EXPORT_STORAGE_BUCKET: str = Field(
+        default="exports",
+        description="Supabase Storage bucket for background export files"
+    )
+    EXPORT_DOWNLOAD_URL_TTL_SECONDS: int = Field(
+        default=3600,
+        description="Lifetime of the signed download URL returned for a completed export job"
+    )
+
+    # Audit outbox (src/models/audit_outbox.py, src/tasks/audit_outbox_task.py)
+    AUDIT_OUTBOX_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Write audit entries to the audit_outbox staging table in the business "
+            "transaction and let a Celery drainer move them into audit_logs in batches"
+        )
+    )
+    AUDIT_OUTBOX_DRAIN_INTERVAL_SECONDS: int = Field(
+        default=5,
+        description="How often Celery Beat runs the audit outbox drainer"
+    )
+    AUDIT_OUTBOX_BATCH_SIZE: int = Field(
+        default=5000,
+        description="Outbox entries moved into audit_logs per drain transaction"
+    )
+    AUDIT_OUTBOX_LAG_ALERT_SECONDS: float = Field(
+        default=300.0,
+        description="Log an error when the oldest undrained audit entry is older than this"
+    )
 
     # SMTP email (for statutory deadline notifications)
     SMTP_HOST: str = Field(default="", description="SMTP server host for outbound email")
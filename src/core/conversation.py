@@ -54,6 +54,15 @@ class ConversationState(BaseModel):
     'manager' | 'auth' | 'municipal' | 'gbv' | 'ticket_status'.
     Used by crew_server.py to short-circuit manager re-entry for active specialist sessions."""
 
+    # --- Rolling history summary (src/core/history.py) ---
+    history_summary: str = ""
+    """Compacted form of the turns that fell out of the verbatim history window.
+    Metadata only (turn counts) for GBV conversations — never their content."""
+
+    summarized_turns: int = 0
+    """Number of leading dialogue turns (system turns excluded) covered by
+    history_summary; only turns after it are considered for the verbatim window."""
+
 
 class ConversationManager:
     """Redis-backed conversation state manager with GBV/municipal namespace separation.
@@ -66,14 +75,22 @@ class ConversationManager:
     MUNICIPAL_PREFIX = "conv:municipal:"
     GBV_PREFIX = "conv:gbv:"
 
-    def __init__(self, redis_url: str, default_ttl: int = 3600):
+    def __init__(
+        self,
+        redis_url: str,
+        default_ttl: int = 3600,
+        redis_client: redis.Redis | None = None,
+    ):
         """Initialize conversation manager.
 
         Args:
             redis_url: Redis connection URL
             default_ttl: Default TTL in seconds (default: 1 hour)
+            redis_client: Shared pooled client (src/core/redis_pool.py). When
+                given, redis_url is ignored and close() leaves the client open
         """
-        self._redis = redis.from_url(redis_url, decode_responses=True)
+        self._owns_client = redis_client is None
+        self._redis = redis_client or redis.from_url(redis_url, decode_responses=True)
         self._default_ttl = default_ttl
 
     def _get_key(self, user_id: str, session_id: str, is_gbv: bool = False) -> str:
@@ -229,5 +246,6 @@ class ConversationManager:
         return state
 
     async def close(self) -> None:
-        """Close Redis connection."""
-        await self._redis.aclose()
+        """Close Redis connection (unless it is the shared pooled client)."""
+        if self._owns_client:
+            await self._redis.aclose()
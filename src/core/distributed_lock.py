@@ -0,0 +1,161 @@
+"""PostgreSQL advisory-lock utilities for coordinating workers and replicas.
+
+Provides deterministic lock keys and two lock flavours:
+- try_advisory_xact_lock: transaction-scoped lock on an existing session
+  (released on commit/rollback), for per-record work such as escalating a
+  single ticket
+- distributed_lock: session-scoped lock held on a dedicated connection for
+  the duration of an ``async with`` block, for singleton periodic tasks
+  (several beat/worker replicas may fire the same task; one runs, the
+  others skip)
+
+Key decisions:
+- Keys are the two-int form pg_try_advisory_lock(int4, int4), derived from
+  a BLAKE2b digest of (namespace, key). Unlike Python's hash(), which is
+  salted per process, the digest is identical in every worker, and 64 bits
+  make collisions between unrelated keys negligible
+- Namespaces keep unrelated lock families (tickets, tasks) apart even if
+  their keys coincide
+- Non-blocking only: contention means another worker owns the work, so the
+  caller skips it and the skip is counted in metrics
+- Metrics and logs name the namespace, never the lock name: names can be
+  citizen phone numbers (per-phone WhatsApp inbox locks), which must not
+  become metric labels (PII, and one series per phone that never goes away)
+- On SQLite (tests, local dev) there is no concurrency to coordinate, so
+  distributed_lock always succeeds
+"""
+import hashlib
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def advisory_lock_key(namespace: str, key: UUID | str) -> tuple[int, int]:
+    """Derive a stable (int4, int4) advisory lock key.
+
+    Args:
+        namespace: Lock family (e.g. "ticket_escalation", "task")
+        key: Record UUID or name within the namespace
+
+    Returns:
+        Two signed 32-bit integers for pg_*advisory*_lock(int4, int4)
+    """
+    key_bytes = key.bytes if isinstance(key, UUID) else str(key).encode("utf-8")
+    digest = hashlib.blake2b(
+        namespace.encode("utf-8") + b"\x00" + key_bytes, digest_size=8
+    ).digest()
+    return (
+        int.from_bytes(digest[:4], "big", signed=True),
+        int.from_bytes(digest[4:], "big", signed=True),
+    )
+
+
+def _record(namespace: str, acquired: bool) -> None:
+    """Count lock outcomes: acquisitions and contended (skipped) attempts."""
+    if acquired:
+        metrics.inc("distributed_lock_acquired_total", lock=namespace)
+    else:
+        metrics.inc("distributed_lock_contended_total", lock=namespace)
+
+
+async def try_advisory_xact_lock(
+    db: AsyncSession,
+    namespace: str,
+    key: UUID | str,
+) -> bool:
+    """Try to take a transaction-scoped advisory lock (PostgreSQL).
+
+    Args:
+        db: Session whose current transaction will hold the lock
+        namespace: Lock family
+        key: Record UUID or name
+
+    Returns:
+        True if acquired, False if another transaction holds it
+    """
+    high, low = advisory_lock_key(namespace, key)
+    result = await db.execute(
+        text("SELECT pg_try_advisory_xact_lock(:high, :low)"),
+        {"high": high, "low": low},
+    )
+    acquired = bool(result.scalar())
+    _record(namespace, acquired)
+    return acquired
+
+
+@asynccontextmanager
+async def distributed_lock(
+    name: str,
+    engine: AsyncEngine | None = None,
+    namespace: str = "task",
+) -> AsyncIterator[bool]:
+    """Hold a session-scoped advisory lock for the duration of the block.
+
+    Yields whether the lock was acquired; callers skip their work when it
+    was not. The lock lives on a dedicated connection (not a pooled ORM
+    session, whose connection may change between transactions) and is
+    released explicitly on exit.
+
+    Usage:
+        async with distributed_lock("sla_monitor") as acquired:
+            if not acquired:
+                return {"skipped": True}
+            ...
+
+    Args:
+        name: Lock name (usually the task name); kept out of metrics and logs
+        engine: Engine to take the connection from (default: app engine)
+        namespace: Lock family
+    """
+    if engine is None:
+        from src.core.database import engine as default_engine
+        engine = default_engine
+
+    if engine.dialect.name != "postgresql":
+        _record(namespace, True)
+        yield True
+        return
+
+    high, low = advisory_lock_key(namespace, name)
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            text("SELECT pg_try_advisory_lock(:high, :low)"),
+            {"high": high, "low": low},
+        )
+        acquired = bool(result.scalar())
+        # End the implicit transaction so the connection is not left
+        # idle-in-transaction while the protected work runs
+        await conn.commit()
+        _record(namespace, acquired)
+
+        if not acquired:
+            metrics.inc("distributed_lock_skipped_runs_total", lock=namespace)
+            logger.info(f"Lock in namespace '{namespace}' held by another worker, skipping run")
+            yield False
+            return
+
+        metrics.add_gauge("distributed_lock_held", 1, lock=namespace)
+        try:
+            yield True
+        finally:
+            metrics.add_gauge("distributed_lock_held", -1, lock=namespace)
+            try:
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:high, :low)"),
+                    {"high": high, "low": low},
+                )
+                await conn.commit()
+            except Exception as e:
+                # Never return a connection that may still hold the lock
+                logger.error(
+                    f"Failed to release lock in namespace '{namespace}': {e}", exc_info=True
+                )
+                await conn.invalidate()
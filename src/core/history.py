@@ -0,0 +1,188 @@
+"""Token-budgeted conversation history for specialist prompts.
+
+Every turn used to inject the whole conversation (up to 20 turns of up to
+2000 chars each) into the specialist's task description, so prompt size —
+and with it latency and cost — grew with every message. build_history()
+bounds it instead:
+
+- Recent turns verbatim: the last HISTORY_VERBATIM_TURNS dialogue turns,
+  trimmed oldest-first until they fit the agent's HISTORY_TOKEN_BUDGETS
+  entry. The newest turn (the citizen's current message) is always kept
+- Older turns are rolled into ConversationState.history_summary once and
+  reused on later turns (ConversationState.summarized_turns marks how far
+  it reaches), capped at HISTORY_SUMMARY_TOKEN_BUDGET
+- GBV conversations get a metadata-only summary (turn counts), never
+  content; any content summary from before the conversation turned GBV is
+  replaced
+
+Key decisions:
+- The summary is extractive (leading snippet of each turn), not an LLM
+  call: a summarisation call per turn would add back the latency the
+  window removes
+- Tokens are counted with tiktoken's cl100k_base; if the encoding cannot be
+  loaded (offline, no cached BPE file) a 4-chars-per-token estimate is used.
+  The outcome of the first load is cached: a failed fetch switches the
+  process to the estimate until restart, and is logged once as a warning
+- System turns (e.g. lang_pref:...) are bookkeeping and never reach prompts
+- Conversations short enough to fit render exactly as before (no summary
+  header), so early-turn prompts are unchanged
+"""
+import functools
+import logging
+import math
+from typing import Iterable
+
+from src.core.config import settings
+from src.core.conversation import ConversationState
+from src.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+_ENCODING = "cl100k_base"
+
+# Characters of each older turn kept in the rolling summary
+_SUMMARY_SNIPPET_CHARS = 120
+
+_OMITTED_LINE = "- (earlier turns omitted)"
+
+_GBV_PHASES = ("gbv", "gbv_pending_confirm")
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    """cl100k_base, or None to use the length estimate.
+
+    Cached, including a failure: a fetch that fails on first use (network,
+    no TIKTOKEN_CACHE_DIR) is not retried, so the warning below is logged
+    once and the process estimates until it restarts.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(_ENCODING)
+    except Exception as e:
+        logger.warning(
+            f"tiktoken encoding {_ENCODING} unavailable, estimating token counts "
+            f"(4 chars per token) for the rest of this process: {e}"
+        )
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Token count of text (cl100k_base, or a length estimate without tiktoken)."""
+    encoding = _encoding()
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def format_turns(turns: list[dict]) -> str:
+    """Format turns as "User: ..." / "Agent: ..." lines, or "(none)" if empty."""
+    if not turns:
+        return "(none)"
+    return "\n".join(_format_turn(turn) for turn in turns)
+
+
+def _format_turn(turn: dict) -> str:
+    return f"{turn.get('role', 'user').capitalize()}: {turn.get('content', '')}"
+
+
+def budget_for(agent: str) -> int:
+    """History token budget for a routing phase (manager budget if unknown)."""
+    budgets = settings.HISTORY_TOKEN_BUDGETS
+    return budgets.get(agent, budgets.get("manager", 800))
+
+
+def is_gbv_conversation(state: ConversationState) -> bool:
+    return state.category == "gbv" or state.routing_phase in _GBV_PHASES
+
+
+def _snippet(turn: dict) -> str:
+    content = " ".join(str(turn.get("content", "")).split())
+    if len(content) > _SUMMARY_SNIPPET_CHARS:
+        content = content[:_SUMMARY_SNIPPET_CHARS].rstrip() + "..."
+    return f"- {turn.get('role', 'user').capitalize()}: {content}"
+
+
+def _cap_summary(lines: list[str]) -> str:
+    """Drop the oldest summary lines until the summary fits its budget."""
+    lines = [line for line in lines if line != _OMITTED_LINE]
+    costs = [count_tokens(line) + 1 for line in lines]
+    used, dropped = sum(costs), False
+    while lines and used > settings.HISTORY_SUMMARY_TOKEN_BUDGET:
+        used -= costs.pop(0)
+        lines.pop(0)
+        dropped = True
+    return "\n".join(([_OMITTED_LINE] if dropped else []) + lines)
+
+
+def _gbv_summary(turns: list[dict]) -> str:
+    users = sum(1 for turn in turns if turn.get("role") == "user")
+    return (
+        f"- {users} earlier citizen message(s) and {len(turns) - users} earlier "
+        "assistant reply(ies); content not retained"
+    )
+
+
+def build_history(
+    state: ConversationState,
+    pending_turns: Iterable[dict] = (),
+    agent: str | None = None,
+    is_gbv: bool | None = None,
+) -> str:
+    """Render the conversation for a prompt within the agent's token budget.
+
+    Advances state.history_summary / state.summarized_turns when turns fall
+    out of the verbatim window; the caller persists the state if
+    summarized_turns changed.
+
+    Args:
+        state: Conversation state (turns already persisted)
+        pending_turns: Turns not persisted yet, e.g. the current message
+        agent: Routing phase whose budget applies (default: state.routing_phase)
+        is_gbv: Metadata-only summary (default: derived from state)
+
+    Returns:
+        History string for the task description, or "(none)" if empty.
+    """
+    agent = agent or state.routing_phase
+    if is_gbv is None:
+        is_gbv = is_gbv_conversation(state)
+
+    dialogue = [turn for turn in (*state.turns, *pending_turns) if turn.get("role") != "system"]
+    if not dialogue:
+        return "(none)"
+
+    # Never re-show summarised turns, never summarise the newest turn
+    start = max(
+        min(state.summarized_turns, len(dialogue) - 1),
+        len(dialogue) - settings.HISTORY_VERBATIM_TURNS,
+    )
+    lines = [_format_turn(turn) for turn in dialogue[start:]]
+    costs = [count_tokens(line) + 1 for line in lines]
+    used = sum(costs)
+    budget = budget_for(agent)
+    while len(lines) > 1 and used > budget:
+        used -= costs.pop(0)
+        lines.pop(0)
+        start += 1
+
+    if start > state.summarized_turns:
+        if not is_gbv:
+            previous = state.history_summary.splitlines() if state.history_summary else []
+            state.history_summary = _cap_summary(
+                previous + [_snippet(turn) for turn in dialogue[state.summarized_turns:start]]
+            )
+        state.summarized_turns = start
+    if is_gbv and state.summarized_turns:
+        state.history_summary = _gbv_summary(dialogue[:state.summarized_turns])
+
+    history = "\n".join(lines)
+    if state.history_summary:
+        history = (
+            f"Earlier in this conversation (summary):\n{state.history_summary}\n\n"
+            f"Recent turns:\n{history}"
+        )
+        used += count_tokens(state.history_summary)
+    metrics.observe("conversation_history_tokens", used, agent=agent)
+    return history
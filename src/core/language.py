@@ -4,11 +4,29 @@ This module provides deterministic language detection for South African citizens
 reporting issues in English, isiZulu, or Afrikaans. Uses confidence thresholds
 and minimum text length to ensure reliable detection.
 
+Detection runs on every WhatsApp and web message before routing, so it is
+kept cheap:
+- Single pass: the label and its confidence both come from one
+  compute_language_confidence_values() call (detect_language_of() would run
+  the same n-gram scoring a second time)
+- Bounded LRU memo keyed by a hash of the normalized text, so repeated
+  messages ("yes please", greetings, retries) are not scored again
+- The lingua detector is built on first use, or explicitly with preload()
+  (crew server startup), not at import time
+
 Key decisions:
 - Short text (<20 chars) falls back to user's preferred language (unreliable)
 - Minimum confidence 0.7 required to avoid false positives
-- Minimum relative distance 0.25 to distinguish between similar languages
+- Minimum relative distance 0.25 to distinguish between similar languages,
+  applied to the confidence values exactly as lingua's detect_language_of() does
+- The memo stores a digest of the text, never the text itself, so citizen
+  messages are not retained in process memory
 """
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Iterable
+
 from lingua import Language, LanguageDetectorBuilder, LanguageDetector as LinguaDetector
 
 
@@ -28,15 +46,119 @@ class LanguageDetector:
 
     MIN_CONFIDENCE = 0.7
     MIN_TEXT_LENGTH = 20
-
-    def __init__(self):
-        """Initialize the language detector for EN/ZU/AF only."""
-        self._detector: LinguaDetector = (
-            LanguageDetectorBuilder
-            .from_languages(Language.ENGLISH, Language.ZULU, Language.AFRIKAANS)
-            .with_minimum_relative_distance(0.25)
-            .build()
-        )
+    MIN_RELATIVE_DISTANCE = 0.25
+
+    # Memo entries kept (digest -> (language, confidence)), least recently used evicted
+    CACHE_SIZE = 4096
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        """Set up the detector; the lingua model is built on first use."""
+        self._lingua: LinguaDetector | None = None
+        self._build_lock = threading.Lock()
+        self._cache: OrderedDict[bytes, tuple[Language | None, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_size = cache_size
+
+    @property
+    def _detector(self) -> LinguaDetector:
+        if self._lingua is None:
+            with self._build_lock:
+                if self._lingua is None:
+                    self._lingua = (
+                        LanguageDetectorBuilder
+                        .from_languages(*self.LANGUAGE_MAP)
+                        .with_minimum_relative_distance(self.MIN_RELATIVE_DISTANCE)
+                        .build()
+                    )
+        return self._lingua
+
+    def preload(self) -> None:
+        """Build the detector and load its language models now.
+
+        Call at process startup to keep the model load off the first
+        citizen's message.
+        """
+        self._detector.compute_language_confidence_values("preload")
+
+    def cache_clear(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        # lingua lowercases and splits on whitespace itself, so these
+        # variants score identically and can share a memo entry
+        return " ".join(text.split()).lower()
+
+    @staticmethod
+    def _key(normalized: str) -> bytes:
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> tuple[Language | None, float] | None:
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _cache_put(self, key: bytes, result: tuple[Language | None, float]) -> None:
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _pick(self, confidence_values) -> tuple[Language | None, float]:
+        """Most likely language and its confidence, or (None, 0.0) if ambiguous.
+
+        Mirrors lingua's detect_language_of(): no language when the top two
+        confidences are equal or closer than the minimum relative distance.
+        """
+        if not confidence_values:
+            return (None, 0.0)
+        top = confidence_values[0]
+        if len(confidence_values) > 1:
+            second = confidence_values[1].value
+            if top.value == second or top.value - second < self.MIN_RELATIVE_DISTANCE:
+                return (None, 0.0)
+        return (top.language, top.value)
+
+    def _score(self, text: str) -> tuple[Language | None, float]:
+        """Detected language and confidence for text, memoized."""
+        normalized = self._normalize(text)
+        key = self._key(normalized)
+        result = self._cache_get(key)
+        if result is None:
+            result = self._pick(self._detector.compute_language_confidence_values(normalized))
+            self._cache_put(key, result)
+        return result
+
+    def _score_many(self, texts: list[str]) -> list[tuple[Language | None, float]]:
+        """_score() for many texts; cache misses are scored in parallel by lingua."""
+        normalized = [self._normalize(text) for text in texts]
+        keys = [self._key(n) for n in normalized]
+        results = [self._cache_get(key) for key in keys]
+
+        misses: dict[bytes, str] = {}
+        for key, n, result in zip(keys, normalized, results):
+            if result is None:
+                misses.setdefault(key, n)
+        if misses:
+            scored = self._detector.compute_language_confidence_values_in_parallel(
+                list(misses.values())
+            )
+            fresh = {}
+            for key, values in zip(misses, scored):
+                fresh[key] = self._pick(values)
+                self._cache_put(key, fresh[key])
+            results = [fresh[key] if result is None else result for key, result in zip(keys, results)]
+        return results
+
+    def _label(self, detected: Language | None, confidence: float, fallback: str) -> str:
+        # No detection or low confidence - use fallback
+        if detected is None or confidence < self.MIN_CONFIDENCE:
+            return fallback
+        return self.LANGUAGE_MAP.get(detected, fallback)
 
     def detect(self, text: str, fallback: str = "en") -> str:
         """Detect language from text with fallback logic.
@@ -57,29 +179,25 @@ class LanguageDetector:
         if len(text.strip()) < self.MIN_TEXT_LENGTH:
             return fallback
 
-        # Detect language
-        detected = self._detector.detect_language_of(text)
-
-        # No detection - use fallback
-        if detected is None:
-            return fallback
+        return self._label(*self._score(text), fallback)
 
-        # Check confidence
-        confidence_values = self._detector.compute_language_confidence_values(text)
+    def detect_batch(self, texts: Iterable[str], fallback: str = "en") -> list[str]:
+        """detect() for many texts at once (evaluation runs, backfill jobs).
 
-        # Find confidence for detected language
-        detected_confidence = 0.0
-        for lang_conf in confidence_values:
-            if lang_conf.language == detected:
-                detected_confidence = lang_conf.value
-                break
-
-        # Low confidence - use fallback
-        if detected_confidence < self.MIN_CONFIDENCE:
-            return fallback
+        Args:
+            texts: Input texts
+            fallback: ISO language code for texts whose detection is unreliable
 
-        # Return ISO code
-        return self.LANGUAGE_MAP.get(detected, fallback)
+        Returns:
+            One ISO 639-1 code per input text, in input order.
+        """
+        texts = list(texts)
+        long_enough = [i for i, text in enumerate(texts) if len(text.strip()) >= self.MIN_TEXT_LENGTH]
+        codes = [fallback] * len(texts)
+        scores = self._score_many([texts[i] for i in long_enough])
+        for i, (detected, confidence) in zip(long_enough, scores):
+            codes[i] = self._label(detected, confidence, fallback)
+        return codes
 
     def detect_with_confidence(self, text: str) -> tuple[str, float]:
         """Detect language and return confidence score for logging/debugging.
@@ -94,23 +212,13 @@ class LanguageDetector:
         if len(text.strip()) < self.MIN_TEXT_LENGTH:
             return ("en", 0.0)
 
-        detected = self._detector.detect_language_of(text)
+        detected, confidence = self._score(text)
 
         if detected is None:
             return ("en", 0.0)
 
-        confidence_values = self._detector.compute_language_confidence_values(text)
-
-        detected_confidence = 0.0
-        for lang_conf in confidence_values:
-            if lang_conf.language == detected:
-                detected_confidence = lang_conf.value
-                break
-
-        language_code = self.LANGUAGE_MAP.get(detected, "en")
-
-        return (language_code, detected_confidence)
+        return (self.LANGUAGE_MAP.get(detected, "en"), confidence)
 
 
-# Module-level singleton
+# Module-level singleton (the lingua model is built on first use)
 language_detector = LanguageDetector()
@@ -0,0 +1,97 @@
+"""Lightweight in-process metrics registry.
+
+Counters, gauges and timing summaries keyed by metric name plus a sorted
+label tuple. Values are per process (each API worker and Celery worker keeps
+its own); snapshot() returns a plain dict suitable for logging or a debug
+endpoint.
+
+Key decisions:
+- No external dependency (no Prometheus client in the stack); the registry
+  is small enough to swap for a real exporter later without touching callers
+- Thread-safe (Celery prefork/threads and the asyncio loop may both record)
+- Labels are keyword arguments so call sites read like structured logs
+"""
+import threading
+from collections import defaultdict
+from typing import Any
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class MetricsRegistry:
+    """Process-wide counters, gauges and summaries."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[LabelKey, float]] = defaultdict(dict)
+        self._gauges: dict[str, dict[LabelKey, float]] = defaultdict(dict)
+        self._summaries: dict[str, dict[LabelKey, list[float]]] = defaultdict(dict)
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Increment a counter."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters[name]
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        """Set a gauge to an absolute value."""
+        with self._lock:
+            self._gauges[name][_label_key(labels)] = value
+
+    def add_gauge(self, name: str, delta: float, **labels: Any) -> None:
+        """Adjust a gauge by delta (e.g. +1 on acquire, -1 on release)."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._gauges[name]
+            series[key] = series.get(key, 0) + delta
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record an observation (count, sum and max are kept)."""
+        key = _label_key(labels)
+        with self._lock:
+            summary = self._summaries[name].setdefault(key, [0, 0.0, 0.0])
+            summary[0] += 1
+            summary[1] += value
+            summary[2] = max(summary[2], value)
+
+    def get(self, name: str, **labels: Any) -> float:
+        """Return the current value of a counter or gauge (0 if unset)."""
+        key = _label_key(labels)
+        with self._lock:
+            if key in self._counters.get(name, {}):
+                return self._counters[name][key]
+            return self._gauges.get(name, {}).get(key, 0)
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """Return all series as {name: [{"labels": {...}, ...values}]}."""
+        with self._lock:
+            result: dict[str, list[dict[str, Any]]] = {}
+            for name, series in self._counters.items():
+                result[name] = [
+                    {"labels": dict(key), "value": value} for key, value in series.items()
+                ]
+            for name, series in self._gauges.items():
+                result[name] = [
+                    {"labels": dict(key), "value": value} for key, value in series.items()
+                ]
+            for name, series in self._summaries.items():
+                result[name] = [
+                    {"labels": dict(key), "count": count, "sum": total, "max": peak}
+                    for key, (count, total, peak) in series.items()
+                ]
+            return result
+
+    def reset(self) -> None:
+        """Clear all series (tests)."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._summaries.clear()
+
+
+metrics = MetricsRegistry()
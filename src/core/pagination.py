@@ -0,0 +1,235 @@
+"""Keyset (cursor) pagination helpers for list endpoints.
+
+Offset pagination re-reads and discards every row before the requested page,
+so deep pages get linearly slower. Keyset pagination instead remembers the
+last row's (sort value, id) and asks for rows strictly after it, which an
+index on the sort column answers directly regardless of depth.
+
+Key decisions:
+- The cursor is opaque to clients: URL-safe base64 of a small JSON payload
+  holding the sort key, direction, last sort value and last id. A cursor is
+  only valid for the sort it was issued with
+- id is the tie-breaker so rows sharing a sort value are neither skipped
+  nor repeated; comparison uses a row-value (sort, id) < (:v, :id), which
+  PostgreSQL can satisfy from a composite index
+- Totals are optional: estimate_count reads the planner's row estimate
+  (EXPLAIN) instead of running COUNT(*) over the full filter, and
+  total_mode="none" skips counting altogether. Cursor mode defaults to
+  "none" so each page costs one index range read, not a full COUNT(*)
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.tenant import get_tenant_context
+
+TOTAL_MODES = ("exact", "estimate", "none")
+
+
+@dataclass
+class CursorPosition:
+    """Decoded cursor: the last row of the previous page."""
+
+    sort_key: str
+    descending: bool
+    value: Any
+    id: UUID
+
+
+def _encode_value(value: Any) -> dict:
+    if isinstance(value, datetime):
+        return {"t": "dt", "v": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"t": "uuid", "v": str(value)}
+    return {"t": "raw", "v": value.value if hasattr(value, "value") else value}
+
+
+def _decode_value(payload: dict) -> Any:
+    kind, value = payload["t"], payload["v"]
+    if kind == "dt":
+        return datetime.fromisoformat(value)
+    if kind == "uuid":
+        return UUID(value)
+    return value
+
+
+def encode_cursor(sort_key: str, descending: bool, value: Any, row_id: UUID) -> str:
+    """Encode the position after a row as an opaque cursor string."""
+    payload = {
+        "k": sort_key,
+        "d": descending,
+        "v": _encode_value(value),
+        "id": str(row_id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str, descending: bool) -> CursorPosition:
+    """Decode and validate a cursor for the requested sort.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        position = CursorPosition(
+            sort_key=payload["k"],
+            descending=bool(payload["d"]),
+            value=_decode_value(payload["v"]),
+            id=UUID(payload["id"]),
+        )
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if position.sort_key != sort_key or position.descending != descending:
+        raise ValueError("Cursor does not match the requested sort order")
+    return position
+
+
+async def keyset_page(
+    db: AsyncSession,
+    query: Select,
+    sort_column,
+    id_column,
+    sort_key: str,
+    descending: bool,
+    page_size: int,
+    cursor: str | None = None,
+) -> tuple[list[Any], str | None]:
+    """Fetch one page of ORM entities using keyset pagination.
+
+    Args:
+        db: Database session
+        query: Filtered select of a single entity (no ORDER BY/LIMIT)
+        sort_column: Column to sort by
+        id_column: Unique tie-breaker column (primary key)
+        sort_key: Name of the sort column (embedded in the cursor)
+        descending: Sort direction
+        page_size: Rows per page
+        cursor: Cursor from the previous page's next_cursor, or None for the
+            first page
+
+    Returns:
+        (rows, next_cursor) where next_cursor is None on the last page
+
+    Raises:
+        ValueError: If the cursor is invalid for this sort
+    """
+    if cursor:
+        position = decode_cursor(cursor, sort_key, descending)
+        boundary = tuple_(sort_column, id_column)
+        after = (position.value, position.id)
+        query = query.where(boundary < after if descending else boundary > after)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    # One extra row tells us whether another page exists
+    result = await db.execute(query.limit(page_size + 1))
+    rows = list(result.scalars().all())
+
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            sort_key,
+            descending,
+            getattr(last, sort_column.key),
+            getattr(last, id_column.key),
+        )
+    return rows, next_cursor
+
+
+def _with_tenant_filter(query: Select) -> Select:
+    """Apply the tenant predicate to a query that will not go through the ORM filter.
+
+    The do_orm_execute tenant filter (src/models/base.py) only rewrites
+    ORM entity selects; a driver-level EXPLAIN would otherwise see every
+    tenant's rows.
+    """
+    entity = query.column_descriptions[0].get("entity")
+    tenant_id = get_tenant_context()
+    if tenant_id is not None and entity is not None and hasattr(entity, "tenant_id"):
+        query = query.where(entity.tenant_id == tenant_id)
+    return query
+
+
+async def exact_count(db: AsyncSession, query: Select) -> int:
+    """COUNT(*) over a filtered query (tenant-scoped).
+
+    Counts over the query's own FROM rather than wrapping it in a subquery:
+    the ORM tenant filter appends its predicate to the outermost statement,
+    and on a ``SELECT count(*) FROM (subquery)`` that cross-joins the
+    entity table back in and multiplies the count.
+    """
+    query = _with_tenant_filter(query)
+    count_query = query.with_only_columns(
+        func.count(), maintain_column_froms=True
+    ).order_by(None)
+    result = await db.execute(count_query)
+    return result.scalar() or 0
+
+
+async def estimate_count(db: AsyncSession, query: Select) -> int:
+    """Estimate the number of rows a query returns from planner statistics.
+
+    On PostgreSQL runs EXPLAIN (FORMAT JSON) and returns the top node's
+    "Plan Rows", which costs a planning pass instead of a scan. Other
+    dialects (SQLite tests) fall back to an exact count.
+
+    EXPLAIN is executed as a driver-level statement, which bypasses the ORM
+    tenant filter, so the tenant predicate is applied here explicitly.
+    """
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return await exact_count(db, query)
+
+    query = _with_tenant_filter(query)
+    compiled = query.order_by(None).compile(
+        dialect=bind.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    conn = await db.connection()
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def resolve_total_mode(total_mode: str | None, cursor_mode: bool) -> str:
+    """Pick the total_mode for a request: explicit, else "none" in cursor mode.
+
+    Raises:
+        ValueError: If total_mode is not one of TOTAL_MODES
+    """
+    if total_mode is None:
+        return "none" if cursor_mode else "exact"
+    if total_mode not in TOTAL_MODES:
+        raise ValueError(f"total_mode must be one of {', '.join(TOTAL_MODES)}")
+    return total_mode
+
+
+async def count_total(
+    db: AsyncSession, query: Select, total_mode: str
+) -> tuple[int | None, bool]:
+    """Return (total, is_estimate) for a query according to total_mode.
+
+    total is None for total_mode="none" (no query is run).
+    """
+    if total_mode == "none":
+        return None, False
+    if total_mode == "estimate":
+        return await estimate_count(db, query), True
+    return await exact_count(db, query), False
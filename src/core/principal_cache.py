@@ -0,0 +1,205 @@
+"""In-process cache of authenticated principals for get_current_user.
+
+get_current_user used to SELECT the user row on every authenticated request,
+although role and tenant already come from the verified JWT. This cache keeps
+the user's column values for a short TTL, keyed by (user id, token hash), so
+repeat requests with the same token skip the round-trip on the small DB pool.
+
+Key decisions:
+- Values, not ORM instances: a hit rebuilds a User and attaches it to the
+  request's session as a clean persistent object (no SQL), so endpoints
+  that modify current_user and commit (data rights, verification) emit the
+  same UPDATEs as before
+- Keyed by token hash as well as user id: a refreshed token (new role or
+  tenant claims) never reuses an entry built for the old one
+- Explicit invalidation, propagated to every worker over Redis pub/sub
+  (PRINCIPAL_CACHE_CHANNEL):
+  - blacklisting a token (rbac_service.blacklist_user_token)
+  - any committed ORM change to a User row or a UserRoleAssignment (role
+    assignment, approval, revocation, deactivation, deletion), collected in
+    after_flush and published after_commit
+- Writes that bypass the ORM (Supabase dashboard, Core UPDATEs) are bounded
+  by the TTL (settings.PRINCIPAL_CACHE_TTL_SECONDS, 0 disables the cache)
+- The listener clears the whole cache whenever it (re)subscribes, since
+  invalidations published while it was disconnected are lost
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.core.redis_pool import get_redis
+from src.models.role_assignment import UserRoleAssignment
+from src.models.user import User
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_CACHE_CHANNEL = "principal_cache:invalidate"
+
+_PENDING_KEY = "principal_cache_invalidations"
+
+
+def token_digest(token: str) -> str:
+    """SHA-256 hex digest of a JWT (same digest the blacklist stores)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class PrincipalCache:
+    """TTL + LRU map of (user_id, token_digest) -> User column values."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10000):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict]] = OrderedDict()
+
+    def get(self, user_id: str, digest: str) -> dict | None:
+        """Return cached column values, or None on a miss or expired entry."""
+        key = (user_id, digest)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            metrics.inc("principal_cache_misses_total")
+            return None
+        self._entries.move_to_end(key)
+        metrics.inc("principal_cache_hits_total")
+        return entry[1]
+
+    def put(self, user_id: str, digest: str, values: dict) -> None:
+        """Cache a user's column values for this token."""
+        if self._ttl <= 0:
+            return
+        self._entries[(user_id, digest)] = (time.monotonic() + self._ttl, values)
+        self._entries.move_to_end((user_id, digest))
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_ids=(), digests=()) -> None:
+        """Drop every entry of the given users and of the given tokens."""
+        user_ids, digests = set(user_ids), set(digests)
+        stale = [
+            key for key in self._entries
+            if key[0] in user_ids or key[1] in digests
+        ]
+        for key in stale:
+            del self._entries[key]
+        metrics.inc("principal_cache_invalidations_total", len(stale))
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+principal_cache = PrincipalCache(ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+def principal_values(user: User) -> dict:
+    """Snapshot a loaded User's column values for the cache."""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def attach_cached_user(values: dict, db: AsyncSession) -> User:
+    """Rebuild a User from cached values as a clean, persistent instance of db."""
+    user = User(**values)
+    make_transient_to_detached(user)
+    db.add(user)
+    return user
+
+
+# ---------------------------------------------------------------------------
+# Invalidation: local, then broadcast to every worker
+# ---------------------------------------------------------------------------
+
+_publish_tasks: set[asyncio.Task] = set()
+
+
+async def publish_invalidation(user_ids=(), digests=()) -> None:
+    """Invalidate entries here and in every other process.
+
+    Best-effort: a Redis failure is logged and counted, and staleness
+    elsewhere is then bounded by the TTL.
+    """
+    user_ids, digests = [str(u) for u in user_ids], list(digests)
+    principal_cache.invalidate(user_ids, digests)
+
+    message = json.dumps({"users": user_ids, "tokens": digests})
+    shared = get_redis()
+    try:
+        if shared is not None:
+            await shared.publish(PRINCIPAL_CACHE_CHANNEL, message)
+        else:
+            import redis.asyncio as aioredis  # lazy import — processes without the shared pool
+
+            client = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+            try:
+                await client.publish(PRINCIPAL_CACHE_CHANNEL, message)
+            finally:
+                await client.aclose()
+    except Exception as e:
+        metrics.inc("principal_cache_publish_errors_total")
+        logger.warning(f"Failed to publish principal cache invalidation: {e}")
+
+
+async def listen_for_invalidations(redis) -> None:
+    """Apply invalidations published by other workers (runs until cancelled)."""
+    while True:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(PRINCIPAL_CACHE_CHANNEL)
+            principal_cache.clear()
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                payload = json.loads(message["data"])
+                principal_cache.invalidate(payload.get("users", ()), payload.get("tokens", ()))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            metrics.inc("principal_cache_listener_errors_total")
+            logger.warning(f"Principal cache listener failed, resubscribing: {e}")
+            await asyncio.sleep(1)
+        finally:
+            await pubsub.aclose()
+
+
+@event.listens_for(Session, "after_flush")
+def collect_principal_changes(session, flush_context):
+    """Remember users whose row or role assignments this transaction changed."""
+    changed = session.info.setdefault(_PENDING_KEY, set())
+    for obj in list(session.dirty) + list(session.deleted) + list(session.new):
+        if isinstance(obj, User) and obj.id is not None:
+            changed.add(str(obj.id))
+        elif isinstance(obj, UserRoleAssignment) and obj.user_id is not None:
+            changed.add(str(obj.user_id))
+
+
+@event.listens_for(Session, "after_commit")
+def publish_principal_changes(session):
+    """Invalidate the committed users locally and broadcast to other workers."""
+    changed = session.info.pop(_PENDING_KEY, None)
+    if not changed:
+        return
+    principal_cache.invalidate(changed)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # Sync session outside an event loop: TTL bounds other workers
+    task = loop.create_task(publish_invalidation(changed))
+    _publish_tasks.add(task)
+    task.add_done_callback(_publish_tasks.discard)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_principal_changes(session):
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,101 @@
+"""Process-wide pooled async Redis client.
+
+Opened once in the lifespan handlers of the main API (src/main.py) and the
+crew server (src/api/v1/crew_server.py) and shared by every hot-path caller:
+JWT revocation sync, WhatsApp conversation state and the WhatsApp inbox.
+Before this each of those built its own client, paying a TCP (and TLS on
+managed Redis) handshake per request.
+
+Key decisions:
+- BlockingConnectionPool with REDIS_POOL_MAX_CONNECTIONS: under a burst,
+  callers wait up to REDIS_POOL_TIMEOUT_SECONDS for a free connection
+  instead of opening unbounded sockets against Redis' maxclients
+- Metrics: redis_pool_in_use / redis_pool_idle gauges, a
+  redis_pool_wait_seconds summary for connection checkout, and
+  redis_pool_errors_total for checkout failures (pool exhausted, connect
+  errors), which is where an unreachable Redis surfaces
+- get_redis() returns None in processes that never opened the pool (Celery
+  workers run each task in a fresh asyncio.run() loop, and a pool cannot
+  outlive its loop); callers then fall back to a short-lived client
+- decode_responses=True, matching every caller that uses it
+"""
+import logging
+import time
+
+import redis.asyncio as aioredis
+from redis.asyncio.connection import BlockingConnectionPool
+
+from src.core.config import settings
+from src.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedConnectionPool(BlockingConnectionPool):
+    """BlockingConnectionPool that reports checkout latency and pool usage."""
+
+    def _record_usage(self) -> None:
+        metrics.set_gauge("redis_pool_in_use", len(self._in_use_connections))
+        metrics.set_gauge("redis_pool_idle", len(self._available_connections))
+
+    async def get_connection(self, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except Exception as e:
+            metrics.inc("redis_pool_errors_total", error=type(e).__name__)
+            raise
+        finally:
+            metrics.observe("redis_pool_wait_seconds", time.perf_counter() - started)
+        self._record_usage()
+        return connection
+
+    async def release(self, connection) -> None:
+        await super().release(connection)
+        self._record_usage()
+
+
+_client: aioredis.Redis | None = None
+
+
+async def init_redis(url: str | None = None) -> bool:
+    """Open the shared pooled client (idempotent).
+
+    Args:
+        url: Redis URL (default settings.REDIS_URL)
+
+    Returns:
+        True if Redis answered a PING; the client is kept either way so a
+        Redis that comes up later is used without a restart
+    """
+    global _client
+    if _client is None:
+        pool = InstrumentedConnectionPool.from_url(
+            url or settings.REDIS_URL,
+            max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+            decode_responses=True,
+        )
+        metrics.set_gauge("redis_pool_max_connections", settings.REDIS_POOL_MAX_CONNECTIONS)
+        _client = aioredis.Redis(connection_pool=pool)
+
+    try:
+        await _client.ping()
+        return True
+    except Exception as e:
+        logger.warning(f"Redis unreachable at startup: {e}")
+        return False
+
+
+def get_redis() -> aioredis.Redis | None:
+    """Return the shared client, or None if this process never opened it."""
+    return _client
+
+
+async def close_redis() -> None:
+    """Close the shared client and disconnect its pool."""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+        await client.connection_pool.disconnect()
@@ -0,0 +1,259 @@
+"""Redis-backed response cache for unauthenticated public endpoints.
+
+The public transparency endpoints (src/api/v1/public.py) serve the same
+aggregate payloads to every visitor, so each response is cached in Redis for
+a short per-endpoint TTL, keyed by endpoint name and normalised query
+parameters. Responses carry an ETag and Cache-Control header so a CDN or the
+public React site can revalidate with If-None-Match and receive a 304.
+
+Key decisions:
+- Cache keys are built from the endpoint's declared parameters, never the raw
+  query string, so junk parameters cannot be used to bypass the cache
+- Single-flight on a miss: concurrent requests in one process await the same
+  in-flight computation, and a short Redis SET NX lock makes other workers
+  wait for the winner's result instead of all hitting the database
+- Fail-open: any Redis error falls back to computing the response directly;
+  the cache is an optimisation, never a dependency
+- ETag is a SHA-256 of the serialised body, so it is stable across workers
+  and unchanged when a recomputed payload is identical
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+from urllib.parse import urlencode
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Release the single-flight lock only if we still own it
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def serialize_body(payload: Any) -> bytes:
+    """Serialise an endpoint payload to compact JSON bytes."""
+    return json.dumps(
+        jsonable_encoder(payload), separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def compute_etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header (possibly a list, possibly weak) against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+class ResponseCache:
+    """TTL response cache with single-flight fill and fail-open semantics."""
+
+    def __init__(
+        self,
+        redis_client: Any | None = None,
+        prefix: str = "public_cache:v1:",
+        lock_timeout: float = 10.0,
+        poll_interval: float = 0.05,
+    ):
+        """Initialise the cache.
+
+        Args:
+            redis_client: Optional async Redis client (created lazily from
+                settings.REDIS_URL when omitted)
+            prefix: Namespace prefix for cache keys
+            lock_timeout: Seconds a fill lock is held before other workers
+                stop waiting and compute the response themselves
+            poll_interval: Seconds between cache polls while waiting on a lock
+        """
+        self._redis = redis_client
+        self._prefix = prefix
+        self._lock_timeout = lock_timeout
+        self._poll_interval = poll_interval
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _get_redis(self):
+        """Return the Redis client, creating a pooled one on first use."""
+        if self._redis is None:
+            import redis.asyncio as aioredis  # lazy import — avoids startup failure if redis absent
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    def build_key(self, endpoint: str, params: Mapping[str, Any] | None = None) -> str:
+        """Build a cache key from an endpoint name and its query parameters.
+
+        None-valued parameters are dropped and the rest are sorted, so
+        equivalent requests share one entry regardless of parameter order.
+        """
+        items = sorted(
+            (name, str(value)) for name, value in (params or {}).items() if value is not None
+        )
+        return f"{self._prefix}{endpoint}?{urlencode(items)}"
+
+    async def get_or_compute(
+        self,
+        key: str,
+        ttl: int,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> bytes:
+        """Return the cached body for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key (see build_key)
+            ttl: Time-to-live in seconds for a freshly computed entry
+            compute: Coroutine factory producing the JSON-serialisable payload
+
+        Returns:
+            Serialised JSON body
+        """
+        cached = await self._safe_get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            body = await asyncio.shield(inflight)
+            if body is not None:
+                return body
+            # The leader failed; compute independently so its error is not shared
+            return serialize_body(await compute())
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            body = await self._fill(key, ttl, compute)
+        except BaseException:
+            future.set_result(None)
+            raise
+        else:
+            future.set_result(body)
+            return body
+        finally:
+            del self._inflight[key]
+
+    async def _fill(
+        self,
+        key: str,
+        ttl: int,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> bytes:
+        """Compute and store an entry, coordinating with other workers via a lock."""
+        lock_key = f"{key}:lock"
+        token = uuid4().hex
+        locked = await self._safe_acquire(lock_key, token)
+
+        if locked is False:
+            # Another worker is filling this key: wait briefly for its result
+            deadline = time.monotonic() + self._lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self._poll_interval)
+                cached = await self._safe_get(key)
+                if cached is not None:
+                    return cached
+            logger.warning("Response cache fill lock timed out", extra={"key": key})
+
+        try:
+            body = serialize_body(await compute())
+            await self._safe_set(key, body, ttl)
+            return body
+        finally:
+            if locked:
+                await self._safe_release(lock_key, token)
+
+    async def _safe_get(self, key: str) -> bytes | None:
+        try:
+            return await self._get_redis().get(key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed (fail-open): {e}")
+            return None
+
+    async def _safe_set(self, key: str, body: bytes, ttl: int) -> None:
+        try:
+            await self._get_redis().set(key, body, ex=ttl)
+        except Exception as e:
+            logger.warning(f"Response cache write failed (fail-open): {e}")
+
+    async def _safe_acquire(self, lock_key: str, token: str) -> bool | None:
+        """Try to take the fill lock.
+
+        Returns:
+            True if acquired, False if held by another worker, None if Redis
+            is unavailable (caller computes without coordination)
+        """
+        try:
+            acquired = await self._get_redis().set(
+                lock_key, token, nx=True, px=int(self._lock_timeout * 1000)
+            )
+            return bool(acquired)
+        except Exception as e:
+            logger.warning(f"Response cache lock failed (fail-open): {e}")
+            return None
+
+    async def _safe_release(self, lock_key: str, token: str) -> None:
+        try:
+            await self._get_redis().eval(_RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.warning(f"Response cache lock release failed: {e}")
+
+    async def respond(
+        self,
+        request: Request,
+        endpoint: str,
+        ttl: int,
+        compute: Callable[[], Awaitable[Any]],
+        params: Mapping[str, Any] | None = None,
+    ) -> Response:
+        """Serve an endpoint payload through the cache with HTTP validators.
+
+        Sets ETag and Cache-Control on every response and answers 304 Not
+        Modified when the request's If-None-Match matches. When
+        PUBLIC_CACHE_ENABLED is off the payload is computed on every request
+        but the validators are still emitted.
+
+        Args:
+            request: Incoming request (for If-None-Match)
+            endpoint: Stable endpoint name used in the cache key
+            ttl: Cache TTL in seconds (also the Cache-Control max-age)
+            compute: Coroutine factory producing the payload
+            params: Query parameters that distinguish responses
+
+        Returns:
+            JSON response or empty 304 response
+        """
+        if settings.PUBLIC_CACHE_ENABLED:
+            body = await self.get_or_compute(self.build_key(endpoint, params), ttl, compute)
+        else:
+            body = serialize_body(await compute())
+
+        etag = compute_etag(body)
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={ttl}, stale-while-revalidate={ttl}",
+        }
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Process-wide cache for the public transparency endpoints
+public_response_cache = ResponseCache()
@@ -0,0 +1,167 @@
+"""Per-worker mirror of revoked JWT digests.
+
+The JWT blacklist used to be a Redis GET of ``revoked_token:{sha256}`` on
+every authenticated request, failing open (allowing the request) whenever
+Redis was unreachable. Each worker now holds the revoked digests in memory
+and get_current_user probes that instead.
+
+Key decisions:
+- Source of truth stays in Redis: blacklist_user_token writes the
+  ``revoked_token:{digest}`` key (TTL = remaining token lifetime) and
+  appends {digest, exp, published_at} to the REVOCATION_STREAM stream
+- Bootstrap records the stream's last id, then SCANs the keys (their PTTL
+  gives each entry's expiry); the listener XREADs from the recorded id, so
+  a revocation published during the scan is not missed
+- A stream rather than pub/sub: a listener that reconnects resumes from its
+  last id instead of silently losing revocations. On any listener error the
+  mirror bootstraps again, which also covers entries trimmed from the
+  stream (MAXLEN) while it was away
+- Fail closed: the mirror is only trusted while its last successful read is
+  younger than REVOCATION_MAX_STALENESS_SECONDS. An XREAD blocks for at
+  most a fifth of that, so a healthy mirror is never stale; otherwise
+  contains() raises RevocationStateUnavailable and the request gets a 503
+- Propagation delay (publish -> applied on this worker) is observed as
+  revocation_propagation_seconds
+- An exact dict of digest -> exp rather than a Bloom filter: revocations
+  are rare (role changes, forced logouts), and an in-process set probe is
+  already a single hash lookup with no false positives
+"""
+import asyncio
+import logging
+import time
+
+from src.core.config import settings
+from src.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_STREAM = "revoked_tokens"
+REVOKED_KEY_PREFIX = "revoked_token:"
+STREAM_MAXLEN = 10000
+
+
+class RevocationStateUnavailable(Exception):
+    """The local revocation mirror is not in sync with Redis."""
+
+
+class RevocationMirror:
+    """In-memory set of revoked token digests, kept in sync from Redis."""
+
+    def __init__(self, max_staleness: float | None = None):
+        self._max_staleness = max_staleness or settings.REVOCATION_MAX_STALENESS_SECONDS
+        self._revoked: dict[str, float] = {}
+        self._last_sync: float | None = None
+        self._last_prune = 0.0
+
+    # -- hot path -----------------------------------------------------------
+
+    def contains(self, digest: str) -> bool:
+        """Return True if the digest is revoked and not yet expired.
+
+        Raises:
+            RevocationStateUnavailable: If the mirror has not synced recently
+        """
+        if self._last_sync is None or time.monotonic() - self._last_sync > self._max_staleness:
+            metrics.inc("revocation_mirror_unavailable_total")
+            raise RevocationStateUnavailable("Token revocation state is not in sync")
+        exp = self._revoked.get(digest)
+        return exp is not None and exp > time.time()
+
+    # -- updates ------------------------------------------------------------
+
+    def add(self, digest: str, exp: float) -> None:
+        """Record a revoked digest until its token's expiry."""
+        if exp > time.time():
+            self._revoked[digest] = exp
+            metrics.set_gauge("revocation_mirror_entries", len(self._revoked))
+
+    def mark_synced(self) -> None:
+        """Record a successful read from Redis."""
+        self._last_sync = time.monotonic()
+
+    def _prune(self) -> None:
+        now = time.time()
+        self._revoked = {d: exp for d, exp in self._revoked.items() if exp > now}
+        self._last_prune = now
+        metrics.set_gauge("revocation_mirror_entries", len(self._revoked))
+
+    def reset(self) -> None:
+        """Forget all state (tests, resync)."""
+        self._revoked.clear()
+        self._last_sync = None
+
+    # -- sync ---------------------------------------------------------------
+
+    async def bootstrap(self, redis) -> str:
+        """Load every revoked key from Redis.
+
+        Returns:
+            Stream id to start reading from
+        """
+        latest = await redis.xrevrange(REVOCATION_STREAM, count=1)
+        last_id = latest[0][0] if latest else "0-0"
+
+        revoked: dict[str, float] = {}
+        keys = [key async for key in redis.scan_iter(match=f"{REVOKED_KEY_PREFIX}*", count=1000)]
+        for start in range(0, len(keys), 500):
+            batch = keys[start:start + 500]
+            async with redis.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    pipe.pttl(key)
+                ttls = await pipe.execute()
+            now = time.time()
+            for key, ttl in zip(batch, ttls):
+                if ttl and ttl > 0:
+                    revoked[key[len(REVOKED_KEY_PREFIX):]] = now + ttl / 1000
+
+        self._revoked = revoked
+        self._prune()
+        self.mark_synced()
+        logger.info(f"Revocation mirror loaded {len(revoked)} revoked tokens")
+        return last_id
+
+    async def run(self, redis) -> None:
+        """Bootstrap, then apply the revocation stream (runs until cancelled)."""
+        block_ms = int(self._max_staleness * 1000 / 5)
+        while True:
+            try:
+                last_id = await self.bootstrap(redis)
+                while True:
+                    response = await redis.xread(
+                        {REVOCATION_STREAM: last_id}, block=block_ms, count=500
+                    )
+                    for _stream, entries in response or []:
+                        for entry_id, fields in entries:
+                            self.add(fields["digest"], float(fields["exp"]))
+                            metrics.observe(
+                                "revocation_propagation_seconds",
+                                max(time.time() - float(fields["published_at"]), 0.0),
+                            )
+                            last_id = entry_id
+                    self.mark_synced()
+                    if time.time() - self._last_prune > 60:
+                        self._prune()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                metrics.inc("revocation_mirror_errors_total")
+                logger.warning(f"Revocation mirror sync failed, resyncing: {e}")
+                await asyncio.sleep(1)
+
+
+revocation_mirror = RevocationMirror()
+
+
+async def publish_revocation(redis, digest: str, exp: int) -> None:
+    """Persist a revocation and announce it to every worker's mirror."""
+    ttl_seconds = max(int(exp - time.time()), 1)  # at least 1 second
+    # Key first: a mirror that bootstraps between the two writes still sees it
+    await redis.set(f"{REVOKED_KEY_PREFIX}{digest}", "1", ex=ttl_seconds)
+    await redis.xadd(
+        REVOCATION_STREAM,
+        {"digest": digest, "exp": exp, "published_at": time.time()},
+        maxlen=STREAM_MAXLEN,
+        approximate=True,
+    )
+    # Visible on this worker before the stream round-trip
+    revocation_mirror.add(digest, exp)
@@ -0,0 +1,67 @@
+"""Precompiled pattern sets for single-pass guardrail scanning.
+
+validate_input(), sanitize_output() and the crew server's reply sanitizers
+used to run every pattern as its own re.search/re.sub/re.match call (a
+dozen-odd per message, and sanitize_reply() tried every artifact pattern on
+every line). A PatternSet merges a table of patterns into one compiled
+alternation with a named group per entry, so each text (or line) is scanned
+once and the entry that matched is read back from the match.
+
+Key decisions:
+- Leftmost match wins; at the same position the earlier table entry wins.
+  Table order therefore encodes the old filter order where two patterns can
+  start at the same place (e.g. SA ID numbers before phone numbers)
+- Entries must not contain capturing groups (use (?:...)): the outer named
+  group identifies the entry
+- Per-entry flags use scoped inline flags, e.g. "(?i:...)"
+- tests/guardrail_corpus.py pins the results to those of the previous
+  pattern-by-pattern implementations
+"""
+import re
+from typing import Callable, Sequence
+
+
+class PatternSet:
+    """Labelled regex patterns compiled into a single alternation.
+
+    Labels need not be unique; several entries may share one label.
+    """
+
+    def __init__(self, patterns: Sequence[tuple[str, str]], flags: int = 0):
+        self.labels = [label for label, _ in patterns]
+        self.regex = re.compile(
+            "|".join(f"(?P<p{i}>{pattern})" for i, (_, pattern) in enumerate(patterns)),
+            flags,
+        )
+
+    def label(self, match: re.Match) -> str:
+        """Label of the entry that produced match."""
+        return self.labels[int(match.lastgroup[1:])]
+
+    def match(self, text: str) -> re.Match | None:
+        """Match any entry at the start of text."""
+        return self.regex.match(text)
+
+    def search(self, text: str) -> re.Match | None:
+        """Leftmost match of any entry in text."""
+        return self.regex.search(text)
+
+    def sub(self, replace: Callable[[str, re.Match], str], text: str) -> tuple[str, list[str]]:
+        """Replace every match in one pass.
+
+        Args:
+            replace: Called with (label, match), returns the replacement text
+            text: Text to scan
+
+        Returns:
+            (new text, labels that matched, in order of first match)
+        """
+        hits: list[str] = []
+
+        def _replace(match: re.Match) -> str:
+            label = self.label(match)
+            if label not in hits:
+                hits.append(label)
+            return replace(label, match)
+
+        return self.regex.sub(_replace, text), hits
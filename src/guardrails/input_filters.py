@@ -7,11 +7,30 @@ This module implements rule-based input filtering to prevent:
 - Suspicious content patterns
 
 All filters are deterministic (no LLM calls) for performance and reliability.
+Injection patterns are precompiled into one alternation (see
+src/guardrails/compiled.py), so a message is scanned once.
 """
-import re
 from pydantic import BaseModel
 import nh3
 
+from src.guardrails.compiled import PatternSet
+
+# Common prompt injection patterns, matched against the lowercased message
+_INJECTION_PATTERNS = PatternSet([
+    ("ignore_previous_instructions", r"ignore\s+previous\s+instructions"),
+    ("ignore_all_previous", r"ignore\s+all\s+previous"),
+    ("you_are_now", r"you\s+are\s+now"),
+    ("new_instructions", r"new\s+instructions:"),
+    ("system_prompt", r"system\s+prompt:"),
+    ("forget_everything", r"forget\s+everything"),
+    ("disregard_all", r"disregard\s+all"),
+    ("act_as", r"act\s+as"),
+    ("pretend_you_are", r"pretend\s+you\s+are"),
+    ("jailbreak", r"jailbreak"),
+])
+
+_COMMON_PUNCTUATION = frozenset(".,!?;:'-\"")
+
 
 class InputValidationResult(BaseModel):
     """Result of input validation with safety verdict and detected issues.
@@ -78,37 +97,21 @@ def validate_input(message: str) -> InputValidationResult:
             blocked_reason=blocked_reason,
         )
 
-    # Filter 3: Prompt injection detection
-    # Common prompt injection patterns (case-insensitive)
-    injection_patterns = [
-        r"ignore\s+previous\s+instructions",
-        r"ignore\s+all\s+previous",
-        r"you\s+are\s+now",
-        r"new\s+instructions:",
-        r"system\s+prompt:",
-        r"forget\s+everything",
-        r"disregard\s+all",
-        r"act\s+as",
-        r"pretend\s+you\s+are",
-        r"jailbreak",
-    ]
-
-    message_lower = message.lower()
-    for pattern in injection_patterns:
-        if re.search(pattern, message_lower):
-            flags.append("prompt_injection_detected")
-            is_safe = False
-            blocked_reason = (
-                "Message contains suspicious patterns that may be attempting to "
-                "manipulate the system. Please rephrase your message naturally."
-            )
-            return InputValidationResult(
-                is_safe=is_safe,
-                original_message=message,
-                sanitized_message=sanitized,
-                flags=flags,
-                blocked_reason=blocked_reason,
-            )
+    # Filter 3: Prompt injection detection (case-insensitive, one scan)
+    if _INJECTION_PATTERNS.search(message.lower()):
+        flags.append("prompt_injection_detected")
+        is_safe = False
+        blocked_reason = (
+            "Message contains suspicious patterns that may be attempting to "
+            "manipulate the system. Please rephrase your message naturally."
+        )
+        return InputValidationResult(
+            is_safe=is_safe,
+            original_message=message,
+            sanitized_message=sanitized,
+            flags=flags,
+            blocked_reason=blocked_reason,
+        )
 
     # Filter 4: HTML/script injection sanitization
     # Use nh3 to strip HTML tags (already in dependencies)
@@ -119,10 +122,8 @@ def validate_input(message: str) -> InputValidationResult:
 
     # Filter 5: Excessive special characters
     # If message is >50% non-alphanumeric (excluding spaces and common punctuation)
-    alphanumeric_count = sum(c.isalnum() or c.isspace() for c in sanitized)
-    common_punctuation = set(".,!?;:'-\"")
-    valid_chars = alphanumeric_count + sum(
-        1 for c in sanitized if c in common_punctuation
+    valid_chars = sum(
+        1 for c in sanitized if c.isalnum() or c.isspace() or c in _COMMON_PUNCTUATION
     )
 
     if len(sanitized) > 0 and valid_chars / len(sanitized) < 0.5:
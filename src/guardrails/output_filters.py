@@ -7,10 +7,55 @@ This module implements rule-based output filtering to prevent:
 
 Emergency numbers (10111, 0800 150 150) are preserved as they're critical
 for citizen safety in GBV scenarios.
+
+Masks are precompiled into two alternations (see src/guardrails/compiled.py)
+and applied in two scans: PII first, then system information, as before.
+Within a scan, where two patterns could start at the same position, table
+order decides (SA ID before emergency numbers before phone numbers before
+emails). Overlapping matches resolve leftmost-first, so e.g. an email
+address whose local part is a phone number is masked whole.
 """
 import re
+
 from pydantic import BaseModel
 
+from src.guardrails.compiled import PatternSet
+
+# (mask label, pattern); replaced by "[<label> REDACTED]" unless EMERGENCY
+_PII_PATTERNS = PatternSet([
+    # SA ID number: 13 digits starting with YYMMDD (date of birth), e.g. 9501015800086
+    ("ID", r"\b\d{2}[01]\d[0-3]\d\d{7}\b"),
+    # Emergency numbers are kept: 10111 (SAPS), 0800 150 150 (GBV Command Centre)
+    ("EMERGENCY", r"10111|0800\s*150\s*150"),
+    # Mobile numbers (06X, 07X, 08X) in various formats
+    ("PHONE", r"\b0[6-8]\d[\s-]?\d{3}[\s-]?\d{4}\b"),
+    # International format (+27)
+    ("PHONE", r"\+27\d{9}\b"),
+    ("EMAIL", r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"),
+])
+
+# System information: only technical artifacts, not natural language
+_SYSTEM_INFO_PATTERNS = PatternSet([
+    ("TRACEBACK", r"traceback[:\s].*?(?=\n|$)"),
+    ("SQLALCHEMY", r"sqlalchemy\.[a-z.]+"),
+    ("DATABASE_URL", r"postgresql://[^\s]+"),
+    ("SQL_QUERY", r"\bselect\s+\*\s+from\s+\w+"),
+    ("SQL_QUERY", r"\binsert\s+into\s+\w+"),
+    ("SQL_QUERY", r"\bdelete\s+from\s+\w+"),
+    ("SQL_QUERY", r"\bupdate\s+\w+\s+set"),
+    ("DJANGO_DB", r"django\.db\.[a-z.]+"),
+    ("PSYCOPG", r"psycopg[23]?\.[a-z.]+"),
+], re.IGNORECASE)
+
+# PII mask label -> redaction name, in reporting order
+_PII_REDACTIONS = {"ID": "sa_id_number", "PHONE": "phone_number", "EMAIL": "email_address"}
+
+
+def _mask(label: str, match) -> str:
+    if label == "EMERGENCY":
+        return "10111" if match.group() == "10111" else "0800 150 150"
+    return f"[{label} REDACTED]"
+
 
 class OutputSanitizationResult(BaseModel):
     """Result of output sanitization with redaction tracking.
@@ -29,7 +74,7 @@ class OutputSanitizationResult(BaseModel):
 def sanitize_output(response: str) -> OutputSanitizationResult:
     """Sanitize agent output to remove PII and system information.
 
-    Applies filters in order:
+    Applies filters 1-3 in one scan, 4 in a second, then 5:
     1. SA ID number masking (13-digit YYMMDD format)
     2. Phone number masking (SA formats, preserving emergency numbers)
     3. Email address masking
@@ -42,77 +87,12 @@ def sanitize_output(response: str) -> OutputSanitizationResult:
     Returns:
         OutputSanitizationResult with sanitized response and redaction log
     """
-    redactions: list[str] = []
-    sanitized = response
-
-    # Filter 1: SA ID number masking
-    # Pattern: 13 digits starting with YYMMDD (date of birth)
-    # Example: 9501015800086
-    sa_id_pattern = r'\b\d{2}[01]\d[0-3]\d\d{7}\b'
-    if re.search(sa_id_pattern, sanitized):
-        sanitized = re.sub(sa_id_pattern, "[ID REDACTED]", sanitized)
-        redactions.append("sa_id_number")
-
-    # Filter 2: Phone number masking (preserving emergency numbers)
-    # Emergency numbers to preserve: 10111 (SAPS), 0800 150 150 (GBV Command Centre)
-
-    # First, protect emergency numbers by temporarily replacing them
-    emergency_placeholder = "___EMERGENCY_10111___"
-    gbv_placeholder = "___EMERGENCY_GBV___"
-
-    sanitized = sanitized.replace("10111", emergency_placeholder)
-    sanitized = re.sub(r'0800\s*150\s*150', gbv_placeholder, sanitized, flags=re.IGNORECASE)
-
-    # Now mask other SA phone numbers
-    # Pattern 1: Mobile numbers (06X, 07X, 08X) in various formats
-    mobile_pattern = r'\b0[6-8]\d[\s-]?\d{3}[\s-]?\d{4}\b'
-    if re.search(mobile_pattern, sanitized):
-        sanitized = re.sub(mobile_pattern, "[PHONE REDACTED]", sanitized)
-        redactions.append("phone_number")
-
-    # Pattern 2: International format (+27)
-    intl_pattern = r'\+27\d{9}\b'
-    if re.search(intl_pattern, sanitized):
-        sanitized = re.sub(intl_pattern, "[PHONE REDACTED]", sanitized)
-        if "phone_number" not in redactions:
-            redactions.append("phone_number")
-
-    # Restore emergency numbers
-    sanitized = sanitized.replace(emergency_placeholder, "10111")
-    sanitized = sanitized.replace(gbv_placeholder, "0800 150 150")
-
-    # Filter 3: Email address masking
-    # Standard email pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    if re.search(email_pattern, sanitized):
-        sanitized = re.sub(email_pattern, "[EMAIL REDACTED]", sanitized)
-        redactions.append("email_address")
-
-    # Filter 4: System information removal
-    # Patterns: SQL keywords, database names, error tracebacks
-    # Only mask when these appear as technical artifacts, not in natural language
-    system_info_patterns = [
-        (r'traceback[:\s].*?(?=\n|$)', 'TRACEBACK'),
-        (r'sqlalchemy\.[a-z.]+', 'SQLALCHEMY'),
-        (r'postgresql://[^\s]+', 'DATABASE_URL'),
-        (r'\bselect\s+\*\s+from\s+\w+', 'SQL_QUERY'),
-        (r'\binsert\s+into\s+\w+', 'SQL_QUERY'),
-        (r'\bdelete\s+from\s+\w+', 'SQL_QUERY'),
-        (r'\bupdate\s+\w+\s+set', 'SQL_QUERY'),
-        (r'django\.db\.[a-z.]+', 'DJANGO_DB'),
-        (r'psycopg[23]?\.[a-z.]+', 'PSYCOPG'),
-    ]
-
-    for pattern, label in system_info_patterns:
-        if re.search(pattern, sanitized, re.IGNORECASE):
-            sanitized = re.sub(
-                pattern,
-                f"[{label} REDACTED]",
-                sanitized,
-                flags=re.IGNORECASE
-            )
-            if "system_info" not in redactions:
-                redactions.append("system_info")
+    sanitized, pii = _PII_PATTERNS.sub(_mask, response)
+    redactions: list[str] = [name for label, name in _PII_REDACTIONS.items() if label in pii]
+
+    sanitized, system_info = _SYSTEM_INFO_PATTERNS.sub(_mask, sanitized)
+    if system_info:
+        redactions.append("system_info")
 
     # Filter 5: Empty response fallback
     # If sanitization removed everything, provide a helpful message
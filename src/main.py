@@ -1,4 +1,6 @@
 """SALGA Trust Engine - FastAPI application entry point."""
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -40,6 +42,9 @@ from src.api.v1 import (
     whatsapp,
 )
 from src.core.config import settings
+from src.core.principal_cache import listen_for_invalidations
+from src.core.redis_pool import close_redis, get_redis, init_redis
+from src.core.revocation import revocation_mirror
 from src.middleware.error_handler import (
     global_exception_handler,
     http_exception_handler,
@@ -58,9 +63,19 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler for startup and shutdown events."""
     # Startup
     print(f"Starting SALGA Trust Engine - Environment: {settings.ENVIRONMENT}")
+    await init_redis()
+    # Principal cache invalidations from other workers (role changes, logouts)
+    invalidation_listener = asyncio.create_task(listen_for_invalidations(get_redis()))
+    # Revoked JWTs; get_current_user answers 503 until the first sync
+    revocation_sync = asyncio.create_task(revocation_mirror.run(get_redis()))
     yield
     # Shutdown
     print("Shutting down SALGA Trust Engine")
+    for task in (invalidation_listener, revocation_sync):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await close_redis()
 
 
 # Create FastAPI application
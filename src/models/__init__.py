@@ -4,8 +4,11 @@ from src.models.municipality import Municipality
 from src.models.user import User, UserRole
 from src.models.consent import ConsentRecord
 from src.models.audit_log import AuditLog, OperationType
+from src.models.audit_outbox import AuditOutbox
 from src.models.ticket import Ticket, TicketCategory, TicketStatus, TicketSeverity
+from src.models.ticket_metrics import TicketMetricsDaily
 from src.models.team import Team
+from src.models.ward import Ward
 from src.models.assignment import TicketAssignment
 from src.models.sla_config import SLAConfig
 from src.models.whatsapp_session import WhatsAppSession
@@ -36,6 +39,7 @@ from src.models.statutory_report import (
     ReportWorkflow,
 )
 from src.models.notification import Notification, NotificationType
+from src.models.export_job import ExportDataset, ExportFormat, ExportJob, ExportJobStatus
 
 __all__ = [
     "Base",
@@ -47,11 +51,14 @@ __all__ = [
     "ConsentRecord",
     "AuditLog",
     "OperationType",
+    "AuditOutbox",
     "Ticket",
     "TicketCategory",
     "TicketStatus",
     "TicketSeverity",
+    "TicketMetricsDaily",
     "Team",
+    "Ward",
     "TicketAssignment",
     "SLAConfig",
     "WhatsAppSession",
@@ -82,4 +89,8 @@ __all__ = [
     "ReportWorkflow",
     "Notification",
     "NotificationType",
+    "ExportDataset",
+    "ExportFormat",
+    "ExportJob",
+    "ExportJobStatus",
 ]
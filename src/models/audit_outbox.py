@@ -0,0 +1,53 @@
+"""Append-only staging table for audit log entries (outbox mode).
+
+With settings.AUDIT_OUTBOX_ENABLED the after_flush audit handler
+(src/core/audit.py) writes a flush's audit entries here instead of into
+audit_logs, and the Celery drainer (src/tasks/audit_outbox_task.py) moves
+them into audit_logs in large batches. Business transactions then only pay
+for an insert into an index-free table; audit_logs index maintenance is
+amortized over each drained batch.
+
+Key decisions:
+- Same database, same transaction as the change being audited: an entry is
+  committed exactly when its change is, so the POPIA audit trail cannot be
+  lost the way a post-commit push to Redis could
+- id is the audit_logs primary key, assigned when the entry is captured;
+  the drainer inserts with ON CONFLICT (id) DO NOTHING, so redelivering an
+  entry never duplicates it (at-least-once, idempotent)
+- seq orders the drain (oldest first) and is the only index
+- Not a TenantAwareModel/NonTenantModel: rows are never audited themselves
+  and are read and written with Core statements only
+"""
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class AuditOutbox(Base):
+    """Audit log entry waiting to be drained into audit_logs."""
+
+    __tablename__ = "audit_outbox"
+
+    seq: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),  # SQLite autoincrements INTEGER only
+        primary_key=True,
+        autoincrement=True,
+    )
+    id: Mapped[UUID] = mapped_column(nullable=False)
+    tenant_id: Mapped[str] = mapped_column(String, nullable=False)
+    user_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    operation: Mapped[str] = mapped_column(String(32), nullable=False)
+    table_name: Mapped[str] = mapped_column(String, nullable=False)
+    record_id: Mapped[str] = mapped_column(String, nullable=False)
+    changes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    ip_address: Mapped[str | None] = mapped_column(String, nullable=True)
+    user_agent: Mapped[str | None] = mapped_column(String, nullable=True)
+    timestamp: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,69 @@
+"""Background data export job model.
+
+Large exports (multi-year ticket, SDBIP actual and audit log datasets pulled
+by auditors and the Auditor-General's team) run in a Celery worker
+(src/tasks/export_task.py) instead of on the request path. The job row is
+what the client polls; the finished file lives in Supabase Storage and is
+handed out as a short-lived signed URL.
+"""
+from datetime import datetime
+from enum import StrEnum
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import TenantAwareModel
+
+
+class ExportDataset(StrEnum):
+    """Datasets available for background export."""
+
+    TICKETS = "tickets"
+    SDBIP_ACTUALS = "sdbip_actuals"
+    AUDIT_LOGS = "audit_logs"
+
+
+class ExportFormat(StrEnum):
+    """Output file formats."""
+
+    XLSX = "xlsx"
+    CSV_GZ = "csv_gz"
+    PARQUET = "parquet"
+
+
+class ExportJobStatus(StrEnum):
+    """Lifecycle of an export job: pending -> running -> completed | failed."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ExportJob(TenantAwareModel):
+    """A requested export and, once completed, where its file is stored.
+
+    Inherits tenant_id, created_at, updated_at, created_by, updated_by from TenantAwareModel.
+    """
+
+    __tablename__ = "export_jobs"
+
+    dataset: Mapped[str] = mapped_column(String(20), nullable=False)
+    file_format: Mapped[str] = mapped_column(String(10), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=ExportJobStatus.PENDING
+    )
+    filters: Mapped[str | None] = mapped_column(
+        Text, nullable=True, comment="JSON object of the dataset filters"
+    )
+    requested_by: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    row_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    storage_bucket: Mapped[str | None] = mapped_column(String, nullable=True)
+    storage_path: Mapped[str | None] = mapped_column(String, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<ExportJob {self.dataset}.{self.file_format} - {self.status}>"
@@ -11,6 +11,7 @@ Key decisions:
 - is_sensitive flag for GBV tickets (triggers SAPS routing)
 - severity defaults to MEDIUM if not specified by agent
 - Graceful degradation: location stored as TEXT in SQLite tests
+- ward_id is stored (not derived from address) so ward filters are index lookups
 """
 import os
 import secrets
@@ -18,7 +19,7 @@ from datetime import datetime
 from enum import StrEnum
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.encryption import EncryptedString
@@ -77,6 +78,10 @@ class Ticket(TenantAwareModel):
     """
 
     __tablename__ = "tickets"
+    __table_args__ = (
+        # Ward dashboards always filter within a tenant
+        Index("ix_tickets_tenant_ward", "tenant_id", "ward_id"),
+    )
 
     tracking_number: Mapped[str] = mapped_column(
         String(20),
@@ -85,6 +90,9 @@ class Ticket(TenantAwareModel):
         default=generate_tracking_number
     )
     category: Mapped[str] = mapped_column(String(20), nullable=False)
+    # PostgreSQL also has a generated search_vector tsvector over description
+    # (migration 20260304_ticket_search_index). It is deliberately unmapped:
+    # SQLite has no equivalent; see src/services/ticket_search.py
     description: Mapped[str] = mapped_column(Text, nullable=False)
     encrypted_description: Mapped[str | None] = mapped_column(
         EncryptedString(5000),
@@ -97,6 +105,10 @@ class Ticket(TenantAwareModel):
         nullable=True
     )
     address: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # Resolved once on insert by point-in-polygon against Ward.boundary
+    # (trigger in migration 20260305_ward_boundaries, so Supabase inserts from
+    # the agent tools are covered too); NULL when no ward contains location
+    ward_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
 
     # Metadata
     severity: Mapped[str] = mapped_column(
@@ -104,10 +116,13 @@ class Ticket(TenantAwareModel):
         nullable=False,
         default=TicketSeverity.MEDIUM
     )
+    # active_history: load the previous status even if expired, so the
+    # metrics rollup can move the ticket between open/resolved counters
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        default=TicketStatus.OPEN
+        default=TicketStatus.OPEN,
+        active_history=True,
     )
     language: Mapped[str] = mapped_column(String(5), nullable=False, default="en")
 
@@ -0,0 +1,63 @@
+"""Daily ticket metrics rollup for dashboard and transparency queries.
+
+One row per (tenant, category, day, is_sensitive) bucket holding additive
+counters. Rows are maintained incrementally by the after_flush hook in
+src/core/audit.py as tickets are created, transition status, or are
+deleted, so dashboard reads scale with the number of buckets rather than
+with ticket history.
+
+Key decisions:
+- Bucketed by ticket created_at (UTC date), matching the created_at range
+  filters used by the dashboards
+- is_sensitive is a bucket dimension so GBV tickets can be excluded at SQL
+  level (SEC-05) while still contributing to system-level totals (TRNS-05)
+- All counters are additive so a ticket's contribution can be subtracted
+  from its old bucket and added to its new one on every change
+- Exists above tenant scope (like AuditLog) so cross-tenant public metrics
+  can read it; writes go through Core statements, never ORM objects
+"""
+from datetime import date
+
+from sqlalchemy import Boolean, Date, Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import NonTenantModel
+
+
+class TicketMetricsDaily(NonTenantModel):
+    """Per-tenant/per-category/per-day ticket counters."""
+
+    __tablename__ = "ticket_metrics_daily"
+    __table_args__ = (
+        UniqueConstraint(
+            "tenant_id", "category", "day", "is_sensitive",
+            name="uq_ticket_metrics_daily_bucket",
+        ),
+    )
+
+    tenant_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    category: Mapped[str] = mapped_column(String(20), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    is_sensitive: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    # Volume
+    ticket_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    open_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    resolved_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # SLA (resolution deadline)
+    sla_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    sla_met_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    breached_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # SLA (response deadline)
+    response_sla_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Timing sums (divide by the matching count for averages)
+    responded_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    response_seconds_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    resolved_timed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    resolution_seconds_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    def __repr__(self) -> str:
+        return f"<TicketMetricsDaily {self.tenant_id} {self.category} {self.day}>"
@@ -0,0 +1,57 @@
+"""Ward boundary model for ward-level ticket attribution.
+
+Wards are the electoral sub-divisions of a municipality (Municipal Demarcation
+Board boundaries). Each ward polygon belongs to a single municipality and is
+used to resolve Ticket.ward_id once, at ticket creation, by point-in-polygon.
+
+Key decisions:
+- ward_code is the format of User.ward_id (the ward a councillor is
+  assigned to), so ward filtering is a plain equality on an indexed column.
+  Councillors assigned before boundaries existed hold display labels such as
+  "Ward 5"; WardService.remap_user_wards rewrites those to ward codes via
+  ward_number, and the users trigger in migration 20260305_ward_boundaries
+  rejects ward_id values that are not a loaded ward_code
+- boundary uses PostGIS MULTIPOLYGON (some wards are non-contiguous) with a
+  GiST index (see migration 20260305_ward_boundaries)
+- UniqueConstraint on (tenant_id, ward_code) lets boundary reloads upsert
+- Graceful degradation: boundary stored as TEXT in SQLite tests
+"""
+import os
+
+from sqlalchemy import Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import TenantAwareModel
+
+# Detect if we're using SQLite (tests) or PostgreSQL (production)
+# USE_SQLITE_TESTS environment variable is set in conftest.py before imports
+USE_POSTGIS = os.getenv("USE_SQLITE_TESTS") != "1"
+
+if USE_POSTGIS:
+    try:
+        from geoalchemy2 import Geometry
+    except ImportError:
+        USE_POSTGIS = False
+
+
+class Ward(TenantAwareModel):
+    """Ward boundary polygon for a municipality.
+
+    Inherits tenant_id, created_at, updated_at, created_by, updated_by from TenantAwareModel.
+    """
+
+    __tablename__ = "wards"
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "ward_code", name="uq_wards_tenant_ward_code"),
+    )
+
+    ward_code: Mapped[str] = mapped_column(String(100), nullable=False)
+    ward_number: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    name: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    boundary: Mapped[str | None] = mapped_column(
+        Geometry("MULTIPOLYGON", srid=4326) if USE_POSTGIS else Text,
+        nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<Ward {self.ward_code} - {self.tenant_id}>"
@@ -44,6 +44,7 @@ class CitizenMyReportsResponse(BaseModel):
     """Schema for citizen's full report list (mixed municipal + GBV tickets)."""
     tickets: list[CitizenTicketResponse | CitizenGBVTicketResponse]
     total: int
+    next_cursor: str | None = None
 
 
 class CitizenStatsResponse(BaseModel):
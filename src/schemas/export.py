@@ -0,0 +1,56 @@
+"""Pydantic v2 schemas for background export jobs.
+
+Provides request and response models for:
+- POST /api/v1/export/jobs (queue an export)
+- GET /api/v1/export/jobs/{job_id} (poll status, get the download URL)
+"""
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.export_job import ExportDataset, ExportFormat
+
+
+class ExportFilters(BaseModel):
+    """Dataset filters; each dataset accepts only its own keys."""
+
+    # tickets
+    status: str | None = Field(default=None, description="Ticket status (tickets)")
+    category: str | None = Field(default=None, description="Ticket category (tickets)")
+    ward_id: str | None = Field(default=None, description="Ward code (tickets)")
+    search: str | None = Field(default=None, description="Free-text search (tickets)")
+    # sdbip_actuals
+    financial_year: str | None = Field(
+        default=None, description="Financial year, e.g. '2025/26' (sdbip_actuals)"
+    )
+    quarter: str | None = Field(default=None, pattern="^[Qq][1-4]$", description="Q1-Q4 (sdbip_actuals)")
+    # audit_logs
+    table_name: str | None = Field(default=None, description="Audited table (audit_logs)")
+    operation: str | None = Field(default=None, description="Operation type (audit_logs)")
+    since: datetime | None = Field(default=None, description="From timestamp, inclusive (audit_logs)")
+    until: datetime | None = Field(default=None, description="To timestamp, exclusive (audit_logs)")
+
+
+class ExportJobCreate(BaseModel):
+    """Schema for queueing a background export."""
+
+    dataset: ExportDataset
+    file_format: ExportFormat
+    filters: ExportFilters = Field(default_factory=ExportFilters)
+
+
+class ExportJobResponse(BaseModel):
+    """Export job status; download_url is set once the job has completed."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    dataset: str
+    file_format: str
+    status: str
+    row_count: int | None = None
+    error: str | None = None
+    created_at: datetime
+    completed_at: datetime | None = None
+    download_url: str | None = None
@@ -58,6 +58,7 @@ class TicketResponse(BaseModel):
     latitude: float | None
     longitude: float | None
     address: str | None
+    ward_id: str | None = None
     severity: str
     status: str
     language: str
@@ -75,13 +76,21 @@ class TicketResponse(BaseModel):
 
 
 class PaginatedTicketResponse(BaseModel):
-    """Paginated ticket list response with total count."""
+    """Paginated ticket list response with total count.
+
+    In cursor mode, next_cursor is the opaque cursor for the following page
+    (None on the last page). total may be a planner estimate
+    (total_is_estimate=True), or None with page_count when counting was
+    skipped (total_mode="none", the cursor mode default).
+    """
 
     tickets: list[TicketResponse]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    page_count: int
+    page_count: int | None
+    next_cursor: str | None = None
+    total_is_estimate: bool = False
 
 
 class TicketUpdate(BaseModel):
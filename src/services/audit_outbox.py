@@ -0,0 +1,113 @@
+"""Drain the audit_outbox staging table into audit_logs.
+
+Outbox mode (settings.AUDIT_OUTBOX_ENABLED, src/models/audit_outbox.py)
+takes audit writes off the business transaction's hot table; the Celery
+drainer (src/tasks/audit_outbox_task.py) calls drain_batch() until the
+outbox is empty and reports the backlog with outbox_backlog().
+
+Key decisions:
+- One transaction per batch: select the oldest entries (FOR UPDATE SKIP
+  LOCKED on PostgreSQL, so a second drainer takes the next batch instead of
+  waiting), insert them into audit_logs, delete them from the outbox,
+  commit. A crash anywhere before the commit leaves the batch in the outbox
+  to be drained again
+- Inserted with ON CONFLICT (id) DO NOTHING as one executemany (multi-row
+  INSERT ... VALUES pages via insertmanyvalues): an entry delivered twice
+  is written once. COPY cannot skip conflicting rows, which the
+  at-least-once contract needs
+- Core statements on the tables, never ORM objects: nothing here is
+  audited, and the tenant query filter does not apply to the drainer
+- Drain lag is the age of the oldest entry still in the outbox
+"""
+from datetime import datetime, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.audit_log import AuditLog, OperationType
+from src.models.audit_outbox import AuditOutbox
+
+_COLUMNS = (
+    "id",
+    "tenant_id",
+    "user_id",
+    "operation",
+    "table_name",
+    "record_id",
+    "changes",
+    "ip_address",
+    "user_agent",
+    "timestamp",
+)
+
+
+def _dialect_insert(dialect_name: str):
+    """Return the dialect-specific insert construct supporting ON CONFLICT."""
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite returns naive datetimes; stored values are UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+async def drain_batch(db: AsyncSession, batch_size: int) -> int:
+    """Move up to batch_size of the oldest outbox entries into audit_logs.
+
+    Does not commit; the caller commits once per batch.
+
+    Args:
+        db: Database session
+        batch_size: Maximum entries to move
+
+    Returns:
+        Number of entries removed from the outbox
+    """
+    outbox = AuditOutbox.__table__
+    result = await db.execute(
+        select(outbox)
+        .order_by(outbox.c.seq)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    entries = result.mappings().all()
+    if not entries:
+        return 0
+
+    rows = []
+    for entry in entries:
+        row = {column: entry[column] for column in _COLUMNS}
+        row["operation"] = OperationType(entry["operation"])
+        rows.append(row)
+
+    insert = _dialect_insert(db.get_bind().dialect.name)
+    await db.execute(
+        insert(AuditLog.__table__).on_conflict_do_nothing(index_elements=["id"]),
+        rows,
+    )
+    await db.execute(
+        delete(outbox).where(outbox.c.seq.in_([entry["seq"] for entry in entries]))
+    )
+    return len(entries)
+
+
+async def outbox_backlog(db: AsyncSession) -> tuple[int, float]:
+    """Entries waiting in the outbox and the age of the oldest one.
+
+    Args:
+        db: Database session
+
+    Returns:
+        (pending entries, drain lag in seconds; 0.0 when the outbox is empty)
+    """
+    outbox = AuditOutbox.__table__
+    result = await db.execute(select(func.count(), func.min(outbox.c.timestamp)))
+    pending, oldest = result.one()
+    if oldest is None:
+        return 0, 0.0
+    lag = (datetime.now(timezone.utc) - _as_utc(oldest)).total_seconds()
+    return pending, max(lag, 0.0)
@@ -6,17 +6,165 @@ Provides aggregated metrics for municipal operations dashboard:
 - SLA compliance breakdown
 - Team workload distribution
 
+Metrics, volume and SLA panels are all derived from one set of per-category
+aggregates. By default these come from the ticket_metrics_daily rollup plus a
+query over open tickets only (for "now"-relative SLA breaches), so cost stays
+flat as ticket history grows. Ward-filtered requests, which the rollup has
+no dimension for, fall back to a single conditional-aggregate query over the
+ward's tickets (an index range on tenant_id, ward_id).
+
 All queries exclude GBV/sensitive tickets (SEC-05 compliance).
 Ward councillors receive ward-filtered metrics only.
 """
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from datetime import datetime, time, timezone
 from uuid import UUID
 
-from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy import and_, case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.models.team import Team
 from src.models.ticket import Ticket
+from src.models.ticket_metrics import TicketMetricsDaily
+
+OPEN_STATUSES = ["open", "in_progress", "escalated"]
+RESOLVED_STATUSES = ["resolved", "closed"]
+
+
+@dataclass
+class CategoryStats:
+    """Per-category aggregates shared by the metrics, volume and SLA panels."""
+
+    category: str
+    open_count: int = 0
+    resolved_count: int = 0
+    responded_count: int = 0
+    response_seconds_sum: float = 0.0
+    resolution_sla_count: int = 0
+    resolution_breach_count: int = 0
+    resolution_compliant_count: int = 0
+    response_sla_count: int = 0
+    response_breach_count: int = 0
+
+
+def _is_day_boundary(value: datetime | None) -> bool:
+    """True if a date filter can be answered from day-granular rollup buckets."""
+    if value is None:
+        return True
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.time() == time(0)
+
+
+def _build_base_conditions(
+    municipality_id: UUID,
+    ward_id: str | None,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> list:
+    """Build the WHERE conditions shared by every dashboard query.
+
+    Args:
+        municipality_id: Municipality (tenant) ID
+        ward_id: Optional ward filter (Ticket.ward_id equality)
+        start_date: Optional start of date range (filter by created_at)
+        end_date: Optional end of date range (filter by created_at)
+
+    Returns:
+        List of SQLAlchemy conditions (non-sensitive tickets only, SEC-05)
+    """
+    conditions = [
+        Ticket.tenant_id == municipality_id,
+        Ticket.is_sensitive == False,
+    ]
+
+    # Ward filtering (stored ward_id, ix_tickets_tenant_ward)
+    if ward_id:
+        conditions.append(Ticket.ward_id == ward_id)
+
+    # Date range filtering
+    if start_date:
+        conditions.append(Ticket.created_at >= start_date)
+    if end_date:
+        conditions.append(Ticket.created_at <= end_date)
+
+    return conditions
+
+
+def _sum_rows(rows: list, field: str) -> float:
+    """Sum a nullable aggregate column across per-category rows."""
+    return sum((getattr(row, field) or 0) for row in rows)
+
+
+def _metrics_from_rows(rows: list) -> dict:
+    """Derive the overall metrics panel from per-category aggregate rows."""
+    total_open = int(_sum_rows(rows, "open_count"))
+    total_resolved = int(_sum_rows(rows, "resolved_count"))
+    sla_breaches = int(_sum_rows(rows, "resolution_breach_count"))
+    total_with_sla = int(_sum_rows(rows, "resolution_sla_count"))
+    compliant = int(_sum_rows(rows, "resolution_compliant_count"))
+
+    # Average response time (hours) — recombined from per-category sums so
+    # the average is weighted by responded tickets, not by category.
+    responded = int(_sum_rows(rows, "responded_count"))
+    response_seconds = float(_sum_rows(rows, "response_seconds_sum"))
+    avg_response_hours = (response_seconds / responded / 3600) if responded > 0 else 0.0
+
+    sla_compliance_percent = (
+        (compliant / total_with_sla * 100) if total_with_sla > 0 else 0.0
+    )
+
+    return {
+        "total_open": total_open,
+        "total_resolved": total_resolved,
+        "sla_compliance_percent": round(sla_compliance_percent, 2),
+        "avg_response_hours": round(avg_response_hours, 2),
+        "sla_breaches": sla_breaches,
+    }
+
+
+def _sla_from_rows(rows: list) -> dict:
+    """Derive the SLA compliance panel from per-category aggregate rows."""
+    total_with_sla = int(_sum_rows(rows, "response_sla_count"))
+    response_breaches = int(_sum_rows(rows, "response_breach_count"))
+    resolution_breaches = int(_sum_rows(rows, "resolution_breach_count"))
+
+    response_compliance_percent = (
+        ((total_with_sla - response_breaches) / total_with_sla * 100)
+        if total_with_sla > 0
+        else 0.0
+    )
+
+    resolution_compliance_percent = (
+        ((total_with_sla - resolution_breaches) / total_with_sla * 100)
+        if total_with_sla > 0
+        else 0.0
+    )
+
+    return {
+        "response_compliance_percent": round(response_compliance_percent, 2),
+        "resolution_compliance_percent": round(resolution_compliance_percent, 2),
+        "total_with_sla": total_with_sla,
+        "response_breaches": response_breaches,
+        "resolution_breaches": resolution_breaches,
+    }
+
+
+def _volume_from_rows(rows: list) -> list[dict]:
+    """Derive the volume-by-category panel from per-category aggregate rows.
+
+    Excludes GBV category (SEC-05).
+    """
+    return [
+        {
+            "category": row.category,
+            "open": row.open_count or 0,
+            "resolved": row.resolved_count or 0,
+        }
+        for row in rows
+        if row.category != "gbv"
+    ]
 
 
 class DashboardService:
@@ -26,210 +174,292 @@ class DashboardService:
     Ward councillors receive ward-filtered metrics only.
     """
 
-    async def get_metrics(
+    async def _category_stats(
         self,
         municipality_id: UUID,
         db: AsyncSession,
         ward_id: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-    ) -> dict:
-        """Get aggregated dashboard metrics.
+    ) -> list:
+        """Get per-category aggregates from the rollup when possible.
+
+        The rollup is bucketed by (tenant, category, day) with no ward
+        dimension, so ward-filtered or sub-day date ranges use the raw scan.
+        """
+        if (
+            settings.DASHBOARD_USE_METRICS_ROLLUP
+            and not ward_id
+            and _is_day_boundary(start_date)
+            and _is_day_boundary(end_date)
+        ):
+            return await self._rollup_category_stats(
+                municipality_id, db, start_date, end_date
+            )
+        return await self._scan_category_stats(
+            municipality_id, db, ward_id, start_date, end_date
+        )
+
+    async def _rollup_category_stats(
+        self,
+        municipality_id: UUID,
+        db: AsyncSession,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[CategoryStats]:
+        """Compute per-category aggregates from ticket_metrics_daily.
+
+        Volumes, response times and resolved-within-SLA counts are summed from
+        rollup buckets. Breaches relative to "now" cannot be pre-aggregated,
+        so they come from a second query restricted to open tickets, whose
+        size tracks the current backlog rather than total history.
 
         Args:
             municipality_id: Municipality (tenant) ID
             db: Database session
-            ward_id: Optional ward filter (interim: address ILIKE match)
-            start_date: Optional start of date range (filter by created_at)
-            end_date: Optional end of date range (filter by created_at)
+            start_date: Optional start of date range (midnight UTC)
+            end_date: Optional end of date range (midnight UTC, exclusive of
+                that day, matching created_at <= end_date)
 
         Returns:
-            dict with keys:
-            - total_open: int (tickets with status open/in_progress/escalated)
-            - total_resolved: int (resolved + closed)
-            - sla_compliance_percent: float (% tickets within SLA deadline)
-            - avg_response_hours: float (average first_responded_at - created_at)
-            - sla_breaches: int (tickets past sla_resolution_deadline)
+            list of CategoryStats
         """
-        # Base query: non-sensitive tickets only (SEC-05)
-        base_conditions = [
-            Ticket.tenant_id == municipality_id,
-            Ticket.is_sensitive == False,
+        rollup_conditions = [
+            TicketMetricsDaily.tenant_id == str(municipality_id),
+            TicketMetricsDaily.is_sensitive == False,
         ]
-
-        # Ward filtering (interim: address ILIKE)
-        if ward_id:
-            base_conditions.append(Ticket.address.ilike(f"%{ward_id}%"))
-
-        # Date range filtering
         if start_date:
-            base_conditions.append(Ticket.created_at >= start_date)
+            rollup_conditions.append(TicketMetricsDaily.day >= start_date.date())
         if end_date:
-            base_conditions.append(Ticket.created_at <= end_date)
-
-        # Total open tickets (open/in_progress/escalated)
-        open_statuses = ["open", "in_progress", "escalated"]
-        open_result = await db.execute(
-            select(func.count(Ticket.id)).where(
-                and_(
-                    *base_conditions,
-                    Ticket.status.in_(open_statuses)
-                )
-            )
-        )
-        total_open = open_result.scalar() or 0
-
-        # Total resolved tickets (resolved/closed)
-        resolved_statuses = ["resolved", "closed"]
-        resolved_result = await db.execute(
-            select(func.count(Ticket.id)).where(
-                and_(
-                    *base_conditions,
-                    Ticket.status.in_(resolved_statuses)
-                )
-            )
-        )
-        total_resolved = resolved_result.scalar() or 0
+            rollup_conditions.append(TicketMetricsDaily.day < end_date.date())
 
-        # Average response time (hours)
-        avg_response_result = await db.execute(
+        rollup_result = await db.execute(
             select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        Ticket.first_responded_at - Ticket.created_at
-                    ) / 3600
-                )
-            ).where(
-                and_(
-                    *base_conditions,
-                    Ticket.first_responded_at.isnot(None)
-                )
+                TicketMetricsDaily.category,
+                func.sum(TicketMetricsDaily.open_count).label("open_count"),
+                func.sum(TicketMetricsDaily.resolved_count).label("resolved_count"),
+                func.sum(TicketMetricsDaily.responded_count).label("responded_count"),
+                func.sum(TicketMetricsDaily.response_seconds_sum).label("response_seconds_sum"),
+                func.sum(TicketMetricsDaily.sla_count).label("resolution_sla_count"),
+                func.sum(TicketMetricsDaily.sla_met_count).label("sla_met_count"),
+                func.sum(TicketMetricsDaily.response_sla_count).label("response_sla_count"),
             )
+            .where(and_(*rollup_conditions))
+            .group_by(TicketMetricsDaily.category)
         )
-        avg_response_hours = avg_response_result.scalar() or 0.0
 
-        # SLA breaches (tickets past resolution deadline and not resolved)
-        now = datetime.now(timezone.utc)
-        breach_result = await db.execute(
-            select(func.count(Ticket.id)).where(
-                and_(
-                    *base_conditions,
-                    Ticket.sla_resolution_deadline.isnot(None),
-                    Ticket.sla_resolution_deadline < now,
-                    Ticket.status.in_(open_statuses)
-                )
-            )
-        )
-        sla_breaches = breach_result.scalar() or 0
-
-        # SLA compliance (tickets resolved within deadline)
-        total_with_sla_result = await db.execute(
-            select(func.count(Ticket.id)).where(
-                and_(
-                    *base_conditions,
-                    Ticket.sla_resolution_deadline.isnot(None)
-                )
+        stats: dict[str, CategoryStats] = {}
+        for row in rollup_result.all():
+            stats[row.category] = CategoryStats(
+                category=row.category,
+                open_count=int(row.open_count or 0),
+                resolved_count=int(row.resolved_count or 0),
+                responded_count=int(row.responded_count or 0),
+                response_seconds_sum=float(row.response_seconds_sum or 0.0),
+                resolution_sla_count=int(row.resolution_sla_count or 0),
+                resolution_compliant_count=int(row.sla_met_count or 0),
+                response_sla_count=int(row.response_sla_count or 0),
             )
+
+        # Live SLA state of open tickets only
+        open_conditions = _build_base_conditions(
+            municipality_id, None, start_date, end_date
         )
-        total_with_sla = total_with_sla_result.scalar() or 0
-
-        compliant_result = await db.execute(
-            select(func.count(Ticket.id)).where(
-                and_(
-                    *base_conditions,
-                    Ticket.sla_resolution_deadline.isnot(None),
-                    or_(
-                        # Resolved before deadline
+        open_conditions.append(Ticket.status.in_(OPEN_STATUSES))
+        now = datetime.now(timezone.utc)
+
+        live_result = await db.execute(
+            select(
+                Ticket.category,
+                func.count(
+                    case((Ticket.sla_resolution_deadline < now, 1))
+                ).label("resolution_breach_count"),
+                func.count(
+                    case((Ticket.sla_resolution_deadline >= now, 1))
+                ).label("open_within_sla_count"),
+                func.count(
+                    case((
                         and_(
-                            Ticket.status.in_(resolved_statuses),
-                            Ticket.resolved_at <= Ticket.sla_resolution_deadline
+                            Ticket.sla_response_deadline < now,
+                            Ticket.status == "open",
+                            Ticket.first_responded_at.is_(None),
                         ),
-                        # Open but still within deadline
-                        and_(
-                            Ticket.status.in_(open_statuses),
-                            Ticket.sla_resolution_deadline >= now
-                        )
-                    )
-                )
+                        1,
+                    ))
+                ).label("response_breach_count"),
             )
+            .where(and_(*open_conditions))
+            .group_by(Ticket.category)
         )
-        compliant = compliant_result.scalar() or 0
 
-        sla_compliance_percent = (
-            (compliant / total_with_sla * 100) if total_with_sla > 0 else 0.0
-        )
+        for row in live_result.all():
+            category_stats = stats.setdefault(row.category, CategoryStats(category=row.category))
+            category_stats.resolution_breach_count = int(row.resolution_breach_count or 0)
+            category_stats.resolution_compliant_count += int(row.open_within_sla_count or 0)
+            category_stats.response_breach_count = int(row.response_breach_count or 0)
 
-        return {
-            "total_open": total_open,
-            "total_resolved": total_resolved,
-            "sla_compliance_percent": round(sla_compliance_percent, 2),
-            "avg_response_hours": round(avg_response_hours, 2),
-            "sla_breaches": sla_breaches,
-        }
+        return list(stats.values())
 
-    async def get_volume_by_category(
+    async def _scan_category_stats(
         self,
         municipality_id: UUID,
         db: AsyncSession,
         ward_id: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-    ) -> list[dict]:
-        """Get ticket counts grouped by category.
+    ) -> list:
+        """Compute every ticket aggregate in one scan of tickets, grouped by category.
+
+        Uses conditional aggregates (COUNT(CASE ...), SUM) so that open/resolved
+        volumes, response times and SLA breach/compliance counts all come from
+        a single pass over the tenant's tickets. Callers combine the
+        per-category rows into the panel they need.
 
         Args:
             municipality_id: Municipality (tenant) ID
             db: Database session
-            ward_id: Optional ward filter
+            ward_id: Optional ward filter (Ticket.ward_id equality)
             start_date: Optional start of date range (filter by created_at)
             end_date: Optional end of date range (filter by created_at)
 
         Returns:
-            list of: {"category": str, "open": int, "resolved": int}
-            Excludes GBV category (SEC-05).
+            list of rows with: category, open_count, resolved_count,
+            responded_count, response_seconds_sum, resolution_sla_count,
+            resolution_breach_count, resolution_compliant_count,
+            response_sla_count, response_breach_count
         """
-        base_conditions = [
-            Ticket.tenant_id == municipality_id,
-            Ticket.is_sensitive == False,
-            Ticket.category != "gbv",  # Exclude GBV category
-        ]
-
-        if ward_id:
-            base_conditions.append(Ticket.address.ilike(f"%{ward_id}%"))
-
-        if start_date:
-            base_conditions.append(Ticket.created_at >= start_date)
-        if end_date:
-            base_conditions.append(Ticket.created_at <= end_date)
+        base_conditions = _build_base_conditions(
+            municipality_id, ward_id, start_date, end_date
+        )
+        now = datetime.now(timezone.utc)
 
-        # Group by category with open/resolved counts
-        open_statuses = ["open", "in_progress", "escalated"]
-        resolved_statuses = ["resolved", "closed"]
+        is_open = Ticket.status.in_(OPEN_STATUSES)
+        is_resolved = Ticket.status.in_(RESOLVED_STATUSES)
+        has_resolution_sla = Ticket.sla_resolution_deadline.isnot(None)
+        has_response_sla = Ticket.sla_response_deadline.isnot(None)
 
         result = await db.execute(
             select(
                 Ticket.category,
+                func.count(case((is_open, 1))).label("open_count"),
+                func.count(case((is_resolved, 1))).label("resolved_count"),
+                # Average response time inputs (tickets with a first response)
+                func.count(Ticket.first_responded_at).label("responded_count"),
+                func.sum(
+                    func.extract(
+                        "epoch",
+                        Ticket.first_responded_at - Ticket.created_at
+                    )
+                ).label("response_seconds_sum"),
+                # Resolution SLA: breaches are open tickets past deadline
+                func.count(case((has_resolution_sla, 1))).label("resolution_sla_count"),
                 func.count(
-                    case((Ticket.status.in_(open_statuses), 1))
-                ).label("open_count"),
+                    case((
+                        and_(
+                            has_resolution_sla,
+                            Ticket.sla_resolution_deadline < now,
+                            is_open,
+                        ),
+                        1,
+                    ))
+                ).label("resolution_breach_count"),
+                func.count(
+                    case(
+                        # Resolved before deadline
+                        (
+                            and_(
+                                has_resolution_sla,
+                                is_resolved,
+                                Ticket.resolved_at <= Ticket.sla_resolution_deadline,
+                            ),
+                            1,
+                        ),
+                        # Open but still within deadline
+                        (
+                            and_(
+                                has_resolution_sla,
+                                is_open,
+                                Ticket.sla_resolution_deadline >= now,
+                            ),
+                            1,
+                        ),
+                    )
+                ).label("resolution_compliant_count"),
+                # Response SLA: breaches are unanswered open tickets past deadline
+                func.count(case((has_response_sla, 1))).label("response_sla_count"),
                 func.count(
-                    case((Ticket.status.in_(resolved_statuses), 1))
-                ).label("resolved_count"),
+                    case((
+                        and_(
+                            has_response_sla,
+                            Ticket.sla_response_deadline < now,
+                            Ticket.status == "open",
+                            Ticket.first_responded_at.is_(None),
+                        ),
+                        1,
+                    ))
+                ).label("response_breach_count"),
             )
             .where(and_(*base_conditions))
             .group_by(Ticket.category)
         )
 
-        rows = result.all()
-        return [
-            {
-                "category": row.category,
-                "open": row.open_count or 0,
-                "resolved": row.resolved_count or 0,
-            }
-            for row in rows
-        ]
+        return result.all()
+
+    async def get_metrics(
+        self,
+        municipality_id: UUID,
+        db: AsyncSession,
+        ward_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict:
+        """Get aggregated dashboard metrics.
+
+        Args:
+            municipality_id: Municipality (tenant) ID
+            db: Database session
+            ward_id: Optional ward filter (Ticket.ward_id equality)
+            start_date: Optional start of date range (filter by created_at)
+            end_date: Optional end of date range (filter by created_at)
+
+        Returns:
+            dict with keys:
+            - total_open: int (tickets with status open/in_progress/escalated)
+            - total_resolved: int (resolved + closed)
+            - sla_compliance_percent: float (% tickets within SLA deadline)
+            - avg_response_hours: float (average first_responded_at - created_at)
+            - sla_breaches: int (tickets past sla_resolution_deadline)
+        """
+        rows = await self._category_stats(
+            municipality_id, db, ward_id, start_date, end_date
+        )
+        return _metrics_from_rows(rows)
+
+    async def get_volume_by_category(
+        self,
+        municipality_id: UUID,
+        db: AsyncSession,
+        ward_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> list[dict]:
+        """Get ticket counts grouped by category.
+
+        Args:
+            municipality_id: Municipality (tenant) ID
+            db: Database session
+            ward_id: Optional ward filter
+            start_date: Optional start of date range (filter by created_at)
+            end_date: Optional end of date range (filter by created_at)
+
+        Returns:
+            list of: {"category": str, "open": int, "resolved": int}
+            Excludes GBV category (SEC-05).
+        """
+        rows = await self._category_stats(
+            municipality_id, db, ward_id, start_date, end_date
+        )
+        return _volume_from_rows(rows)
 
     async def get_sla_compliance(
         self,
@@ -257,79 +487,10 @@ class DashboardService:
                 "resolution_breaches": int
             }
         """
-        base_conditions = [
-            Ticket.tenant_id == municipality_id,
-            Ticket.is_sensitive == False,
-        ]
-
-        if ward_id:
-            base_conditions.append(Ticket.address.ilike(f"%{ward_id}%"))
-
-        if start_date:
-            base_conditions.append(Ticket.created_at >= start_date)
-        if end_date:
-            base_conditions.append(Ticket.created_at <= end_date)
-
-        now = datetime.now(timezone.utc)
-
-        # Total tickets with SLA deadlines
-        total_result = await db.execute(
-            select(func.count(Ticket.id)).where(
-                and_(
-                    *base_conditions,
-                    Ticket.sla_response_deadline.isnot(None)
-                )
-            )
-        )
-        total_with_sla = total_result.scalar() or 0
-
-        # Response breaches (open tickets past response deadline)
-        response_breach_result = await db.execute(
-            select(func.count(Ticket.id)).where(
-                and_(
-                    *base_conditions,
-                    Ticket.sla_response_deadline.isnot(None),
-                    Ticket.sla_response_deadline < now,
-                    Ticket.status == "open",
-                    Ticket.first_responded_at.is_(None)
-                )
-            )
-        )
-        response_breaches = response_breach_result.scalar() or 0
-
-        # Resolution breaches (open/in_progress tickets past resolution deadline)
-        resolution_breach_result = await db.execute(
-            select(func.count(Ticket.id)).where(
-                and_(
-                    *base_conditions,
-                    Ticket.sla_resolution_deadline.isnot(None),
-                    Ticket.sla_resolution_deadline < now,
-                    Ticket.status.in_(["open", "in_progress", "escalated"])
-                )
-            )
-        )
-        resolution_breaches = resolution_breach_result.scalar() or 0
-
-        # Calculate compliance percentages
-        response_compliance_percent = (
-            ((total_with_sla - response_breaches) / total_with_sla * 100)
-            if total_with_sla > 0
-            else 0.0
+        rows = await self._category_stats(
+            municipality_id, db, ward_id, start_date, end_date
         )
-
-        resolution_compliance_percent = (
-            ((total_with_sla - resolution_breaches) / total_with_sla * 100)
-            if total_with_sla > 0
-            else 0.0
-        )
-
-        return {
-            "response_compliance_percent": round(response_compliance_percent, 2),
-            "resolution_compliance_percent": round(resolution_compliance_percent, 2),
-            "total_with_sla": total_with_sla,
-            "response_breaches": response_breaches,
-            "resolution_breaches": resolution_breaches,
-        }
+        return _sla_from_rows(rows)
 
     async def get_team_workload(
         self,
@@ -352,29 +513,18 @@ class DashboardService:
             list of: {"team_id": str, "team_name": str, "open_count": int, "total_count": int}
             Excludes SAPS teams (SEC-05).
         """
-        base_conditions = [
-            Ticket.tenant_id == municipality_id,
-            Ticket.is_sensitive == False,
-            Team.is_saps == False,  # Exclude SAPS teams
-        ]
-
-        if ward_id:
-            base_conditions.append(Ticket.address.ilike(f"%{ward_id}%"))
-
-        if start_date:
-            base_conditions.append(Ticket.created_at >= start_date)
-        if end_date:
-            base_conditions.append(Ticket.created_at <= end_date)
+        base_conditions = _build_base_conditions(
+            municipality_id, ward_id, start_date, end_date
+        )
+        base_conditions.append(Team.is_saps == False)  # Exclude SAPS teams
 
         # Join Ticket with Team and group by team
-        open_statuses = ["open", "in_progress", "escalated"]
-
         result = await db.execute(
             select(
                 Team.id.label("team_id"),
                 Team.name.label("team_name"),
                 func.count(
-                    case((Ticket.status.in_(open_statuses), 1))
+                    case((Ticket.status.in_(OPEN_STATUSES), 1))
                 ).label("open_count"),
                 func.count(Ticket.id).label("total_count"),
             )
@@ -393,3 +543,46 @@ class DashboardService:
             }
             for row in rows
         ]
+
+    async def get_dashboard_bundle(
+        self,
+        municipality_id: UUID,
+        db: AsyncSession,
+        ward_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> dict:
+        """Get all four dashboard panels in one request.
+
+        The metrics, volume and SLA panels share one set of per-category
+        aggregates (rollup plus open-ticket query, or a single scan when
+        ward-filtered); team workload needs the Team join and runs separately.
+
+        Args:
+            municipality_id: Municipality (tenant) ID
+            db: Database session
+            ward_id: Optional ward filter
+            start_date: Optional start of date range (filter by created_at)
+            end_date: Optional end of date range (filter by created_at)
+
+        Returns:
+            {
+                "metrics": dict (same shape as get_metrics),
+                "volume": list (same shape as get_volume_by_category),
+                "sla": dict (same shape as get_sla_compliance),
+                "workload": list (same shape as get_team_workload)
+            }
+        """
+        rows = await self._category_stats(
+            municipality_id, db, ward_id, start_date, end_date
+        )
+        workload = await self.get_team_workload(
+            municipality_id, db, ward_id, start_date, end_date
+        )
+
+        return {
+            "metrics": _metrics_from_rows(rows),
+            "volume": _volume_from_rows(rows),
+            "sla": _sla_from_rows(rows),
+            "workload": workload,
+        }
@@ -8,28 +8,43 @@ Key decisions:
 - Advisory lock prevents race conditions with multiple Celery workers
 - Escalation changes status to ESCALATED and assigns to team manager
 - Creates TicketAssignment record for audit trail
-- Lock is transaction-scoped (pg_try_advisory_xact_lock)
+- Lock is transaction-scoped (pg_try_advisory_xact_lock) with a stable
+  two-int key from src/core/distributed_lock.py
+- Bulk escalation (SLA monitor) is set-based: rows are claimed with
+  SELECT ... FOR UPDATE SKIP LOCKED so concurrent workers partition the
+  breach set instead of contending, and each chunk commits on its own
 """
 import logging
 from datetime import datetime
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select, text
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.audit import _audit_row, _insert_audit_rows, current_user_id
+from src.core.config import settings
+from src.core.distributed_lock import try_advisory_xact_lock
 from src.models.assignment import TicketAssignment
+from src.models.audit_log import OperationType
 from src.models.team import Team
 from src.models.ticket import Ticket, TicketStatus
+from src.services.ticket_metrics_service import (
+    TRACKED_ATTRIBUTES,
+    apply_ticket_metric_deltas,
+    state_change_deltas,
+)
 
 logger = logging.getLogger(__name__)
 
+ESCALATION_LOCK_NAMESPACE = "ticket_escalation"
+
 
 class EscalationService:
     """Service for escalating tickets to higher authority.
 
     Provides methods to:
     - Escalate single ticket with advisory lock protection
-    - Bulk escalate multiple breached tickets
+    - Bulk escalate multiple breached tickets in set-based chunks
     - Assign ticket to team manager on escalation
     """
 
@@ -60,17 +75,9 @@ class EscalationService:
         Returns:
             True if escalated successfully, False if lock not acquired or already escalated
         """
-        # Generate lock key from ticket_id
-        # Use hash to convert UUID to integer, then mod to fit in 32-bit signed int
-        lock_key = hash(str(ticket_id)) % (2 ** 31)
-
-        # Try to acquire advisory lock
-        # pg_try_advisory_xact_lock is transaction-scoped (released on commit/rollback)
-        result = await db.execute(
-            text("SELECT pg_try_advisory_xact_lock(:lock_key)"),
-            {"lock_key": lock_key}
-        )
-        lock_acquired = result.scalar()
+        # Deterministic (int4, int4) key from the UUID bytes, identical in every
+        # worker; transaction-scoped (released on commit/rollback)
+        lock_acquired = await try_advisory_xact_lock(db, ESCALATION_LOCK_NAMESPACE, ticket_id)
 
         if not lock_acquired:
             logger.info(
@@ -184,17 +191,22 @@ class EscalationService:
     async def bulk_escalate(
         self,
         breached_tickets: list[dict],
-        db: AsyncSession
+        db: AsyncSession,
+        chunk_size: int | None = None,
     ) -> int:
-        """Escalate multiple breached tickets in bulk.
+        """Escalate multiple breached tickets with set-based statements.
 
-        Iterates over breached tickets from SLAService.find_breached_tickets()
-        and calls escalate_ticket for each. Logs summary at the end.
+        Processes breaches in chunks, committing after each chunk so row locks
+        are held briefly and a failure only rolls back one chunk. Each chunk
+        costs a fixed number of statements regardless of its size (see
+        _escalate_chunk).
 
         Args:
             breached_tickets: List of dicts from SLAService.find_breached_tickets()
-                Each dict has keys: ticket_id, ticket, breach_type, overdue_by_hours
+                Each dict has keys: ticket_id, breach_type, overdue_by_hours
             db: Database session
+            chunk_size: Tickets per transaction (default
+                settings.SLA_ESCALATION_CHUNK_SIZE)
 
         Returns:
             Count of successfully escalated tickets
@@ -203,44 +215,239 @@ class EscalationService:
             logger.info("No breached tickets to escalate")
             return 0
 
-        escalated_count = 0
-        failed_count = 0
+        chunk_size = chunk_size or settings.SLA_ESCALATION_CHUNK_SIZE
 
+        # Build escalation reasons (one per ticket, first breach wins)
+        reasons: dict[UUID, str] = {}
         for breach in breached_tickets:
-            ticket_id = breach["ticket_id"]
-            breach_type = breach["breach_type"]
-            overdue_hours = breach["overdue_by_hours"]
+            reasons.setdefault(
+                breach["ticket_id"],
+                f"{breach['breach_type']} (overdue by {round(breach['overdue_by_hours'], 1)}h)",
+            )
 
-            # Build escalation reason
-            reason = f"{breach_type} (overdue by {round(overdue_hours, 1)}h)"
+        ticket_ids = list(reasons)
+        escalated_count = 0
 
+        for start in range(0, len(ticket_ids), chunk_size):
+            chunk = {
+                ticket_id: reasons[ticket_id]
+                for ticket_id in ticket_ids[start:start + chunk_size]
+            }
             try:
-                success = await self.escalate_ticket(ticket_id, reason, db)
-                if success:
-                    escalated_count += 1
-                else:
-                    # Lock not acquired or already escalated
-                    failed_count += 1
-
+                escalated_count += await self._escalate_chunk(chunk, db)
+                await db.commit()
             except Exception as e:
+                await db.rollback()
                 logger.error(
-                    f"Failed to escalate ticket",
+                    f"Failed to escalate ticket chunk",
                     exc_info=True,
-                    extra={
-                        "ticket_id": str(ticket_id),
-                        "breach_type": breach_type,
-                        "error": str(e),
-                    }
+                    extra={"chunk_size": len(chunk), "error": str(e)},
                 )
-                failed_count += 1
 
         logger.info(
             f"Bulk escalation complete",
             extra={
                 "total": len(breached_tickets),
                 "escalated": escalated_count,
-                "failed": failed_count,
+                "failed": len(ticket_ids) - escalated_count,
             }
         )
 
         return escalated_count
+
+    async def _escalate_chunk(
+        self,
+        reasons: dict[UUID, str],
+        db: AsyncSession,
+    ) -> int:
+        """Escalate one chunk of tickets in the current transaction.
+
+        Statements (independent of chunk size):
+        1. SELECT ... FOR UPDATE SKIP LOCKED on still-open candidate tickets;
+           rows locked by another worker are skipped, and tickets already
+           escalated drop out via the status filter
+        2. SELECT team managers for all affected teams
+        3. UPDATE tickets (executemany)
+        4. UPDATE previous assignments to is_current = False (RETURNING ids
+           so each deactivation gets its audit row)
+        5. INSERT new TicketAssignment rows
+        6. INSERT audit log rows and upsert the metrics rollup
+
+        Core statements are used because the SLA monitor runs across tenants
+        without tenant context; they bypass the after_flush hook, so audit
+        rows and rollup deltas are written here explicitly.
+
+        Args:
+            reasons: Mapping of ticket_id -> escalation reason
+            db: Database session (caller commits)
+
+        Returns:
+            Number of tickets escalated
+        """
+        tickets = Ticket.__table__
+        teams = Team.__table__
+        assignments = TicketAssignment.__table__
+
+        locked_columns = [
+            tickets.c.id,
+            tickets.c.user_id,
+            tickets.c.assigned_to,
+            tickets.c.assigned_team_id,
+            *[tickets.c[key] for key in TRACKED_ATTRIBUTES],
+        ]
+        result = await db.execute(
+            select(*locked_columns)
+            .where(
+                tickets.c.id.in_(list(reasons)),
+                tickets.c.status.in_([TicketStatus.OPEN, TicketStatus.IN_PROGRESS]),
+            )
+            .with_for_update(skip_locked=True)
+        )
+        rows = [dict(row._mapping) for row in result]
+        if not rows:
+            return 0
+
+        # Preload team managers in one query
+        team_ids = {row["assigned_team_id"] for row in rows if row["assigned_team_id"]}
+        managers: dict[UUID, UUID | None] = {}
+        if team_ids:
+            team_result = await db.execute(
+                select(teams.c.id, teams.c.manager_id).where(teams.c.id.in_(team_ids))
+            )
+            managers = {team_id: manager_id for team_id, manager_id in team_result}
+
+        now = datetime.utcnow()
+        ticket_updates = []
+        new_assignments = []
+        audit_rows = []
+        state_changes = []
+        audit_user_id = current_user_id.get()
+
+        for row in rows:
+            ticket_id = row["id"]
+            team_id = row["assigned_team_id"]
+            manager_id = managers.get(team_id) if team_id else None
+            assigned_to = manager_id or row["assigned_to"]
+            reason = reasons[ticket_id]
+
+            if not team_id:
+                logger.warning(
+                    f"Ticket has no assigned team for escalation",
+                    extra={"ticket_id": str(ticket_id)}
+                )
+            elif not manager_id:
+                logger.warning(
+                    f"Team has no manager for escalation assignment",
+                    extra={"ticket_id": str(ticket_id), "team_id": str(team_id)}
+                )
+
+            ticket_updates.append({
+                "b_id": ticket_id,
+                "b_assigned_to": assigned_to,
+                "b_reason": reason,
+            })
+
+            assignment_id = uuid4()
+            new_assignments.append({
+                "id": assignment_id,
+                "ticket_id": ticket_id,
+                "team_id": team_id,
+                "assigned_to": manager_id,
+                "assigned_by": "system",
+                "reason": "escalation",
+                "is_current": True,
+                "tenant_id": row["tenant_id"],
+                "created_by": str(row["user_id"]),  # System action on behalf of user
+                "updated_by": str(row["user_id"]),
+            })
+
+            changes = {
+                "status": {"old": row["status"], "new": TicketStatus.ESCALATED.value},
+                "escalated_at": {"old": None, "new": now.isoformat()},
+                "escalation_reason": {"old": None, "new": reason},
+            }
+            if assigned_to != row["assigned_to"]:
+                changes["assigned_to"] = {
+                    "old": str(row["assigned_to"]) if row["assigned_to"] else None,
+                    "new": str(assigned_to),
+                }
+            audit_rows.append(_audit_row(
+                tenant_id=row["tenant_id"],
+                user_id=audit_user_id,
+                operation=OperationType.UPDATE,
+                table_name="tickets",
+                record_id=str(ticket_id),
+                changes=changes,
+            ))
+            audit_rows.append(_audit_row(
+                tenant_id=row["tenant_id"],
+                user_id=audit_user_id,
+                operation=OperationType.CREATE,
+                table_name="ticket_assignments",
+                record_id=str(assignment_id),
+            ))
+
+            previous = {key: row[key] for key in TRACKED_ATTRIBUTES}
+            state_changes.append((
+                previous,
+                {**previous, "status": TicketStatus.ESCALATED.value, "escalated_at": now},
+            ))
+
+        await db.execute(
+            update(tickets)
+            .where(tickets.c.id == bindparam("b_id"))
+            .values(
+                status=TicketStatus.ESCALATED,
+                escalated_at=now,
+                escalation_reason=bindparam("b_reason"),
+                assigned_to=bindparam("b_assigned_to"),
+            ),
+            ticket_updates,
+        )
+
+        # Deactivate previous assignments (only tickets routed to a team had one)
+        routed_ids = [row["id"] for row in rows if row["assigned_team_id"]]
+        if routed_ids:
+            deactivated = await db.execute(
+                update(assignments)
+                .where(
+                    assignments.c.ticket_id.in_(routed_ids),
+                    assignments.c.is_current == True,
+                )
+                .values(is_current=False)
+                .returning(assignments.c.id, assignments.c.tenant_id)
+            )
+            # Same UPDATE audit row the ORM path writes for each assignment
+            for assignment_id, tenant_id in deactivated:
+                audit_rows.append(_audit_row(
+                    tenant_id=tenant_id,
+                    user_id=audit_user_id,
+                    operation=OperationType.UPDATE,
+                    table_name="ticket_assignments",
+                    record_id=str(assignment_id),
+                    changes={"is_current": {"old": True, "new": False}},
+                ))
+
+        await db.execute(insert(assignments), new_assignments)
+        # Same writer as the after_flush hook: audit_logs, or the outbox in outbox mode
+        await db.run_sync(
+            lambda sync_session: _insert_audit_rows(sync_session.connection(), audit_rows)
+        )
+
+        deltas = state_change_deltas(state_changes)
+        await db.run_sync(
+            lambda sync_session: apply_ticket_metric_deltas(
+                sync_session.connection(), deltas
+            )
+        )
+
+        logger.info(
+            f"Escalated ticket chunk",
+            extra={
+                "requested": len(reasons),
+                "escalated": len(rows),
+                "skipped": len(reasons) - len(rows),
+            }
+        )
+
+        return len(rows)
@@ -0,0 +1,435 @@
+"""Dataset queries and file writers for data exports.
+
+Used by the synchronous CSV/Excel ticket endpoints (src/api/v1/export.py)
+and by background export jobs (src/tasks/export_task.py), which cover the
+multi-year ticket, SDBIP actual and audit log datasets auditors pull.
+
+Key decisions:
+- Queries select only the exported columns and are read through a
+  server-side cursor (stream_rows), so memory is bounded by one batch
+- Jobs write to a temp file and upload it once to the exports bucket via
+  StorageService; the client polls the ExportJob row and receives a signed
+  URL when it completes
+- Formats:
+  - CSV.gz: gzip text stream, values formatted as in the CSV endpoint
+  - XLSX: openpyxl write-only workbook (rows are spooled, not kept as cells)
+  - Parquet: pyarrow ParquetWriter, one row group per batch, with column
+    types taken from the SQLAlchemy column types (timestamps, decimals and
+    booleans stay typed for analysts)
+- pyarrow is optional: format_available() is checked when a job is
+  requested, so a deployment without it answers 501 instead of failing jobs
+- SEC-05: ticket exports always exclude sensitive (GBV) tickets
+"""
+import csv
+import gzip
+import importlib.util
+import json
+import logging
+import tempfile
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+
+from sqlalchemy import Boolean, DateTime, Float, Integer, Numeric, Select, desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.models.audit_log import AuditLog
+from src.models.export_job import ExportDataset, ExportFormat, ExportJob, ExportJobStatus
+from src.models.sdbip import SDBIPActual
+from src.models.ticket import Ticket
+from src.services.storage_service import StorageService
+from src.services.ticket_search import apply_ticket_search
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per server-side cursor round-trip (and per file write)
+EXPORT_BATCH_SIZE = 1000
+
+# (header, model attribute) per dataset, in file column order
+TICKET_EXPORT_COLUMNS = [
+    ("Tracking Number", "tracking_number"),
+    ("Category", "category"),
+    ("Status", "status"),
+    ("Severity", "severity"),
+    ("Description", "description"),
+    ("Address", "address"),
+    ("Language", "language"),
+    ("Created", "created_at"),
+    ("SLA Response Deadline", "sla_response_deadline"),
+    ("SLA Resolution Deadline", "sla_resolution_deadline"),
+    ("First Responded", "first_responded_at"),
+    ("Resolved At", "resolved_at"),
+    ("Escalated At", "escalated_at"),
+]
+
+SDBIP_ACTUAL_EXPORT_COLUMNS = [
+    ("KPI ID", "kpi_id"),
+    ("Financial Year", "financial_year"),
+    ("Quarter", "quarter"),
+    ("Actual Value", "actual_value"),
+    ("Achievement %", "achievement_pct"),
+    ("Traffic Light", "traffic_light_status"),
+    ("Submitted By", "submitted_by"),
+    ("Submitted At", "submitted_at"),
+    ("Validated", "is_validated"),
+    ("Validated By", "validated_by"),
+    ("Validated At", "validated_at"),
+    ("Corrects Actual ID", "corrects_actual_id"),
+    ("Auto-populated", "is_auto_populated"),
+]
+
+AUDIT_LOG_EXPORT_COLUMNS = [
+    ("Timestamp", "timestamp"),
+    ("User ID", "user_id"),
+    ("Operation", "operation"),
+    ("Table", "table_name"),
+    ("Record ID", "record_id"),
+    ("Changes", "changes"),
+    ("IP Address", "ip_address"),
+    ("User Agent", "user_agent"),
+]
+
+DATASETS = {
+    ExportDataset.TICKETS: (Ticket, TICKET_EXPORT_COLUMNS),
+    ExportDataset.SDBIP_ACTUALS: (SDBIPActual, SDBIP_ACTUAL_EXPORT_COLUMNS),
+    ExportDataset.AUDIT_LOGS: (AuditLog, AUDIT_LOG_EXPORT_COLUMNS),
+}
+
+# Filter keys accepted per dataset (ExportJob.filters)
+DATASET_FILTERS = {
+    ExportDataset.TICKETS: {"status", "category", "ward_id", "search"},
+    ExportDataset.SDBIP_ACTUALS: {"financial_year", "quarter"},
+    ExportDataset.AUDIT_LOGS: {"table_name", "operation", "since", "until"},
+}
+
+# file extension, content type
+FORMAT_FILES = {
+    ExportFormat.XLSX: (
+        "xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    ),
+    ExportFormat.CSV_GZ: ("csv.gz", "application/gzip"),
+    ExportFormat.PARQUET: ("parquet", "application/vnd.apache.parquet"),
+}
+
+_FORMAT_MODULES = {
+    ExportFormat.XLSX: "openpyxl",
+    ExportFormat.PARQUET: "pyarrow",
+}
+
+
+def format_available(file_format: str) -> bool:
+    """Return True if the libraries for an output format are installed."""
+    module = _FORMAT_MODULES.get(ExportFormat(file_format))
+    return module is None or importlib.util.find_spec(module) is not None
+
+
+# ---------------------------------------------------------------------------
+# Queries
+# ---------------------------------------------------------------------------
+
+
+def _columns(dataset: ExportDataset) -> list:
+    model, columns = DATASETS[dataset]
+    return [getattr(model, attr) for _, attr in columns]
+
+
+def ticket_export_query(
+    tenant_id: str,
+    status_filter: str | None = None,
+    category: str | None = None,
+    ward_id: str | None = None,
+    search: str | None = None,
+    dialect_name: str = "postgresql",
+) -> Select:
+    """Build the ticket export query, newest first.
+
+    SEC-05: Always excludes GBV/sensitive tickets.
+    """
+    query = select(*_columns(ExportDataset.TICKETS)).where(Ticket.is_sensitive == False)
+
+    # Tenant filter
+    query = query.where(Ticket.tenant_id == tenant_id)
+
+    if status_filter:
+        query = query.where(Ticket.status == status_filter.lower())
+    if category:
+        query = query.where(Ticket.category == category.lower())
+    if ward_id:
+        query = query.where(Ticket.ward_id == ward_id)
+
+    # Search (same matching as list_tickets; exports keep newest-first order)
+    if search:
+        query, _ = apply_ticket_search(query, search, dialect_name)
+
+    return query.order_by(desc(Ticket.created_at))
+
+
+def sdbip_actual_export_query(
+    tenant_id: str,
+    financial_year: str | None = None,
+    quarter: str | None = None,
+) -> Select:
+    """Build the SDBIP actuals export query, in submission order."""
+    query = select(*_columns(ExportDataset.SDBIP_ACTUALS)).where(
+        SDBIPActual.tenant_id == tenant_id
+    )
+    if financial_year:
+        query = query.where(SDBIPActual.financial_year == financial_year)
+    if quarter:
+        query = query.where(SDBIPActual.quarter == quarter.upper())
+    return query.order_by(SDBIPActual.financial_year, SDBIPActual.quarter, SDBIPActual.created_at)
+
+
+def audit_log_export_query(
+    tenant_id: str,
+    table_name: str | None = None,
+    operation: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Select:
+    """Build the audit log export query, oldest first.
+
+    AuditLog is not tenant-aware at the ORM level, so the tenant filter here
+    is the only one.
+    """
+    query = select(*_columns(ExportDataset.AUDIT_LOGS)).where(AuditLog.tenant_id == tenant_id)
+    if table_name:
+        query = query.where(AuditLog.table_name == table_name)
+    if operation:
+        query = query.where(AuditLog.operation == operation)
+    if since:
+        query = query.where(AuditLog.timestamp >= since)
+    if until:
+        query = query.where(AuditLog.timestamp < until)
+    return query.order_by(AuditLog.timestamp, AuditLog.id)
+
+
+def dataset_query(dataset: str, tenant_id: str, filters: dict, dialect_name: str) -> Select:
+    """Build the export query of a dataset from ExportJob.filters."""
+    dataset = ExportDataset(dataset)
+    if dataset == ExportDataset.TICKETS:
+        return ticket_export_query(
+            tenant_id,
+            filters.get("status"),
+            filters.get("category"),
+            filters.get("ward_id"),
+            filters.get("search"),
+            dialect_name,
+        )
+    if dataset == ExportDataset.SDBIP_ACTUALS:
+        return sdbip_actual_export_query(
+            tenant_id, filters.get("financial_year"), filters.get("quarter")
+        )
+    since, until = filters.get("since"), filters.get("until")
+    return audit_log_export_query(
+        tenant_id,
+        filters.get("table_name"),
+        filters.get("operation"),
+        datetime.fromisoformat(since) if since else None,
+        datetime.fromisoformat(until) if until else None,
+    )
+
+
+async def stream_rows(
+    db: AsyncSession,
+    query: Select,
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[Sequence]:
+    """Yield batches of result rows from a server-side cursor."""
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
+
+
+def format_row(row: Sequence) -> list[str]:
+    """Render one export row as strings (datetimes as YYYY-MM-DD HH:MM:SS)."""
+    formatted = []
+    for value in row:
+        if isinstance(value, datetime):
+            value = value.strftime("%Y-%m-%d %H:%M:%S")
+        elif isinstance(value, Enum):
+            value = value.value
+        elif value is None:
+            value = ""
+        formatted.append(str(value))
+    return formatted
+
+
+# ---------------------------------------------------------------------------
+# File writers
+# ---------------------------------------------------------------------------
+
+
+class _CsvGzWriter:
+    """Gzip-compressed CSV with the same formatting as the CSV endpoint."""
+
+    def __init__(self, path: Path, model, columns: list[tuple[str, str]]):
+        self._file = gzip.open(path, "wt", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([header for header, _ in columns])
+
+    def write(self, batch: Sequence) -> None:
+        self._writer.writerows(format_row(row) for row in batch)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _XlsxWriter:
+    """openpyxl write-only workbook with a bold header row."""
+
+    def __init__(self, path: Path, model, columns: list[tuple[str, str]]):
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        from openpyxl.utils import get_column_letter
+
+        self._path = path
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("Export")
+
+        for col_idx, (header, _) in enumerate(columns, 1):
+            self._sheet.column_dimensions[get_column_letter(col_idx)].width = max(len(header) + 2, 15)
+        headers = []
+        for header, _ in columns:
+            cell = WriteOnlyCell(self._sheet, value=header)
+            cell.font = Font(bold=True)
+            headers.append(cell)
+        self._sheet.append(headers)
+
+    def write(self, batch: Sequence) -> None:
+        for row in batch:
+            self._sheet.append(format_row(row))
+
+    def close(self) -> None:
+        self._workbook.save(self._path)
+
+
+def _arrow_type(sa_type):
+    """Map a SQLAlchemy column type to the Parquet (Arrow) column type."""
+    import pyarrow as pa
+
+    if isinstance(sa_type, DateTime):
+        return pa.timestamp("us", tz="UTC")
+    if isinstance(sa_type, Boolean):
+        return pa.bool_()
+    if isinstance(sa_type, Integer):
+        return pa.int64()
+    if isinstance(sa_type, Float):
+        return pa.float64()
+    if isinstance(sa_type, Numeric) and sa_type.precision:
+        return pa.decimal128(sa_type.precision, sa_type.scale or 0)
+    return pa.string()
+
+
+class _ParquetWriter:
+    """Parquet file written one row group per batch; columns named by attribute."""
+
+    def __init__(self, path: Path, model, columns: list[tuple[str, str]]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [(attr, _arrow_type(getattr(model, attr).type)) for _, attr in columns]
+        )
+        self._writer = pq.ParquetWriter(str(path), self._schema, compression="zstd")
+
+    def _column(self, batch: Sequence, index: int, arrow_type):
+        values = [row[index] for row in batch]
+        if arrow_type == self._pa.string():
+            values = [
+                None if v is None else v.value if isinstance(v, Enum) else str(v)
+                for v in values
+            ]
+        return self._pa.array(values, type=arrow_type)
+
+    def write(self, batch: Sequence) -> None:
+        arrays = [
+            self._column(batch, index, field.type)
+            for index, field in enumerate(self._schema)
+        ]
+        self._writer.write_batch(self._pa.RecordBatch.from_arrays(arrays, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+_WRITERS = {
+    ExportFormat.CSV_GZ: _CsvGzWriter,
+    ExportFormat.XLSX: _XlsxWriter,
+    ExportFormat.PARQUET: _ParquetWriter,
+}
+
+
+# ---------------------------------------------------------------------------
+# Background job
+# ---------------------------------------------------------------------------
+
+
+async def run_export_job(
+    job: ExportJob,
+    db: AsyncSession,
+    storage: StorageService | None = None,
+) -> None:
+    """Write a job's dataset to a file, upload it and mark the job completed.
+
+    Args:
+        job: Pending (or retried) ExportJob, loaded in db
+        db: Database session (tenant context already set)
+        storage: Storage service (default: a new StorageService)
+
+    Raises:
+        StorageServiceError: If the upload fails (the job stays running so
+            the task can retry)
+    """
+    storage = storage or StorageService()
+    dataset, file_format = ExportDataset(job.dataset), ExportFormat(job.file_format)
+    model, columns = DATASETS[dataset]
+    extension, content_type = FORMAT_FILES[file_format]
+
+    job.status = ExportJobStatus.RUNNING
+    await db.commit()
+
+    query = dataset_query(
+        dataset, job.tenant_id, json.loads(job.filters or "{}"), db.get_bind().dialect.name
+    )
+    filename = f"{dataset.value}_{job.created_at:%Y%m%d_%H%M%S}.{extension}"
+    storage_path = f"{job.tenant_id}/{job.id}/{filename}"
+    row_count = 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        local_path = Path(tmp_dir) / filename
+        writer = _WRITERS[file_format](local_path, model, columns)
+        try:
+            async for batch in stream_rows(db, query):
+                writer.write(batch)
+                row_count += len(batch)
+        finally:
+            writer.close()
+
+        with open(local_path, "rb") as file:
+            await storage.upload_file(
+                bucket=settings.EXPORT_STORAGE_BUCKET,
+                path=storage_path,
+                content=file,
+                content_type=content_type,
+            )
+
+    job.status = ExportJobStatus.COMPLETED
+    job.row_count = row_count
+    job.storage_bucket = settings.EXPORT_STORAGE_BUCKET
+    job.storage_path = storage_path
+    job.completed_at = datetime.now(timezone.utc)
+    job.error = None
+    await db.commit()
+
+    metrics.inc("export_jobs_completed_total", dataset=dataset.value, format=file_format.value)
+    metrics.inc("export_job_rows_total", row_count, dataset=dataset.value)
+    logger.info(
+        "Export job %s completed: %s rows of %s as %s",
+        job.id, row_count, dataset.value, file_format.value,
+    )
@@ -8,6 +8,8 @@ Provides cross-tenant public metrics with mandatory GBV firewall:
 - System-wide summary with sensitive ticket count at system level only
 
 ALL queries filter is_sensitive == False to exclude GBV/sensitive tickets (TRNS-05, SEC-05).
+Resolution rates read the ticket_metrics_daily rollup (is_sensitive bucket
+dimension excluded) so their cost does not grow with ticket history.
 Heatmap data uses PostGIS ST_SnapToGrid for privacy-preserving location aggregation.
 Grid cells with <3 tickets are suppressed (k-anonymity threshold).
 
@@ -25,6 +27,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.municipality import Municipality
 from src.models.ticket import Ticket
+from src.models.ticket_metrics import TicketMetricsDaily
 
 # Detect if we're using SQLite (tests) or PostgreSQL (production)
 # USE_SQLITE_TESTS environment variable is set in conftest.py before imports
@@ -154,51 +157,46 @@ class PublicMetricsService:
                 "trend": [{"month": str, "rate": float}]
             }
         """
-        # Base conditions
+        # Base conditions (rollup buckets; sensitive buckets excluded)
         base_conditions = [
-            Ticket.is_sensitive == False,
+            TicketMetricsDaily.is_sensitive == False,
             Municipality.is_active == True,
         ]
 
         if municipality_id:
-            base_conditions.append(Ticket.tenant_id == municipality_id)
+            base_conditions.append(TicketMetricsDaily.tenant_id == municipality_id)
 
         # Main query: overall resolution rates
-        resolved_statuses = ["resolved", "closed"]
-
         main_result = await db.execute(
             select(
-                Ticket.tenant_id,
+                TicketMetricsDaily.tenant_id,
                 Municipality.name.label("municipality_name"),
-                func.count(Ticket.id).label("total_tickets"),
-                func.count(
-                    func.case((Ticket.status.in_(resolved_statuses), 1))
-                ).label("resolved_tickets"),
+                func.sum(TicketMetricsDaily.ticket_count).label("total_tickets"),
+                func.sum(TicketMetricsDaily.resolved_count).label("resolved_tickets"),
             )
-            .join(Municipality, Ticket.tenant_id == Municipality.id)
+            .join(Municipality, TicketMetricsDaily.tenant_id == Municipality.id)
             .where(and_(*base_conditions))
-            .group_by(Ticket.tenant_id, Municipality.name)
+            .group_by(TicketMetricsDaily.tenant_id, Municipality.name)
         )
 
         main_rows = main_result.all()
 
         # Trend query: monthly resolution rates for last N months
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=months * 30)
-        trend_conditions = base_conditions + [Ticket.created_at >= cutoff_date]
+        trend_conditions = base_conditions + [TicketMetricsDaily.day >= cutoff_date.date()]
+        month = func.date_trunc("month", TicketMetricsDaily.day)
 
         trend_result = await db.execute(
             select(
-                Ticket.tenant_id,
-                func.date_trunc("month", Ticket.created_at).label("month"),
-                func.count(Ticket.id).label("total"),
-                func.count(
-                    func.case((Ticket.status.in_(resolved_statuses), 1))
-                ).label("resolved"),
+                TicketMetricsDaily.tenant_id,
+                month.label("month"),
+                func.sum(TicketMetricsDaily.ticket_count).label("total"),
+                func.sum(TicketMetricsDaily.resolved_count).label("resolved"),
             )
-            .join(Municipality, Ticket.tenant_id == Municipality.id)
+            .join(Municipality, TicketMetricsDaily.tenant_id == Municipality.id)
             .where(and_(*trend_conditions))
-            .group_by(Ticket.tenant_id, func.date_trunc("month", Ticket.created_at))
-            .order_by(func.date_trunc("month", Ticket.created_at))
+            .group_by(TicketMetricsDaily.tenant_id, month)
+            .order_by(month)
         )
 
         trend_rows = trend_result.all()
@@ -1,8 +1,9 @@
 """RBAC service: Redis JWT blacklisting and role assignment business logic.
 
 Provides:
-- blacklist_user_token: Force-expire a JWT by storing its hash in Redis
-- is_token_blacklisted: Check if a token's hash is in the Redis blacklist
+- blacklist_user_token: Force-expire a JWT by storing its hash in Redis and
+  announcing it on the revocation stream
+- is_token_blacklisted: Check if a token's hash is in the local revocation mirror
 - assign_role: Create UserRoleAssignment with Tier 1 approval workflow
 - get_effective_role: Return the highest-authority active role for a user
 - approve_tier1_request: Approve or reject a pending Tier 1 role request
@@ -11,7 +12,6 @@ Provides:
 import hashlib
 import json
 import logging
-import time
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
@@ -20,6 +20,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import TIER_ORDER
 from src.core.config import settings
+from src.core.principal_cache import publish_invalidation
+from src.core.redis_pool import get_redis
+from src.core.revocation import publish_revocation, revocation_mirror
 from src.models.audit_log import AuditLog, OperationType
 from src.models.role_assignment import ApprovalStatus, Tier1ApprovalRequest, UserRoleAssignment
 from src.models.user import User, UserRole
@@ -47,17 +50,25 @@ def _hash_token(token: str) -> str:
     return hashlib.sha256(token.encode()).hexdigest()
 
 
-def _redis_key(digest: str) -> str:
-    """Format the Redis key for a revoked token hash."""
-    return f"revoked_token:{digest}"
-
-
 async def _get_redis():
-    """Create an async Redis client from settings."""
+    """Return the process-wide pooled client, or a short-lived one outside the API.
+
+    The shared client (src/core/redis_pool.py) is opened in the app lifespan;
+    Celery workers and scripts get a new client that _release_redis closes.
+    """
+    shared = get_redis()
+    if shared is not None:
+        return shared
     import redis.asyncio as aioredis  # lazy import — avoids startup failure if redis absent
     return aioredis.from_url(settings.REDIS_URL, decode_responses=True)
 
 
+async def _release_redis(redis) -> None:
+    """Close a client from _get_redis unless it is the shared pooled client."""
+    if redis is not get_redis():
+        await redis.aclose()
+
+
 # ---------------------------------------------------------------------------
 # JWT blacklist
 # ---------------------------------------------------------------------------
@@ -67,40 +78,41 @@ async def blacklist_user_token(token: str, exp: int) -> None:
 
     The TTL is computed as the remaining token lifetime so that stale blacklist
     entries are automatically evicted when the token would have expired anyway.
+    The revocation is also appended to the revocation stream, from which every
+    worker's mirror picks it up (src/core/revocation.py).
 
     Args:
         token: Raw JWT string to blacklist.
         exp: Token expiry timestamp (Unix epoch seconds, from the 'exp' JWT claim).
     """
     digest = _hash_token(token)
-    ttl_seconds = max(int(exp - time.time()), 1)  # at least 1 second
 
     redis = await _get_redis()
     try:
-        await redis.set(_redis_key(digest), "1", ex=ttl_seconds)
+        await publish_revocation(redis, digest, exp)
     finally:
-        await redis.aclose()
+        await _release_redis(redis)
+
+    # Drop the cached principal for this token in every worker
+    await publish_invalidation(digests=[digest])
 
 
 async def is_token_blacklisted(token: str) -> bool:
     """Return True if the given JWT has been blacklisted.
 
-    On any Redis failure the caller should catch the exception and apply
-    fail-open policy (log warning, allow request through).
+    Answered from the in-process revocation mirror, without a Redis round-trip.
 
     Args:
         token: Raw JWT string to check.
 
     Returns:
         True if the token has been revoked, False otherwise.
+
+    Raises:
+        RevocationStateUnavailable: If the mirror is out of sync with Redis;
+            the caller must fail closed.
     """
-    digest = _hash_token(token)
-    redis = await _get_redis()
-    try:
-        value = await redis.get(_redis_key(digest))
-        return value is not None
-    finally:
-        await redis.aclose()
+    return revocation_mirror.contains(_hash_token(token))
 
 
 # ---------------------------------------------------------------------------
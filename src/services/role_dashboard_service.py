@@ -806,40 +806,27 @@ class RoleDashboardService:
                 ach_result = await db.execute(ach_q, {"tenant_id": tenant_id})
                 avg_achievement = ach_result.scalar() or 0.0
 
-                # Ticket resolution rate (SEC-05: is_sensitive=False)
+                # Ticket resolution rate and SLA compliance from the daily
+                # metrics rollup (SEC-05: is_sensitive=False buckets only).
+                # SLA compliance = resolved within sla_resolution_deadline.
                 ticket_q = text(
                     "SELECT "
-                    "  COUNT(*) FILTER (WHERE status IN ('resolved', 'closed')) * 100.0 "
-                    "    / NULLIF(COUNT(*), 0) as resolution_rate "
-                    "FROM tickets "
+                    "  SUM(resolved_count) * 100.0 "
+                    "    / NULLIF(SUM(ticket_count), 0) as resolution_rate, "
+                    "  SUM(sla_met_count) * 100.0 "
+                    "    / NULLIF(SUM(sla_count), 0) as sla_compliance "
+                    "FROM ticket_metrics_daily "
                     "WHERE tenant_id = :tenant_id "
                     "  AND is_sensitive = FALSE"
                 )
                 try:
                     ticket_result = await db.execute(ticket_q, {"tenant_id": tenant_id})
-                    resolution_rate = ticket_result.scalar() or 0.0
+                    ticket_row = ticket_result.one_or_none()
+                    resolution_rate = (ticket_row[0] if ticket_row else None) or 0.0
+                    sla_compliance = (ticket_row[1] if ticket_row else None) or 0.0
                 except Exception:
-                    # tickets table may not exist in test environment
+                    # rollup table may not exist in test environment
                     resolution_rate = 0.0
-
-                # SLA compliance (simplified: resolved within sla_resolution_deadline)
-                sla_q = text(
-                    "SELECT "
-                    "  COUNT(*) FILTER ("
-                    "    WHERE status IN ('resolved', 'closed') "
-                    "      AND sla_resolution_deadline IS NOT NULL "
-                    "      AND resolved_at <= sla_resolution_deadline"
-                    "  ) * 100.0 / NULLIF(COUNT(*) FILTER ("
-                    "    WHERE sla_resolution_deadline IS NOT NULL"
-                    "  ), 0) as sla_compliance "
-                    "FROM tickets "
-                    "WHERE tenant_id = :tenant_id "
-                    "  AND is_sensitive = FALSE"
-                )
-                try:
-                    sla_result = await db.execute(sla_q, {"tenant_id": tenant_id})
-                    sla_compliance = sla_result.scalar() or 0.0
-                except Exception:
                     sla_compliance = 0.0
 
                 # Find municipality name via tenant_id lookup in users
@@ -10,19 +10,69 @@ Key decisions:
 - GBV tickets excluded from all SLA checks (handled internally by SAPS)
 - System defaults: 24h response, 168h (7 days) resolution
 - In-memory cache for SLA configs during task execution (performance optimization)
+- Breach/warning detection runs in SQL (thresholds joined from sla_configs)
+  and streams only matching ticket ids, so worker memory does not grow with
+  the open backlog
 """
 import logging
-from datetime import datetime, timedelta
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import (
+    DateTime,
+    String,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    literal_column,
+    not_,
+    or_,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.models.sla_config import SLAConfig
 from src.models.ticket import Ticket, TicketStatus
 
 logger = logging.getLogger(__name__)
 
+# Inlined literals (not bind parameters) so the planner can match the
+# ix_tickets_sla_monitoring partial index (WHERE status IN ('open', 'in_progress'))
+SLA_MONITORED_STATUSES = Ticket.__table__.c.status.in_([
+    literal_column("'open'"),
+    literal_column("'in_progress'"),
+])
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalise naive datetimes (SQLite returns them without tz) to UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _epoch_seconds(expr, dialect_name: str):
+    """Portable epoch-seconds expression for timestamp arithmetic in SQL."""
+    if dialect_name == "postgresql":
+        return func.extract("epoch", expr)
+    return func.julianday(expr) * 86400.0
+
+
+def _config_for_tenant(config, dialect_name: str):
+    """Join condition matching an SLAConfig alias to the ticket's tenant.
+
+    tickets.tenant_id is a string while sla_configs.municipality_id is a
+    UUID. SQLite stores UUIDs as 32-char hex, so dashes are stripped there.
+    """
+    tenant_id = Ticket.__table__.c.tenant_id
+    if dialect_name == "postgresql":
+        return cast(config.municipality_id, String) == tenant_id
+    return config.municipality_id == func.replace(tenant_id, "-", "")
+
 
 class SLAService:
     """Service for SLA deadline calculation and breach detection.
@@ -189,183 +239,239 @@ class SLAService:
             }
         )
 
-    async def find_breached_tickets(self, db: AsyncSession) -> list[dict]:
-        """Find tickets that have breached their SLA deadlines.
+    async def stream_breached_tickets(
+        self,
+        db: AsyncSession,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict]]:
+        """Stream tickets that have breached their SLA deadlines, in batches.
 
         A ticket is breached if:
         - Response breach: status='open' AND now > sla_response_deadline
         - Resolution breach: status IN ('open','in_progress') AND now > sla_resolution_deadline
 
-        GBV tickets (is_sensitive=True) are excluded.
+        The comparison runs in the database over the ix_tickets_sla_monitoring
+        partial index; only breaching rows (a handful of columns each) are
+        returned, via a server-side cursor. GBV tickets (is_sensitive=True)
+        are excluded.
 
         Args:
             db: Database session
+            batch_size: Rows fetched per cursor round-trip
 
-        Returns:
-            List of dicts with keys:
+        Yields:
+            Lists of dicts with keys:
             - ticket_id: UUID
-            - ticket: Ticket model instance
+            - tenant_id: str
             - breach_type: "response_breach" or "resolution_breach"
             - overdue_by_hours: float
         """
-        now = datetime.utcnow()
-
-        # Query for breached tickets
-        # Exclude GBV tickets (is_sensitive=True) and tickets without SLA deadlines
-        stmt = select(Ticket).where(
-            Ticket.is_sensitive == False,
-            Ticket.sla_response_deadline != None,
-            Ticket.status.in_([TicketStatus.OPEN, TicketStatus.IN_PROGRESS]),
-        )
+        now = datetime.now(timezone.utc)
+        tickets = Ticket.__table__
+        now_param = literal(now, DateTime(timezone=True))
 
-        result = await db.execute(stmt)
-        tickets = result.scalars().all()
+        response_breach = and_(
+            tickets.c.status == TicketStatus.OPEN,
+            tickets.c.sla_response_deadline < now_param,
+        )
+        breach_type = case(
+            (response_breach, literal("response_breach")),
+            else_=literal("resolution_breach"),
+        )
+        deadline = case(
+            (response_breach, tickets.c.sla_response_deadline),
+            else_=tickets.c.sla_resolution_deadline,
+        )
 
-        breached = []
+        stmt = select(
+            tickets.c.id,
+            tickets.c.tenant_id,
+            breach_type.label("breach_type"),
+            deadline.label("deadline"),
+        ).where(
+            SLA_MONITORED_STATUSES,
+            tickets.c.is_sensitive == False,
+            tickets.c.sla_response_deadline != None,
+            or_(
+                response_breach,
+                tickets.c.sla_resolution_deadline < now_param,
+            ),
+        )
 
-        for ticket in tickets:
-            # Check response breach (only for OPEN tickets)
-            if (ticket.status == TicketStatus.OPEN and
-                ticket.sla_response_deadline and
-                now > ticket.sla_response_deadline):
+        result = await db.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield [
+                {
+                    "ticket_id": row.id,
+                    "tenant_id": row.tenant_id,
+                    "breach_type": row.breach_type,
+                    "overdue_by_hours": (now - _as_utc(row.deadline)).total_seconds() / 3600,
+                }
+                for row in partition
+            ]
 
-                overdue_delta = now - ticket.sla_response_deadline
-                overdue_hours = overdue_delta.total_seconds() / 3600
+    async def find_breached_tickets(self, db: AsyncSession) -> list[dict]:
+        """Find tickets that have breached their SLA deadlines.
 
-                breached.append({
-                    "ticket_id": ticket.id,
-                    "ticket": ticket,
-                    "breach_type": "response_breach",
-                    "overdue_by_hours": overdue_hours,
-                })
+        Collects stream_breached_tickets. Memory is bounded by the number of
+        breaches, not by the open backlog.
 
-                logger.warning(
-                    f"Response SLA breach detected",
-                    extra={
-                        "ticket_id": str(ticket.id),
-                        "tracking_number": ticket.tracking_number,
-                        "deadline": ticket.sla_response_deadline.isoformat(),
-                        "overdue_hours": round(overdue_hours, 2),
-                    }
-                )
-
-            # Check resolution breach (for OPEN or IN_PROGRESS tickets)
-            elif (ticket.status in [TicketStatus.OPEN, TicketStatus.IN_PROGRESS] and
-                  ticket.sla_resolution_deadline and
-                  now > ticket.sla_resolution_deadline):
-
-                overdue_delta = now - ticket.sla_resolution_deadline
-                overdue_hours = overdue_delta.total_seconds() / 3600
-
-                breached.append({
-                    "ticket_id": ticket.id,
-                    "ticket": ticket,
-                    "breach_type": "resolution_breach",
-                    "overdue_by_hours": overdue_hours,
-                })
+        Args:
+            db: Database session
 
-                logger.warning(
-                    f"Resolution SLA breach detected",
-                    extra={
-                        "ticket_id": str(ticket.id),
-                        "tracking_number": ticket.tracking_number,
-                        "deadline": ticket.sla_resolution_deadline.isoformat(),
-                        "overdue_hours": round(overdue_hours, 2),
-                    }
-                )
+        Returns:
+            List of dicts with keys: ticket_id, tenant_id, breach_type,
+            overdue_by_hours
+        """
+        breached = []
+        async for batch in self.stream_breached_tickets(db):
+            breached.extend(batch)
 
         logger.info(
             f"SLA breach check complete",
-            extra={
-                "total_tickets_checked": len(tickets),
-                "breached_count": len(breached),
-            }
+            extra={"breached_count": len(breached)}
         )
 
         return breached
 
-    async def find_warning_tickets(self, db: AsyncSession) -> list[dict]:
-        """Find tickets approaching SLA breach (within warning threshold).
+    async def stream_warning_tickets(
+        self,
+        db: AsyncSession,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[dict]]:
+        """Stream tickets approaching SLA breach (within warning threshold), in batches.
 
-        Calculates elapsed percentage for each ticket:
         elapsed_pct = (now - created_at) / (deadline - created_at) * 100
 
-        Returns tickets where elapsed_pct >= warning_threshold_pct AND not yet breached.
-        Used for early warning notifications to team leads.
+        Returns tickets where elapsed_pct >= warning_threshold_pct AND not yet
+        breached. The threshold comes from sla_configs joined in the same
+        query with the same fallback as get_sla_config (category-specific
+        config, then municipality default, then 80%).
 
         Args:
             db: Database session
+            batch_size: Rows fetched per cursor round-trip
 
-        Returns:
-            List of dicts with keys:
+        Yields:
+            Lists of dicts with keys:
             - ticket_id: UUID
-            - ticket: Ticket model instance
+            - tenant_id: str
             - warning_type: "response_warning" or "resolution_warning"
             - elapsed_pct: float (0-100)
         """
-        now = datetime.utcnow()
-
-        # Query for active tickets with SLA deadlines
-        stmt = select(Ticket).where(
-            Ticket.is_sensitive == False,
-            Ticket.sla_response_deadline != None,
-            Ticket.status.in_([TicketStatus.OPEN, TicketStatus.IN_PROGRESS]),
+        now = datetime.now(timezone.utc)
+        dialect_name = db.get_bind().dialect.name
+        tickets = Ticket.__table__
+        now_param = literal(now, DateTime(timezone=True))
+
+        category_config = aliased(SLAConfig)
+        default_config = aliased(SLAConfig)
+        threshold = func.coalesce(
+            category_config.warning_threshold_pct,
+            default_config.warning_threshold_pct,
+            80,
         )
 
-        result = await db.execute(stmt)
-        tickets = result.scalars().all()
+        def reached_threshold(deadline_column):
+            created = _epoch_seconds(tickets.c.created_at, dialect_name)
+            total = _epoch_seconds(deadline_column, dialect_name) - created
+            elapsed = _epoch_seconds(now_param, dialect_name) - created
+            return and_(
+                deadline_column > tickets.c.created_at,
+                elapsed * 100 >= total * threshold,
+            )
 
-        warnings = []
+        # Mirrors the breach rule: an open ticket inside its response window is
+        # only checked against the response deadline
+        in_response_window = and_(
+            tickets.c.status == TicketStatus.OPEN,
+            tickets.c.sla_response_deadline > now_param,
+        )
+        response_warning = and_(
+            in_response_window,
+            reached_threshold(tickets.c.sla_response_deadline),
+        )
+        resolution_warning = and_(
+            not_(in_response_window),
+            tickets.c.sla_resolution_deadline > now_param,
+            reached_threshold(tickets.c.sla_resolution_deadline),
+        )
+        warning_type = case(
+            (response_warning, literal("response_warning")),
+            else_=literal("resolution_warning"),
+        )
+        deadline = case(
+            (response_warning, tickets.c.sla_response_deadline),
+            else_=tickets.c.sla_resolution_deadline,
+        )
 
-        for ticket in tickets:
-            # Get municipality's warning threshold (default 80%)
-            config = await self.get_sla_config(
-                municipality_id=ticket.tenant_id,
-                category=ticket.category,
-                db=db
+        stmt = (
+            select(
+                tickets.c.id,
+                tickets.c.tenant_id,
+                tickets.c.created_at,
+                warning_type.label("warning_type"),
+                deadline.label("deadline"),
+            )
+            .outerjoin(
+                category_config,
+                and_(
+                    _config_for_tenant(category_config, dialect_name),
+                    category_config.category == tickets.c.category,
+                    category_config.is_active == True,
+                ),
+            )
+            .outerjoin(
+                default_config,
+                and_(
+                    _config_for_tenant(default_config, dialect_name),
+                    default_config.category == None,
+                    default_config.is_active == True,
+                ),
+            )
+            .where(
+                SLA_MONITORED_STATUSES,
+                tickets.c.is_sensitive == False,
+                tickets.c.sla_response_deadline != None,
+                or_(response_warning, resolution_warning),
             )
-            threshold_pct = config.warning_threshold_pct if config else 80
-
-            # Check response warning (only for OPEN tickets)
-            if (ticket.status == TicketStatus.OPEN and
-                ticket.sla_response_deadline and
-                now < ticket.sla_response_deadline):
-
-                total_time = (ticket.sla_response_deadline - ticket.created_at).total_seconds()
-                elapsed_time = (now - ticket.created_at).total_seconds()
-                elapsed_pct = (elapsed_time / total_time) * 100 if total_time > 0 else 0
-
-                if elapsed_pct >= threshold_pct:
-                    warnings.append({
-                        "ticket_id": ticket.id,
-                        "ticket": ticket,
-                        "warning_type": "response_warning",
-                        "elapsed_pct": elapsed_pct,
-                    })
-
-            # Check resolution warning (for OPEN or IN_PROGRESS tickets)
-            elif (ticket.status in [TicketStatus.OPEN, TicketStatus.IN_PROGRESS] and
-                  ticket.sla_resolution_deadline and
-                  now < ticket.sla_resolution_deadline):
-
-                total_time = (ticket.sla_resolution_deadline - ticket.created_at).total_seconds()
-                elapsed_time = (now - ticket.created_at).total_seconds()
-                elapsed_pct = (elapsed_time / total_time) * 100 if total_time > 0 else 0
-
-                if elapsed_pct >= threshold_pct:
-                    warnings.append({
-                        "ticket_id": ticket.id,
-                        "ticket": ticket,
-                        "warning_type": "resolution_warning",
-                        "elapsed_pct": elapsed_pct,
-                    })
+        )
+
+        result = await db.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            batch = []
+            for row in partition:
+                created_at = _as_utc(row.created_at)
+                total = (_as_utc(row.deadline) - created_at).total_seconds()
+                elapsed = (now - created_at).total_seconds()
+                batch.append({
+                    "ticket_id": row.id,
+                    "tenant_id": row.tenant_id,
+                    "warning_type": row.warning_type,
+                    "elapsed_pct": (elapsed / total) * 100 if total > 0 else 0,
+                })
+            yield batch
+
+    async def find_warning_tickets(self, db: AsyncSession) -> list[dict]:
+        """Find tickets approaching SLA breach (within warning threshold).
+
+        Collects stream_warning_tickets. Used for early warning notifications
+        to team leads.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List of dicts with keys: ticket_id, tenant_id, warning_type,
+            elapsed_pct
+        """
+        warnings = []
+        async for batch in self.stream_warning_tickets(db):
+            warnings.extend(batch)
 
         logger.info(
             f"SLA warning check complete",
-            extra={
-                "total_tickets_checked": len(tickets),
-                "warning_count": len(warnings),
-            }
+            extra={"warning_count": len(warnings)}
         )
 
         return warnings
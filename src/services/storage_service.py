@@ -3,6 +3,7 @@
 Handles file upload/download via Supabase Storage with RLS-enforced access control.
 Supports three private buckets: evidence, documents, gbv-evidence.
 """
+from typing import BinaryIO
 from uuid import uuid4
 import httpx
 
@@ -72,15 +73,16 @@ class StorageService:
         self,
         bucket: str,
         path: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         content_type: str
     ) -> dict:
-        """Server-side upload using admin client (for WhatsApp media).
+        """Server-side upload using admin client (WhatsApp media, export files).
 
         Args:
-            bucket: Bucket name (evidence, documents, gbv-evidence)
+            bucket: Bucket name (evidence, documents, gbv-evidence, exports)
             path: Storage path (e.g., {tenant_id}/{file_id}/{filename})
-            content: File content bytes
+            content: File content bytes, or a binary file opened for reading
+                (large export files are not read into memory)
             content_type: MIME type
 
         Returns:
@@ -0,0 +1,418 @@
+"""Incremental maintenance of the daily ticket metrics rollup.
+
+Every ticket contributes a fixed set of additive counters (open, resolved,
+SLA met/breached, response/resolution seconds) to exactly one
+(tenant, category, day, is_sensitive) bucket in ticket_metrics_daily. When a
+ticket is inserted, changed or deleted, its previous contribution is
+subtracted and the new one added, so the rollup always equals the sum of
+contributions over all tickets.
+
+On PostgreSQL this is done by a row trigger on tickets (migration
+20260304_ticket_metrics_trigger), because the agent tools insert tickets
+through Supabase and never reach the ORM. On other dialects (SQLite tests)
+the after_flush hook in src/core/audit.py applies the same deltas.
+
+Key decisions:
+- Contribution is a pure function of ticket state, shared by the incremental
+  hook and the full rebuild so both paths agree exactly
+- Deltas for a flush are merged per bucket and written with one multi-row
+  INSERT ... ON CONFLICT DO UPDATE (counter = counter + delta)
+- "Breached" means the ticket was escalated (the SLA monitor escalates on
+  breach) or was resolved after its resolution deadline; live "open and past
+  deadline" counts remain a query over open tickets only
+- Rebuild streams tickets with a server-side cursor and is the reconciliation
+  path for any drift; it runs nightly (src/tasks/ticket_metrics_task.py)
+- Tracked attributes are read through the instance state; anything not
+  loaded is loaded in before_flush (prepare_ticket_metric_states) so an
+  expired created_at or category never lands in the wrong bucket
+"""
+import logging
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Any, Iterable
+from uuid import uuid4
+
+from sqlalchemy import delete, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.orm.base import NO_VALUE, PASSIVE_NO_INITIALIZE
+
+from src.models.ticket import Ticket
+from src.models.ticket_metrics import TicketMetricsDaily
+
+logger = logging.getLogger(__name__)
+
+OPEN_STATUSES = frozenset({"open", "in_progress", "escalated"})
+RESOLVED_STATUSES = frozenset({"resolved", "closed"})
+
+# Ticket attributes that determine a ticket's bucket and contribution
+TRACKED_ATTRIBUTES = (
+    "tenant_id",
+    "category",
+    "is_sensitive",
+    "status",
+    "created_at",
+    "first_responded_at",
+    "resolved_at",
+    "escalated_at",
+    "sla_response_deadline",
+    "sla_resolution_deadline",
+)
+
+COUNTER_FIELDS = (
+    "ticket_count",
+    "open_count",
+    "resolved_count",
+    "sla_count",
+    "sla_met_count",
+    "breached_count",
+    "response_sla_count",
+    "responded_count",
+    "response_seconds_sum",
+    "resolved_timed_count",
+    "resolution_seconds_sum",
+)
+
+BucketKey = tuple[str, str, date, bool]
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    """Normalise naive datetimes (stored without tz) to UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def bucket_key(state: dict[str, Any]) -> BucketKey:
+    """Return the rollup bucket a ticket state belongs to."""
+    created_at = _as_utc(state.get("created_at")) or datetime.now(timezone.utc)
+    return (
+        str(state["tenant_id"]),
+        str(state["category"]),
+        created_at.date(),
+        bool(state.get("is_sensitive")),
+    )
+
+
+def ticket_contribution(state: dict[str, Any]) -> dict[str, float]:
+    """Compute the counters a single ticket state contributes to its bucket.
+
+    Args:
+        state: Mapping of TRACKED_ATTRIBUTES to values
+
+    Returns:
+        dict of COUNTER_FIELDS -> value (zero-valued fields omitted)
+    """
+    status = state.get("status")
+    created_at = _as_utc(state.get("created_at")) or datetime.now(timezone.utc)
+    first_responded_at = _as_utc(state.get("first_responded_at"))
+    resolved_at = _as_utc(state.get("resolved_at"))
+    response_deadline = _as_utc(state.get("sla_response_deadline"))
+    resolution_deadline = _as_utc(state.get("sla_resolution_deadline"))
+
+    is_open = status in OPEN_STATUSES
+    is_resolved = status in RESOLVED_STATUSES
+    resolved_late = (
+        is_resolved
+        and resolution_deadline is not None
+        and resolved_at is not None
+        and resolved_at > resolution_deadline
+    )
+
+    contribution: dict[str, float] = {"ticket_count": 1}
+    if is_open:
+        contribution["open_count"] = 1
+    if is_resolved:
+        contribution["resolved_count"] = 1
+
+    if resolution_deadline is not None:
+        contribution["sla_count"] = 1
+        if is_resolved and resolved_at is not None and resolved_at <= resolution_deadline:
+            contribution["sla_met_count"] = 1
+        if state.get("escalated_at") is not None or resolved_late:
+            contribution["breached_count"] = 1
+
+    if response_deadline is not None:
+        contribution["response_sla_count"] = 1
+
+    if first_responded_at is not None:
+        contribution["responded_count"] = 1
+        contribution["response_seconds_sum"] = (first_responded_at - created_at).total_seconds()
+
+    if is_resolved and resolved_at is not None:
+        contribution["resolved_timed_count"] = 1
+        contribution["resolution_seconds_sum"] = (resolved_at - created_at).total_seconds()
+
+    return contribution
+
+
+def _current_state(ticket: Ticket) -> dict[str, Any]:
+    """Read tracked attributes through the instance state without triggering loads.
+
+    prepare_ticket_metric_states has loaded every tracked attribute before
+    the flush; new tickets get created_at filled in there as well.
+    """
+    attrs = inspect(ticket).attrs
+    state = {}
+    for key in TRACKED_ATTRIBUTES:
+        value = attrs[key].loaded_value
+        if value is NO_VALUE:
+            raise RuntimeError(
+                f"Ticket.{key} not loaded for metrics rollup; "
+                "prepare_ticket_metric_states must run in before_flush"
+            )
+        state[key] = value
+    return state
+
+
+def _previous_state(ticket: Ticket) -> dict[str, Any]:
+    """Reconstruct the pre-flush state of a modified ticket from attribute history."""
+    state = _current_state(ticket)
+    for key in TRACKED_ATTRIBUTES:
+        history = get_history(ticket, key, passive=PASSIVE_NO_INITIALIZE)
+        if history.deleted:
+            state[key] = history.deleted[0]
+    return state
+
+
+def _accumulate(
+    deltas: dict[BucketKey, dict[str, float]],
+    state: dict[str, Any],
+    sign: int,
+) -> None:
+    """Add (sign=1) or subtract (sign=-1) a state's contribution."""
+    bucket = deltas[bucket_key(state)]
+    for field, value in ticket_contribution(state).items():
+        bucket[field] = bucket.get(field, 0) + sign * value
+
+
+def _insert_value(key: str) -> Any:
+    """Value an INSERT stores for a tracked Ticket column that was never set."""
+    column = Ticket.__table__.c[key]
+    if column.default is not None and column.default.is_scalar:
+        return column.default.arg
+    return None
+
+
+def rollup_maintained_by_trigger(connection: Connection) -> bool:
+    """Whether the database maintains ticket_metrics_daily itself (PostgreSQL)."""
+    return connection.dialect.name == "postgresql"
+
+
+def prepare_ticket_metric_states(session: Session) -> None:
+    """Load every tracked attribute of tickets about to be flushed.
+
+    Runs in before_flush, where lazy loads are still allowed. Expired or
+    deferred attributes are refreshed from the database; new tickets get an
+    explicit created_at so their bucket matches the stored row, and tracked
+    attributes never set are filled with the value the INSERT will store
+    (the column's scalar default, else NULL).
+
+    Args:
+        session: SQLAlchemy session inside a before_flush event
+    """
+    for obj in session.new:
+        if not isinstance(obj, Ticket):
+            continue
+        if obj.created_at is None:
+            obj.created_at = datetime.now(timezone.utc)
+        unset = inspect(obj).unloaded
+        for key in TRACKED_ATTRIBUTES:
+            if key in unset:
+                setattr(obj, key, _insert_value(key))
+
+    for obj in (*session.dirty, *session.deleted):
+        if not isinstance(obj, Ticket):
+            continue
+        unloaded = inspect(obj).unloaded
+        missing = [key for key in TRACKED_ATTRIBUTES if key in unloaded]
+        if missing:
+            session.refresh(obj, attribute_names=missing)
+
+
+def collect_ticket_metric_deltas(session: Session) -> dict[BucketKey, dict[str, float]]:
+    """Collect per-bucket counter deltas for all tickets in the current flush.
+
+    Args:
+        session: SQLAlchemy session inside an after_flush event
+
+    Returns:
+        dict mapping bucket key -> {counter field: delta}; buckets whose
+        deltas cancel out are dropped
+    """
+    deltas: dict[BucketKey, dict[str, float]] = defaultdict(dict)
+
+    for obj in session.new:
+        if isinstance(obj, Ticket):
+            _accumulate(deltas, _current_state(obj), 1)
+
+    for obj in session.dirty:
+        if not isinstance(obj, Ticket):
+            continue
+        previous = _previous_state(obj)
+        current = _current_state(obj)
+        if previous == current:
+            continue
+        _accumulate(deltas, previous, -1)
+        _accumulate(deltas, current, 1)
+
+    for obj in session.deleted:
+        if isinstance(obj, Ticket):
+            _accumulate(deltas, _previous_state(obj), -1)
+
+    return {
+        key: fields
+        for key, fields in deltas.items()
+        if any(value for value in fields.values())
+    }
+
+
+def state_change_deltas(
+    changes: Iterable[tuple[dict[str, Any], dict[str, Any]]],
+) -> dict[BucketKey, dict[str, float]]:
+    """Compute rollup deltas for ticket changes written with Core statements.
+
+    Bulk UPDATEs bypass the after_flush hook, so callers that modify tickets
+    set-wise pass (previous, current) state pairs here and apply the result
+    with apply_ticket_metric_deltas in the same transaction.
+
+    Args:
+        changes: Iterable of (previous state, current state) mappings of
+            TRACKED_ATTRIBUTES
+
+    Returns:
+        dict mapping bucket key -> {counter field: delta}; buckets whose
+        deltas cancel out are dropped
+    """
+    deltas: dict[BucketKey, dict[str, float]] = defaultdict(dict)
+    for previous, current in changes:
+        _accumulate(deltas, previous, -1)
+        _accumulate(deltas, current, 1)
+    return {
+        key: fields
+        for key, fields in deltas.items()
+        if any(value for value in fields.values())
+    }
+
+
+def _dialect_insert(connection: Connection):
+    """Return the dialect-specific insert construct supporting ON CONFLICT."""
+    if connection.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def apply_ticket_metric_deltas(
+    connection: Connection,
+    deltas: dict[BucketKey, dict[str, float]],
+) -> None:
+    """Upsert counter deltas into ticket_metrics_daily in one statement.
+
+    Uses direct connection.execute (like audit log inserts) so no ORM
+    objects are flushed and no audit events are triggered. A no-op where
+    the rollup trigger already applied the same change.
+
+    Args:
+        connection: Database connection from the flushing session
+        deltas: Output of collect_ticket_metric_deltas
+    """
+    if rollup_maintained_by_trigger(connection):
+        return
+    _upsert_deltas(connection, deltas)
+
+
+def _upsert_deltas(
+    connection: Connection,
+    deltas: dict[BucketKey, dict[str, float]],
+) -> None:
+    """Add counter deltas to their buckets with INSERT ... ON CONFLICT."""
+    if not deltas:
+        return
+
+    rows = []
+    for (tenant_id, category, day, is_sensitive), fields in deltas.items():
+        row = {
+            "id": uuid4(),
+            "tenant_id": tenant_id,
+            "category": category,
+            "day": day,
+            "is_sensitive": is_sensitive,
+        }
+        for field in COUNTER_FIELDS:
+            row[field] = fields.get(field, 0)
+        rows.append(row)
+
+    insert = _dialect_insert(connection)
+    table = TicketMetricsDaily.__table__
+    stmt = insert(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["tenant_id", "category", "day", "is_sensitive"],
+        set_={
+            **{field: table.c[field] + stmt.excluded[field] for field in COUNTER_FIELDS},
+            "updated_at": datetime.now(timezone.utc),
+        },
+    )
+    connection.execute(stmt)
+
+
+class TicketMetricsService:
+    """Service for rebuilding the ticket metrics rollup from raw tickets."""
+
+    async def rebuild(
+        self,
+        db: AsyncSession,
+        tenant_id: str | None = None,
+        batch_size: int = 5000,
+    ) -> int:
+        """Recompute rollup rows from the tickets table.
+
+        Streams tickets with a server-side cursor so memory is bounded by the
+        number of buckets, not tickets. Used for initial backfill outside the
+        migration and by the nightly reconciliation task.
+
+        Args:
+            db: Database session (caller commits)
+            tenant_id: Optional tenant to rebuild; all tenants if None
+            batch_size: Rows fetched per cursor round-trip
+
+        Returns:
+            Number of rollup buckets written
+        """
+        # Block trigger upserts until this transaction commits: writers that
+        # already upserted finish first (and are in our snapshot), later ones
+        # apply on top of the rebuilt rows
+        if db.get_bind().dialect.name == "postgresql":
+            await db.execute(text("LOCK TABLE ticket_metrics_daily IN EXCLUSIVE MODE"))
+
+        tickets = Ticket.__table__
+        columns = [tickets.c[key] for key in TRACKED_ATTRIBUTES]
+        stmt = select(*columns)
+        if tenant_id is not None:
+            stmt = stmt.where(tickets.c.tenant_id == tenant_id)
+
+        deltas: dict[BucketKey, dict[str, float]] = defaultdict(dict)
+        result = await db.stream(stmt.execution_options(yield_per=batch_size))
+        async for row in result:
+            _accumulate(deltas, dict(row._mapping), 1)
+
+        clear_stmt = delete(TicketMetricsDaily)
+        if tenant_id is not None:
+            clear_stmt = clear_stmt.where(TicketMetricsDaily.tenant_id == tenant_id)
+        await db.execute(clear_stmt)
+
+        deltas = dict(deltas)
+        await db.run_sync(
+            lambda sync_session: _upsert_deltas(sync_session.connection(), deltas)
+        )
+
+        logger.info(
+            "Rebuilt ticket metrics rollup",
+            extra={"tenant_id": tenant_id, "buckets": len(deltas)},
+        )
+        return len(deltas)
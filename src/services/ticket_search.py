@@ -0,0 +1,132 @@
+"""Ticket free-text search for the manager dashboard and exports.
+
+Replaces ``ILIKE '%term%'`` on description/tracking_number, which cannot use
+a B-tree index and scans every ticket in the tenant.
+
+On PostgreSQL (see migration 20260304_ticket_search_index):
+- tickets.search_vector is a STORED generated tsvector over description,
+  built with the ticket's own language config ('english' for en,
+  'afrikaans' for af, 'simple' otherwise) and GIN-indexed
+- tickets.tracking_number has a pg_trgm GIN index, which serves prefix
+  matches (TKT-20260301...) and fuzzy matches on mistyped numbers
+- Results are ranked: an exact tracking-number prefix outranks everything,
+  then the better of ts_rank_cd and trigram similarity
+
+Key decisions:
+- The user's query language is unknown, so it is parsed with both the
+  English and Afrikaans configs and the tsqueries are OR'ed; a term matches
+  whichever config stemmed the ticket
+- websearch_to_tsquery accepts raw user input (quotes, OR, -term) without
+  raising on syntax errors
+- Trigram matching is only attempted when the term looks like a tracking
+  number, so ordinary words do not fuzzy-match against TKT-... values.
+  Such terms are normalised to TKT-... first (bare "20260301" included) so
+  the anchored prefix match can hit
+- SQLite (tests) has neither tsvector nor pg_trgm: search falls back to
+  substring ILIKE and relevance ordering falls back to newest first
+- search_vector is not mapped on the Ticket model (no SQLite equivalent);
+  it is referenced by column name here only
+"""
+import re
+
+from sqlalchemy import Float, Select, case, cast, func, literal, literal_column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.models.ticket import Ticket
+
+# Text search configuration per ticket language (must match the migration)
+SEARCH_CONFIGS = {"en": "english", "af": "afrikaans"}  # other languages: "simple"
+
+_TRACKING_NUMBER_RE = re.compile(r"^(TKT-?)?\d[\dA-F-]*$|^TKT", re.IGNORECASE)
+
+search_vector = literal_column("tickets.search_vector")
+
+
+def looks_like_tracking_number(term: str) -> bool:
+    """Whether a search term is (part of) a TKT-YYYYMMDD-XXXXXX number."""
+    return bool(_TRACKING_NUMBER_RE.match(term.strip()))
+
+
+def normalize_tracking_number(term: str) -> str:
+    """Canonicalise a tracking-number term to the stored TKT-... form.
+
+    Bare dates ("20260301") and a missing dash ("TKT20260301") are common
+    when citizens read numbers aloud or copy them from SMS; without the
+    prefix an anchored match could never hit a TKT-... value.
+    """
+    term = term.strip().upper()
+    if term[:1].isdigit():
+        return f"TKT-{term}"
+    if term.startswith("TKT") and len(term) > 3 and term[3] != "-":
+        return f"TKT-{term[3:]}"
+    return term
+
+
+def _escape_like(term: str) -> str:
+    """Escape LIKE wildcards so user input matches literally."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _tsquery(term: str) -> ColumnElement:
+    """Parse term with every ticket language config and OR the results."""
+    # Configs are module constants, so rendering them inline is safe and
+    # gives the planner a constant regconfig
+    queries = [
+        func.websearch_to_tsquery(literal_column(f"'{config}'::regconfig"), term)
+        for config in SEARCH_CONFIGS.values()
+    ]
+    combined = queries[0]
+    for query in queries[1:]:
+        combined = combined.op("||")(query)
+    return combined
+
+
+def apply_ticket_search(
+    query: Select,
+    term: str,
+    dialect_name: str,
+) -> tuple[Select, ColumnElement | None]:
+    """Filter a ticket query by a free-text search term.
+
+    Args:
+        query: Select over Ticket
+        term: Raw search input
+        dialect_name: Bound dialect name ("postgresql" or "sqlite")
+
+    Returns:
+        (filtered query, rank expression) -- rank is None when the dialect
+        cannot rank (SQLite), in which case callers keep their own ordering
+    """
+    term = term.strip()
+    if not term:
+        return query, None
+
+    if dialect_name != "postgresql":
+        pattern = f"%{_escape_like(term)}%"
+        return query.where(
+            or_(
+                Ticket.tracking_number.ilike(pattern, escape="\\"),
+                Ticket.description.ilike(pattern, escape="\\"),
+            )
+        ), None
+
+    tsquery = _tsquery(term)
+    text_match = search_vector.op("@@")(tsquery)
+    text_rank = func.ts_rank_cd(search_vector, tsquery)
+
+    if not looks_like_tracking_number(term):
+        return query.where(text_match), text_rank
+
+    tracking_number = normalize_tracking_number(term)
+    prefix_match = Ticket.tracking_number.ilike(
+        f"{_escape_like(tracking_number)}%", escape="\\"
+    )
+    # The % operator (not similarity() >= x) is what the trigram index serves;
+    # its cut-off is pg_trgm.similarity_threshold (default 0.3)
+    fuzzy_match = Ticket.tracking_number.op("%")(tracking_number)
+    similarity = func.similarity(Ticket.tracking_number, tracking_number)
+    rank = case(
+        (prefix_match, literal(1.0)),
+        else_=func.greatest(cast(text_rank, Float), similarity),
+    )
+    return query.where(or_(prefix_match, fuzzy_match, text_match)), rank
@@ -0,0 +1,272 @@
+"""Ward boundary loading and ticket ward resolution.
+
+Replaces the interim ``Ticket.address ILIKE '%ward%'`` ward filter with a
+real ward dimension: ward polygons per municipality (Ward model, GiST
+indexed) and a stored, indexed Ticket.ward_id.
+
+Key decisions:
+- Ticket.ward_id is resolved once on insert by a BEFORE INSERT trigger
+  (migration 20260305_ward_boundaries), so ward dashboards and councillor
+  checks are equality lookups, not spatial joins. A trigger rather than
+  application code because agent tools insert tickets through Supabase
+- ST_Contains against a GiST-indexed boundary; if polygons overlap (bad
+  source data) the lowest ward_code wins so resolution is deterministic.
+  _containing_ward mirrors the trigger's query for the backfill
+- Tickets created before boundaries were loaded are filled in by
+  backfill_ticket_wards (Celery task src/tasks/ward_backfill_task.py),
+  chunked by id keyset so each transaction stays short
+- Boundary reloads upsert on (tenant_id, ward_code); re-run the backfill
+  with only_missing=False to re-attribute existing tickets
+- User.ward_id must be a Ward.ward_code of the user's municipality.
+  Councillors assigned before boundaries existed carry labels such as
+  "Ward 5"; load_boundaries remaps those through Ward.ward_number
+  (remap_user_wards) and a users trigger rejects unknown codes afterwards
+- SQLite (tests) has no PostGIS or trigger: tickets are created without a
+  ward and the backfill is a no-op
+"""
+import json
+import logging
+import re
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models.ticket import Ticket
+from src.models.user import User
+from src.models.ward import USE_POSTGIS, Ward
+
+logger = logging.getLogger(__name__)
+
+# "Ward 5", "ward 05", "Ward No. 5" or a bare "5"
+_WARD_LABEL_RE = re.compile(r"^\s*(?:ward\s*(?:no\.?\s*)?)?(\d+)\s*$", re.IGNORECASE)
+
+
+def ward_number_from_label(label: str) -> int | None:
+    """Parse the ward number out of a legacy User.ward_id label.
+
+    Returns:
+        The ward number, or None if the label is not of the form "Ward N"
+    """
+    match = _WARD_LABEL_RE.match(label)
+    return int(match.group(1)) if match else None
+
+
+def _containing_ward(tenant_id, location):
+    """Select the ward_code whose boundary contains location (or nothing)."""
+    return (
+        select(Ward.ward_code)
+        .where(
+            Ward.tenant_id == tenant_id,
+            func.ST_Contains(Ward.boundary, location),
+        )
+        .order_by(Ward.ward_code)
+        .limit(1)
+    )
+
+
+class WardService:
+    """Service for ward boundaries and ticket-to-ward attribution."""
+
+    async def load_boundaries(
+        self,
+        tenant_id: str,
+        feature_collection: dict,
+        db: AsyncSession,
+        code_property: str = "ward_code",
+        name_property: str = "name",
+        number_property: str = "ward_number",
+    ) -> int:
+        """Upsert ward polygons from a GeoJSON FeatureCollection.
+
+        Polygons are promoted to MULTIPOLYGON and stamped with SRID 4326.
+        Councillor ward assignments are then remapped to ward codes
+        (remap_user_wards). Does not commit; the caller owns the transaction.
+
+        Args:
+            tenant_id: Municipality tenant ID the wards belong to
+            feature_collection: GeoJSON FeatureCollection dict
+            db: Database session
+            code_property: Feature property holding the ward code
+                (e.g. "WardID" in Municipal Demarcation Board exports)
+            name_property: Feature property holding the display name
+            number_property: Feature property holding the ward number within
+                the municipality ("WardNo" in MDB exports)
+
+        Returns:
+            Number of wards upserted
+
+        Raises:
+            RuntimeError: If PostGIS is unavailable
+            ValueError: If a feature has no ward code or geometry
+        """
+        if not USE_POSTGIS:
+            raise RuntimeError("Loading ward boundaries requires PostGIS")
+
+        from sqlalchemy.dialects.postgresql import insert
+
+        rows = []
+        for feature in feature_collection.get("features", []):
+            properties = feature.get("properties") or {}
+            ward_code = properties.get(code_property)
+            geometry = feature.get("geometry")
+            if ward_code is None or geometry is None:
+                raise ValueError(
+                    f"Ward feature missing '{code_property}' or geometry: {properties}"
+                )
+            ward_number = properties.get(number_property)
+            rows.append({
+                "tenant_id": tenant_id,
+                "ward_code": str(ward_code),
+                "ward_number": int(ward_number) if ward_number is not None else None,
+                "name": properties.get(name_property),
+                "boundary": func.ST_Multi(
+                    func.ST_SetSRID(func.ST_GeomFromGeoJSON(json.dumps(geometry)), 4326)
+                ),
+            })
+
+        for row in rows:
+            stmt = insert(Ward).values(**row)
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_wards_tenant_ward_code",
+                set_={
+                    "ward_number": stmt.excluded.ward_number,
+                    "name": stmt.excluded.name,
+                    "boundary": stmt.excluded.boundary,
+                    "updated_at": func.now(),
+                },
+            )
+            await db.execute(stmt)
+
+        logger.info(
+            "Loaded ward boundaries",
+            extra={"tenant_id": tenant_id, "wards": len(rows)},
+        )
+        await self.remap_user_wards(tenant_id, db)
+        return len(rows)
+
+    async def remap_user_wards(self, tenant_id: str, db: AsyncSession) -> dict:
+        """Rewrite a tenant's User.ward_id labels to ward codes.
+
+        A ward_id that is already a ward_code is left alone. Otherwise it is
+        matched against Ward.name (case-insensitive), then by ward number
+        ("Ward 5" -> the ward with ward_number 5). Users that match nothing
+        are logged and left unchanged. Does not commit.
+
+        Args:
+            tenant_id: Municipality tenant ID (tenant context must be set)
+            db: Database session
+
+        Returns:
+            dict with keys: remapped (int), unmatched (list of user ids)
+        """
+        wards = (await db.execute(
+            select(Ward.ward_code, Ward.ward_number, Ward.name)
+            .where(Ward.tenant_id == tenant_id)
+        )).all()
+        codes = {ward.ward_code for ward in wards}
+        by_name = {ward.name.strip().lower(): ward.ward_code for ward in wards if ward.name}
+        by_number = {
+            ward.ward_number: ward.ward_code for ward in wards if ward.ward_number is not None
+        }
+
+        users = (await db.execute(
+            select(User.id, User.ward_id)
+            .where(User.tenant_id == tenant_id, User.ward_id.is_not(None))
+        )).all()
+
+        remapped = 0
+        unmatched = []
+        for user_id, label in users:
+            if label in codes:
+                continue
+            code = by_name.get(label.strip().lower())
+            if code is None:
+                code = by_number.get(ward_number_from_label(label))
+            if code is None:
+                unmatched.append(str(user_id))
+                continue
+            await db.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(ward_id=code)
+                .execution_options(synchronize_session=False)
+            )
+            remapped += 1
+
+        if unmatched:
+            logger.warning(
+                "Users with a ward_id that matches no ward",
+                extra={"tenant_id": tenant_id, "user_ids": unmatched},
+            )
+        return {"remapped": remapped, "unmatched": unmatched}
+
+    async def backfill_ticket_wards(
+        self,
+        tenant_id: str,
+        db: AsyncSession,
+        only_missing: bool = True,
+        chunk_size: int | None = None,
+    ) -> int:
+        """Set Ticket.ward_id for a tenant's located tickets.
+
+        Walks tickets in id order and updates one chunk per transaction with
+        a correlated point-in-polygon subquery. Tickets outside every ward
+        are set to NULL (and are not revisited within the same run).
+
+        Args:
+            tenant_id: Municipality tenant ID (tenant context must be set)
+            db: Database session
+            only_missing: Only tickets with no ward_id yet; False re-resolves
+                every located ticket (after a boundary reload)
+            chunk_size: Tickets per transaction (default
+                settings.WARD_BACKFILL_CHUNK_SIZE)
+
+        Returns:
+            Number of tickets processed
+        """
+        if not USE_POSTGIS:
+            return 0
+
+        chunk_size = chunk_size or settings.WARD_BACKFILL_CHUNK_SIZE
+        ward_code = (
+            _containing_ward(Ticket.tenant_id, Ticket.location)
+            .correlate(Ticket)
+            .scalar_subquery()
+        )
+
+        processed = 0
+        last_id: UUID | None = None
+        while True:
+            query = (
+                select(Ticket.id)
+                .where(Ticket.tenant_id == tenant_id, Ticket.location.is_not(None))
+                .order_by(Ticket.id)
+                .limit(chunk_size)
+            )
+            if only_missing:
+                query = query.where(Ticket.ward_id.is_(None))
+            if last_id is not None:
+                query = query.where(Ticket.id > last_id)
+
+            ids = list((await db.execute(query)).scalars().all())
+            if not ids:
+                break
+
+            await db.execute(
+                update(Ticket)
+                .where(Ticket.id.in_(ids))
+                .values(ward_id=ward_code)
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+            processed += len(ids)
+            last_id = ids[-1]
+
+        logger.info(
+            "Backfilled ticket wards",
+            extra={"tenant_id": tenant_id, "processed": processed},
+        )
+        return processed
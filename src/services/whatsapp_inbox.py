@@ -0,0 +1,109 @@
+"""Redis-backed per-phone inbox for asynchronous WhatsApp processing.
+
+When settings.WHATSAPP_ASYNC_PROCESSING is on, the webhook acknowledges
+Twilio immediately and the agent turn runs in a Celery worker
+(src/tasks/whatsapp_inbox_task.py), which replies through
+WhatsAppService.send_whatsapp_message.
+
+Key decisions:
+- Dedupe on MessageSid with SET NX + TTL: Twilio retries a webhook it did
+  not get a timely answer for, and a retried message must not produce a
+  second agent turn (or a second ticket)
+- One Redis list per phone number, consumed by a single worker at a time
+  (advisory lock per phone in the task), so turns of one conversation are
+  processed strictly in arrival order and never interleave. Celery alone
+  gives no ordering across workers
+- Messages are popped before processing (at-most-once): a worker crash
+  mid-turn loses that turn rather than risking a duplicate ticket
+"""
+import json
+import logging
+
+import redis.asyncio as redis
+
+from src.core.config import settings
+from src.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class WhatsAppInbox:
+    """Per-phone FIFO of inbound WhatsApp messages awaiting a worker."""
+
+    SID_PREFIX = "wa:sid:"
+    INBOX_PREFIX = "wa:inbox:"
+
+    def __init__(
+        self,
+        redis_url: str,
+        dedupe_ttl: int | None = None,
+        redis_client: redis.Redis | None = None,
+    ):
+        """Initialize the inbox.
+
+        Args:
+            redis_url: Redis connection URL
+            dedupe_ttl: Seconds a MessageSid is remembered (default
+                settings.WHATSAPP_DEDUPE_TTL_SECONDS)
+            redis_client: Shared pooled client (src/core/redis_pool.py). When
+                given, redis_url is ignored and close() leaves the client open
+        """
+        self._owns_client = redis_client is None
+        self._redis = redis_client or redis.from_url(redis_url, decode_responses=True)
+        self._dedupe_ttl = dedupe_ttl or settings.WHATSAPP_DEDUPE_TTL_SECONDS
+
+    def _inbox_key(self, phone: str) -> str:
+        return f"{self.INBOX_PREFIX}{phone}"
+
+    async def enqueue(self, message_sid: str, phone: str, message: dict) -> bool:
+        """Append a message to the phone's inbox unless it was seen before.
+
+        Args:
+            message_sid: Twilio MessageSid (dedupe key)
+            phone: Normalized sender phone number (inbox key)
+            message: JSON-serializable message payload
+
+        Returns:
+            True if enqueued, False if the MessageSid is a duplicate
+        """
+        sid_key = f"{self.SID_PREFIX}{message_sid}"
+        is_new = await self._redis.set(sid_key, "1", nx=True, ex=self._dedupe_ttl)
+        if not is_new:
+            metrics.inc("whatsapp_webhook_duplicates_total")
+            logger.info(
+                "Dropped duplicate WhatsApp webhook",
+                extra={"message_sid": message_sid},
+            )
+            return False
+
+        try:
+            await self._redis.rpush(self._inbox_key(phone), json.dumps(message))
+        except Exception:
+            # Let Twilio's retry enqueue the message instead
+            await self._redis.delete(sid_key)
+            raise
+
+        metrics.inc("whatsapp_inbox_enqueued_total")
+        return True
+
+    async def pop(self, phone: str) -> dict | None:
+        """Remove and return the oldest message for a phone, or None."""
+        raw = await self._redis.lpop(self._inbox_key(phone))
+        return json.loads(raw) if raw is not None else None
+
+    async def requeue(self, phone: str, message: dict) -> None:
+        """Put a popped message back at the head of the phone's inbox.
+
+        Used when a turn could not start (LLM pool busy), so it is retried
+        before any later message of the same conversation.
+        """
+        await self._redis.lpush(self._inbox_key(phone), json.dumps(message))
+
+    async def pending(self, phone: str) -> int:
+        """Number of messages waiting for a phone."""
+        return await self._redis.llen(self._inbox_key(phone))
+
+    async def close(self) -> None:
+        """Close Redis connection (unless it is the shared pooled client)."""
+        if self._owns_client:
+            await self._redis.aclose()
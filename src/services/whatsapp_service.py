@@ -9,15 +9,18 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
+from redis.asyncio import Redis
 from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
 
+from src.agents.llm_pool import LLMPoolBusy
 from src.api.v1.crew_server import GBV_CONFIRMATION_MESSAGES, sanitize_reply, _format_history
 from src.core.config import settings
 from src.core.conversation import ConversationManager
+from src.core.redis_pool import get_redis
 from src.guardrails.engine import guardrails_engine
 from src.models.media import MediaAttachment
 from src.models.user import User
@@ -37,14 +40,22 @@ class WhatsAppService:
     - Reply message sending via Twilio
     """
 
-    def __init__(self, redis_url: str, storage_service: StorageService):
+    def __init__(
+        self,
+        redis_url: str,
+        storage_service: StorageService,
+        redis_client: Redis | None = None,
+    ):
         """Initialize WhatsApp service.
 
         Args:
             redis_url: Redis connection URL for conversation management
             storage_service: StorageService instance for media handling
+            redis_client: Pooled Redis client for conversation state
+                (default: the process-wide client, if this process opened it)
         """
         self._redis_url = redis_url
+        self._redis_client = redis_client or get_redis()
         self._storage_service = storage_service
 
         # Create Twilio client if credentials are configured
@@ -244,7 +255,9 @@ class WhatsAppService:
 
         # Step 4: Get or create conversation session
         session_id = session_id or str(uuid.uuid4())
-        conversation_manager = ConversationManager(self._redis_url)
+        conversation_manager = ConversationManager(
+            self._redis_url, redis_client=self._redis_client
+        )
 
         try:
             # Try to get existing session
@@ -329,7 +342,11 @@ class WhatsAppService:
                     }
 
             # Step 5: Build conversation history and run IntakeFlow
-            conversation_history = _format_history(conversation_state.turns)
+            summarized_turns = conversation_state.summarized_turns
+            conversation_history = _format_history(conversation_state)
+            if conversation_state.summarized_turns != summarized_turns:
+                # Older turns were rolled into the summary; keep it for later turns
+                await conversation_manager.save_state(conversation_state)
 
             # Step 6: Run IntakeFlow (deterministic @router dispatch to specialist crews)
             # WhatsApp users are authenticated (session_status="active") since they
@@ -407,6 +424,9 @@ class WhatsAppService:
                         f"{len(media_file_ids)} file(s) pending tracking_number={tracking_number}"
                     )
 
+            except LLMPoolBusy:
+                # Turn not processed: the caller answers "busy" or retries later
+                raise
             except Exception as e:
                 logger.error(f"ManagerCrew execution failed: {e}", exc_info=True)
                 agent_response = "I'm sorry, something went wrong processing your message. Please try again in a few minutes."
@@ -444,7 +464,7 @@ class WhatsAppService:
             }
 
         finally:
-            # Clean up Redis connection
+            # Clean up Redis connection (no-op for the shared pooled client)
             await conversation_manager.close()
 
     async def send_whatsapp_message(self, to_number: str, message: str) -> str | None:
@@ -0,0 +1,80 @@
+"""Periodic drain of the audit outbox into audit_logs.
+
+Runs every settings.AUDIT_OUTBOX_DRAIN_INTERVAL_SECONDS via Celery Beat.
+Moves entries written by the after_flush audit handler in outbox mode
+(settings.AUDIT_OUTBOX_ENABLED) into audit_logs, one committed batch at a
+time (src/services/audit_outbox.py), then records the remaining backlog.
+
+Key decisions:
+- Scheduled whether or not outbox mode is on, so entries left behind after
+  switching it off still reach audit_logs
+- Singleton per run via distributed_lock (same as the SLA monitor): batches
+  are drained oldest first by one worker
+- Drain lag (age of the oldest undrained entry) and pending count are
+  published as the audit_outbox_lag_seconds / audit_outbox_pending gauges
+  and logged as an error past settings.AUDIT_OUTBOX_LAG_ALERT_SECONDS: the
+  POPIA audit trail is only complete once the outbox is drained
+- Celery workers are synchronous, so wrap async code with asyncio.run()
+- Windows compatibility: use WindowsSelectorEventLoopPolicy
+"""
+import asyncio
+import logging
+import sys
+
+from src.tasks.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(bind=True, name="src.tasks.audit_outbox_task.drain_audit_outbox", max_retries=3)
+def drain_audit_outbox(self):
+    """Move all pending audit outbox entries into audit_logs.
+
+    Returns:
+        dict with keys: drained (int), pending (int), lag_seconds (float),
+        and skipped (bool) when another worker holds the lock
+    """
+    # Windows event loop compatibility
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    async def _run():
+        from src.core.config import settings
+        from src.core.database import AsyncSessionLocal
+        from src.core.distributed_lock import distributed_lock
+        from src.core.metrics import metrics
+        from src.services.audit_outbox import drain_batch, outbox_backlog
+
+        async with distributed_lock("audit_outbox_drain") as acquired:
+            if not acquired:
+                return {"drained": 0, "pending": 0, "lag_seconds": 0.0, "skipped": True}
+
+            drained = 0
+            async with AsyncSessionLocal() as db:
+                while True:
+                    moved = await drain_batch(db, settings.AUDIT_OUTBOX_BATCH_SIZE)
+                    await db.commit()
+                    drained += moved
+                    metrics.inc("audit_outbox_drained", moved)
+                    if moved < settings.AUDIT_OUTBOX_BATCH_SIZE:
+                        break
+
+                pending, lag_seconds = await outbox_backlog(db)
+
+        metrics.set_gauge("audit_outbox_pending", pending)
+        metrics.set_gauge("audit_outbox_lag_seconds", lag_seconds)
+        if lag_seconds > settings.AUDIT_OUTBOX_LAG_ALERT_SECONDS:
+            logger.error(
+                f"Audit outbox drain lag {lag_seconds:.0f}s exceeds "
+                f"{settings.AUDIT_OUTBOX_LAG_ALERT_SECONDS:.0f}s ({pending} entries pending)"
+            )
+        elif drained:
+            logger.info(f"Drained {drained} audit outbox entries into audit_logs")
+
+        return {"drained": drained, "pending": pending, "lag_seconds": lag_seconds}
+
+    try:
+        return asyncio.run(_run())
+    except Exception as exc:
+        logger.error(f"Audit outbox drain failed, retrying: {exc}")
+        raise self.retry(exc=exc, countdown=10 * (2 ** self.request.retries))
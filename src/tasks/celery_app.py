@@ -4,6 +4,8 @@ Configures Celery with Redis broker/backend and beat schedule for:
 - Periodic SLA monitoring (every 5 minutes)
 - Daily SDBIP actuals auto-population (01:00 SAST)
 - Quarterly PA evaluator notifications (Q-start: 1st Jan/Apr/Jul/Oct at 08:00 SAST)
+- Nightly ticket metrics rollup reconciliation (02:00 SAST)
+- Audit outbox drain into audit_logs (every few seconds)
 
 Uses Africa/Johannesburg timezone for all time-based calculations.
 """
@@ -24,6 +26,11 @@ app = Celery(
         "src.tasks.report_generation_task",
         "src.tasks.statutory_deadline_task",
         "src.tasks.risk_autoflag_task",
+        "src.tasks.ticket_metrics_task",
+        "src.tasks.ward_backfill_task",
+        "src.tasks.whatsapp_inbox_task",
+        "src.tasks.export_task",
+        "src.tasks.audit_outbox_task",
     ]
 )
 
@@ -58,10 +65,22 @@ app.conf.beat_schedule = {
         "task": "src.tasks.pa_notify_task.notify_pa_evaluators",
         "schedule": crontab(day_of_month="1", month_of_year="1,4,7,10", hour=8, minute=0),
     },
+    "reconcile-ticket-metrics": {
+        # Run daily at 02:00 SAST to rebuild ticket_metrics_daily from tickets,
+        # correcting any drift in the incrementally maintained rollup.
+        "task": "src.tasks.ticket_metrics_task.reconcile_ticket_metrics",
+        "schedule": crontab(minute=0, hour=2),  # 02:00 SAST daily
+    },
     "check-statutory-deadlines": {
         # Run daily at 07:00 SAST to check statutory deadlines,
         # send escalating notifications, and auto-create report tasks.
         "task": "src.tasks.statutory_deadline_task.check_statutory_deadlines",
         "schedule": crontab(minute=0, hour=7),  # 07:00 SAST daily
     },
+    "drain-audit-outbox": {
+        # Move audit entries written in outbox mode into audit_logs. Always
+        # scheduled so entries left after disabling outbox mode still drain.
+        "task": "src.tasks.audit_outbox_task.drain_audit_outbox",
+        "schedule": settings.AUDIT_OUTBOX_DRAIN_INTERVAL_SECONDS,
+    },
 }
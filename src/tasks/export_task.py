@@ -0,0 +1,99 @@
+"""Celery task for background data exports.
+
+Dispatched on-demand by POST /api/v1/export/jobs. Streams the requested
+dataset into an XLSX, CSV.gz or Parquet file, uploads it to the exports
+bucket and marks the ExportJob completed (see src/services/export_service.py).
+
+Pattern follows src/tasks/risk_autoflag_task.py:
+- asyncio.run() wraps async logic (Celery workers are synchronous)
+- Windows event loop compatibility via WindowsSelectorEventLoopPolicy
+- Retry with exponential backoff (max 3 retries, 60s/120s/240s delays)
+- Imports deferred into inner async function for Celery worker isolation
+
+The job is marked failed (with the error) only once retries are exhausted,
+so a polling client sees "running" while a transient failure is retried.
+"""
+import asyncio
+import logging
+import sys
+from uuid import UUID
+
+from src.tasks.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+
+async def _load_job(db, job_id: str):
+    from sqlalchemy import select
+
+    from src.models.export_job import ExportJob
+
+    result = await db.execute(select(ExportJob).where(ExportJob.id == UUID(job_id)))
+    job = result.scalar_one_or_none()
+    if job is None:
+        raise ValueError(f"Export job {job_id} not found")
+    return job
+
+
+@app.task(
+    bind=True,
+    name="src.tasks.export_task.run_export",
+    max_retries=3,
+)
+def run_export(self, job_id: str, tenant_id: str):
+    """Generate and upload the file for an export job.
+
+    Args:
+        job_id: UUID string of the ExportJob
+        tenant_id: Municipality tenant ID for tenant context
+
+    Returns:
+        Dict with keys job_id and row_count
+    """
+    # Windows event loop compatibility (required for development on Windows)
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    async def _run():
+        from src.core.database import AsyncSessionLocal
+        from src.core.tenant import clear_tenant_context, set_tenant_context
+        from src.services.export_service import run_export_job
+
+        async with AsyncSessionLocal() as db:
+            try:
+                set_tenant_context(tenant_id)
+                job = await _load_job(db, job_id)
+                await run_export_job(job, db)
+                return {"job_id": job_id, "row_count": job.row_count}
+            finally:
+                clear_tenant_context()
+
+    async def _mark_failed(error: str):
+        from datetime import datetime, timezone
+
+        from src.core.database import AsyncSessionLocal
+        from src.core.metrics import metrics
+        from src.core.tenant import clear_tenant_context, set_tenant_context
+        from src.models.export_job import ExportJobStatus
+
+        async with AsyncSessionLocal() as db:
+            try:
+                set_tenant_context(tenant_id)
+                job = await _load_job(db, job_id)
+                job.status = ExportJobStatus.FAILED
+                job.error = error[:1000]
+                job.completed_at = datetime.now(timezone.utc)
+                await db.commit()
+                metrics.inc("export_jobs_failed_total", dataset=job.dataset, format=job.file_format)
+            finally:
+                clear_tenant_context()
+
+    try:
+        return asyncio.run(_run())
+    except Exception as exc:
+        if self.request.retries >= self.max_retries:
+            logger.error("Export job %s failed permanently: %s", job_id, exc)
+            asyncio.run(_mark_failed(str(exc)))
+            raise
+        logger.error("Export task failed, retrying: %s", exc)
+        raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
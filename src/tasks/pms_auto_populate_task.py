@@ -11,6 +11,7 @@ Pattern follows src/tasks/sla_monitor.py:
 - asyncio.run() wraps async logic (Celery workers are synchronous)
 - Windows event loop compatibility via WindowsSelectorEventLoopPolicy
 - Retry with exponential backoff (max 3 retries, 60s/120s/240s delays)
+- Singleton per run via distributed_lock (safe with several beat/worker replicas)
 """
 import asyncio
 import logging
@@ -35,8 +36,12 @@ def populate_sdbip_actuals(self):
     SEC-05: GBV tickets (is_sensitive=True) are unconditionally excluded from
     all aggregation queries inside AutoPopulationEngine.populate_quarter().
 
+    Only one replica populates at a time (distributed_lock); others return
+    immediately with lock_skipped=True.
+
     Returns:
-        Dict with keys: populated (int), skipped (int), errors (int).
+        Dict with keys: populated (int), skipped (int), errors (int), and
+        lock_skipped (bool) when another worker holds the lock.
     """
     # Windows event loop compatibility (required for development on Windows)
     if sys.platform == "win32":
@@ -44,9 +49,15 @@ def populate_sdbip_actuals(self):
 
     async def _run():
         from src.core.database import AsyncSessionLocal
+        from src.core.distributed_lock import distributed_lock
         from src.services.pms_auto_populate import AutoPopulationEngine
 
-        engine = AutoPopulationEngine()
+        async with distributed_lock("pms_auto_populate") as acquired:
+            if not acquired:
+                return {"populated": 0, "skipped": 0, "errors": 0, "lock_skipped": True}
+            return await _populate(AutoPopulationEngine(), AsyncSessionLocal)
+
+    async def _populate(engine, AsyncSessionLocal):
         async with AsyncSessionLocal() as db:
             try:
                 result = await engine.populate_current_quarter(db)
@@ -7,7 +7,11 @@ Key decisions:
 - Celery workers are synchronous, so wrap async code with asyncio.run()
 - Windows compatibility: use WindowsSelectorEventLoopPolicy
 - Retry with exponential backoff on failures
-- Advisory locks in EscalationService prevent duplicate escalations
+- Singleton per run: a session-scoped advisory lock (distributed_lock) lets
+  several beat/worker replicas fire the task while only one does the work
+- EscalationService.bulk_escalate claims rows with FOR UPDATE SKIP LOCKED
+  and commits in chunks (SLA_ESCALATION_CHUNK_SIZE), so overlapping runs
+  never escalate the same ticket twice
 """
 import asyncio
 import logging
@@ -25,8 +29,12 @@ def check_sla_breaches(self):
     Uses synchronous database session (Celery workers are synchronous).
     Finds breached tickets and triggers escalation for each.
 
+    Only one replica runs the check at a time (distributed_lock); others
+    return immediately with skipped=True.
+
     Returns:
-        dict with keys: breached (int), escalated (int)
+        dict with keys: breached (int), escalated (int), and skipped (bool)
+        when another worker holds the lock
     """
     # Windows event loop compatibility
     if sys.platform == "win32":
@@ -34,12 +42,19 @@ def check_sla_breaches(self):
 
     async def _run():
         from src.core.database import AsyncSessionLocal
+        from src.core.distributed_lock import distributed_lock
         from src.services.escalation_service import EscalationService
         from src.services.sla_service import SLAService
 
         sla_service = SLAService()
         escalation_service = EscalationService()
 
+        async with distributed_lock("sla_monitor") as acquired:
+            if not acquired:
+                return {"breached": 0, "escalated": 0, "skipped": True}
+            return await _check(sla_service, escalation_service, AsyncSessionLocal)
+
+    async def _check(sla_service, escalation_service, AsyncSessionLocal):
         async with AsyncSessionLocal() as db:
             try:
                 # Find breached tickets
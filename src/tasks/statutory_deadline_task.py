@@ -11,6 +11,8 @@ Pattern follows src/tasks/pa_notify_task.py:
 - Windows event loop compatibility via WindowsSelectorEventLoopPolicy
 - Tenant discovery via text() raw SQL (bypasses ORM do_orm_execute RLS filter)
 - set_tenant_context() / clear_tenant_context() with try/finally per tenant
+- Singleton per run via distributed_lock, so replicas never send duplicate
+  notifications
 """
 import asyncio
 import logging
@@ -83,6 +85,7 @@ def check_statutory_deadlines(self):
         - notifications_sent (int): total in-app notifications created
         - tasks_created (int): total auto-report tasks created
         - financial_year (str): the FY that was processed
+        - skipped (bool): present when another replica holds the run lock
     """
     # Windows event loop compatibility (required for development on Windows)
     if sys.platform == "win32":
@@ -91,6 +94,20 @@ def check_statutory_deadlines(self):
     current_fy = _determine_current_financial_year()
 
     async def _run():
+        from src.core.distributed_lock import distributed_lock
+
+        async with distributed_lock("statutory_deadline") as acquired:
+            if not acquired:
+                return {
+                    "tenant_count": 0,
+                    "notifications_sent": 0,
+                    "tasks_created": 0,
+                    "financial_year": current_fy,
+                    "skipped": True,
+                }
+            return await _check_all_tenants()
+
+    async def _check_all_tenants():
         from sqlalchemy import text
 
         from src.core.database import AsyncSessionLocal
@@ -0,0 +1,71 @@
+"""Nightly reconciliation of the ticket_metrics_daily rollup.
+
+Runs daily at 02:00 SAST via Celery Beat. The rollup is maintained
+incrementally (row trigger on PostgreSQL, after_flush hook elsewhere); this
+task rebuilds it from the tickets table so any drift -- manual SQL fixes,
+restored backups, rows changed while the trigger was disabled -- is
+corrected within a day.
+
+Key decisions:
+- Celery workers are synchronous, so wrap async code with asyncio.run()
+- Windows compatibility: use WindowsSelectorEventLoopPolicy
+- Singleton per run via distributed_lock (same as the SLA monitor)
+- One transaction per municipality: TicketMetricsService.rebuild locks the
+  rollup table, so per-tenant commits keep trigger writers waiting only for
+  the duration of one tenant's scan
+"""
+import asyncio
+import logging
+import sys
+
+from src.tasks.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(bind=True, name="src.tasks.ticket_metrics_task.reconcile_ticket_metrics", max_retries=3)
+def reconcile_ticket_metrics(self):
+    """Rebuild ticket_metrics_daily for every municipality.
+
+    Returns:
+        dict with keys: tenants (int), buckets (int), and skipped (bool)
+        when another worker holds the lock
+    """
+    # Windows event loop compatibility
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    async def _run():
+        from sqlalchemy import select
+
+        from src.core.database import AsyncSessionLocal
+        from src.core.distributed_lock import distributed_lock
+        from src.models.municipality import Municipality
+        from src.services.ticket_metrics_service import TicketMetricsService
+
+        service = TicketMetricsService()
+
+        async with distributed_lock("ticket_metrics_reconcile") as acquired:
+            if not acquired:
+                return {"tenants": 0, "buckets": 0, "skipped": True}
+
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(select(Municipality.id))
+                tenant_ids = [str(row) for row in result.scalars().all()]
+
+                buckets = 0
+                for tenant_id in tenant_ids:
+                    buckets += await service.rebuild(db, tenant_id=tenant_id)
+                    await db.commit()
+
+            logger.info(
+                f"Reconciled ticket metrics for {len(tenant_ids)} tenants "
+                f"({buckets} buckets)"
+            )
+            return {"tenants": len(tenant_ids), "buckets": buckets}
+
+    try:
+        return asyncio.run(_run())
+    except Exception as exc:
+        logger.error(f"Ticket metrics reconciliation failed, retrying: {exc}")
+        raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
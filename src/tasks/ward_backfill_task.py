@@ -0,0 +1,70 @@
+"""Backfill Ticket.ward_id from ward boundaries.
+
+Dispatched on-demand after ward boundaries are loaded for a municipality
+(WardService.load_boundaries). New tickets get their ward at creation, so
+this only catches up tickets created before the boundaries existed, or
+re-attributes tickets after a boundary reload (only_missing=False).
+
+Pattern follows src/tasks/risk_autoflag_task.py:
+- asyncio.run() wraps async logic (Celery workers are synchronous)
+- Windows event loop compatibility via WindowsSelectorEventLoopPolicy
+- Retry with exponential backoff (max 3 retries, 60s/120s/240s delays)
+- Imports deferred into inner async function for Celery worker isolation
+
+WardService commits per chunk, so a retry resumes where the failed run
+left off when only_missing=True.
+"""
+import asyncio
+import logging
+import sys
+
+from src.tasks.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(
+    bind=True,
+    name="src.tasks.ward_backfill_task.backfill_ticket_wards",
+    max_retries=3,
+)
+def backfill_ticket_wards(self, tenant_id: str, only_missing: bool = True):
+    """Resolve ward_id for a municipality's located tickets.
+
+    Args:
+        tenant_id: Municipality tenant ID for tenant context
+        only_missing: Only tickets with no ward_id (False re-resolves all)
+
+    Returns:
+        Dict with key "processed" (int count of tickets visited)
+    """
+    # Windows event loop compatibility (required for development on Windows)
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    async def _run():
+        from src.core.database import AsyncSessionLocal
+        from src.core.tenant import clear_tenant_context, set_tenant_context
+        from src.services.ward_service import WardService
+
+        service = WardService()
+        async with AsyncSessionLocal() as db:
+            try:
+                set_tenant_context(tenant_id)
+                processed = await service.backfill_ticket_wards(
+                    tenant_id=tenant_id, db=db, only_missing=only_missing
+                )
+                logger.info(
+                    "Backfilled ward_id on %d tickets (tenant=%s)",
+                    processed,
+                    tenant_id,
+                )
+                return {"processed": processed}
+            finally:
+                clear_tenant_context()
+
+    try:
+        return asyncio.run(_run())
+    except Exception as exc:
+        logger.error("Ward backfill task failed, retrying: %s", exc)
+        raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
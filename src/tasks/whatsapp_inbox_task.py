@@ -0,0 +1,153 @@
+"""Asynchronous WhatsApp turn processing.
+
+Dispatched by the WhatsApp webhook (src/api/v1/whatsapp.py) when
+settings.WHATSAPP_ASYNC_PROCESSING is on. The webhook has already validated
+the Twilio signature, deduplicated on MessageSid and appended the message to
+the sender's inbox (src/services/whatsapp_inbox.py); this task drains that
+inbox, runs each turn through WhatsAppService.process_incoming_message and
+sends the reply with WhatsAppService.send_whatsapp_message.
+
+Key decisions:
+- Per-phone ordering: the inbox is drained under an advisory lock keyed by
+  phone number. A task that finds the lock held exits, because the holder
+  drains every queued message in order. After releasing the lock the holder
+  re-checks the inbox, so a message queued between its last pop and the
+  unlock is not stranded
+- A failed turn is answered with an apology and the drain continues; only
+  infrastructure failures (Redis/DB) retry the task
+- A turn refused by the LLM pool (LLMPoolBusy) is pushed back to the head of
+  the inbox and the drain is rescheduled after Retry-After seconds
+- asyncio.run() wraps async logic (Celery workers are synchronous)
+- Windows event loop compatibility via WindowsSelectorEventLoopPolicy
+- Imports deferred into async functions for Celery worker isolation
+"""
+import asyncio
+import logging
+import sys
+import time
+
+from src.tasks.celery_app import app
+
+logger = logging.getLogger(__name__)
+
+FAILED_TURN_REPLY = (
+    "Sorry, we encountered an error processing your message. "
+    "Please try again later or visit our web portal."
+)
+
+
+async def _process_message(whatsapp_service, message: dict) -> None:
+    """Run one queued turn and send the reply to the sender."""
+    from uuid import UUID
+
+    from sqlalchemy import select
+
+    from src.agents.llm_pool import LLMPoolBusy
+    from src.core.database import AsyncSessionLocal
+    from src.core.metrics import metrics
+    from src.core.tenant import clear_tenant_context, set_tenant_context
+    from src.models.user import User
+
+    metrics.observe("whatsapp_inbox_wait_seconds", time.time() - message["received_at"])
+
+    set_tenant_context(message["tenant_id"])
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(select(User).where(User.id == UUID(message["user_id"])))
+            user = result.scalar_one_or_none()
+            if user is None or not user.is_active:
+                logger.warning(
+                    "Dropping queued WhatsApp message for missing or inactive user",
+                    extra={"message_sid": message["message_sid"]},
+                )
+                return
+
+            try:
+                turn = await whatsapp_service.process_incoming_message(
+                    user=user,
+                    message_body=message["body"],
+                    media_items=message["media_items"],
+                    session_id=message["session_id"],
+                    db=db,
+                )
+                reply = turn.get("response", "Thank you for your message.")
+            except LLMPoolBusy:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Queued WhatsApp turn failed: {e}",
+                    exc_info=True,
+                    extra={"message_sid": message["message_sid"]},
+                )
+                metrics.inc("whatsapp_inbox_failed_turns_total")
+                reply = FAILED_TURN_REPLY
+    finally:
+        clear_tenant_context()
+
+    await whatsapp_service.send_whatsapp_message(message["phone"], reply)
+    metrics.observe("whatsapp_turn_seconds", time.time() - message["received_at"])
+
+
+@app.task(
+    bind=True,
+    name="src.tasks.whatsapp_inbox_task.process_whatsapp_inbox",
+    max_retries=3,
+)
+def process_whatsapp_inbox(self, phone: str):
+    """Drain and answer the queued WhatsApp messages of one phone number.
+
+    Args:
+        phone: Normalized sender phone number (inbox key)
+
+    Returns:
+        dict with keys: processed (int), and skipped (bool) when another
+        worker is already draining this phone's inbox
+    """
+    # Windows event loop compatibility
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    async def _run():
+        from src.agents.llm_pool import LLMPoolBusy
+        from src.core.config import settings
+        from src.core.distributed_lock import distributed_lock
+        from src.services.storage_service import StorageService
+        from src.services.whatsapp_inbox import WhatsAppInbox
+        from src.services.whatsapp_service import WhatsAppService
+
+        inbox = WhatsAppInbox(settings.REDIS_URL)
+        try:
+            async with distributed_lock(phone, namespace="whatsapp_inbox") as acquired:
+                if not acquired:
+                    return {"processed": 0, "skipped": True}
+
+                whatsapp_service = WhatsAppService(
+                    redis_url=settings.REDIS_URL,
+                    storage_service=StorageService(),
+                )
+                processed = 0
+                while (message := await inbox.pop(phone)) is not None:
+                    try:
+                        await _process_message(whatsapp_service, message)
+                    except LLMPoolBusy as e:
+                        # Keep arrival order: the turn goes back to the head
+                        # and the whole inbox is retried once the pool drains
+                        await inbox.requeue(phone, message)
+                        process_whatsapp_inbox.apply_async(
+                            (phone,), countdown=int(e.retry_after_header)
+                        )
+                        return {"processed": processed, "deferred": True}
+                    processed += 1
+
+            if await inbox.pending(phone):
+                process_whatsapp_inbox.delay(phone)
+
+            return {"processed": processed}
+        finally:
+            await inbox.close()
+
+    try:
+        return asyncio.run(_run())
+    except Exception as exc:
+        logger.error(f"WhatsApp inbox processing failed, retrying: {exc}")
+        raise self.retry(exc=exc, countdown=60 * (2 ** self.request.retries))
@@ -0,0 +1,240 @@
+"""Unit tests for streamed chat replies.
+
+Tests:
+- StreamingReplySanitizer: reasoning skipped, artifact lines dropped, JSON
+  "message" extraction, guardrail masking across chunk boundaries, error cut,
+  first answer wins, parity with sanitize_reply() on clean replies
+- ReplyStream / stream_llm (src/agents/streaming.py): routing by LLM instance,
+  opt-out crews, LLM stream flag restored
+- POST /api/v1/chat/stream: delta + done events, busy pool -> error event
+
+All agent calls are mocked — no real LLM calls, no real Redis/DB calls.
+"""
+import json
+import os
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "fake-key-for-tests")
+os.environ.setdefault("DEEPSEEK_API_KEY", "fake-key-for-tests")
+
+from src.agents.llm_pool import LLMPoolBusy  # noqa: E402
+from src.agents.streaming import (  # noqa: E402
+    CALL_START,
+    ReplyStream,
+    _on_call_started,
+    _on_chunk,
+    reply_stream,
+    stream_llm,
+)
+from src.api.v1.crew_server import StreamingReplySanitizer, sanitize_reply  # noqa: E402
+from src.guardrails.output_filters import sanitize_output  # noqa: E402
+from tests.agents.test_crew_server import _make_conv_state, _make_mock_manager  # noqa: E402
+
+
+def _chunks(text: str, seed: int = 0) -> list[str]:
+    """Split text into random 1-7 char chunks, like LLM token deltas."""
+    rng = random.Random(seed)
+    chunks, i = [], 0
+    while i < len(text):
+        size = rng.randint(1, 7)
+        chunks.append(text[i:i + size])
+        i += size
+    return chunks
+
+
+def _stream(chunks) -> str:
+    sanitizer = StreamingReplySanitizer()
+    out = []
+    for chunk in chunks:
+        out.extend(sanitizer.feed(chunk))
+    out.extend(sanitizer.finish())
+    return "".join(out)
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    events, event = [], None
+    for line in body.splitlines():
+        if line.startswith("event:"):
+            event = line.split(":", 1)[1].strip()
+        elif line.startswith("data:"):
+            events.append((event, json.loads(line.split(":", 1)[1].strip())))
+    return events
+
+
+class TestStreamingReplySanitizer:
+    CLEAN_REPLIES = [
+        "Sawubona! Ngiyabonga ngokubika inkinga yamanzi. Ungangitshela ukuthi ikuphi indawo ngqo?",
+        "Thank you for reporting the pothole on Main Road.\nCould you tell me the nearest house number?",
+        "Your ticket TKT-20260301-ABC123 is open and a team has been assigned to it this morning.",
+    ]
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("reply", CLEAN_REPLIES)
+    def test_matches_sanitize_reply_for_any_chunking(self, reply, seed):
+        assert _stream(_chunks(reply, seed)) == sanitize_reply(reply, "municipal_intake")
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_reasoning_call_streams_only_final_answer(self, seed):
+        raw = (
+            "Thought: I need to look up the ticket\n"
+            "Action: lookup_ticket\n"
+            "Final Answer: Your water leak report is being handled by the team."
+        )
+        assert _stream(_chunks(raw, seed)) == "Your water leak report is being handled by the team."
+
+    def test_artifact_and_delegation_lines_never_sent(self):
+        raw = (
+            "Let me check that for you.\n"
+            "As the Municipal Services Manager I will route this.\n"
+            "What is the address of the leak?"
+        )
+        assert _stream(_chunks(raw)) == "What is the address of the leak?"
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_json_answer_streams_message_value(self, seed):
+        raw = json.dumps({
+            "message": "Thank you! Your report has been logged.\nTracking: TKT-20260301-ABC123",
+            "action_taken": "ticket_created",
+        })
+        assert _stream(_chunks(raw, seed)) == (
+            "Thank you! Your report has been logged.\nTracking: TKT-20260301-ABC123"
+        )
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_phone_numbers_masked_across_chunks(self, seed):
+        raw = "Please call the depot on 082 123 4567 or email depot@example.com for an update today."
+        streamed = _stream(_chunks(raw, seed))
+        assert streamed == sanitize_output(raw).sanitized_response
+        assert "4567" not in streamed
+
+    def test_error_marker_ends_stream(self):
+        raw = "Your request was received. Error: connection refused\nmore text here"
+        assert _stream(_chunks(raw)) == "Your request was received."
+
+    def test_nothing_released_before_line_is_decided(self):
+        sanitizer = StreamingReplySanitizer()
+        assert sanitizer.feed("I need to call the ticket tool now") == []
+        assert sanitizer.feed("\nHello!") == []
+        assert "".join(sanitizer.finish()) == "Hello!"
+
+    def test_first_answer_wins(self):
+        sanitizer = StreamingReplySanitizer()
+        out = sanitizer.feed("Your report about the streetlight on Oak Avenue has been logged.\n")
+        out += sanitizer.feed(CALL_START)
+        out += sanitizer.feed('{"message": "Duplicate from the conversion call"}')
+        out += sanitizer.finish()
+        assert "".join(out) == "Your report about the streetlight on Oak Avenue has been logged."
+
+    def test_reasoning_call_then_answer_call(self):
+        sanitizer = StreamingReplySanitizer()
+        out = sanitizer.feed("Thought: I should create the ticket\nAction: create_municipal_ticket\n")
+        out += sanitizer.feed(CALL_START)
+        out += sanitizer.feed("Final Answer: Done! Your ticket has been created.")
+        out += sanitizer.finish()
+        assert "".join(out) == "Done! Your ticket has been created."
+
+
+class TestReplyStream:
+    async def test_chunks_routed_by_llm_instance(self):
+        stream = ReplyStream()
+        llm, other = MagicMock(stream=False), MagicMock(stream=False)
+
+        with reply_stream(stream), stream_llm(llm):
+            assert llm.stream is True
+            _on_call_started(llm, SimpleNamespace())
+            _on_chunk(llm, SimpleNamespace(chunk="Hello"))
+            _on_chunk(other, SimpleNamespace(chunk="not mine"))
+        stream.close()
+
+        assert [item async for item in stream] == [CALL_START, "Hello"]
+        assert llm.stream is False
+
+    async def test_no_active_stream_is_noop(self):
+        llm = MagicMock(stream=False)
+        with stream_llm(llm):
+            assert llm.stream is False
+
+    async def test_disabled_crew_not_streamed(self):
+        stream = ReplyStream()
+        llm = MagicMock(stream=False)
+        with reply_stream(stream), stream_llm(llm, enabled=False):
+            _on_chunk(llm, SimpleNamespace(chunk="draft"))
+        stream.close()
+
+        assert [item async for item in stream] == []
+
+    def test_gbv_crew_opts_out(self):
+        from src.agents.crews.gbv_crew import GBVCrew
+        from src.agents.crews.municipal_crew import MunicipalIntakeCrew
+
+        assert GBVCrew.stream_tokens is False
+        assert MunicipalIntakeCrew.stream_tokens is True
+
+
+def _streaming_flow(chunks, result):
+    """IntakeFlow stand-in whose kickoff emits chunks like a streaming crew."""
+    flow = MagicMock()
+    flow.state.intent = "municipal"
+    flow.state.pending_intent = ""
+
+    async def kickoff_async():
+        llm = MagicMock(stream=False)
+        with stream_llm(llm):
+            for chunk in chunks:
+                _on_chunk(llm, SimpleNamespace(chunk=chunk))
+        flow.state.result = result
+
+    flow.kickoff_async = kickoff_async
+    return flow
+
+
+class TestChatStreamEndpoint:
+    def _post(self, flow):
+        from fastapi.testclient import TestClient
+
+        from src.api.v1.crew_server import crew_app
+
+        mock_mgr = _make_mock_manager(_make_conv_state(routing_phase="municipal"))
+        with patch("src.api.v1.crew_server._get_conversation_manager", return_value=mock_mgr), \
+                patch("src.agents.flows.intake_flow.IntakeFlow", return_value=flow):
+            return TestClient(crew_app).post("/api/v1/chat/stream", json={
+                "phone": "+27821234567",
+                "message": "There is a water leak on Main Road",
+                "session_override": "new",
+            })
+
+    def test_streams_deltas_then_done(self):
+        reply = "Thank you for reporting the leak on Main Road. A team will be sent to inspect it."
+        flow = _streaming_flow(
+            _chunks("Final Answer: " + reply),
+            {"message": reply, "agent_name": "municipal_intake", "routing_phase": "municipal"},
+        )
+
+        response = self._post(flow)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(response.text)
+        deltas = "".join(data["text"] for event, data in events if event == "delta")
+        assert deltas == reply
+        assert events[-1][0] == "done"
+        assert events[-1][1]["reply"] == reply
+
+    def test_busy_pool_sends_error_event(self):
+        flow = MagicMock()
+        flow.kickoff_async = AsyncMock(side_effect=LLMPoolBusy("deepseek", "full", 3.0))
+
+        events = _parse_sse(self._post(flow).text)
+
+        assert events == [(
+            "error",
+            {
+                "status": 429,
+                "detail": "The assistant is busy right now. Please try again shortly.",
+                "retry_after": "3",
+            },
+        )]
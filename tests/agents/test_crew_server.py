@@ -56,6 +56,9 @@ def _make_conv_state(**kwargs):
     state.pending_intent = kwargs.get("pending_intent", "")
     state.tenant_id = kwargs.get("tenant_id", "")
     state.max_turns = kwargs.get("max_turns", 20)
+    state.category = kwargs.get("category")
+    state.history_summary = kwargs.get("history_summary", "")
+    state.summarized_turns = kwargs.get("summarized_turns", 0)
     return state
 
 
@@ -0,0 +1,117 @@
+"""Unit tests for the crew template registry (src/agents/crews/templates.py).
+
+Tests cover:
+- YAML configs parsed once per process, not per crew instance
+- One rendered template per (crew class, language), reused across turns
+- Rendered values match the previous per-turn resolution (prompts, YAML, defaults)
+- create_crew() builds fresh Agent/Task/Crew objects per turn from the template
+
+No real LLM calls.
+"""
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+
+os.environ.setdefault("OPENAI_API_KEY", "fake-key-for-tests")
+os.environ.setdefault("DEEPSEEK_API_KEY", "fake-key-for-tests")
+
+from crewai import LLM  # noqa: E402
+
+from src.agents.crews.templates import CrewTemplateRegistry, crew_templates  # noqa: E402
+
+FAKE_LLM = LLM(model="openai/test-model", api_key="fake-key-for-tests")
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    crew_templates.clear()
+    yield
+    crew_templates.clear()
+
+
+def test_yaml_parsed_once_across_instances():
+    """Constructing many crews parses agents.yaml and tasks.yaml once in total."""
+    from src.agents.crews.municipal_crew import MunicipalIntakeCrew
+
+    with patch("src.agents.crews.templates.yaml.safe_load", wraps=yaml.safe_load) as spy:
+        for _ in range(5):
+            MunicipalIntakeCrew(llm=MagicMock())
+
+    assert spy.call_count == 2
+
+
+def test_instances_share_parsed_configs():
+    from src.agents.crews.auth_crew import AuthCrew
+    from src.agents.crews.gbv_crew import GBVCrew
+
+    auth, gbv = AuthCrew(llm=MagicMock()), GBVCrew(llm=MagicMock())
+
+    assert auth.agents_config is gbv.agents_config
+    assert auth.tasks_config is gbv.tasks_config
+
+
+def test_template_rendered_once_per_crew_and_language():
+    from src.agents.crews.gbv_crew import GBVCrew
+
+    with patch.object(GBVCrew, "render_template", wraps=GBVCrew.render_template) as spy:
+        first = crew_templates.get(GBVCrew, "zu")
+        second = crew_templates.get(GBVCrew, "zu")
+        crew_templates.get(GBVCrew, "af")
+
+    assert first is second
+    assert spy.call_count == 2
+
+
+@pytest.mark.parametrize("language", ["en", "zu", "af"])
+def test_template_uses_language_prompt_and_yaml_settings(language):
+    from src.agents.crews.gbv_crew import GBVCrew
+    from src.agents.prompts.gbv import GBV_PROMPTS
+
+    template = crew_templates.get(GBVCrew, language)
+    agent_config = crew_templates.agents_config["gbv_agent"]
+
+    assert template.backstory == GBV_PROMPTS[language]
+    assert template.role == agent_config["role"]
+    assert template.goal == agent_config["goal"]
+    assert template.expected_output == crew_templates.tasks_config["gbv_intake_task"]["expected_output"]
+    assert template.agent_kwargs == {"allow_delegation": False, "max_iter": 8, "verbose": False}
+
+
+def test_missing_yaml_keys_fall_back_to_class_defaults(tmp_path):
+    from src.agents.crews.ticket_status_crew import TicketStatusCrew
+
+    (tmp_path / "agents.yaml").write_text("")
+    (tmp_path / "tasks.yaml").write_text("")
+    registry = CrewTemplateRegistry(config_dir=tmp_path)
+
+    template = registry.get(TicketStatusCrew, "en")
+
+    assert template.role == TicketStatusCrew.default_role
+    assert template.goal == TicketStatusCrew.default_goal
+    assert template.expected_output == TicketStatusCrew.default_expected_output
+    assert template.agent_kwargs["max_iter"] == 8
+
+
+def test_create_crew_builds_fresh_objects_per_turn(municipal_context):
+    from src.agents.crews.municipal_crew import MunicipalIntakeCrew
+    from src.agents.prompts.municipal import MUNICIPAL_PROMPTS
+
+    first = MunicipalIntakeCrew(llm=FAKE_LLM).create_crew({**municipal_context, "language": "zu"})
+    second = MunicipalIntakeCrew(llm=FAKE_LLM).create_crew({**municipal_context, "language": "zu"})
+
+    assert first.agents[0] is not second.agents[0]
+    assert first.tasks[0] is not second.tasks[0]
+    assert first.agents[0].backstory == MUNICIPAL_PROMPTS["zu"]
+    assert first.agents[0].max_iter == 10
+    assert first.memory is False
+
+
+def test_unknown_context_language_uses_crew_language(gbv_context):
+    from src.agents.crews.gbv_crew import GBVCrew
+    from src.agents.prompts.gbv import GBV_PROMPTS
+
+    crew = GBVCrew(language="af", llm=FAKE_LLM).create_crew({**gbv_context, "language": "fr"})
+
+    assert crew.agents[0].backstory == GBV_PROMPTS["af"]
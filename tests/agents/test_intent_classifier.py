@@ -0,0 +1,211 @@
+"""Unit tests for the local intent classifier and its IntakeFlow integration.
+
+Tests:
+- Held-out check against tests/evals/scenarios (not used for training)
+- accept() threshold and GBV floor
+- Training file loading (logged conversations)
+- IntakeFlow._classify_raw_intent in off / shadow / active modes
+- SEC-05 SAPS override still runs before the local classifier
+"""
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "fake-key-for-tests")
+os.environ.setdefault("DEEPSEEK_API_KEY", "fake-key-for-tests")
+
+from src.agents.flows.intent_classifier import (  # noqa: E402
+    IntentClassifier,
+    IntentPrediction,
+    accept,
+    get_intent_classifier,
+    load_training_file,
+    reset_intent_classifier,
+)
+from src.agents.flows.intent_corpus import INTENT_CORPUS  # noqa: E402
+from src.core.config import settings  # noqa: E402
+from src.core.metrics import metrics  # noqa: E402
+from tests.evals.scenarios.gbv_scenarios import GBV_SCENARIOS  # noqa: E402
+from tests.evals.scenarios.municipal_scenarios import MUNICIPAL_SCENARIOS  # noqa: E402
+from tests.evals.scenarios.ticket_status_scenarios import TICKET_STATUS_SCENARIOS  # noqa: E402
+
+HELD_OUT = [
+    (scenario["input"], intent)
+    for scenarios, intent in (
+        (MUNICIPAL_SCENARIOS, "municipal"),
+        (TICKET_STATUS_SCENARIOS, "ticket_status"),
+        (GBV_SCENARIOS, "gbv"),
+    )
+    for scenario in scenarios
+    if "adversarial" not in scenario["name"]
+]
+
+
+@pytest.fixture(autouse=True)
+def fresh_classifier():
+    reset_intent_classifier()
+    metrics.reset()
+    yield
+    reset_intent_classifier()
+    metrics.reset()
+
+
+def _make_flow(message: str):
+    from src.agents.flows.intake_flow import IntakeFlow
+
+    flow = IntakeFlow()
+    flow.state.message = message
+    flow.state.session_status = "active"
+    return flow
+
+
+def _mock_llm(answer: str) -> MagicMock:
+    llm = MagicMock()
+    llm.call.return_value = answer
+    return llm
+
+
+class TestHeldOutScenarios:
+    """The eval scenarios are never trained on; they check generalisation."""
+
+    def test_scenarios_are_not_in_training_corpus(self):
+        corpus = {message for message, _ in INTENT_CORPUS}
+        assert not corpus.intersection(message for message, _ in HELD_OUT)
+
+    def test_top_label_matches_scenario_intent(self):
+        classifier = get_intent_classifier()
+        for message, intent in HELD_OUT:
+            assert classifier.predict(message).intent == intent, message
+
+    def test_no_accepted_prediction_is_wrong(self):
+        classifier = get_intent_classifier()
+        for message, intent in HELD_OUT:
+            prediction = classifier.predict(message)
+            if accept(prediction, settings.INTENT_CLASSIFIER_THRESHOLD, settings.INTENT_CLASSIFIER_GBV_FLOOR):
+                assert prediction.intent == intent, message
+
+    def test_prediction_is_sub_millisecond(self):
+        classifier = get_intent_classifier()
+        message = MUNICIPAL_SCENARIOS[0]["input"]
+        started = time.perf_counter()
+        for _ in range(200):
+            classifier.predict(message)
+        assert (time.perf_counter() - started) / 200 < 0.001
+
+
+class TestAccept:
+    """Confidence threshold and GBV floor."""
+
+    def test_below_threshold_is_rejected(self):
+        prediction = IntentPrediction("municipal", 0.8, {"municipal": 0.8, "gbv": 0.0})
+        assert accept(prediction, threshold=0.9, gbv_floor=0.05) is False
+
+    def test_gbv_signal_blocks_non_gbv_label(self):
+        prediction = IntentPrediction("municipal", 0.92, {"municipal": 0.92, "gbv": 0.06})
+        assert accept(prediction, threshold=0.9, gbv_floor=0.05) is False
+
+    def test_confident_gbv_is_accepted(self):
+        prediction = IntentPrediction("gbv", 0.95, {"gbv": 0.95})
+        assert accept(prediction, threshold=0.9, gbv_floor=0.05) is True
+
+    def test_unknown_text_is_never_confident(self):
+        classifier = IntentClassifier(INTENT_CORPUS)
+        assert classifier.predict("xqzv").confidence < 0.9
+
+
+class TestTrainingFile:
+    """Logged conversations extend the seed corpus."""
+
+    def test_loads_valid_lines_and_skips_bad_ones(self, tmp_path):
+        path = tmp_path / "intents.jsonl"
+        path.write_text(
+            json.dumps({"message": "Ibhuloho liwile", "intent": "municipal"}) + "\n"
+            "not json\n"
+            + json.dumps({"message": "hello", "intent": "weather"}) + "\n"
+            + json.dumps({"text": "missing keys"}) + "\n",
+            encoding="utf-8",
+        )
+        assert load_training_file(str(path)) == [("Ibhuloho liwile", "municipal")]
+
+    def test_training_file_is_used_at_first_use(self, tmp_path, monkeypatch):
+        path = tmp_path / "intents.jsonl"
+        path.write_text(json.dumps({"message": "Ibhuloho liwile", "intent": "municipal"}) + "\n")
+        monkeypatch.setattr(settings, "INTENT_CLASSIFIER_TRAINING_FILE", str(path))
+
+        assert get_intent_classifier().size == len(INTENT_CORPUS) + 1
+
+    def test_missing_training_file_falls_back_to_corpus(self, monkeypatch):
+        monkeypatch.setattr(settings, "INTENT_CLASSIFIER_TRAINING_FILE", "/nonexistent/intents.jsonl")
+
+        assert get_intent_classifier().size == len(INTENT_CORPUS)
+
+
+class TestIntakeFlowIntegration:
+    """_classify_raw_intent with the local stage in each mode."""
+
+    def test_active_mode_confident_prediction_skips_llm(self, monkeypatch):
+        monkeypatch.setattr(settings, "INTENT_CLASSIFIER_MODE", "active")
+        flow = _make_flow("What is the status of my ticket TKT-20260301-ABC123?")
+        llm = _mock_llm("municipal")
+
+        with patch("src.agents.llm.get_routing_llm", return_value=llm):
+            intent = flow._classify_raw_intent()
+
+        assert intent == "ticket_status"
+        llm.call.assert_not_called()
+        assert metrics.get("intent_classifications_total", source="local", intent="ticket_status") == 1
+
+    def test_active_mode_low_confidence_falls_back_to_llm(self, monkeypatch):
+        monkeypatch.setattr(settings, "INTENT_CLASSIFIER_MODE", "active")
+        flow = _make_flow("xqzv")
+        llm = _mock_llm("auth")
+
+        with patch("src.agents.llm.get_routing_llm", return_value=llm):
+            intent = flow._classify_raw_intent()
+
+        assert intent == "auth"
+        llm.call.assert_called_once()
+        assert metrics.get("intent_classifications_total", source="llm", intent="auth") == 1
+
+    def test_shadow_mode_uses_llm_and_records_comparison(self, monkeypatch):
+        monkeypatch.setattr(settings, "INTENT_CLASSIFIER_MODE", "shadow")
+        flow = _make_flow("What is the status of my ticket TKT-20260301-ABC123?")
+        llm = _mock_llm("municipal")
+
+        with patch("src.agents.llm.get_routing_llm", return_value=llm):
+            intent = flow._classify_raw_intent()
+
+        assert intent == "municipal"
+        llm.call.assert_called_once()
+        assert metrics.get(
+            "intent_classifier_shadow_total",
+            local="ticket_status", llm="municipal", confident="true",
+        ) == 1
+        assert "intent_classifier_latency_seconds" in metrics.snapshot()
+
+    def test_off_mode_never_runs_local_classifier(self, monkeypatch):
+        monkeypatch.setattr(settings, "INTENT_CLASSIFIER_MODE", "off")
+        flow = _make_flow("What is the status of my ticket?")
+
+        with patch("src.agents.llm.get_routing_llm", return_value=_mock_llm("ticket_status")), \
+                patch("src.agents.flows.intake_flow.get_intent_classifier") as mock_get:
+            intent = flow._classify_raw_intent()
+
+        assert intent == "ticket_status"
+        mock_get.assert_not_called()
+
+    def test_saps_override_runs_before_local_classifier(self, monkeypatch):
+        monkeypatch.setattr(settings, "INTENT_CLASSIFIER_MODE", "active")
+        flow = _make_flow("I need the SAPS officer assigned to my case")
+        llm = _mock_llm("ticket_status")
+
+        with patch("src.agents.llm.get_routing_llm", return_value=llm), \
+                patch("src.agents.flows.intake_flow.get_intent_classifier") as mock_get:
+            intent = flow._classify_raw_intent()
+
+        assert intent == "gbv"
+        mock_get.assert_not_called()
+        llm.call.assert_not_called()
@@ -0,0 +1,198 @@
+"""Unit tests for the bounded per-provider LLM pool (src/agents/llm_pool.py).
+
+Tests cover:
+- Admission: full queue and unreachable deadline are refused up front
+- A kickoff dequeued after its deadline never reaches the provider
+- Queue/in-flight gauges and wait/run summaries
+- A caller cancelled while queued releases its slot
+- Provider selection and BaseCrew.kickoff propagating LLMPoolBusy
+
+No real LLM calls: the pooled callables are plain functions.
+"""
+import asyncio
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "fake-key-for-tests")
+os.environ.setdefault("DEEPSEEK_API_KEY", "fake-key-for-tests")
+
+from src.agents.llm_pool import (  # noqa: E402
+    LLMPoolBusy,
+    ProviderPool,
+    llm_deadline,
+    llm_pool,
+    provider_for,
+)
+from src.core.metrics import metrics  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    llm_pool.reset()
+    metrics.reset()
+    yield
+    llm_pool.reset()
+    metrics.reset()
+
+
+@pytest.fixture
+def pool():
+    p = ProviderPool("test", max_concurrency=1, max_queue=1)
+    yield p
+    p.shutdown()
+
+
+def _blocker():
+    """A pooled callable that holds its worker until released."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def fn():
+        started.set()
+        release.wait(5)
+        return "done"
+
+    return fn, started, release
+
+
+async def _wait_for(event: threading.Event) -> None:
+    await asyncio.get_running_loop().run_in_executor(None, event.wait, 5)
+
+
+class TestAdmission:
+    async def test_runs_callable_and_returns_result(self, pool):
+        assert await pool.run(lambda: 42) == 42
+        assert pool.queued == 0 and pool.in_flight == 0
+
+    async def test_full_queue_is_refused(self, pool):
+        fn, started, release = _blocker()
+        running = asyncio.create_task(pool.run(fn))
+        await _wait_for(started)
+        queued = asyncio.create_task(pool.run(lambda: "queued"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(LLMPoolBusy) as exc_info:
+            await pool.run(lambda: "refused")
+
+        assert exc_info.value.reason == "full"
+        assert exc_info.value.retry_after_header == "1"
+        assert metrics.get("llm_pool_rejected_total", provider="test", reason="full") == 1
+        release.set()
+        assert await running == "done"
+        assert await queued == "queued"
+
+    async def test_unreachable_deadline_is_refused(self, pool):
+        pool._avg_run_seconds = 10.0
+        fn, started, release = _blocker()
+        running = asyncio.create_task(pool.run(fn))
+        await _wait_for(started)
+
+        with llm_deadline(2.0), pytest.raises(LLMPoolBusy) as exc_info:
+            await pool.run(lambda: "refused")
+
+        assert exc_info.value.reason == "deadline"
+        assert exc_info.value.retry_after_header == "10"
+        release.set()
+        await running
+
+    async def test_idle_pool_admits_despite_slow_average(self, pool):
+        """Run time alone never refuses: only the wait ahead counts."""
+        pool._avg_run_seconds = 60.0
+
+        with llm_deadline(1.0):
+            assert await pool.run(lambda: "ok") == "ok"
+
+    async def test_expired_in_queue_is_never_called(self, pool):
+        fn, started, release = _blocker()
+        running = asyncio.create_task(pool.run(fn))
+        await _wait_for(started)
+        called = MagicMock()
+
+        waiting = asyncio.create_task(pool.run(called, deadline=time.monotonic() + 0.05))
+        await asyncio.sleep(0.1)
+        release.set()
+
+        with pytest.raises(LLMPoolBusy) as exc_info:
+            await waiting
+        assert exc_info.value.reason == "expired"
+        called.assert_not_called()
+        await running
+
+
+class TestMetrics:
+    async def test_gauges_track_queue_and_in_flight(self, pool):
+        fn, started, release = _blocker()
+        running = asyncio.create_task(pool.run(fn))
+        await _wait_for(started)
+        queued = asyncio.create_task(pool.run(lambda: None))
+        await asyncio.sleep(0)
+
+        assert metrics.get("llm_pool_in_flight", provider="test") == 1
+        assert metrics.get("llm_pool_queue_depth", provider="test") == 1
+
+        release.set()
+        await running
+        await queued
+        assert metrics.get("llm_pool_in_flight", provider="test") == 0
+        assert metrics.get("llm_pool_queue_depth", provider="test") == 0
+
+    async def test_wait_and_run_summaries_recorded(self, pool):
+        await pool.run(lambda: time.sleep(0.01))
+
+        snapshot = metrics.snapshot()
+        assert "llm_pool_wait_seconds" in snapshot
+        assert "llm_pool_run_seconds" in snapshot
+        assert pool._avg_run_seconds >= 0.01
+
+
+class TestCancellation:
+    async def test_cancelled_queued_call_releases_slot(self, pool):
+        fn, started, release = _blocker()
+        running = asyncio.create_task(pool.run(fn))
+        await _wait_for(started)
+        called = MagicMock()
+        queued = asyncio.create_task(pool.run(called))
+        await asyncio.sleep(0)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+
+        assert pool.queued == 0
+        release.set()
+        await running
+        await asyncio.sleep(0.05)
+        called.assert_not_called()
+
+
+class TestIntegration:
+    def test_provider_for_model_prefix(self):
+        assert provider_for(MagicMock(model="deepseek/deepseek-chat")) == "deepseek"
+        assert provider_for(MagicMock(model="gpt-4o-mini")) == "openai"
+
+    def test_pools_sized_from_settings(self, monkeypatch):
+        from src.core.config import settings
+
+        monkeypatch.setattr(settings, "LLM_POOL_DEEPSEEK_CONCURRENCY", 3)
+        monkeypatch.setattr(settings, "LLM_POOL_MAX_QUEUE", 7)
+
+        pool = llm_pool.get("deepseek")
+        assert (pool.max_concurrency, pool.max_queue) == (3, 7)
+        assert llm_pool.get("deepseek") is pool
+
+    async def test_base_crew_kickoff_propagates_busy(self, monkeypatch, municipal_context):
+        from src.agents.crews.municipal_crew import MunicipalIntakeCrew
+
+        async def busy(llm, fn):
+            raise LLMPoolBusy("openai", "full", 2.0)
+
+        monkeypatch.setattr(llm_pool, "run", busy)
+        crew = MunicipalIntakeCrew(llm=MagicMock(model="gpt-4o-mini"))
+        monkeypatch.setattr(crew, "create_crew", lambda context: MagicMock())
+
+        with pytest.raises(LLMPoolBusy):
+            await crew.kickoff(municipal_context)
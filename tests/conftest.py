@@ -51,6 +51,7 @@ POSTGRES_AVAILABLE = _check_postgres()
 
 # Override settings for testing
 settings.ENVIRONMENT = "test"
+settings.PUBLIC_CACHE_ENABLED = False  # every test sees its own mocked payloads
 
 # Create test database URL
 if POSTGRES_AVAILABLE:
@@ -133,6 +134,23 @@ def reset_rate_limiter():
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_principal_cache():
+    """Clear cached principals so a user row changed by one test is never reused by the next."""
+    from src.core.principal_cache import principal_cache
+    principal_cache.clear()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def synced_revocation_mirror():
+    """Start each test with an empty revocation mirror that counts as in sync with Redis."""
+    from src.core.revocation import revocation_mirror
+    revocation_mirror.reset()
+    revocation_mirror.mark_synced()
+    yield
+
+
 @pytest_asyncio.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Provide a test database session with cleanup after each test."""
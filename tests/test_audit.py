@@ -3,7 +3,7 @@ import json
 from uuid import uuid4
 
 import pytest
-from sqlalchemy import select
+from sqlalchemy import event, select
 
 from src.core.audit import (
     clear_audit_context,
@@ -11,6 +11,7 @@ from src.core.audit import (
     current_user_id,
     set_audit_context,
 )
+from src.core.tenant import clear_tenant_context, set_tenant_context
 from src.models.audit_log import AuditLog, OperationType
 from src.models.municipality import Municipality
 from src.models.user import User, UserRole
@@ -308,3 +309,83 @@ async def test_audit_log_non_tenant_model(db_session):
 
     # Clean up
     clear_audit_context()
+
+
+
+@pytest.fixture
+def audit_inserts(db_session):
+    """Record the row count of every INSERT INTO audit_logs statement sent."""
+    engine = db_session.bind.sync_engine
+    calls = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO AUDIT_LOGS"):
+            calls.append(len(parameters) if executemany else 1)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    yield calls
+    event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+async def _municipality_audit_logs(db_session, operation=None) -> list[AuditLog]:
+    """Audit rows for municipalities (non-tenant rows are stored under "system")."""
+    query = select(AuditLog).where(AuditLog.table_name == "municipalities")
+    if operation is not None:
+        query = query.where(AuditLog.operation == operation)
+    set_tenant_context("system")
+    try:
+        result = await db_session.execute(query)
+        return list(result.scalars().all())
+    finally:
+        clear_tenant_context()
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_audit_rows_in_one_insert(db_session, audit_inserts):
+    """All audit rows of a flush go out in one multi-row insert (SQLite)."""
+    set_audit_context(user_id="test-admin")
+    db_session.add_all([
+        Municipality(name=f"Batch Municipality {i}", code=f"BAT{i}", province="Gauteng")
+        for i in range(5)
+    ])
+    await db_session.flush()
+    clear_audit_context()
+
+    assert audit_inserts == [5]
+    logs = await _municipality_audit_logs(db_session)
+    assert len(logs) == 5
+    assert {log.operation for log in logs} == {OperationType.CREATE}
+    assert {log.user_id for log in logs} == {"test-admin"}
+
+
+@pytest.mark.asyncio
+async def test_flush_without_audited_changes_sends_no_insert(db_session, audit_inserts):
+    """Re-assigning an unchanged value produces neither an audit row nor an empty insert."""
+    municipality = Municipality(name="Steady Municipality", code="STD", province="Gauteng")
+    db_session.add(municipality)
+    await db_session.flush()
+    audit_inserts.clear()
+
+    municipality.province = "Gauteng"
+    await db_session.flush()
+
+    assert audit_inserts == []
+
+
+@pytest.mark.asyncio
+async def test_update_audit_covers_only_modified_attributes(db_session):
+    """UPDATE changes list exactly the attributes the unit of work marked modified."""
+    municipality = Municipality(name="Old Name", code="UPD", province="Gauteng", population=100)
+    db_session.add(municipality)
+    await db_session.flush()
+
+    municipality.name = "New Name"
+    municipality.population = 250
+    municipality.province = "Gauteng"  # unchanged value
+    await db_session.flush()
+
+    [audit_log] = await _municipality_audit_logs(db_session, OperationType.UPDATE)
+    assert json.loads(audit_log.changes) == {
+        "name": {"old": "Old Name", "new": "New Name"},
+        "population": {"old": "100", "new": "250"},
+    }
@@ -0,0 +1,212 @@
+"""Unit tests for the audit outbox (SQLite).
+
+Tests:
+- Outbox mode: the after_flush audit handler writes to audit_outbox, not
+  audit_logs, with the audit log id already assigned
+- drain_batch: moves the oldest entries into audit_logs unchanged, at most
+  batch_size per call, and skips entries already present (redelivery)
+- outbox_backlog: pending count and drain lag
+- drain_audit_outbox task: drains until a short batch, publishes the lag
+  gauges, alerts on lag, skips when another worker holds the lock
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select
+
+from src.core.audit import clear_audit_context, set_audit_context
+from src.core.config import settings
+from src.core.metrics import metrics
+from src.models.audit_log import AuditLog, OperationType
+from src.models.audit_outbox import AuditOutbox
+from src.models.municipality import Municipality
+from src.services.audit_outbox import drain_batch, outbox_backlog
+
+
+@pytest.fixture
+def outbox_mode(monkeypatch):
+    monkeypatch.setattr(settings, "AUDIT_OUTBOX_ENABLED", True)
+
+
+async def _rows(db_session, model) -> list:
+    """All rows of model's table (Core select: no tenant filter)."""
+    table = model.__table__
+    order = table.c.seq if model is AuditOutbox else table.c.timestamp
+    result = await db_session.execute(select(table).order_by(order))
+    return list(result.mappings().all())
+
+
+async def _add_municipalities(db_session, count: int) -> None:
+    db_session.add_all([
+        Municipality(name=f"Outbox Municipality {i}", code=f"OBX{i}", province="Gauteng")
+        for i in range(count)
+    ])
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+class TestOutboxCapture:
+    """Test the after_flush handler in outbox mode."""
+
+    async def test_flush_writes_to_outbox_only(self, db_session, outbox_mode):
+        set_audit_context(user_id="test-admin", ip_address="127.0.0.1")
+        await _add_municipalities(db_session, 3)
+        clear_audit_context()
+
+        entries = await _rows(db_session, AuditOutbox)
+        assert await _rows(db_session, AuditLog) == []
+        assert len(entries) == 3
+        assert {entry["operation"] for entry in entries} == {"CREATE"}
+        assert {entry["user_id"] for entry in entries} == {"test-admin"}
+        assert {entry["tenant_id"] for entry in entries} == {"system"}
+        assert len({entry["id"] for entry in entries}) == 3
+
+    async def test_outbox_off_writes_audit_logs(self, db_session):
+        await _add_municipalities(db_session, 2)
+
+        assert len(await _rows(db_session, AuditLog)) == 2
+        assert await _rows(db_session, AuditOutbox) == []
+
+
+@pytest.mark.asyncio
+class TestDrain:
+    """Test moving outbox entries into audit_logs."""
+
+    async def test_drain_moves_entries_unchanged(self, db_session, outbox_mode):
+        await _add_municipalities(db_session, 3)
+        entries = await _rows(db_session, AuditOutbox)
+
+        moved = await drain_batch(db_session, batch_size=100)
+
+        logs = await _rows(db_session, AuditLog)
+        assert moved == 3
+        assert await _rows(db_session, AuditOutbox) == []
+        assert {log["id"] for log in logs} == {entry["id"] for entry in entries}
+        assert {log["operation"] for log in logs} == {OperationType.CREATE}
+        assert {log["record_id"] for log in logs} == {entry["record_id"] for entry in entries}
+
+    async def test_drain_takes_oldest_batch_first(self, db_session, outbox_mode):
+        await _add_municipalities(db_session, 5)
+        entries = await _rows(db_session, AuditOutbox)
+
+        moved = await drain_batch(db_session, batch_size=2)
+
+        remaining = await _rows(db_session, AuditOutbox)
+        assert moved == 2
+        assert [entry["seq"] for entry in remaining] == [entry["seq"] for entry in entries[2:]]
+        assert {log["id"] for log in await _rows(db_session, AuditLog)} == {
+            entry["id"] for entry in entries[:2]
+        }
+
+    async def test_redelivered_entry_is_written_once(self, db_session, outbox_mode):
+        await _add_municipalities(db_session, 1)
+        [entry] = await _rows(db_session, AuditOutbox)
+        # Same entry delivered again, e.g. after an ambiguous commit
+        await db_session.execute(
+            insert(AuditOutbox.__table__),
+            [{key: value for key, value in entry.items() if key != "seq"}],
+        )
+
+        moved = await drain_batch(db_session, batch_size=100)
+
+        assert moved == 2
+        assert [log["id"] for log in await _rows(db_session, AuditLog)] == [entry["id"]]
+        assert await _rows(db_session, AuditOutbox) == []
+
+    async def test_drain_empty_outbox(self, db_session):
+        assert await drain_batch(db_session, batch_size=100) == 0
+
+
+@pytest.mark.asyncio
+class TestBacklog:
+    """Test the pending count and drain lag."""
+
+    async def test_empty_outbox_has_no_lag(self, db_session):
+        assert await outbox_backlog(db_session) == (0, 0.0)
+
+    async def test_lag_is_age_of_oldest_entry(self, db_session):
+        now = datetime.now(timezone.utc)
+        await db_session.execute(
+            insert(AuditOutbox.__table__),
+            [
+                {
+                    "id": uuid4(),
+                    "tenant_id": "system",
+                    "operation": "UPDATE",
+                    "table_name": "tickets",
+                    "record_id": str(uuid4()),
+                    "timestamp": now - timedelta(seconds=age),
+                }
+                for age in (600, 30)
+            ],
+        )
+
+        pending, lag = await outbox_backlog(db_session)
+
+        assert pending == 2
+        assert 595 <= lag <= 660
+
+
+class TestDrainTask:
+    """Test the drainer Celery task (synchronous: it calls asyncio.run)."""
+
+    @pytest.fixture(autouse=True)
+    def _restore_event_loop(self, event_loop):
+        # asyncio.run() leaves no current loop behind; later async tests need the session loop
+        yield
+        asyncio.set_event_loop(event_loop)
+
+    def _run_task(self, batches: list[int], backlog=(0, 0.0), acquired=True):
+        from src.tasks import audit_outbox_task
+
+        db = MagicMock()
+        db.commit = AsyncMock()
+
+        @asynccontextmanager
+        async def fake_session():
+            yield db
+
+        @asynccontextmanager
+        async def fake_lock(name, namespace="task"):
+            assert name == "audit_outbox_drain"
+            yield acquired
+
+        with patch("src.core.database.AsyncSessionLocal", fake_session), \
+             patch("src.core.distributed_lock.distributed_lock", fake_lock), \
+             patch("src.services.audit_outbox.drain_batch", AsyncMock(side_effect=batches)), \
+             patch("src.services.audit_outbox.outbox_backlog", AsyncMock(return_value=backlog)), \
+             patch.object(settings, "AUDIT_OUTBOX_BATCH_SIZE", 10), \
+             patch.object(audit_outbox_task, "logger") as mock_logger:
+            result = audit_outbox_task.drain_audit_outbox()
+
+        return result, db, mock_logger
+
+    def test_drains_until_short_batch(self):
+        metrics.reset()
+
+        result, db, mock_logger = self._run_task([10, 10, 3], backlog=(0, 0.0))
+
+        assert result == {"drained": 23, "pending": 0, "lag_seconds": 0.0}
+        assert db.commit.await_count == 3
+        snapshot = metrics.snapshot()
+        assert snapshot["audit_outbox_drained"] == [{"labels": {}, "value": 23}]
+        assert snapshot["audit_outbox_lag_seconds"] == [{"labels": {}, "value": 0.0}]
+        mock_logger.error.assert_not_called()
+
+    def test_lag_above_threshold_is_logged_as_error(self):
+        lag = settings.AUDIT_OUTBOX_LAG_ALERT_SECONDS + 1
+
+        result, _, mock_logger = self._run_task([0], backlog=(42, lag))
+
+        assert result == {"drained": 0, "pending": 42, "lag_seconds": lag}
+        assert "drain lag" in mock_logger.error.call_args[0][0]
+
+    def test_skips_when_locked(self):
+        result, db, _ = self._run_task([10], acquired=False)
+
+        assert result["skipped"] is True
+        db.commit.assert_not_called()
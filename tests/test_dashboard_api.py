@@ -5,6 +5,7 @@ Tests RBAC enforcement and response structure for dashboard metrics endpoints:
 - /dashboard/volume - Volume by category
 - /dashboard/sla - SLA compliance breakdown
 - /dashboard/workload - Team workload distribution
+- /dashboard/bundle - All four panels in one request
 
 SEC-05: Verifies GBV ticket exclusion from all dashboard queries.
 Phase 9-02: Verifies ward councillor auto-enforcement from stored ward_id.
@@ -566,3 +567,100 @@ class TestDashboardWardCouncillorEnforcement:
             # Assert — service is called normally (manager sees all)
             mock_service.get_metrics.assert_called_once()
             assert result["total_open"] == 50
+
+
+class TestDashboardBundle:
+    """Test /dashboard/bundle combined endpoint."""
+
+    async def test_bundle_endpoint_returns_all_panels(self):
+        """Manager receives metrics, volume, sla and workload from one call."""
+        # Arrange
+        with patch('src.api.v1.dashboard.DashboardService') as mock_service_class:
+            mock_user = make_mock_user(role=UserRole.MANAGER)
+            mock_db = AsyncMock()
+
+            bundle = {
+                "metrics": {
+                    "total_open": 7,
+                    "total_resolved": 3,
+                    "sla_compliance_percent": 90.0,
+                    "avg_response_hours": 1.5,
+                    "sla_breaches": 1,
+                },
+                "volume": [{"category": "water", "open": 7, "resolved": 3}],
+                "sla": {
+                    "response_compliance_percent": 100.0,
+                    "resolution_compliance_percent": 90.0,
+                    "total_with_sla": 10,
+                    "response_breaches": 0,
+                    "resolution_breaches": 1,
+                },
+                "workload": [],
+            }
+            mock_service = MagicMock()
+            mock_service.get_dashboard_bundle = AsyncMock(return_value=bundle)
+            mock_service_class.return_value = mock_service
+
+            from src.api.v1.dashboard import get_dashboard_bundle
+
+            # Act
+            result = await get_dashboard_bundle(
+                make_mock_starlette_request(),
+                current_user=mock_user,
+                db=mock_db,
+                ward_id=None,
+                start_date=None,
+                end_date=None,
+            )
+
+            # Assert
+            mock_service.get_dashboard_bundle.assert_called_once()
+            assert set(result.keys()) == {"metrics", "volume", "sla", "workload"}
+            assert result["metrics"]["total_open"] == 7
+
+    async def test_bundle_ward_councillor_no_ward_returns_zeroed_panels(self):
+        """Ward councillor with no ward_id gets zeroed panels without a query."""
+        # Arrange
+        with patch('src.api.v1.dashboard.DashboardService') as mock_service_class:
+            mock_user = make_mock_user(role=UserRole.WARD_COUNCILLOR, ward_id=None)
+            mock_db = AsyncMock()
+
+            mock_service = MagicMock()
+            mock_service_class.return_value = mock_service
+
+            from src.api.v1.dashboard import get_dashboard_bundle
+
+            # Act
+            result = await get_dashboard_bundle(
+                make_mock_starlette_request(),
+                current_user=mock_user,
+                db=mock_db,
+                start_date=None,
+                end_date=None,
+            )
+
+            # Assert
+            mock_service.get_dashboard_bundle.assert_not_called()
+            assert result["metrics"]["total_open"] == 0
+            assert result["sla"]["total_with_sla"] == 0
+            assert result["volume"] == []
+            assert result["workload"] == []
+
+    async def test_bundle_citizen_forbidden(self):
+        """Citizens cannot access the dashboard bundle."""
+        from fastapi import HTTPException
+
+        from src.api.v1.dashboard import get_dashboard_bundle
+
+        mock_user = make_mock_user(role=UserRole.CITIZEN)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_dashboard_bundle(
+                make_mock_starlette_request(),
+                current_user=mock_user,
+                db=AsyncMock(),
+                start_date=None,
+                end_date=None,
+            )
+
+        assert exc_info.value.status_code == 403
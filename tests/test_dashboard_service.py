@@ -5,6 +5,8 @@ Tests dashboard metrics calculation methods:
 - get_volume_by_category: Volume breakdown by category
 - get_sla_compliance: SLA compliance percentages
 - get_team_workload: Team workload distribution
+- get_dashboard_bundle: All four panels from two scans
+- Rollup path: ticket_metrics_daily sums combined with live open-ticket counts
 
 SEC-05: Verifies all queries exclude GBV/sensitive tickets.
 """
@@ -13,11 +15,24 @@ from datetime import datetime, timezone, timedelta
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+from src.core.config import settings
 from src.services.dashboard_service import DashboardService
 
 pytestmark = pytest.mark.asyncio
 
 
+@pytest.fixture
+def scan_mode(monkeypatch):
+    """Force the raw ticket scan path (metrics rollup disabled)."""
+    monkeypatch.setattr(settings, "DASHBOARD_USE_METRICS_ROLLUP", False)
+
+
+@pytest.fixture
+def rollup_mode(monkeypatch):
+    """Force the ticket_metrics_daily rollup path."""
+    monkeypatch.setattr(settings, "DASHBOARD_USE_METRICS_ROLLUP", True)
+
+
 # Helper factory functions
 def make_mock_ticket(
     id=None,
@@ -67,6 +82,41 @@ def make_mock_team(
     return team
 
 
+def make_stats_row(
+    category="water",
+    open_count=0,
+    resolved_count=0,
+    responded_count=0,
+    response_seconds_sum=None,
+    resolution_sla_count=0,
+    resolution_breach_count=0,
+    resolution_compliant_count=0,
+    response_sla_count=0,
+    response_breach_count=0,
+):
+    """Create a mock per-category aggregate row from the single-scan query."""
+    return MagicMock(
+        category=category,
+        open_count=open_count,
+        resolved_count=resolved_count,
+        responded_count=responded_count,
+        response_seconds_sum=response_seconds_sum,
+        resolution_sla_count=resolution_sla_count,
+        resolution_breach_count=resolution_breach_count,
+        resolution_compliant_count=resolution_compliant_count,
+        response_sla_count=response_sla_count,
+        response_breach_count=response_breach_count,
+    )
+
+
+def make_rows_result(rows):
+    """Wrap rows in a mock result object exposing .all()."""
+    mock_result = MagicMock()
+    mock_result.all.return_value = rows
+    return mock_result
+
+
+@pytest.mark.usefixtures("scan_mode")
 class TestDashboardServiceGetMetrics:
     """Test DashboardService.get_metrics method."""
 
@@ -77,22 +127,24 @@ class TestDashboardServiceGetMetrics:
         municipality_id = uuid4()
         mock_db = MagicMock()
 
-        # Mock query results (executed in order):
-        # 1. Total open tickets: 5
-        # 2. Total resolved tickets: 3
-        # 3. Avg response hours: 2.5
-        # 4. SLA breaches: 1
-        # 5. Total with SLA: 8
-        # 6. Compliant tickets: 7
-        mock_results = [
-            MagicMock(scalar=MagicMock(return_value=5)),   # total_open
-            MagicMock(scalar=MagicMock(return_value=3)),   # total_resolved
-            MagicMock(scalar=MagicMock(return_value=2.5)), # avg_response_hours
-            MagicMock(scalar=MagicMock(return_value=1)),   # sla_breaches
-            MagicMock(scalar=MagicMock(return_value=8)),   # total_with_sla
-            MagicMock(scalar=MagicMock(return_value=7)),   # compliant
+        # Two category rows from the single scan; totals are summed:
+        # open=5, resolved=3, responded=4 over 36000s (2.5h avg),
+        # breaches=1, with_sla=8, compliant=7
+        mock_rows = [
+            make_stats_row(
+                category="water", open_count=3, resolved_count=2,
+                responded_count=3, response_seconds_sum=27000,
+                resolution_sla_count=5, resolution_breach_count=1,
+                resolution_compliant_count=4,
+            ),
+            make_stats_row(
+                category="roads", open_count=2, resolved_count=1,
+                responded_count=1, response_seconds_sum=9000,
+                resolution_sla_count=3, resolution_breach_count=0,
+                resolution_compliant_count=3,
+            ),
         ]
-        mock_db.execute = AsyncMock(side_effect=mock_results)
+        mock_db.execute = AsyncMock(return_value=make_rows_result(mock_rows))
 
         # Act
         result = await service.get_metrics(municipality_id, mock_db)
@@ -111,16 +163,8 @@ class TestDashboardServiceGetMetrics:
         municipality_id = uuid4()
         mock_db = MagicMock()
 
-        # All queries return 0 or None
-        mock_results = [
-            MagicMock(scalar=MagicMock(return_value=0)),    # total_open
-            MagicMock(scalar=MagicMock(return_value=0)),    # total_resolved
-            MagicMock(scalar=MagicMock(return_value=None)), # avg_response_hours
-            MagicMock(scalar=MagicMock(return_value=0)),    # sla_breaches
-            MagicMock(scalar=MagicMock(return_value=0)),    # total_with_sla
-            MagicMock(scalar=MagicMock(return_value=0)),    # compliant
-        ]
-        mock_db.execute = AsyncMock(side_effect=mock_results)
+        # No category rows at all
+        mock_db.execute = AsyncMock(return_value=make_rows_result([]))
 
         # Act
         result = await service.get_metrics(municipality_id, mock_db)
@@ -140,16 +184,14 @@ class TestDashboardServiceGetMetrics:
         ward_id = "Ward 1"
         mock_db = MagicMock()
 
-        # Mock results
-        mock_results = [
-            MagicMock(scalar=MagicMock(return_value=2)),
-            MagicMock(scalar=MagicMock(return_value=1)),
-            MagicMock(scalar=MagicMock(return_value=3.0)),
-            MagicMock(scalar=MagicMock(return_value=0)),
-            MagicMock(scalar=MagicMock(return_value=3)),
-            MagicMock(scalar=MagicMock(return_value=3)),
+        mock_rows = [
+            make_stats_row(
+                open_count=2, resolved_count=1,
+                responded_count=1, response_seconds_sum=10800,
+                resolution_sla_count=3, resolution_compliant_count=3,
+            ),
         ]
-        mock_db.execute = AsyncMock(side_effect=mock_results)
+        mock_db.execute = AsyncMock(return_value=make_rows_result(mock_rows))
 
         # Act
         result = await service.get_metrics(municipality_id, mock_db, ward_id=ward_id)
@@ -157,6 +199,8 @@ class TestDashboardServiceGetMetrics:
         # Assert
         assert result["total_open"] == 2
         assert result["total_resolved"] == 1
+        query = mock_db.execute.call_args.args[0]
+        assert "ward_id" in str(query)
 
     async def test_get_metrics_excludes_sensitive_tickets(self):
         """Test SEC-05: get_metrics excludes is_sensitive=True tickets."""
@@ -164,27 +208,18 @@ class TestDashboardServiceGetMetrics:
         service = DashboardService()
         municipality_id = uuid4()
         mock_db = MagicMock()
-
-        mock_results = [
-            MagicMock(scalar=MagicMock(return_value=0)),
-            MagicMock(scalar=MagicMock(return_value=0)),
-            MagicMock(scalar=MagicMock(return_value=0.0)),
-            MagicMock(scalar=MagicMock(return_value=0)),
-            MagicMock(scalar=MagicMock(return_value=0)),
-            MagicMock(scalar=MagicMock(return_value=0)),
-        ]
-        mock_db.execute = AsyncMock(side_effect=mock_results)
+        mock_db.execute = AsyncMock(return_value=make_rows_result([]))
 
         # Act
         await service.get_metrics(municipality_id, mock_db)
 
-        # Assert - verify is_sensitive == False in WHERE clause
-        # Check that execute was called with queries containing is_sensitive filter
-        assert mock_db.execute.call_count == 6
-        # All calls should have queries that filter by is_sensitive == False
-        # (implementation detail: verified by integration tests)
+        # Assert - every metric comes from one scan that filters is_sensitive
+        assert mock_db.execute.call_count == 1
+        query = mock_db.execute.call_args.args[0]
+        assert "is_sensitive" in str(query)
 
 
+@pytest.mark.usefixtures("scan_mode")
 class TestDashboardServiceGetVolumeByCategory:
     """Test DashboardService.get_volume_by_category method."""
 
@@ -238,9 +273,11 @@ class TestDashboardServiceGetVolumeByCategory:
         municipality_id = uuid4()
         mock_db = MagicMock()
 
-        # Mock result WITHOUT GBV category (filtered at query level)
+        # Shared scan includes non-sensitive GBV-category rows; the volume
+        # panel must drop them
         mock_rows = [
             MagicMock(category="water", open_count=5, resolved_count=3),
+            MagicMock(category="gbv", open_count=1, resolved_count=0),
         ]
         mock_result = MagicMock()
         mock_result.all.return_value = mock_rows
@@ -250,9 +287,11 @@ class TestDashboardServiceGetVolumeByCategory:
         result = await service.get_volume_by_category(municipality_id, mock_db)
 
         # Assert
+        assert len(result) == 1
         assert all(item["category"] != "gbv" for item in result)
 
 
+@pytest.mark.usefixtures("scan_mode")
 class TestDashboardServiceGetSLACompliance:
     """Test DashboardService.get_sla_compliance method."""
 
@@ -263,18 +302,24 @@ class TestDashboardServiceGetSLACompliance:
         municipality_id = uuid4()
         mock_db = MagicMock()
 
-        # Mock results: total_with_sla=10, response_breaches=1, resolution_breaches=2
-        mock_results = [
-            MagicMock(scalar=MagicMock(return_value=10)),  # total_with_sla
-            MagicMock(scalar=MagicMock(return_value=1)),   # response_breaches
-            MagicMock(scalar=MagicMock(return_value=2)),   # resolution_breaches
+        # Summed: total_with_sla=10, response_breaches=1, resolution_breaches=2
+        mock_rows = [
+            make_stats_row(
+                category="water", response_sla_count=6,
+                response_breach_count=1, resolution_breach_count=1,
+            ),
+            make_stats_row(
+                category="electricity", response_sla_count=4,
+                response_breach_count=0, resolution_breach_count=1,
+            ),
         ]
-        mock_db.execute = AsyncMock(side_effect=mock_results)
+        mock_db.execute = AsyncMock(return_value=make_rows_result(mock_rows))
 
         # Act
         result = await service.get_sla_compliance(municipality_id, mock_db)
 
         # Assert
+        assert mock_db.execute.call_count == 1
         assert result["total_with_sla"] == 10
         assert result["response_breaches"] == 1
         assert result["resolution_breaches"] == 2
@@ -288,13 +333,7 @@ class TestDashboardServiceGetSLACompliance:
         municipality_id = uuid4()
         mock_db = MagicMock()
 
-        # All queries return 0
-        mock_results = [
-            MagicMock(scalar=MagicMock(return_value=0)),
-            MagicMock(scalar=MagicMock(return_value=0)),
-            MagicMock(scalar=MagicMock(return_value=0)),
-        ]
-        mock_db.execute = AsyncMock(side_effect=mock_results)
+        mock_db.execute = AsyncMock(return_value=make_rows_result([make_stats_row()]))
 
         # Act
         result = await service.get_sla_compliance(municipality_id, mock_db)
@@ -400,3 +439,154 @@ class TestDashboardServiceGetTeamWorkload:
         # Assert
         assert len(result) == 1
         assert "SAPS" not in result[0]["team_name"]
+
+
+@pytest.mark.usefixtures("scan_mode")
+class TestDashboardServiceGetDashboardBundle:
+    """Test DashboardService.get_dashboard_bundle method."""
+
+    async def test_bundle_returns_all_panels_in_two_queries(self):
+        """Bundle derives metrics/volume/SLA from one scan plus a workload query."""
+        # Arrange
+        service = DashboardService()
+        municipality_id = uuid4()
+        mock_db = MagicMock()
+
+        team_id = uuid4()
+        stats_rows = [
+            make_stats_row(
+                category="water", open_count=4, resolved_count=6,
+                responded_count=2, response_seconds_sum=7200,
+                resolution_sla_count=10, resolution_breach_count=1,
+                resolution_compliant_count=9, response_sla_count=10,
+                response_breach_count=2,
+            ),
+        ]
+        workload_rows = [
+            MagicMock(team_id=team_id, team_name="Water Team", open_count=4, total_count=10),
+        ]
+        mock_db.execute = AsyncMock(side_effect=[
+            make_rows_result(stats_rows),
+            make_rows_result(workload_rows),
+        ])
+
+        # Act
+        result = await service.get_dashboard_bundle(municipality_id, mock_db)
+
+        # Assert
+        assert mock_db.execute.call_count == 2
+        assert result["metrics"] == {
+            "total_open": 4,
+            "total_resolved": 6,
+            "sla_compliance_percent": 90.0,
+            "avg_response_hours": 1.0,
+            "sla_breaches": 1,
+        }
+        assert result["volume"] == [{"category": "water", "open": 4, "resolved": 6}]
+        assert result["sla"]["total_with_sla"] == 10
+        assert result["sla"]["response_compliance_percent"] == 80.0
+        assert result["sla"]["resolution_compliance_percent"] == 90.0
+        assert result["workload"] == [{
+            "team_id": str(team_id),
+            "team_name": "Water Team",
+            "open_count": 4,
+            "total_count": 10,
+        }]
+
+
+@pytest.mark.usefixtures("rollup_mode")
+class TestDashboardServiceRollup:
+    """Test the ticket_metrics_daily rollup read path."""
+
+    async def test_metrics_combine_rollup_and_live_open_counts(self):
+        """Volumes come from rollup sums; breaches from the open-ticket query."""
+        # Arrange
+        service = DashboardService()
+        municipality_id = uuid4()
+        mock_db = MagicMock()
+
+        rollup_rows = [
+            MagicMock(
+                category="water", open_count=3, resolved_count=5,
+                responded_count=4, response_seconds_sum=28800.0,
+                resolution_sla_count=8, sla_met_count=4, response_sla_count=8,
+            ),
+        ]
+        live_rows = [
+            MagicMock(
+                category="water", resolution_breach_count=1,
+                open_within_sla_count=2, response_breach_count=1,
+            ),
+        ]
+        mock_db.execute = AsyncMock(side_effect=[
+            make_rows_result(rollup_rows),
+            make_rows_result(live_rows),
+        ])
+
+        # Act
+        metrics = await service.get_metrics(municipality_id, mock_db)
+
+        # Assert
+        assert mock_db.execute.call_count == 2
+        rollup_query = str(mock_db.execute.call_args_list[0].args[0])
+        assert "ticket_metrics_daily" in rollup_query
+        assert "is_sensitive" in rollup_query
+        assert metrics == {
+            "total_open": 3,
+            "total_resolved": 5,
+            "sla_compliance_percent": 75.0,  # (4 met + 2 open within) / 8
+            "avg_response_hours": 2.0,
+            "sla_breaches": 1,
+        }
+
+    async def test_live_only_category_is_included(self):
+        """A category with open tickets but no rollup row still appears."""
+        # Arrange
+        service = DashboardService()
+        mock_db = MagicMock()
+        live_rows = [
+            MagicMock(
+                category="roads", resolution_breach_count=2,
+                open_within_sla_count=0, response_breach_count=0,
+            ),
+        ]
+        mock_db.execute = AsyncMock(side_effect=[
+            make_rows_result([]),
+            make_rows_result(live_rows),
+        ])
+
+        # Act
+        sla = await service.get_sla_compliance(uuid4(), mock_db)
+
+        # Assert
+        assert sla["resolution_breaches"] == 2
+
+    async def test_ward_filter_falls_back_to_ticket_scan(self):
+        """Rollup has no ward dimension, so ward-filtered requests scan tickets."""
+        # Arrange
+        service = DashboardService()
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=make_rows_result([]))
+
+        # Act
+        await service.get_metrics(uuid4(), mock_db, ward_id="Ward 5")
+
+        # Assert
+        assert mock_db.execute.call_count == 1
+        query = str(mock_db.execute.call_args.args[0])
+        assert "ticket_metrics_daily" not in query
+
+    async def test_sub_day_date_range_falls_back_to_ticket_scan(self):
+        """Date bounds that are not midnight UTC cannot use day buckets."""
+        # Arrange
+        service = DashboardService()
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=make_rows_result([]))
+        start = datetime(2026, 2, 1, 12, 30, tzinfo=timezone.utc)
+
+        # Act
+        await service.get_metrics(uuid4(), mock_db, start_date=start)
+
+        # Assert
+        assert mock_db.execute.call_count == 1
+        assert "ticket_metrics_daily" not in str(mock_db.execute.call_args.args[0])
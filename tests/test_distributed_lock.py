@@ -0,0 +1,168 @@
+"""Unit tests for advisory lock utilities (src/core/distributed_lock.py).
+
+Tests:
+- Lock keys are deterministic across processes and fit int4 pairs
+- try_advisory_xact_lock passes the two-int key and records contention
+- distributed_lock acquires/skips/releases on PostgreSQL and is a no-op
+  success on other dialects
+"""
+import os
+import subprocess
+import sys
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from src.core.distributed_lock import (
+    advisory_lock_key,
+    distributed_lock,
+    try_advisory_xact_lock,
+)
+from src.core.metrics import metrics
+
+pytestmark = pytest.mark.asyncio
+
+TICKET_ID = UUID("5f0c2b8e-7d1a-4c3e-9b6f-2a8d4e1c7f90")
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def make_pg_engine(lock_result: bool):
+    """Mock AsyncEngine whose connection returns lock_result for try-lock."""
+    result = MagicMock()
+    result.scalar.return_value = lock_result
+
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value=result)
+    conn.commit = AsyncMock()
+    conn.invalidate = AsyncMock()
+
+    connect_ctx = MagicMock()
+    connect_ctx.__aenter__ = AsyncMock(return_value=conn)
+    connect_ctx.__aexit__ = AsyncMock(return_value=False)
+
+    engine = MagicMock()
+    engine.dialect.name = "postgresql"
+    engine.connect.return_value = connect_ctx
+    return engine, conn
+
+
+class TestAdvisoryLockKey:
+    """Test deterministic lock key derivation."""
+
+    async def test_key_is_stable_across_processes(self):
+        """Python's hash() is salted per process; the lock key must not be."""
+        code = (
+            "from uuid import UUID;"
+            "from src.core.distributed_lock import advisory_lock_key;"
+            f"print(advisory_lock_key('ticket_escalation', UUID('{TICKET_ID}')))"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                capture_output=True, text=True, check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+
+        assert outputs == {str(advisory_lock_key("ticket_escalation", TICKET_ID))}
+
+    async def test_key_fits_two_int4(self):
+        for _ in range(100):
+            high, low = advisory_lock_key("ticket_escalation", uuid4())
+            assert -(2 ** 31) <= high < 2 ** 31
+            assert -(2 ** 31) <= low < 2 ** 31
+
+    async def test_namespaces_do_not_collide(self):
+        assert advisory_lock_key("task", "sla_monitor") != advisory_lock_key(
+            "ticket_escalation", "sla_monitor"
+        )
+
+
+class TestTryAdvisoryXactLock:
+    """Test transaction-scoped try-lock."""
+
+    async def test_passes_two_int_key_and_counts_acquired(self):
+        result = MagicMock()
+        result.scalar.return_value = True
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        acquired = await try_advisory_xact_lock(db, "ticket_escalation", TICKET_ID)
+
+        assert acquired is True
+        params = db.execute.call_args[0][1]
+        assert (params["high"], params["low"]) == advisory_lock_key("ticket_escalation", TICKET_ID)
+        assert metrics.get("distributed_lock_acquired_total", lock="ticket_escalation") == 1
+
+    async def test_contention_is_counted(self):
+        result = MagicMock()
+        result.scalar.return_value = False
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+
+        acquired = await try_advisory_xact_lock(db, "ticket_escalation", TICKET_ID)
+
+        assert acquired is False
+        assert metrics.get("distributed_lock_contended_total", lock="ticket_escalation") == 1
+
+
+class TestDistributedLock:
+    """Test the session-scoped singleton lock."""
+
+    async def test_acquires_and_releases(self):
+        engine, conn = make_pg_engine(lock_result=True)
+
+        async with distributed_lock("sla_monitor", engine=engine) as acquired:
+            assert acquired is True
+            assert metrics.get("distributed_lock_held", lock="task") == 1
+
+        statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+        assert "pg_try_advisory_lock" in statements[0]
+        assert "pg_advisory_unlock" in statements[1]
+        assert metrics.get("distributed_lock_held", lock="task") == 0
+
+    async def test_skips_when_held_elsewhere(self):
+        engine, conn = make_pg_engine(lock_result=False)
+
+        async with distributed_lock("sla_monitor", engine=engine) as acquired:
+            assert acquired is False
+
+        assert conn.execute.call_count == 1  # no unlock for a lock we do not hold
+        assert metrics.get("distributed_lock_skipped_runs_total", lock="task") == 1
+        assert metrics.get("distributed_lock_contended_total", lock="task") == 1
+
+    async def test_lock_name_never_becomes_a_metric_label(self):
+        phone = "+27821234567"
+        for lock_result in (True, False):
+            engine, _ = make_pg_engine(lock_result=lock_result)
+            async with distributed_lock(phone, engine=engine, namespace="whatsapp_inbox"):
+                pass
+
+        assert phone not in repr(metrics.snapshot())
+        assert metrics.get("distributed_lock_held", lock="whatsapp_inbox") == 0
+        assert metrics.get("distributed_lock_skipped_runs_total", lock="whatsapp_inbox") == 1
+
+    async def test_releases_on_error(self):
+        engine, conn = make_pg_engine(lock_result=True)
+
+        with pytest.raises(RuntimeError):
+            async with distributed_lock("sla_monitor", engine=engine):
+                raise RuntimeError("task failed")
+
+        assert "pg_advisory_unlock" in str(conn.execute.call_args_list[-1].args[0])
+
+    async def test_non_postgres_always_acquires(self):
+        engine = MagicMock()
+        engine.dialect.name = "sqlite"
+
+        async with distributed_lock("sla_monitor", engine=engine) as acquired:
+            assert acquired is True
+        engine.connect.assert_not_called()
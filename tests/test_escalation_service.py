@@ -3,15 +3,22 @@
 Tests ticket escalation with PostgreSQL advisory locks,
 manager assignment, and escalation history tracking.
 """
+import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import func, select, update
 
+from src.core.config import settings
+from src.core.tenant import clear_tenant_context, set_tenant_context
 from src.models.assignment import TicketAssignment
+from src.models.audit_log import AuditLog, OperationType
+from src.models.audit_outbox import AuditOutbox
 from src.models.team import Team
 from src.models.ticket import Ticket, TicketStatus
+from src.models.ticket_metrics import TicketMetricsDaily
 from src.services.escalation_service import EscalationService
 
 # Module-level marker
@@ -296,32 +303,205 @@ async def test_escalate_ticket_creates_assignment_record():
     assert added_obj.is_current is True
 
 
-async def test_bulk_escalate_counts_correctly():
-    """Test bulk_escalate returns correct count of escalated tickets."""
+async def _seed_breached_tickets(db_session, tenant_id, count, team=None):
+    """Insert open tickets (optionally routed to a team) and return their ids."""
+    set_tenant_context(tenant_id)
+    tickets = [
+        Ticket(
+            tenant_id=tenant_id,
+            category="water",
+            description=f"Burst pipe {i}",
+            user_id=uuid4(),
+            status="open",
+            assigned_team_id=team.id if team else None,
+            sla_resolution_deadline=datetime(2026, 3, 1, tzinfo=timezone.utc),
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(tickets)
+    await db_session.commit()
+    ticket_ids = [ticket.id for ticket in tickets]
+    clear_tenant_context()
+    return ticket_ids
+
+
+async def test_bulk_escalate_counts_correctly(db_session):
+    """Test bulk_escalate escalates open tickets and skips already escalated ones."""
     # Arrange
     service = EscalationService()
+    tenant_id = str(uuid4())
+    ticket_ids = await _seed_breached_tickets(db_session, tenant_id, 3)
+
+    await db_session.execute(
+        update(Ticket.__table__)
+        .where(Ticket.__table__.c.id == ticket_ids[2])
+        .values(status="escalated")
+    )
+    await db_session.commit()
 
     breached_tickets = [
-        {"ticket_id": uuid4(), "breach_type": "response_breach", "overdue_by_hours": 5.2},
-        {"ticket_id": uuid4(), "breach_type": "resolution_breach", "overdue_by_hours": 12.8},
-        {"ticket_id": uuid4(), "breach_type": "response_breach", "overdue_by_hours": 3.1},
+        {"ticket_id": ticket_ids[0], "breach_type": "response_breach", "overdue_by_hours": 5.2},
+        {"ticket_id": ticket_ids[1], "breach_type": "resolution_breach", "overdue_by_hours": 12.8},
+        {"ticket_id": ticket_ids[2], "breach_type": "response_breach", "overdue_by_hours": 3.1},
     ]
 
-    # Mock escalate_ticket to return True for first 2, False for third
-    async def mock_escalate(ticket_id, reason, db):
-        if ticket_id == breached_tickets[2]["ticket_id"]:
-            return False  # Already escalated or lock not acquired
-        return True
+    # Act
+    count = await service.bulk_escalate(breached_tickets, db_session)
 
-    service.escalate_ticket = mock_escalate
+    # Assert
+    assert count == 2
 
-    mock_db = MagicMock()
+
+async def test_bulk_escalate_assigns_managers_in_chunks(db_session):
+    """Test set-based escalation: manager assignment, history, audit and rollup."""
+    # Arrange
+    service = EscalationService()
+    tenant_id = str(uuid4())
+    manager_id = uuid4()
+    set_tenant_context(tenant_id)
+    team = Team(tenant_id=tenant_id, name="Water", category="water", manager_id=manager_id)
+    db_session.add(team)
+    await db_session.commit()
+    ticket_ids = await _seed_breached_tickets(db_session, tenant_id, 5, team=team)
+
+    breached_tickets = [
+        {"ticket_id": ticket_id, "breach_type": "resolution_breach", "overdue_by_hours": 30.0}
+        for ticket_id in ticket_ids
+    ]
+
+    # Act: chunk size 2 -> three transactions
+    count = await service.bulk_escalate(breached_tickets, db_session, chunk_size=2)
+
+    # Assert
+    assert count == 5
+    ticket_rows = (await db_session.execute(
+        select(Ticket.__table__.c.status, Ticket.__table__.c.assigned_to,
+               Ticket.__table__.c.escalation_reason)
+        .where(Ticket.__table__.c.tenant_id == tenant_id)
+    )).all()
+    assert {row.status for row in ticket_rows} == {"escalated"}
+    assert {row.assigned_to for row in ticket_rows} == {manager_id}
+    assert ticket_rows[0].escalation_reason == "resolution_breach (overdue by 30.0h)"
+
+    assignment_rows = (await db_session.execute(
+        select(TicketAssignment.__table__.c.reason, TicketAssignment.__table__.c.assigned_to)
+        .where(TicketAssignment.__table__.c.tenant_id == tenant_id)
+    )).all()
+    assert len(assignment_rows) == 5
+    assert all(row.reason == "escalation" and row.assigned_to == manager_id for row in assignment_rows)
+
+    set_tenant_context(tenant_id)  # audit_logs / rollup reads are tenant-filtered
+    try:
+        audit_count = (await db_session.execute(
+            select(func.count()).select_from(AuditLog).where(
+                AuditLog.tenant_id == tenant_id,
+                AuditLog.table_name == "tickets",
+                AuditLog.operation == OperationType.UPDATE,
+            )
+        )).scalar()
+        assert audit_count == 5
+
+        bucket = (await db_session.execute(
+            select(TicketMetricsDaily).where(TicketMetricsDaily.tenant_id == tenant_id)
+        )).scalar_one()
+        assert bucket.open_count == 5
+        assert bucket.breached_count == 5
+    finally:
+        clear_tenant_context()
+
+
+async def test_bulk_escalate_audits_deactivated_assignments(db_session):
+    """Test each deactivated assignment gets the UPDATE audit row the ORM path wrote."""
+    # Arrange
+    service = EscalationService()
+    tenant_id = str(uuid4())
+    set_tenant_context(tenant_id)
+    team = Team(tenant_id=tenant_id, name="Roads", category="roads", manager_id=uuid4())
+    db_session.add(team)
+    await db_session.commit()
+    ticket_ids = await _seed_breached_tickets(db_session, tenant_id, 2, team=team)
+
+    set_tenant_context(tenant_id)
+    previous = [
+        TicketAssignment(
+            tenant_id=tenant_id, ticket_id=ticket_id, team_id=team.id,
+            assigned_by="system", reason="routing", is_current=True,
+        )
+        for ticket_id in ticket_ids
+    ]
+    db_session.add_all(previous)
+    await db_session.commit()
+    previous_ids = {str(assignment.id) for assignment in previous}
+    clear_tenant_context()
+
+    breached_tickets = [
+        {"ticket_id": ticket_id, "breach_type": "resolution_breach", "overdue_by_hours": 2.0}
+        for ticket_id in ticket_ids
+    ]
 
     # Act
-    count = await service.bulk_escalate(breached_tickets, mock_db)
+    count = await service.bulk_escalate(breached_tickets, db_session)
 
     # Assert
     assert count == 2
+    set_tenant_context(tenant_id)
+    try:
+        audit_rows = (await db_session.execute(
+            select(AuditLog).where(
+                AuditLog.tenant_id == tenant_id,
+                AuditLog.table_name == "ticket_assignments",
+                AuditLog.operation == OperationType.UPDATE,
+            )
+        )).scalars().all()
+        assert {row.record_id for row in audit_rows} == previous_ids
+        assert all(
+            json.loads(row.changes) == {"is_current": {"old": True, "new": False}}
+            for row in audit_rows
+        )
+    finally:
+        clear_tenant_context()
+
+
+async def test_bulk_escalate_writes_audit_outbox_in_outbox_mode(db_session, monkeypatch):
+    """Test bulk escalation follows AUDIT_OUTBOX_ENABLED like the after_flush hook."""
+    # Arrange
+    monkeypatch.setattr(settings, "AUDIT_OUTBOX_ENABLED", True)
+    service = EscalationService()
+    tenant_id = str(uuid4())
+    set_tenant_context(tenant_id)
+    team = Team(tenant_id=tenant_id, name="Power", category="electricity", manager_id=uuid4())
+    db_session.add(team)
+    await db_session.commit()
+    ticket_ids = await _seed_breached_tickets(db_session, tenant_id, 2, team=team)
+    outbox = AuditOutbox.__table__
+    already_queued = {
+        row.id for row in (await db_session.execute(select(outbox.c.id))).all()
+    }
+
+    breached_tickets = [
+        {"ticket_id": ticket_id, "breach_type": "response_breach", "overdue_by_hours": 1.0}
+        for ticket_id in ticket_ids
+    ]
+
+    # Act
+    count = await service.bulk_escalate(breached_tickets, db_session)
+
+    # Assert: one UPDATE (ticket) and one CREATE (assignment) per ticket, each with its id
+    assert count == 2
+    entries = (await db_session.execute(
+        select(outbox).where(outbox.c.tenant_id == tenant_id, outbox.c.id.not_in(already_queued))
+    )).mappings().all()
+    assert sorted((entry["table_name"], entry["operation"]) for entry in entries) == [
+        ("ticket_assignments", "CREATE"),
+        ("ticket_assignments", "CREATE"),
+        ("tickets", "UPDATE"),
+        ("tickets", "UPDATE"),
+    ]
+    assert all(entry["id"] is not None for entry in entries)
+    assert (await db_session.execute(
+        select(func.count()).select_from(AuditLog.__table__)
+        .where(AuditLog.__table__.c.tenant_id == tenant_id)
+    )).scalar() == 0
 
 
 async def test_bulk_escalate_empty_list():
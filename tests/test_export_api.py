@@ -55,26 +55,31 @@ def make_mock_ticket(
     description="Test ticket",
     address="123 Main St",
     language="en",
-    is_sensitive=False,
 ):
-    """Create a mock Ticket object."""
-    ticket = MagicMock(spec=Ticket)
-    ticket.id = uuid4()
-    ticket.tracking_number = tracking_number
-    ticket.category = category
-    ticket.status = status
-    ticket.severity = severity
-    ticket.description = description
-    ticket.address = address
-    ticket.language = language
-    ticket.is_sensitive = is_sensitive
-    ticket.created_at = datetime(2026, 1, 15, 10, 30, 0, tzinfo=timezone.utc)
-    ticket.sla_response_deadline = None
-    ticket.sla_resolution_deadline = None
-    ticket.first_responded_at = None
-    ticket.resolved_at = None
-    ticket.escalated_at = None
-    return ticket
+    """Create an export row (values in EXPORT_COLUMNS order)."""
+    return (
+        tracking_number,
+        category,
+        status,
+        severity,
+        description,
+        address,
+        language,
+        datetime(2026, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
+        None,  # sla_response_deadline
+        None,  # sla_resolution_deadline
+        None,  # first_responded_at
+        None,  # resolved_at
+        None,  # escalated_at
+    )
+
+
+def stream_batches(rows):
+    """side_effect for a patched _stream_export_rows: yield rows as one batch."""
+    async def batches(*args, **kwargs):
+        if rows:
+            yield rows
+    return batches
 
 
 class TestExportCSVRBAC:
@@ -83,7 +88,7 @@ class TestExportCSVRBAC:
     async def test_manager_can_export_csv(self):
         """Test MANAGER role can export CSV."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.MANAGER)
             mock_db = AsyncMock()
 
@@ -91,7 +96,7 @@ class TestExportCSVRBAC:
                 make_mock_ticket(tracking_number="TKT-001"),
                 make_mock_ticket(tracking_number="TKT-002"),
             ]
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -105,12 +110,12 @@ class TestExportCSVRBAC:
     async def test_admin_can_export_csv(self):
         """Test ADMIN role can export CSV."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.ADMIN)
             mock_db = AsyncMock()
 
             mock_tickets = []
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -123,12 +128,12 @@ class TestExportCSVRBAC:
     async def test_ward_councillor_can_export_csv(self):
         """Test WARD_COUNCILLOR role can export CSV."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.WARD_COUNCILLOR)
             mock_db = AsyncMock()
 
             mock_tickets = [make_mock_ticket()]
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -175,12 +180,12 @@ class TestCSVExportOutput:
     async def test_csv_export_contains_expected_headers(self):
         """Test CSV contains all expected column headers."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.MANAGER)
             mock_db = AsyncMock()
 
             mock_tickets = [make_mock_ticket()]
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -191,7 +196,7 @@ class TestCSVExportOutput:
             # Extract CSV content from StreamingResponse
             content = ""
             async for chunk in response.body_iterator:
-                content += chunk
+                content += chunk.decode()
 
             reader = csv.reader(io.StringIO(content))
             headers = next(reader)
@@ -207,7 +212,7 @@ class TestCSVExportOutput:
     async def test_csv_export_data_matches_tickets(self):
         """Test CSV data rows match mock ticket data."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.MANAGER)
             mock_db = AsyncMock()
 
@@ -222,7 +227,7 @@ class TestCSVExportOutput:
                     language="en"
                 )
             ]
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -232,7 +237,7 @@ class TestCSVExportOutput:
             # Extract CSV content
             content = ""
             async for chunk in response.body_iterator:
-                content += chunk
+                content += chunk.decode()
 
             reader = csv.reader(io.StringIO(content))
             next(reader)  # Skip header
@@ -250,12 +255,12 @@ class TestCSVExportOutput:
     async def test_csv_export_filename_has_timestamp(self):
         """Test CSV filename includes timestamp."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.MANAGER)
             mock_db = AsyncMock()
 
             mock_tickets = []
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -274,12 +279,12 @@ class TestExcelExportRBAC:
     async def test_manager_can_export_excel(self):
         """Test MANAGER role can export Excel."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.MANAGER)
             mock_db = AsyncMock()
 
             mock_tickets = []
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_excel
 
@@ -310,26 +315,137 @@ class TestExportSEC05Compliance:
     """Test SEC-05: GBV ticket exclusion from exports."""
 
     async def test_export_query_excludes_sensitive_tickets(self):
-        """Test _fetch_export_tickets filters is_sensitive == False."""
+        """Test ticket_export_query filters is_sensitive == False."""
         # Arrange
         mock_user = make_mock_user(role=UserRole.MANAGER)
-        mock_db = AsyncMock()
 
-        # Mock database result
-        mock_result = MagicMock()
-        mock_scalars = MagicMock()
-        mock_scalars.all.return_value = []
-        mock_result.scalars.return_value = mock_scalars
-        mock_db.execute = AsyncMock(return_value=mock_result)
+        from src.services.export_service import ticket_export_query
+
+        # Act
+        query = ticket_export_query(mock_user.tenant_id, None, None, None, None, "sqlite")
+
+        # Assert
+        assert "tickets.is_sensitive = false" in str(query.whereclause).lower()
+
+
+class TestExportWardFilter:
+    """Test ticket_export_query ward filtering."""
+
+    async def test_ward_filter_uses_stored_ward_id(self):
+        """Test ward_id filters on Ticket.ward_id instead of the address."""
+        # Arrange
+        mock_user = make_mock_user(role=UserRole.MANAGER)
+
+        from src.services.export_service import ticket_export_query
+
+        # Act
+        query = ticket_export_query(mock_user.tenant_id, None, None, "79800005", None, "sqlite")
+
+        # Assert
+        compiled = str(query.compile(compile_kwargs={"literal_binds": True}))
+        assert "tickets.ward_id = '79800005'" in compiled
+        assert "address" not in str(query.whereclause)
+
+    async def test_no_ward_filter_without_ward_id(self):
+        """Test exports are not restricted to a ward when ward_id is None."""
+        # Arrange
+        mock_user = make_mock_user(role=UserRole.MANAGER)
+
+        from src.services.export_service import ticket_export_query
+
+        # Act
+        query = ticket_export_query(mock_user.tenant_id, None, None, None, None, "sqlite")
+
+        # Assert
+        assert "ward_id" not in str(query.whereclause)
+
+
+class TestExportStreaming:
+    """Test rows are read in batches and sent as they arrive."""
+
+    async def test_query_selects_only_export_columns(self):
+        """Test the export reads columns, not full Ticket rows, with no row limit."""
+        # Arrange
+        mock_user = make_mock_user(role=UserRole.MANAGER)
+
+        from src.api.v1.export import EXPORT_COLUMNS
+        from src.services.export_service import ticket_export_query
+
+        # Act
+        query = ticket_export_query(mock_user.tenant_id, None, None, None, None, "sqlite")
+
+        # Assert
+        assert [c.name for c in query.selected_columns] == [attr for _, attr in EXPORT_COLUMNS]
+        assert query._limit_clause is None
+
+    async def test_csv_chunk_per_batch(self):
+        """Test each batch of rows becomes one encoded CSV chunk."""
+        # Arrange
+        from src.api.v1.export import _csv_chunks
+
+        batches = stream_batches([make_mock_ticket(tracking_number="TKT-1")])
+
+        async def two_batches():
+            async for batch in batches():
+                yield batch
+            yield [make_mock_ticket(tracking_number="TKT-2")]
+
+        # Act
+        chunks = [chunk async for chunk in _csv_chunks(two_batches())]
 
-        from src.api.v1.export import _fetch_export_tickets
+        # Assert
+        assert len(chunks) == 2
+        assert all(isinstance(chunk, bytes) for chunk in chunks)
+        assert chunks[0].decode().startswith("Tracking Number,")
+        assert chunks[1].decode().startswith("TKT-2,")
+
+    async def test_csv_header_only_when_no_rows(self):
+        """Test an empty export still sends the header row."""
+        # Arrange
+        from src.api.v1.export import _csv_chunks
 
         # Act
-        await _fetch_export_tickets(mock_db, mock_user, None, None, None, None)
+        chunks = [chunk async for chunk in _csv_chunks(stream_batches([])())]
+
+        # Assert
+        assert len(chunks) == 1
+        assert chunks[0].decode().startswith("Tracking Number,")
+
+    async def test_stream_reads_all_rows_in_batches(self, db_session):
+        """Test _stream_export_rows pages through the tenant's tickets newest first."""
+        # Arrange
+        from src.api.v1.export import _stream_export_rows
+        from src.core.tenant import clear_tenant_context, set_tenant_context
+
+        mock_user = make_mock_user(role=UserRole.MANAGER)
+        set_tenant_context(mock_user.tenant_id)
+        try:
+            db_session.add_all([
+                Ticket(tenant_id=mock_user.tenant_id, category="water", user_id=uuid4(),
+                       description=f"Leak {i}", tracking_number=f"TKT-STREAM-{i}",
+                       created_at=datetime(2026, 1, 1, i, tzinfo=timezone.utc))
+                for i in range(5)
+            ] + [
+                Ticket(tenant_id=mock_user.tenant_id, category="other", user_id=uuid4(),
+                       description="Sensitive", tracking_number="TKT-STREAM-GBV",
+                       is_sensitive=True)
+            ])
+            await db_session.commit()
+
+            # Act
+            batches = [
+                batch async for batch in _stream_export_rows(
+                    db_session, mock_user, None, None, None, None, batch_size=2
+                )
+            ]
+        finally:
+            clear_tenant_context()
 
         # Assert
-        # Verify execute was called (query was built with is_sensitive filter)
-        assert mock_db.execute.called
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [row[0] for batch in batches for row in batch] == [
+            f"TKT-STREAM-{i}" for i in range(4, -1, -1)
+        ]
 
 
 class TestExportFilters:
@@ -338,12 +454,12 @@ class TestExportFilters:
     async def test_export_with_status_filter(self):
         """Test CSV export filters by status parameter."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.MANAGER)
             mock_db = AsyncMock()
 
             mock_tickets = [make_mock_ticket(status="resolved")]
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -363,12 +479,12 @@ class TestExportFilters:
     async def test_export_with_category_filter(self):
         """Test CSV export filters by category parameter."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.MANAGER)
             mock_db = AsyncMock()
 
             mock_tickets = []
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -387,12 +503,12 @@ class TestExportFilters:
     async def test_export_with_search_filter(self):
         """Test CSV export filters by search parameter."""
         # Arrange
-        with patch('src.api.v1.export._fetch_export_tickets') as mock_fetch:
+        with patch('src.api.v1.export._stream_export_rows') as mock_fetch:
             mock_user = make_mock_user(role=UserRole.MANAGER)
             mock_db = AsyncMock()
 
             mock_tickets = []
-            mock_fetch.return_value = mock_tickets
+            mock_fetch.side_effect = stream_batches(mock_tickets)
 
             from src.api.v1.export import export_tickets_csv
 
@@ -0,0 +1,286 @@
+"""Unit tests for background export jobs (Phase 5 exports at scale).
+
+Tests:
+- CSV.gz, XLSX and Parquet writers round-trip a batch of rows
+- run_export_job streams the dataset, uploads the file and completes the job
+- POST /export/jobs RBAC, filter validation, format availability and dispatch
+- GET /export/jobs/{job_id} signs a download URL for the requester only
+"""
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from starlette.datastructures import Headers
+from starlette.requests import Request
+
+from src.core.tenant import clear_tenant_context, set_tenant_context
+from src.models.export_job import ExportDataset, ExportFormat, ExportJob, ExportJobStatus
+from src.models.sdbip import SDBIPActual
+from src.models.ticket import Ticket
+from src.models.user import User, UserRole
+from src.schemas.export import ExportFilters, ExportJobCreate
+from src.services.export_service import (
+    SDBIP_ACTUAL_EXPORT_COLUMNS,
+    TICKET_EXPORT_COLUMNS,
+    _CsvGzWriter,
+    _ParquetWriter,
+    _XlsxWriter,
+    run_export_job,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_request():
+    """Minimal starlette Request for @limiter.limit() decorated endpoints."""
+    return Request(scope={
+        "type": "http",
+        "method": "POST",
+        "path": "/api/v1/export/jobs",
+        "headers": Headers(headers={}).raw,
+        "query_string": b"",
+        "client": ("127.0.0.1", 0),
+    })
+
+
+def make_mock_user(role=UserRole.MANAGER, tenant_id=None):
+    user = MagicMock(spec=User)
+    user.id = uuid4()
+    user.role = role
+    user.tenant_id = str(tenant_id or uuid4())
+    return user
+
+
+TICKET_ROW = (
+    "TKT-1", "water", "open", "high", "Leak", "1 Main Rd", "en",
+    datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc),
+    None, None, None, None, None,
+)
+
+
+class TestWriters:
+    """Each format writes the header (or schema) and the rows."""
+
+    async def test_csv_gz(self, tmp_path):
+        path = tmp_path / "out.csv.gz"
+        writer = _CsvGzWriter(path, Ticket, TICKET_EXPORT_COLUMNS)
+        writer.write([TICKET_ROW])
+        writer.close()
+
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0][0] == "Tracking Number"
+        assert rows[1][:2] == ["TKT-1", "water"]
+        assert rows[1][7] == "2026-01-15 10:30:00"
+
+    async def test_xlsx(self, tmp_path):
+        openpyxl = pytest.importorskip("openpyxl")
+        path = tmp_path / "out.xlsx"
+        writer = _XlsxWriter(path, Ticket, TICKET_EXPORT_COLUMNS)
+        writer.write([TICKET_ROW])
+        writer.close()
+
+        sheet = openpyxl.load_workbook(path, read_only=True).active
+        rows = list(sheet.iter_rows(values_only=True))
+        assert rows[0][0] == "Tracking Number"
+        assert rows[1][0] == "TKT-1"
+
+    async def test_parquet_keeps_column_types(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        path = tmp_path / "out.parquet"
+        writer = _ParquetWriter(path, SDBIPActual, SDBIP_ACTUAL_EXPORT_COLUMNS)
+        writer.write([(
+            uuid4(), "2025/26", "Q1", Decimal("42.5000"), Decimal("85.0000"), "green",
+            "user-1", datetime(2025, 10, 1, tzinfo=timezone.utc), True, None, None,
+            None, False,
+        )])
+        writer.close()
+
+        table = pq.read_table(path)
+        assert table.num_rows == 1
+        assert table.schema.field("actual_value").type == pa.decimal128(12, 4)
+        assert table.schema.field("submitted_at").type == pa.timestamp("us", tz="UTC")
+        assert table.schema.field("is_validated").type == pa.bool_()
+        assert table.column("financial_year").to_pylist() == ["2025/26"]
+
+
+class TestRunExportJob:
+    """run_export_job writes, uploads and completes the job."""
+
+    async def test_tickets_csv_gz_job(self, db_session):
+        tenant_id = str(uuid4())
+        uploaded = {}
+
+        async def fake_upload(bucket, path, content, content_type):
+            uploaded.update(bucket=bucket, path=path, body=content.read(), content_type=content_type)
+            return {"bucket": bucket, "path": path}
+
+        storage = MagicMock()
+        storage.upload_file = AsyncMock(side_effect=fake_upload)
+
+        set_tenant_context(tenant_id)
+        try:
+            db_session.add_all([
+                Ticket(tenant_id=tenant_id, category="water", user_id=uuid4(),
+                       description=f"Leak {i}", tracking_number=f"TKT-JOB-{i}")
+                for i in range(3)
+            ] + [
+                Ticket(tenant_id=tenant_id, category="other", user_id=uuid4(),
+                       description="Sensitive", tracking_number="TKT-JOB-GBV",
+                       is_sensitive=True)
+            ])
+            job = ExportJob(
+                tenant_id=tenant_id,
+                dataset=ExportDataset.TICKETS,
+                file_format=ExportFormat.CSV_GZ,
+                filters=json.dumps({"category": "water"}),
+                requested_by="user-1",
+            )
+            db_session.add(job)
+            await db_session.commit()
+
+            await run_export_job(job, db_session, storage)
+        finally:
+            clear_tenant_context()
+
+        assert job.status == ExportJobStatus.COMPLETED
+        assert job.row_count == 3
+        assert job.completed_at is not None
+        assert uploaded["bucket"] == "exports"
+        assert uploaded["path"].startswith(f"{tenant_id}/{job.id}/tickets_")
+        assert uploaded["path"].endswith(".csv.gz")
+        rows = list(csv.reader(io.StringIO(gzip.decompress(uploaded["body"]).decode())))
+        assert sorted(row[0] for row in rows[1:]) == ["TKT-JOB-0", "TKT-JOB-1", "TKT-JOB-2"]
+
+
+class TestCreateExportJob:
+    """POST /export/jobs."""
+
+    async def test_queues_job_and_dispatches_task(self, db_session):
+        from src.api.v1.export import create_export_job
+
+        user = make_mock_user(role=UserRole.ADMIN)
+        payload = ExportJobCreate(
+            dataset=ExportDataset.AUDIT_LOGS,
+            file_format=ExportFormat.CSV_GZ,
+            filters=ExportFilters(table_name="tickets"),
+        )
+
+        set_tenant_context(user.tenant_id)
+        try:
+            with patch("src.tasks.export_task.run_export.delay") as mock_delay:
+                response = await create_export_job(make_request(), payload, user, db_session)
+
+            job = (await db_session.execute(
+                select(ExportJob).where(ExportJob.id == response.id)
+            )).scalar_one()
+        finally:
+            clear_tenant_context()
+
+        assert response.status == ExportJobStatus.PENDING
+        assert response.download_url is None
+        assert json.loads(job.filters) == {"table_name": "tickets"}
+        assert job.requested_by == str(user.id)
+        mock_delay.assert_called_once_with(str(job.id), user.tenant_id)
+
+    async def test_role_without_dataset_access_gets_403(self, db_session):
+        from src.api.v1.export import create_export_job
+
+        payload = ExportJobCreate(dataset=ExportDataset.AUDIT_LOGS, file_format=ExportFormat.CSV_GZ)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_export_job(make_request(), payload, make_mock_user(UserRole.MANAGER), db_session)
+
+        assert exc_info.value.status_code == 403
+
+    async def test_filter_of_other_dataset_gets_422(self, db_session):
+        from src.api.v1.export import create_export_job
+
+        payload = ExportJobCreate(
+            dataset=ExportDataset.TICKETS,
+            file_format=ExportFormat.CSV_GZ,
+            filters=ExportFilters(financial_year="2025/26"),
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await create_export_job(make_request(), payload, make_mock_user(), db_session)
+
+        assert exc_info.value.status_code == 422
+
+    async def test_unavailable_format_gets_501(self, db_session):
+        from src.api.v1.export import create_export_job
+
+        payload = ExportJobCreate(dataset=ExportDataset.TICKETS, file_format=ExportFormat.PARQUET)
+
+        with patch("src.api.v1.export.format_available", return_value=False):
+            with pytest.raises(HTTPException) as exc_info:
+                await create_export_job(make_request(), payload, make_mock_user(), db_session)
+
+        assert exc_info.value.status_code == 501
+
+
+class TestGetExportJob:
+    """GET /export/jobs/{job_id}."""
+
+    async def _add_job(self, db_session, user, **kwargs):
+        job = ExportJob(
+            tenant_id=user.tenant_id,
+            dataset=ExportDataset.TICKETS,
+            file_format=ExportFormat.XLSX,
+            requested_by=str(user.id),
+            **kwargs,
+        )
+        db_session.add(job)
+        await db_session.commit()
+        return job
+
+    async def test_completed_job_returns_signed_url(self, db_session):
+        from src.api.v1.export import get_export_job
+
+        user = make_mock_user()
+        set_tenant_context(user.tenant_id)
+        try:
+            job = await self._add_job(
+                db_session, user,
+                status=ExportJobStatus.COMPLETED,
+                row_count=10,
+                storage_bucket="exports",
+                storage_path=f"{user.tenant_id}/x/tickets.xlsx",
+            )
+            with patch("src.api.v1.export.StorageService") as mock_storage:
+                mock_storage.return_value.get_signed_url.return_value = "https://signed.example/x"
+                response = await get_export_job(job.id, user, db_session)
+        finally:
+            clear_tenant_context()
+
+        assert response.status == ExportJobStatus.COMPLETED
+        assert response.row_count == 10
+        assert response.download_url == "https://signed.example/x"
+        mock_storage.return_value.get_signed_url.assert_called_once_with(
+            "exports", f"{user.tenant_id}/x/tickets.xlsx", expiry=3600
+        )
+
+    async def test_other_users_job_is_404(self, db_session):
+        from src.api.v1.export import get_export_job
+
+        owner = make_mock_user()
+        other = make_mock_user(tenant_id=owner.tenant_id)
+        set_tenant_context(owner.tenant_id)
+        try:
+            job = await self._add_job(db_session, owner)
+            with pytest.raises(HTTPException) as exc_info:
+                await get_export_job(job.id, other, db_session)
+        finally:
+            clear_tenant_context()
+
+        assert exc_info.value.status_code == 404
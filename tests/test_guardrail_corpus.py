@@ -0,0 +1,63 @@
+"""Regression tests: compiled guardrails reproduce the recorded corpus.
+
+validate_input(), sanitize_output(), sanitize_reply() and
+_validate_crew_output() scan with precompiled pattern sets
+(src/guardrails/compiled.py); tests/guardrail_corpus.py holds the results
+of the previous pattern-by-pattern implementations.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("OPENAI_API_KEY", "fake-key-for-tests")
+
+from src.api.v1.crew_server import _validate_crew_output, sanitize_reply  # noqa: E402
+from src.guardrails.compiled import PatternSet  # noqa: E402
+from src.guardrails.input_filters import validate_input  # noqa: E402
+from src.guardrails.output_filters import sanitize_output  # noqa: E402
+from tests.guardrail_corpus import (  # noqa: E402
+    CREW_OUTPUT_CASES,
+    INPUT_CASES,
+    OUTPUT_CASES,
+    REPLY_CASES,
+)
+
+
+@pytest.mark.parametrize("message, is_safe, flags, sanitized", INPUT_CASES)
+def test_validate_input_corpus(message, is_safe, flags, sanitized):
+    result = validate_input(message)
+
+    assert (result.is_safe, result.flags, result.sanitized_message) == (is_safe, flags, sanitized)
+
+
+@pytest.mark.parametrize("response, sanitized, redactions", OUTPUT_CASES)
+def test_sanitize_output_corpus(response, sanitized, redactions):
+    result = sanitize_output(response)
+
+    assert (result.sanitized_response, result.redactions) == (sanitized, redactions)
+
+
+@pytest.mark.parametrize("raw, agent_name, language, expected", REPLY_CASES)
+def test_sanitize_reply_corpus(raw, agent_name, language, expected):
+    assert sanitize_reply(raw, agent_name, language) == expected
+
+
+@pytest.mark.parametrize("message, agent_name, language, expected", CREW_OUTPUT_CASES)
+def test_validate_crew_output_corpus(message, agent_name, language, expected):
+    assert _validate_crew_output({"message": message}, agent_name, language) == expected
+
+
+class TestPatternSet:
+    def test_earlier_entry_wins_at_same_position(self):
+        patterns = PatternSet([("long", r"\d{4}"), ("short", r"\d{2}")])
+
+        assert patterns.label(patterns.search("call 1234")) == "long"
+        assert patterns.label(patterns.search("call 12")) == "short"
+
+    def test_sub_reports_labels_in_first_match_order(self):
+        patterns = PatternSet([("digits", r"\d+"), ("upper", r"[A-Z]+")])
+
+        text, labels = patterns.sub(lambda label, match: f"<{label}>", "AB 12 CD 34")
+
+        assert text == "<upper> <digits> <upper> <digits>"
+        assert labels == ["upper", "digits"]
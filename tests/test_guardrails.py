@@ -229,6 +229,23 @@ class TestOutputSanitization:
         assert "[PHONE REDACTED]" in result.sanitized_response
         assert "082 555 1234" not in result.sanitized_response
 
+    def test_phone_containing_10111_masked(self):
+        """Phone numbers that contain the digits 10111 are not treated as emergency numbers."""
+        response = "Call 0821011123 or +27821011123 or SAPS on 10111"
+
+        result = sanitize_output(response)
+
+        assert result.sanitized_response == "Call [PHONE REDACTED] or [PHONE REDACTED] or SAPS on 10111"
+
+    def test_email_containing_phone_masked_whole(self):
+        """An email address whose local part is a phone number is masked as one email."""
+        response = "Write to john.0821234567@example.com"
+
+        result = sanitize_output(response)
+
+        assert result.sanitized_response == "Write to [EMAIL REDACTED]"
+        assert result.redactions == ["email_address"]
+
     def test_email_masked(self):
         """Email addresses should be masked."""
         response = "Contact user@example.com for more information"
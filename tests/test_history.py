@@ -0,0 +1,161 @@
+"""Unit tests for the token-budgeted conversation history (src/core/history.py).
+
+Tests cover:
+- Short conversations render exactly as the plain "Role: content" format
+- Verbatim window bounded by turn count and per-agent token budget
+- Older turns rolled into a cached summary on ConversationState
+- GBV conversations get metadata-only summaries
+- Prompt size stays flat as the conversation grows
+"""
+import time
+
+import pytest
+
+from src.core.config import settings
+from src.core.conversation import ConversationState
+from src.core.history import budget_for, build_history, count_tokens, format_turns
+from src.core.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def history_settings(monkeypatch):
+    monkeypatch.setattr(
+        settings, "HISTORY_TOKEN_BUDGETS", {"manager": 300, "municipal": 300, "auth": 60}
+    )
+    monkeypatch.setattr(settings, "HISTORY_VERBATIM_TURNS", 4)
+    monkeypatch.setattr(settings, "HISTORY_SUMMARY_TOKEN_BUDGET", 120)
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def _state(routing_phase: str = "municipal", turns: int = 0, words: int = 5) -> ConversationState:
+    state = ConversationState(
+        user_id="+27821234567",
+        session_id="crew:+27821234567",
+        tenant_id="tenant-1",
+        created_at=time.time(),
+        routing_phase=routing_phase,
+    )
+    for i in range(turns):
+        role = "user" if i % 2 == 0 else "agent"
+        state.turns.append({"role": role, "content": f"turn {i} " + "water " * words, "timestamp": 0})
+    return state
+
+
+def test_empty_history_is_none():
+    assert build_history(_state()) == "(none)"
+
+
+def test_short_conversation_matches_plain_format():
+    state = _state(turns=3)
+    current = {"role": "user", "content": "The leak is getting worse"}
+
+    assert build_history(state, [current]) == format_turns(state.turns + [current])
+    assert state.summarized_turns == 0
+    assert state.history_summary == ""
+
+
+def test_system_turns_never_reach_the_prompt():
+    state = _state(turns=2)
+    state.turns.insert(1, {"role": "system", "content": "lang_pref:zu"})
+
+    assert "lang_pref" not in build_history(state)
+
+
+def test_only_last_verbatim_turns_kept():
+    state = _state(turns=8)
+
+    history = build_history(state)
+
+    assert "User: turn 4 " in history
+    assert "Agent: turn 7 " in history
+    assert "\nUser: turn 3 " not in history.split("Recent turns:")[1]
+    assert state.summarized_turns == 4
+
+
+def test_window_trimmed_to_agent_budget():
+    # Sized from the budget so one turn exceeds it under either token counter
+    # (tiktoken, or the length estimate when the encoding is unavailable)
+    words = 2 * budget_for("auth")
+    state = _state(routing_phase="auth", turns=4, words=words)
+    assert count_tokens(state.turns[-1]["content"]) > budget_for("auth")
+
+    recent = build_history(state).split("Recent turns:\n")[1]
+
+    assert recent.startswith("Agent: turn 3 ")
+    assert count_tokens(recent) > budget_for("auth")  # newest turn always kept whole
+
+
+def test_newest_turn_is_never_summarised():
+    state = _state(routing_phase="auth", turns=2, words=200)
+    current = {"role": "user", "content": "current message " + "water " * 200}
+
+    history = build_history(state, [current])
+
+    assert history.endswith(current["content"])
+    assert state.summarized_turns == 2
+
+
+def test_summary_is_cached_and_extended():
+    state = _state(turns=8)
+    build_history(state)
+    first_summary = state.history_summary
+
+    state.turns.extend(_state(turns=10).turns[8:])
+    build_history(state)
+
+    assert state.summarized_turns == 6
+    assert state.history_summary.startswith(first_summary)
+    assert "turn 5 " in state.history_summary
+    assert "turn 6 " not in state.history_summary
+
+
+def test_summary_capped_oldest_first():
+    state = _state(turns=20, words=30)
+
+    build_history(state)
+
+    assert count_tokens(state.history_summary) <= settings.HISTORY_SUMMARY_TOKEN_BUDGET + 10
+    assert state.history_summary.startswith("- (earlier turns omitted)")
+    assert "turn 15 " in state.history_summary
+
+
+def test_gbv_summary_has_no_content():
+    state = _state(routing_phase="gbv", turns=8)
+
+    history = build_history(state)
+
+    assert state.history_summary == (
+        "- 2 earlier citizen message(s) and 2 earlier assistant reply(ies); content not retained"
+    )
+    assert "turn 0 " not in history
+
+
+def test_content_summary_replaced_once_conversation_is_gbv():
+    state = _state(turns=8)
+    build_history(state)
+    assert "turn 0 " in state.history_summary
+
+    state.routing_phase = "gbv_pending_confirm"
+    build_history(state)
+
+    assert "turn 0 " not in state.history_summary
+    assert "content not retained" in state.history_summary
+
+
+def test_prompt_size_flat_as_conversation_grows():
+    sizes = []
+    state = _state()
+    for i in range(20):
+        state.turns.append({"role": "user" if i % 2 == 0 else "agent", "content": "pothole " * 60})
+        sizes.append(count_tokens(build_history(state)))
+
+    budget = budget_for("municipal") + settings.HISTORY_SUMMARY_TOKEN_BUDGET + 20
+    assert max(sizes[6:]) <= budget
+    [series] = metrics.snapshot()["conversation_history_tokens"]
+    assert series["labels"] == {"agent": "municipal"} and series["count"] == 20
+
+
+def test_unknown_phase_uses_manager_budget():
+    assert budget_for("gbv_pending_confirm") == settings.HISTORY_TOKEN_BUDGETS["manager"]
@@ -0,0 +1,64 @@
+"""Import-path guard: the main API and Celery workers never load the agent stack.
+
+Report submission reaches IntakeFlow through src/agents/facade.py, which
+imports it on first call. These tests import the entry points in a fresh
+interpreter and fail if CrewAI, LiteLLM or the flow modules were loaded.
+See scripts/profile_import_time.py for the timing profile.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+AGENT_STACK = ("crewai", "litellm", "src.agents.flows", "src.agents.crews")
+
+_PROBE = (
+    "import importlib, sys\n"
+    "for name in sys.argv[1:]:\n"
+    "    importlib.import_module(name)\n"
+    "print('\\n'.join(sys.modules))\n"
+)
+
+
+def _loaded_modules(*modules: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, *modules],
+        cwd=ROOT,
+        env=dict(os.environ),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return set(result.stdout.split())
+
+
+def _agent_modules(loaded: set[str]) -> list[str]:
+    return sorted(
+        name for name in loaded
+        if any(name == prefix or name.startswith(prefix + ".") for prefix in AGENT_STACK)
+    )
+
+
+def test_main_api_does_not_import_agent_stack():
+    loaded = _loaded_modules("src.main")
+
+    assert "src.api.v1.reports" in loaded
+    assert _agent_modules(loaded) == []
+
+
+def test_celery_worker_modules_do_not_import_agent_stack():
+    from src.tasks.celery_app import app
+
+    loaded = _loaded_modules("src.tasks.celery_app", *app.conf.include)
+
+    assert _agent_modules(loaded) == []
+
+
+@pytest.mark.parametrize("module", ["src.agents.facade", "src.api.v1.crew_server"])
+def test_agent_entry_points_import_lazily(module):
+    assert _agent_modules(_loaded_modules(module)) == []
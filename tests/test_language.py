@@ -1,10 +1,11 @@
 """Unit tests for language detection module.
 
-Tests trilingual detection (EN/ZU/AF) with confidence thresholds and fallback logic.
+Tests trilingual detection (EN/ZU/AF) with confidence thresholds and fallback logic,
+plus single-pass scoring, the normalized-text memo, lazy model build and batch API.
 No external dependencies - pure unit tests.
 """
 import pytest
-from src.core.language import language_detector
+from src.core.language import LanguageDetector, language_detector
 
 
 def test_detect_english():
@@ -104,3 +105,91 @@ def test_longer_afrikaans_text():
     text = "Die padtoestande in ons area is baie sleg en moet dringend aandag kry"
     result = language_detector.detect(text)
     assert result == "af"
+
+
+class _CountingLingua:
+    """Wraps a lingua detector and counts scoring calls."""
+
+    def __init__(self, lingua):
+        self._lingua = lingua
+        self.calls = 0
+
+    def compute_language_confidence_values(self, text):
+        self.calls += 1
+        return self._lingua.compute_language_confidence_values(text)
+
+    def compute_language_confidence_values_in_parallel(self, texts):
+        self.calls += len(texts)
+        return self._lingua.compute_language_confidence_values_in_parallel(texts)
+
+    def detect_language_of(self, text):
+        raise AssertionError("detection must derive the label from the confidence values")
+
+
+@pytest.fixture
+def counting_detector():
+    detector = LanguageDetector(cache_size=2)
+    detector._lingua = _CountingLingua(language_detector._detector)
+    return detector
+
+
+def test_detector_built_lazily():
+    """Test that constructing the detector does not build the lingua model."""
+    detector = LanguageDetector()
+    assert detector._lingua is None
+
+    detector.preload()
+    assert detector._lingua is not None
+
+
+def test_single_scoring_pass_for_label_and_confidence(counting_detector):
+    """Test that label and confidence come from one confidence computation."""
+    language_code, confidence = counting_detector.detect_with_confidence(
+        "Die padtoestande in ons area is baie sleg"
+    )
+
+    assert language_code == "af"
+    assert confidence >= LanguageDetector.MIN_CONFIDENCE
+    assert counting_detector._lingua.calls == 1
+
+
+def test_memo_shared_by_normalized_variants(counting_detector):
+    """Test that case and whitespace variants hit the memo instead of rescoring."""
+    counting_detector.detect("There is a water pipe burst on Main Street")
+    result = counting_detector.detect("  THERE is a water pipe\nburst on Main   Street ")
+
+    assert result == "en"
+    assert counting_detector._lingua.calls == 1
+
+
+def test_memo_is_bounded_lru(counting_detector):
+    """Test that the least recently used entry is evicted at capacity."""
+    english = "There is a water pipe burst on Main Street"
+    zulu = "Amanzi ami ayaphuma endlini yami"
+    afrikaans = "My water lek by die pyp naby die winkel"
+    for text in (english, zulu, english, afrikaans):
+        counting_detector.detect(text)
+    assert counting_detector._lingua.calls == 3
+
+    counting_detector.detect(english)
+    assert counting_detector._lingua.calls == 3
+    counting_detector.detect(zulu)
+    assert counting_detector._lingua.calls == 4
+
+
+def test_detect_batch_matches_detect(counting_detector):
+    """Test that detect_batch returns detect() results in input order."""
+    texts = [
+        "There is a water pipe burst on Main Street",
+        "ok",
+        "Umgwaqo udonakele kakhulu futhi kudingeka ukulungiswa ngokushesha",
+        "123 456 789 000 111 222",
+        "Die padtoestande in ons area is baie sleg en moet dringend aandag kry",
+        "There is a water pipe burst on Main Street",
+    ]
+
+    batch = counting_detector.detect_batch(texts, fallback="zu")
+
+    assert batch == [language_detector.detect(text, fallback="zu") for text in texts]
+    assert batch == ["en", "zu", "zu", "zu", "af", "en"]
+    assert counting_detector._lingua.calls == 4  # short text skipped, duplicate scored once
@@ -0,0 +1,210 @@
+"""Unit tests for keyset (cursor) pagination (src/core/pagination.py).
+
+Tests:
+- Cursor encode/decode round trip and validation
+- keyset_page walks every row exactly once, including sort-value ties (SQLite)
+- count_total exact/estimate/none (SQLite estimate falls back to exact)
+- list_tickets cursor mode returns next_cursor, skips the count by default
+  and rejects bad cursors
+"""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+
+from src.core.pagination import (
+    count_total,
+    decode_cursor,
+    encode_cursor,
+    keyset_page,
+    resolve_total_mode,
+)
+from src.core.tenant import clear_tenant_context, set_tenant_context
+from src.models.ticket import Ticket
+from src.models.user import User, UserRole
+
+pytestmark = pytest.mark.asyncio
+
+BASE = datetime(2026, 3, 1, 8, 0, tzinfo=timezone.utc)
+
+
+class TestCursorEncoding:
+    """Test opaque cursor encoding."""
+
+    async def test_round_trip_datetime(self):
+        row_id = uuid4()
+        cursor = encode_cursor("created_at", True, BASE, row_id)
+
+        position = decode_cursor(cursor, "created_at", True)
+
+        assert position.value == BASE
+        assert position.id == row_id
+        assert "=" not in cursor
+
+    async def test_cursor_for_other_sort_rejected(self):
+        cursor = encode_cursor("created_at", True, BASE, uuid4())
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "status", True)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "created_at", False)
+
+    async def test_garbage_cursor_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor!!", "created_at", True)
+
+
+async def _seed_tickets(db_session, tenant_id: str, count: int) -> None:
+    # Pairs of tickets share created_at to exercise the id tie-breaker
+    db_session.add_all([
+        Ticket(
+            tenant_id=tenant_id,
+            category="water",
+            description=f"ticket {i}",
+            user_id=uuid4(),
+            created_at=BASE + timedelta(minutes=i // 2),
+        )
+        for i in range(count)
+    ])
+    await db_session.commit()
+
+
+class TestKeysetPage:
+    """Test keyset_page against SQLite."""
+
+    @pytest.mark.parametrize("descending", [True, False])
+    async def test_pages_cover_all_rows_once(self, db_session, descending):
+        tenant_id = str(uuid4())
+        set_tenant_context(tenant_id)
+        try:
+            await _seed_tickets(db_session, tenant_id, 7)
+            query = select(Ticket)
+
+            seen, cursor, pages = [], None, 0
+            while True:
+                rows, cursor = await keyset_page(
+                    db_session, query, Ticket.created_at, Ticket.id,
+                    "created_at", descending, 3, cursor,
+                )
+                seen.extend(rows)
+                pages += 1
+                if cursor is None:
+                    break
+
+            assert pages == 3
+            assert len({row.id for row in seen}) == 7
+            keys = [(row.created_at, row.id.hex) for row in seen]
+            assert keys == sorted(keys, reverse=descending)
+        finally:
+            clear_tenant_context()
+
+    async def test_count_total_estimate_falls_back_to_exact(self, db_session):
+        tenant_id = str(uuid4())
+        set_tenant_context(tenant_id)
+        try:
+            await _seed_tickets(db_session, tenant_id, 4)
+
+            total, is_estimate = await count_total(db_session, select(Ticket), "estimate")
+
+            assert total == 4
+            assert is_estimate is True
+        finally:
+            clear_tenant_context()
+
+
+    async def test_count_total_none_runs_no_query(self):
+        db = MagicMock()
+        db.execute = AsyncMock()
+
+        total, is_estimate = await count_total(db, select(Ticket), "none")
+
+        assert (total, is_estimate) == (None, False)
+        db.execute.assert_not_called()
+
+    async def test_resolve_total_mode_defaults(self):
+        assert resolve_total_mode(None, cursor_mode=True) == "none"
+        assert resolve_total_mode(None, cursor_mode=False) == "exact"
+        assert resolve_total_mode("estimate", cursor_mode=True) == "estimate"
+        with pytest.raises(ValueError):
+            resolve_total_mode("bogus", cursor_mode=False)
+
+
+def _make_manager() -> User:
+    user = MagicMock(spec=User)
+    user.id = uuid4()
+    user.role = UserRole.MANAGER
+    user.tenant_id = str(uuid4())
+    user.ward_id = None
+    return user
+
+
+def _make_request():
+    from starlette.requests import Request
+    return Request(scope={
+        "type": "http", "method": "GET", "path": "/test",
+        "headers": [], "query_string": b"", "client": ("127.0.0.1", 0),
+    })
+
+
+class TestListTicketsCursorMode:
+    """Test list_tickets cursor mode wiring."""
+
+    async def test_cursor_mode_returns_next_cursor(self, db_session):
+        from src.api.v1.tickets import list_tickets
+
+        user = _make_manager()
+        set_tenant_context(user.tenant_id)
+        try:
+            await _seed_tickets(db_session, user.tenant_id, 5)
+
+            first = await list_tickets(
+                request=_make_request(), current_user=user, db=db_session,
+                page_size=3, cursor_mode=True, total_mode="exact",
+            )
+            second = await list_tickets(
+                request=_make_request(), current_user=user, db=db_session,
+                page_size=3, cursor=first.next_cursor,
+            )
+        finally:
+            clear_tenant_context()
+
+        assert len(first.tickets) == 3
+        assert first.next_cursor is not None
+        assert first.total == 5
+        assert len(second.tickets) == 2
+        assert second.next_cursor is None
+        assert not {t.id for t in first.tickets} & {t.id for t in second.tickets}
+
+    async def test_cursor_mode_skips_total_by_default(self, db_session):
+        from src.api.v1.tickets import list_tickets
+
+        user = _make_manager()
+        set_tenant_context(user.tenant_id)
+        try:
+            await _seed_tickets(db_session, user.tenant_id, 4)
+
+            page = await list_tickets(
+                request=_make_request(), current_user=user, db=db_session,
+                page_size=3, cursor_mode=True,
+            )
+        finally:
+            clear_tenant_context()
+
+        assert len(page.tickets) == 3
+        assert page.total is None
+        assert page.page_count is None
+        assert page.next_cursor is not None
+
+    async def test_invalid_cursor_returns_400(self):
+        from src.api.v1.tickets import list_tickets
+
+        with pytest.raises(HTTPException) as exc_info:
+            await list_tickets(
+                request=_make_request(), current_user=_make_manager(), db=AsyncMock(),
+                cursor="garbage",
+            )
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,161 @@
+"""Unit tests for the authenticated principal cache (src/core/principal_cache.py).
+
+Tests:
+- PrincipalCache: TTL expiry, LRU bound, invalidation by user and by token
+- get_current_user: a repeat request with the same token skips the user query
+- Cached users attach to the session as clean persistent rows
+- Committed ORM changes to a user invalidate its cached principals
+"""
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+
+from src.core.principal_cache import (
+    PrincipalCache,
+    attach_cached_user,
+    principal_cache,
+    principal_values,
+    token_digest,
+)
+from src.core.tenant import clear_tenant_context, set_tenant_context
+from src.models.user import User, UserRole
+
+pytestmark = pytest.mark.asyncio
+
+
+class TestPrincipalCache:
+    """Test the TTL/LRU map."""
+
+    async def test_entry_expires_after_ttl(self):
+        cache = PrincipalCache(ttl_seconds=30)
+
+        with patch("src.core.principal_cache.time.monotonic", return_value=100.0):
+            cache.put("user-1", "digest-1", {"role": "manager"})
+            assert cache.get("user-1", "digest-1") == {"role": "manager"}
+
+        with patch("src.core.principal_cache.time.monotonic", return_value=131.0):
+            assert cache.get("user-1", "digest-1") is None
+        assert len(cache) == 0
+
+    async def test_other_token_of_same_user_misses(self):
+        cache = PrincipalCache(ttl_seconds=30)
+        cache.put("user-1", "digest-1", {"role": "manager"})
+
+        assert cache.get("user-1", "digest-2") is None
+
+    async def test_invalidate_by_user_and_by_token(self):
+        cache = PrincipalCache(ttl_seconds=30)
+        cache.put("user-1", "digest-1", {})
+        cache.put("user-1", "digest-2", {})
+        cache.put("user-2", "digest-3", {})
+
+        cache.invalidate(user_ids=["user-1"])
+        assert len(cache) == 1
+
+        cache.invalidate(digests=["digest-3"])
+        assert len(cache) == 0
+
+    async def test_oldest_entry_evicted_beyond_max_entries(self):
+        cache = PrincipalCache(ttl_seconds=30, max_entries=2)
+        cache.put("user-1", "d", {})
+        cache.put("user-2", "d", {})
+        cache.get("user-1", "d")  # user-2 is now least recently used
+        cache.put("user-3", "d", {})
+
+        assert cache.get("user-2", "d") is None
+        assert cache.get("user-1", "d") is not None
+
+    async def test_zero_ttl_disables_cache(self):
+        cache = PrincipalCache(ttl_seconds=0)
+        cache.put("user-1", "digest-1", {})
+
+        assert len(cache) == 0
+
+
+class TestGetCurrentUserCache:
+    """get_current_user reuses the cached principal for the same token."""
+
+    async def test_second_request_skips_user_query(self):
+        from src.api.deps import get_current_user
+
+        tenant_id = str(uuid.uuid4())
+        user = User(
+            id=uuid.uuid4(),
+            email="manager@example.com",
+            hashed_password="supabase_managed",
+            full_name="Manager",
+            tenant_id=tenant_id,
+            municipality_id=uuid.uuid4(),
+            role=UserRole.MANAGER,
+            is_active=True,
+            is_deleted=False,
+        )
+        payload = {
+            "sub": str(user.id),
+            "app_metadata": {"role": "manager", "tenant_id": tenant_id},
+        }
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = user
+        db = MagicMock()
+        db.execute = AsyncMock(return_value=result)
+        request = MagicMock()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="jwt-token")
+
+        try:
+            with patch("src.api.deps.verify_supabase_token", return_value=payload), \
+                 patch("src.services.rbac_service.is_token_blacklisted", AsyncMock(return_value=False)):
+                first = await get_current_user(request, credentials, db)
+                second = await get_current_user(request, credentials, db)
+        finally:
+            clear_tenant_context()
+
+        assert first is user
+        assert db.execute.await_count == 1
+        assert second is not user
+        assert (second.id, second.role, second.tenant_id) == (user.id, UserRole.MANAGER, tenant_id)
+        db.add.assert_called_once_with(second)
+
+
+class TestCachedUserSession:
+    """Cached users behave like loaded rows in the request session."""
+
+    @pytest.fixture
+    def tenant(self, test_municipality):
+        # Set before test_user is created: its refresh is a tenant-filtered query
+        set_tenant_context(str(test_municipality.id))
+        yield
+        clear_tenant_context()
+
+    @pytest.fixture
+    def user(self, tenant, test_user):
+        return test_user
+
+    async def test_attached_user_is_clean_and_updates_on_commit(self, db_session, user):
+        values = principal_values(user)
+        db_session.expunge(user)
+
+        attached = attach_cached_user(values, db_session)
+        assert attached not in db_session.dirty
+        assert attached not in db_session.new
+
+        attached.full_name = "Renamed User"
+        await db_session.commit()
+
+        result = await db_session.execute(
+            select(User.full_name).where(User.id == user.id)
+        )
+        assert result.scalar_one() == "Renamed User"
+
+    async def test_committed_user_change_invalidates_cache(self, db_session, user):
+        user_id = str(user.id)
+        principal_cache.put(user_id, token_digest("jwt-token"), principal_values(user))
+
+        with patch("src.core.principal_cache.publish_invalidation", AsyncMock()) as mock_publish:
+            user.is_active = False
+            await db_session.commit()
+
+        assert principal_cache.get(user_id, token_digest("jwt-token")) is None
+        mock_publish.assert_called_once_with({user_id})
@@ -0,0 +1,117 @@
+"""Unit tests for the process-wide pooled Redis client (src/core/redis_pool.py).
+
+Tests:
+- InstrumentedConnectionPool reports checkout wait, usage and errors
+- init_redis / get_redis / close_redis lifecycle
+- Callers reuse the shared client and never close it
+"""
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+import pytest
+from fakeredis.aioredis import FakeConnection
+from redis.asyncio import Redis
+
+from src.core import redis_pool
+from src.core.metrics import metrics
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.fixture
+def fake_pool():
+    """Instrumented pool of fake connections (max 2, short checkout timeout)."""
+    return redis_pool.InstrumentedConnectionPool(
+        connection_class=FakeConnection,
+        server=fakeredis.FakeServer(),
+        max_connections=2,
+        timeout=0.05,
+        decode_responses=True,
+    )
+
+
+@pytest.fixture
+async def shared_client(fake_pool):
+    """Install a fake-backed client as the process-wide client."""
+    client = Redis(connection_pool=fake_pool)
+    with patch.object(redis_pool, "_client", client):
+        yield client
+    await fake_pool.disconnect()
+
+
+class TestInstrumentedConnectionPool:
+    """Test pool metrics."""
+
+    async def test_commands_record_wait_and_release_connection(self, fake_pool):
+        client = Redis(connection_pool=fake_pool)
+
+        await client.set("key", "value")
+        assert await client.get("key") == "value"
+
+        wait = metrics.snapshot()["redis_pool_wait_seconds"][0]
+        assert wait["count"] == 2
+        assert metrics.get("redis_pool_in_use") == 0
+        assert metrics.get("redis_pool_idle") == 1
+        await fake_pool.disconnect()
+
+    async def test_exhausted_pool_counts_error(self, fake_pool):
+        held = [await fake_pool.get_connection("PING") for _ in range(2)]
+        assert metrics.get("redis_pool_in_use") == 2
+
+        with pytest.raises(Exception):
+            await fake_pool.get_connection("PING")
+
+        errors = metrics.snapshot()["redis_pool_errors_total"]
+        assert sum(series["value"] for series in errors) == 1
+
+        for connection in held:
+            await fake_pool.release(connection)
+        await fake_pool.disconnect()
+
+
+class TestLifecycle:
+    """Test opening and closing the shared client."""
+
+    async def test_get_redis_is_none_until_initialised(self):
+        with patch.object(redis_pool, "_client", None):
+            assert redis_pool.get_redis() is None
+
+    async def test_init_reports_unreachable_redis_but_keeps_client(self):
+        with patch.object(redis_pool, "_client", None), \
+             patch.object(Redis, "ping", AsyncMock(side_effect=ConnectionError("down"))):
+            assert await redis_pool.init_redis("redis://localhost:1/0") is False
+            client = redis_pool.get_redis()
+            assert client is not None
+            assert client.connection_pool.max_connections == 50
+
+            await redis_pool.close_redis()
+            assert redis_pool.get_redis() is None
+
+
+class TestSharedClientCallers:
+    """Callers borrow the shared client instead of opening their own."""
+
+    async def test_conversation_manager_does_not_close_shared_client(self, shared_client):
+        from src.core.conversation import ConversationManager
+
+        manager = ConversationManager("redis://unused", redis_client=shared_client)
+        await manager.close()
+
+        assert await shared_client.ping() is True
+
+    async def test_blacklist_uses_shared_client(self, shared_client):
+        import time
+
+        from src.services.rbac_service import blacklist_user_token, is_token_blacklisted
+
+        await blacklist_user_token("shared.jwt.token", int(time.time()) + 60)
+
+        assert await is_token_blacklisted("shared.jwt.token") is True
+        assert await shared_client.ping() is True
@@ -120,7 +120,7 @@ class TestReportsAPI:
         }
 
         with patch('src.api.v1.reports.guardrails_engine') as mock_guardrails, \
-             patch('src.api.v1.reports.IntakeFlow') as mock_flow_class:
+             patch('src.agents.flows.intake_flow.IntakeFlow') as mock_flow_class:
 
             mock_guardrails.process_input = AsyncMock(return_value=MagicMock(
                 is_safe=True,
@@ -153,7 +153,7 @@ class TestReportsAPI:
         }
 
         with patch('src.api.v1.reports.guardrails_engine') as mock_guardrails, \
-             patch('src.api.v1.reports.IntakeFlow') as mock_flow_class:
+             patch('src.agents.flows.intake_flow.IntakeFlow') as mock_flow_class:
 
             mock_guardrails.process_input = AsyncMock(return_value=MagicMock(
                 is_safe=True,
@@ -188,7 +188,7 @@ class TestReportsAPI:
         }
 
         with patch('src.api.v1.reports.guardrails_engine') as mock_guardrails, \
-             patch('src.api.v1.reports.IntakeFlow') as mock_flow_class, \
+             patch('src.agents.flows.intake_flow.IntakeFlow') as mock_flow_class, \
              patch('src.agents.tools.saps_tool.notify_saps') as mock_saps:
 
             mock_guardrails.process_input = AsyncMock(return_value=MagicMock(
@@ -220,7 +220,7 @@ class TestReportsAPI:
         }
 
         with patch('src.api.v1.reports.guardrails_engine') as mock_guardrails, \
-             patch('src.api.v1.reports.IntakeFlow') as mock_flow_class:
+             patch('src.agents.flows.intake_flow.IntakeFlow') as mock_flow_class:
 
             mock_guardrails.process_input = AsyncMock(return_value=MagicMock(
                 is_safe=True,
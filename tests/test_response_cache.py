@@ -0,0 +1,169 @@
+"""Unit tests for the public API response cache (src/core/response_cache.py).
+
+Tests:
+- Cache keys ignore parameter order and None values
+- Hits are served from Redis without recomputing
+- Concurrent misses compute once (single-flight)
+- Redis failures fail open to direct computation
+- ETag / Cache-Control headers and 304 revalidation on public endpoints
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from fakeredis import aioredis
+from httpx import ASGITransport
+
+from src.core.config import settings
+from src.core.response_cache import ResponseCache, compute_etag, serialize_body
+from src.main import app
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def cache():
+    """ResponseCache backed by an in-memory fake Redis."""
+    return ResponseCache(redis_client=aioredis.FakeRedis(), poll_interval=0.01)
+
+
+@pytest.fixture
+def cache_enabled(monkeypatch):
+    monkeypatch.setattr(settings, "PUBLIC_CACHE_ENABLED", True)
+
+
+class TestResponseCacheKeys:
+    """Test cache key normalisation."""
+
+    async def test_key_ignores_parameter_order_and_none(self, cache):
+        a = cache.build_key("resolution-rates", {"months": 6, "municipality_id": "m1"})
+        b = cache.build_key(
+            "resolution-rates", {"municipality_id": "m1", "months": 6, "extra": None}
+        )
+
+        assert a == b
+        assert a.endswith("resolution-rates?months=6&municipality_id=m1")
+
+    async def test_different_parameters_use_different_keys(self, cache):
+        assert cache.build_key("heatmap", {"municipality_id": "m1"}) != cache.build_key(
+            "heatmap", {"municipality_id": "m2"}
+        )
+
+
+class TestResponseCacheGetOrCompute:
+    """Test hit/miss, single-flight and fail-open behaviour."""
+
+    async def test_second_call_is_served_from_cache(self, cache):
+        compute = AsyncMock(return_value=[{"name": "Cape Town"}])
+
+        first = await cache.get_or_compute("k", 60, compute)
+        second = await cache.get_or_compute("k", 60, compute)
+
+        assert first == second == serialize_body([{"name": "Cape Town"}])
+        compute.assert_awaited_once()
+
+    async def test_concurrent_misses_compute_once(self, cache):
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"total_tickets": 10}
+
+        bodies = await asyncio.gather(
+            *[cache.get_or_compute("k", 60, compute) for _ in range(10)]
+        )
+
+        assert calls == 1
+        assert len(set(bodies)) == 1
+
+    async def test_waits_for_other_worker_holding_lock(self, cache):
+        redis = cache._get_redis()
+        await redis.set("k:lock", "other-worker")
+        compute = AsyncMock(return_value={"fresh": True})
+
+        async def other_worker_fills():
+            await asyncio.sleep(0.03)
+            await redis.set("k", serialize_body({"filled_by": "other"}))
+
+        body, _ = await asyncio.gather(
+            cache.get_or_compute("k", 60, compute), other_worker_fills()
+        )
+
+        assert body == serialize_body({"filled_by": "other"})
+        compute.assert_not_awaited()
+
+    async def test_redis_failure_fails_open(self):
+        broken = MagicMock()
+        broken.get = AsyncMock(side_effect=ConnectionError("redis down"))
+        broken.set = AsyncMock(side_effect=ConnectionError("redis down"))
+        broken.eval = AsyncMock(side_effect=ConnectionError("redis down"))
+        cache = ResponseCache(redis_client=broken)
+        compute = AsyncMock(return_value={"ok": True})
+
+        body = await cache.get_or_compute("k", 60, compute)
+
+        assert body == serialize_body({"ok": True})
+
+    async def test_compute_error_propagates_and_is_not_cached(self, cache):
+        compute = AsyncMock(side_effect=[RuntimeError("db error"), {"ok": True}])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("k", 60, compute)
+        body = await cache.get_or_compute("k", 60, compute)
+
+        assert body == serialize_body({"ok": True})
+
+
+class TestPublicEndpointCaching:
+    """Test HTTP validators and caching on the public endpoints."""
+
+    async def test_response_has_etag_and_cache_control(self):
+        with patch("src.api.v1.public.PublicMetricsService") as mock_service_class:
+            mock_service = MagicMock()
+            mock_service.get_system_summary = AsyncMock(return_value={"total_tickets": 5})
+            mock_service_class.return_value = mock_service
+
+            async with httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.get("/api/v1/public/summary")
+
+        assert response.status_code == 200
+        assert response.json() == {"total_tickets": 5}
+        assert response.headers["etag"] == compute_etag(serialize_body({"total_tickets": 5}))
+        assert "max-age=120" in response.headers["cache-control"]
+
+    async def test_matching_if_none_match_returns_304(self):
+        with patch("src.api.v1.public.PublicMetricsService") as mock_service_class:
+            mock_service = MagicMock()
+            mock_service.get_system_summary = AsyncMock(return_value={"total_tickets": 5})
+            mock_service_class.return_value = mock_service
+
+            async with httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                first = await client.get("/api/v1/public/summary")
+                second = await client.get(
+                    "/api/v1/public/summary",
+                    headers={"If-None-Match": first.headers["etag"]},
+                )
+
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == first.headers["etag"]
+
+    async def test_enabled_cache_serves_repeat_requests_without_service_call(
+        self, cache, cache_enabled
+    ):
+        with patch("src.api.v1.public.public_response_cache", cache), \
+             patch("src.api.v1.public.PublicMetricsService") as mock_service_class:
+            mock_service = MagicMock()
+            mock_service.get_resolution_rates = AsyncMock(return_value=[{"resolution_rate": 80.0}])
+            mock_service_class.return_value = mock_service
+
+            async with httpx.AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                first = await client.get("/api/v1/public/resolution-rates?months=3")
+                second = await client.get("/api/v1/public/resolution-rates?months=3")
+                other = await client.get("/api/v1/public/resolution-rates?months=12")
+
+        assert first.json() == second.json() == other.json()
+        assert mock_service.get_resolution_rates.await_count == 2
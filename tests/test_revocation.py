@@ -0,0 +1,161 @@
+"""Unit tests for the local JWT revocation mirror (src/core/revocation.py).
+
+Tests:
+- contains() fails closed before the first sync and once the mirror is stale
+- Revoked digests expire with their token
+- bootstrap loads every revoked key with its remaining TTL
+- run() applies the revocation stream and records propagation delay
+- publish_revocation writes the key and the stream entry
+- get_current_user answers 503 while the mirror is unavailable
+"""
+import asyncio
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from src.core.metrics import metrics
+from src.core.revocation import (
+    REVOCATION_STREAM,
+    REVOKED_KEY_PREFIX,
+    RevocationMirror,
+    RevocationStateUnavailable,
+    publish_revocation,
+    revocation_mirror,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+@pytest.fixture
+async def fake_redis():
+    client = FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+class TestContains:
+    """Test the hot-path probe."""
+
+    async def test_unsynced_mirror_raises(self):
+        mirror = RevocationMirror(max_staleness=30)
+
+        with pytest.raises(RevocationStateUnavailable):
+            mirror.contains("digest")
+        assert metrics.get("revocation_mirror_unavailable_total") == 1
+
+    async def test_stale_mirror_raises(self):
+        mirror = RevocationMirror(max_staleness=30)
+        with patch("src.core.revocation.time.monotonic", return_value=100.0):
+            mirror.mark_synced()
+
+        with patch("src.core.revocation.time.monotonic", return_value=129.0):
+            assert mirror.contains("digest") is False
+        with patch("src.core.revocation.time.monotonic", return_value=131.0):
+            with pytest.raises(RevocationStateUnavailable):
+                mirror.contains("digest")
+
+    async def test_revocation_expires_with_token(self):
+        mirror = RevocationMirror(max_staleness=30)
+        mirror.mark_synced()
+        mirror.add("digest", time.time() + 60)
+
+        assert mirror.contains("digest") is True
+        with patch("src.core.revocation.time.time", return_value=time.time() + 61):
+            assert mirror.contains("digest") is False
+
+    async def test_already_expired_token_not_added(self):
+        mirror = RevocationMirror(max_staleness=30)
+        mirror.mark_synced()
+        mirror.add("digest", time.time() - 1)
+
+        assert mirror.contains("digest") is False
+
+
+class TestSync:
+    """Test bootstrap and the stream listener against fakeredis."""
+
+    async def test_bootstrap_loads_revoked_keys(self, fake_redis):
+        await fake_redis.set(f"{REVOKED_KEY_PREFIX}aaa", "1", ex=600)
+        await fake_redis.set(f"{REVOKED_KEY_PREFIX}bbb", "1", ex=600)
+        await fake_redis.set("unrelated", "1")
+        mirror = RevocationMirror(max_staleness=30)
+
+        last_id = await mirror.bootstrap(fake_redis)
+
+        assert last_id == "0-0"
+        assert mirror.contains("aaa") is True
+        assert mirror.contains("bbb") is True
+        assert mirror.contains("unrelated") is False
+
+    async def test_bootstrap_resumes_after_latest_stream_entry(self, fake_redis):
+        entry_id = await fake_redis.xadd(
+            REVOCATION_STREAM, {"digest": "aaa", "exp": time.time() + 600, "published_at": time.time()}
+        )
+        mirror = RevocationMirror(max_staleness=30)
+
+        assert await mirror.bootstrap(fake_redis) == entry_id
+
+    async def test_run_applies_stream_and_records_propagation(self, fake_redis):
+        mirror = RevocationMirror(max_staleness=0.5)
+        task = asyncio.create_task(mirror.run(fake_redis))
+        try:
+            await asyncio.sleep(0.05)  # let bootstrap finish
+            await fake_redis.xadd(
+                REVOCATION_STREAM,
+                {"digest": "ccc", "exp": time.time() + 600, "published_at": time.time()},
+            )
+            for _ in range(50):
+                if "ccc" in mirror._revoked:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert mirror.contains("ccc") is True
+        propagation = metrics.snapshot()["revocation_propagation_seconds"][0]
+        assert propagation["count"] == 1
+
+
+class TestPublish:
+    """Test publish_revocation."""
+
+    async def test_writes_key_stream_entry_and_local_mirror(self, fake_redis):
+        exp = int(time.time()) + 600
+
+        await publish_revocation(fake_redis, "ddd", exp)
+
+        assert await fake_redis.get(f"{REVOKED_KEY_PREFIX}ddd") == "1"
+        assert 0 < await fake_redis.ttl(f"{REVOKED_KEY_PREFIX}ddd") <= 600
+        entries = await fake_redis.xrange(REVOCATION_STREAM)
+        assert entries[0][1]["digest"] == "ddd"
+        assert revocation_mirror.contains("ddd") is True
+
+
+class TestGetCurrentUserFailsClosed:
+    """An out-of-sync mirror rejects requests instead of skipping the check."""
+
+    async def test_unsynced_mirror_returns_503(self):
+        from src.api.deps import get_current_user
+
+        revocation_mirror.reset()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="jwt-token")
+        payload = {"sub": "user-1", "app_metadata": {"role": "citizen"}}
+
+        with patch("src.api.deps.verify_supabase_token", return_value=payload):
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user(MagicMock(), credentials, MagicMock())
+
+        assert exc_info.value.status_code == 503
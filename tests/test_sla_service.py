@@ -9,6 +9,7 @@ from uuid import uuid4
 
 import pytest
 
+from src.core.tenant import clear_tenant_context, set_tenant_context
 from src.models.sla_config import SLAConfig
 from src.models.ticket import Ticket, TicketStatus
 from src.services.sla_service import SLAService
@@ -229,208 +230,233 @@ async def test_set_ticket_deadlines_sets_fields():
     mock_db.commit.assert_called_once()
 
 
-async def test_find_breached_tickets_response_breach():
+async def _insert_ticket(db_session, tenant_id, **fields):
+    """Insert a ticket row for SQL-side breach/warning detection tests."""
+    values = {
+        "tenant_id": tenant_id,
+        "category": "water",
+        "description": "Burst pipe",
+        "user_id": uuid4(),
+        "status": "open",
+        "is_sensitive": False,
+    }
+    values.update(fields)
+    set_tenant_context(tenant_id)
+    ticket = Ticket(**values)
+    db_session.add(ticket)
+    await db_session.commit()
+    ticket_id = ticket.id
+    clear_tenant_context()
+    return ticket_id
+
+
+async def test_find_breached_tickets_response_breach(db_session):
     """Test finding tickets with response breach (open past response deadline)."""
     # Arrange
     service = SLAService()
-    now = datetime.now(timezone.utc).replace(tzinfo=None)  # Make naive for mock comparison
-    created_at = now - timedelta(hours=30)
-    response_deadline = now - timedelta(hours=6)  # 6 hours overdue
-
-    ticket = make_mock_ticket(
+    now = datetime.now(timezone.utc)
+    ticket_id = await _insert_ticket(
+        db_session, str(uuid4()),
         status="open",
-        is_sensitive=False,
-        created_at=created_at,
-        sla_response_deadline=response_deadline,
-        sla_resolution_deadline=now + timedelta(hours=100)
+        created_at=now - timedelta(hours=30),
+        sla_response_deadline=now - timedelta(hours=6),  # 6 hours overdue
+        sla_resolution_deadline=now + timedelta(hours=100),
     )
 
-    mock_db = MagicMock()
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [ticket]
-    mock_db.execute = AsyncMock(return_value=mock_result)
-
     # Act
-    breached = await service.find_breached_tickets(mock_db)
+    breached = await service.find_breached_tickets(db_session)
 
     # Assert
     assert len(breached) == 1
-    assert breached[0]["ticket"] == ticket
+    assert breached[0]["ticket_id"] == ticket_id
     assert breached[0]["breach_type"] == "response_breach"
     assert breached[0]["overdue_by_hours"] > 5  # Approximately 6 hours
 
 
-async def test_find_breached_tickets_resolution_breach():
+async def test_find_breached_tickets_resolution_breach(db_session):
     """Test finding tickets with resolution breach (in_progress past resolution deadline)."""
     # Arrange
     service = SLAService()
-    now = datetime.now(timezone.utc).replace(tzinfo=None)  # Make naive for mock comparison
-    created_at = now - timedelta(hours=200)
-    response_deadline = now - timedelta(hours=170)
-    resolution_deadline = now - timedelta(hours=10)  # 10 hours overdue
-
-    ticket = make_mock_ticket(
+    now = datetime.now(timezone.utc)
+    ticket_id = await _insert_ticket(
+        db_session, str(uuid4()),
         status="in_progress",
-        is_sensitive=False,
-        created_at=created_at,
-        sla_response_deadline=response_deadline,
-        sla_resolution_deadline=resolution_deadline
+        created_at=now - timedelta(hours=200),
+        sla_response_deadline=now - timedelta(hours=170),
+        sla_resolution_deadline=now - timedelta(hours=10),  # 10 hours overdue
     )
 
-    mock_db = MagicMock()
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [ticket]
-    mock_db.execute = AsyncMock(return_value=mock_result)
-
     # Act
-    breached = await service.find_breached_tickets(mock_db)
+    breached = await service.find_breached_tickets(db_session)
 
     # Assert
     assert len(breached) == 1
-    assert breached[0]["ticket"] == ticket
+    assert breached[0]["ticket_id"] == ticket_id
     assert breached[0]["breach_type"] == "resolution_breach"
     assert breached[0]["overdue_by_hours"] > 9  # Approximately 10 hours
 
 
-async def test_find_breached_tickets_excludes_gbv():
+async def test_find_breached_tickets_excludes_gbv(db_session):
     """Test find_breached_tickets excludes GBV tickets (is_sensitive=True)."""
     # Arrange
     service = SLAService()
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = datetime.now(timezone.utc)
+    tenant_id = str(uuid4())
 
     # GBV ticket that would be breached
-    gbv_ticket = make_mock_ticket(
+    await _insert_ticket(
+        db_session, tenant_id,
+        category="gbv",
         is_sensitive=True,
-        status="open",
         created_at=now - timedelta(hours=50),
-        sla_response_deadline=now - timedelta(hours=10)
+        sla_response_deadline=now - timedelta(hours=10),
     )
 
     # Municipal ticket that is breached
-    municipal_ticket = make_mock_ticket(
-        is_sensitive=False,
-        status="open",
+    municipal_id = await _insert_ticket(
+        db_session, tenant_id,
         created_at=now - timedelta(hours=30),
-        sla_response_deadline=now - timedelta(hours=5)
+        sla_response_deadline=now - timedelta(hours=5),
     )
 
-    mock_db = MagicMock()
-    mock_result = MagicMock()
-    # Query filters out GBV, only returns municipal
-    mock_result.scalars.return_value.all.return_value = [municipal_ticket]
-    mock_db.execute = AsyncMock(return_value=mock_result)
-
     # Act
-    breached = await service.find_breached_tickets(mock_db)
+    breached = await service.find_breached_tickets(db_session)
 
     # Assert
     assert len(breached) == 1
-    assert breached[0]["ticket"] == municipal_ticket
+    assert breached[0]["ticket_id"] == municipal_id
 
 
-async def test_find_breached_tickets_no_breaches():
+async def test_find_breached_tickets_no_breaches(db_session):
     """Test find_breached_tickets returns empty list when all tickets within SLA."""
     # Arrange
     service = SLAService()
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
-
-    ticket = make_mock_ticket(
-        status="open",
-        is_sensitive=False,
+    now = datetime.now(timezone.utc)
+    tenant_id = str(uuid4())
+    await _insert_ticket(
+        db_session, tenant_id,
         created_at=now - timedelta(hours=10),
         sla_response_deadline=now + timedelta(hours=14),  # Still has time
-        sla_resolution_deadline=now + timedelta(hours=158)
+        sla_resolution_deadline=now + timedelta(hours=158),
+    )
+    # Resolved tickets are never breached, whatever their deadlines
+    await _insert_ticket(
+        db_session, tenant_id,
+        status="resolved",
+        created_at=now - timedelta(hours=300),
+        sla_response_deadline=now - timedelta(hours=276),
+        sla_resolution_deadline=now - timedelta(hours=132),
     )
-
-    mock_db = MagicMock()
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [ticket]
-    mock_db.execute = AsyncMock(return_value=mock_result)
 
     # Act
-    breached = await service.find_breached_tickets(mock_db)
+    breached = await service.find_breached_tickets(db_session)
 
     # Assert
     assert len(breached) == 0
 
 
-async def test_find_warning_tickets():
+async def test_stream_breached_tickets_yields_batches(db_session):
+    """Test breaches are streamed in cursor-sized batches."""
+    # Arrange
+    service = SLAService()
+    now = datetime.now(timezone.utc)
+    tenant_id = str(uuid4())
+    for _ in range(5):
+        await _insert_ticket(
+            db_session, tenant_id,
+            created_at=now - timedelta(hours=30),
+            sla_response_deadline=now - timedelta(hours=6),
+        )
+
+    # Act
+    batches = [batch async for batch in service.stream_breached_tickets(db_session, batch_size=2)]
+
+    # Assert
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+
+
+async def test_find_warning_tickets(db_session):
     """Test finding tickets approaching SLA breach (>= 80% elapsed)."""
     # Arrange
     service = SLAService()
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = datetime.now(timezone.utc)
 
     # Ticket at 85% of response time
     created_at = now - timedelta(hours=20.4)  # 20.4 / 24 = 85%
-    response_deadline = created_at + timedelta(hours=24)
-
-    ticket = make_mock_ticket(
-        status="open",
-        is_sensitive=False,
+    ticket_id = await _insert_ticket(
+        db_session, str(uuid4()),
         created_at=created_at,
-        sla_response_deadline=response_deadline,
-        sla_resolution_deadline=now + timedelta(hours=100)
+        sla_response_deadline=created_at + timedelta(hours=24),
+        sla_resolution_deadline=now + timedelta(hours=100),
     )
 
-    mock_db = MagicMock()
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [ticket]
-
-    # Mock get_sla_config for warning threshold - need two mock results (exact + default lookup)
-    mock_result2 = MagicMock()
-    mock_result2.scalar_one_or_none.return_value = None  # Exact match
-
-    mock_result3 = MagicMock()
-    mock_result3.scalar_one_or_none.return_value = None  # Default fallback
-
-    mock_db.execute = AsyncMock(side_effect=[mock_result, mock_result2, mock_result3])
-
     # Act
-    warnings = await service.find_warning_tickets(mock_db)
+    warnings = await service.find_warning_tickets(db_session)
 
     # Assert
     assert len(warnings) == 1
-    assert warnings[0]["ticket"] == ticket
+    assert warnings[0]["ticket_id"] == ticket_id
     assert warnings[0]["warning_type"] == "response_warning"
     assert warnings[0]["elapsed_pct"] >= 80
 
 
-async def test_find_warning_tickets_below_threshold():
+async def test_find_warning_tickets_below_threshold(db_session):
     """Test find_warning_tickets excludes tickets below threshold."""
     # Arrange
     service = SLAService()
-    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    now = datetime.now(timezone.utc)
 
     # Ticket at 50% of response time (below 80% threshold)
     created_at = now - timedelta(hours=12)
-    response_deadline = created_at + timedelta(hours=24)
-
-    ticket = make_mock_ticket(
-        status="open",
-        is_sensitive=False,
+    await _insert_ticket(
+        db_session, str(uuid4()),
         created_at=created_at,
-        sla_response_deadline=response_deadline,
-        sla_resolution_deadline=now + timedelta(hours=100)
+        sla_response_deadline=created_at + timedelta(hours=24),
+        sla_resolution_deadline=now + timedelta(hours=100),
     )
 
-    mock_db = MagicMock()
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [ticket]
+    # Act
+    warnings = await service.find_warning_tickets(db_session)
 
-    # Mock get_sla_config for warning threshold lookup (exact + default)
-    mock_result2 = MagicMock()
-    mock_result2.scalar_one_or_none.return_value = None
+    # Assert
+    assert len(warnings) == 0
 
-    mock_result3 = MagicMock()
-    mock_result3.scalar_one_or_none.return_value = None
 
-    mock_db.execute = AsyncMock(side_effect=[mock_result, mock_result2, mock_result3])
+async def test_find_warning_tickets_uses_config_threshold_with_fallback(db_session):
+    """Test warning thresholds come from sla_configs (category, then default)."""
+    # Arrange
+    service = SLAService()
+    now = datetime.now(timezone.utc)
+    municipality_id = uuid4()
+    tenant_id = str(municipality_id)
+    db_session.add_all([
+        SLAConfig(municipality_id=municipality_id, category="water", warning_threshold_pct=40),
+        SLAConfig(municipality_id=municipality_id, category=None, warning_threshold_pct=95),
+    ])
+    await db_session.commit()
+
+    # 50% elapsed: warns under the water config (40%)
+    created_at = now - timedelta(hours=12)
+    water_id = await _insert_ticket(
+        db_session, tenant_id,
+        category="water",
+        created_at=created_at,
+        sla_response_deadline=created_at + timedelta(hours=24),
+    )
+    # 85% elapsed: below the municipality default (95%) for roads
+    created_at = now - timedelta(hours=20.4)
+    await _insert_ticket(
+        db_session, tenant_id,
+        category="roads",
+        created_at=created_at,
+        sla_response_deadline=created_at + timedelta(hours=24),
+    )
 
     # Act
-    warnings = await service.find_warning_tickets(mock_db)
+    warnings = await service.find_warning_tickets(db_session)
 
     # Assert
-    assert len(warnings) == 0
+    assert [warning["ticket_id"] for warning in warnings] == [water_id]
 
 
 async def test_sla_cache():
@@ -0,0 +1,239 @@
+"""Unit tests for the ticket metrics rollup (ticket_metrics_daily).
+
+Tests:
+- ticket_contribution: counters contributed by a single ticket state
+- after_flush maintenance: create, status transition and delete keep the
+  rollup equal to the sum of ticket contributions (SQLite)
+- Expired tickets: tracked attributes are reloaded before flush, so the
+  delta lands in the ticket's own bucket
+- TicketMetricsService.rebuild: recomputes the same buckets from tickets
+"""
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from src.core.tenant import clear_tenant_context, set_tenant_context
+from src.models.ticket import Ticket
+from src.models.ticket_metrics import TicketMetricsDaily
+from src.services.ticket_metrics_service import (
+    TicketMetricsService,
+    bucket_key,
+    ticket_contribution,
+)
+
+pytestmark = pytest.mark.asyncio
+
+CREATED = datetime(2026, 3, 1, 8, 0, tzinfo=timezone.utc)
+
+
+def make_state(**overrides) -> dict:
+    """Build a tracked-attribute state dict for an open ticket."""
+    state = {
+        "tenant_id": "tenant-1",
+        "category": "water",
+        "is_sensitive": False,
+        "status": "open",
+        "created_at": CREATED,
+        "first_responded_at": None,
+        "resolved_at": None,
+        "escalated_at": None,
+        "sla_response_deadline": None,
+        "sla_resolution_deadline": None,
+    }
+    state.update(overrides)
+    return state
+
+
+class TestTicketContribution:
+    """Test the pure per-ticket contribution function."""
+
+    async def test_open_ticket_counts_as_open(self):
+        contribution = ticket_contribution(make_state())
+
+        assert contribution == {"ticket_count": 1, "open_count": 1}
+
+    async def test_resolved_within_sla_counts_as_met(self):
+        state = make_state(
+            status="resolved",
+            first_responded_at=CREATED + timedelta(hours=2),
+            resolved_at=(CREATED + timedelta(hours=10)).replace(tzinfo=None),  # naive column
+            sla_response_deadline=CREATED + timedelta(hours=24),
+            sla_resolution_deadline=CREATED + timedelta(hours=48),
+        )
+
+        contribution = ticket_contribution(state)
+
+        assert contribution["resolved_count"] == 1
+        assert contribution["sla_count"] == 1
+        assert contribution["sla_met_count"] == 1
+        assert "breached_count" not in contribution
+        assert contribution["response_sla_count"] == 1
+        assert contribution["response_seconds_sum"] == 7200
+        assert contribution["resolution_seconds_sum"] == 36000
+
+    async def test_resolved_late_counts_as_breached(self):
+        state = make_state(
+            status="closed",
+            resolved_at=CREATED + timedelta(hours=72),
+            sla_resolution_deadline=CREATED + timedelta(hours=48),
+        )
+
+        contribution = ticket_contribution(state)
+
+        assert contribution["breached_count"] == 1
+        assert "sla_met_count" not in contribution
+
+    async def test_escalated_ticket_counts_as_breached(self):
+        state = make_state(
+            status="escalated",
+            escalated_at=CREATED + timedelta(hours=50),
+            sla_resolution_deadline=CREATED + timedelta(hours=48),
+        )
+
+        contribution = ticket_contribution(state)
+
+        assert contribution["open_count"] == 1
+        assert contribution["breached_count"] == 1
+
+    async def test_bucket_key_uses_utc_created_date_and_sensitivity(self):
+        state = make_state(is_sensitive=True)
+
+        assert bucket_key(state) == ("tenant-1", "water", CREATED.date(), True)
+
+
+async def _load_buckets(db_session, tenant_id: str) -> dict:
+    result = await db_session.execute(
+        select(TicketMetricsDaily).where(TicketMetricsDaily.tenant_id == tenant_id)
+    )
+    return {(row.category, row.is_sensitive): row for row in result.scalars().all()}
+
+
+class TestRollupMaintenance:
+    """Test the after_flush hook keeps the rollup in step with tickets."""
+
+    async def test_create_transition_and_delete(self, db_session):
+        tenant_id = str(uuid4())
+        set_tenant_context(tenant_id)
+        try:
+            ticket = Ticket(
+                tenant_id=tenant_id,
+                category="water",
+                description="Burst pipe",
+                user_id=uuid4(),
+                created_at=CREATED,
+                sla_resolution_deadline=CREATED + timedelta(hours=48),
+            )
+            db_session.add(ticket)
+            await db_session.commit()
+
+            buckets = await _load_buckets(db_session, tenant_id)
+            water = buckets[("water", False)]
+            assert water.ticket_count == 1
+            assert water.open_count == 1
+            assert water.resolved_count == 0
+            assert water.sla_count == 1
+
+            # Status transition: open -> resolved within SLA
+            ticket.status = "resolved"
+            ticket.resolved_at = CREATED + timedelta(hours=5)
+            await db_session.commit()
+
+            db_session.expire_all()
+            water = (await _load_buckets(db_session, tenant_id))[("water", False)]
+            assert water.ticket_count == 1
+            assert water.open_count == 0
+            assert water.resolved_count == 1
+            assert water.sla_met_count == 1
+            assert water.resolution_seconds_sum == 5 * 3600
+
+            # Delete removes the contribution entirely
+            await db_session.delete(ticket)
+            await db_session.commit()
+
+            db_session.expire_all()
+            water = (await _load_buckets(db_session, tenant_id))[("water", False)]
+            assert water.ticket_count == 0
+            assert water.resolved_count == 0
+            assert water.sla_met_count == 0
+        finally:
+            clear_tenant_context()
+
+    async def test_expired_ticket_keeps_its_bucket(self, db_session):
+        tenant_id = str(uuid4())
+        set_tenant_context(tenant_id)
+        try:
+            ticket = Ticket(
+                tenant_id=tenant_id, category="water", description="Leak",
+                user_id=uuid4(), created_at=CREATED,
+            )
+            db_session.add(ticket)
+            await db_session.commit()
+
+            # created_at/category unloaded: must not fall into today's or a "None" bucket
+            db_session.expire(ticket, ["created_at", "category", "tenant_id"])
+            ticket.status = "in_progress"
+            await db_session.commit()
+
+            result = await db_session.execute(
+                select(TicketMetricsDaily).where(TicketMetricsDaily.tenant_id == tenant_id)
+            )
+            rows = result.scalars().all()
+            assert [(row.category, row.day) for row in rows] == [("water", CREATED.date())]
+            assert rows[0].ticket_count == 1
+            assert rows[0].open_count == 1
+        finally:
+            clear_tenant_context()
+
+    async def test_sensitive_tickets_use_separate_bucket(self, db_session):
+        tenant_id = str(uuid4())
+        set_tenant_context(tenant_id)
+        try:
+            db_session.add_all([
+                Ticket(
+                    tenant_id=tenant_id, category="gbv", description="report",
+                    user_id=uuid4(), created_at=CREATED, is_sensitive=True,
+                ),
+                Ticket(
+                    tenant_id=tenant_id, category="gbv", description="report",
+                    user_id=uuid4(), created_at=CREATED, is_sensitive=False,
+                ),
+            ])
+            await db_session.commit()
+
+            buckets = await _load_buckets(db_session, tenant_id)
+            assert buckets[("gbv", True)].ticket_count == 1
+            assert buckets[("gbv", False)].ticket_count == 1
+        finally:
+            clear_tenant_context()
+
+    async def test_rebuild_matches_incremental_rollup(self, db_session):
+        tenant_id = str(uuid4())
+        set_tenant_context(tenant_id)
+        try:
+            tickets = [
+                Ticket(
+                    tenant_id=tenant_id, category="roads", description=f"pothole {i}",
+                    user_id=uuid4(), created_at=CREATED,
+                    status="resolved" if i % 2 else "open",
+                    resolved_at=CREATED + timedelta(hours=1) if i % 2 else None,
+                )
+                for i in range(5)
+            ]
+            db_session.add_all(tickets)
+            await db_session.commit()
+
+            incremental = (await _load_buckets(db_session, tenant_id))[("roads", False)]
+            expected = (incremental.ticket_count, incremental.open_count, incremental.resolved_count)
+
+            written = await TicketMetricsService().rebuild(db_session, tenant_id=tenant_id)
+            await db_session.commit()
+
+            db_session.expire_all()
+            rebuilt = (await _load_buckets(db_session, tenant_id))[("roads", False)]
+            assert written == 1
+            assert (rebuilt.ticket_count, rebuilt.open_count, rebuilt.resolved_count) == expected
+            assert expected == (5, 3, 2)
+        finally:
+            clear_tenant_context()
@@ -0,0 +1,162 @@
+"""Unit tests for ticket free-text search (src/services/ticket_search.py).
+
+Tests:
+- Tracking-number detection and normalisation to TKT-...
+- PostgreSQL query shape: tsvector match with both language configs,
+  trigram prefix/fuzzy match, rank expression
+- SQLite fallback: substring match with LIKE wildcards escaped
+- list_tickets applies search and keeps newest-first order on SQLite
+"""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.core.tenant import clear_tenant_context, set_tenant_context
+from src.models.ticket import Ticket
+from src.models.user import User, UserRole
+from src.services.ticket_search import (
+    apply_ticket_search,
+    looks_like_tracking_number,
+    normalize_tracking_number,
+)
+
+pytestmark = pytest.mark.asyncio
+
+BASE = datetime(2026, 3, 1, 8, 0, tzinfo=timezone.utc)
+
+
+def compile_pg(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+class TestTrackingNumberDetection:
+    """Test looks_like_tracking_number."""
+
+    @pytest.mark.parametrize("term", ["TKT-20260301-A1B2C3", "tkt-2026", "TKT", "20260301"])
+    async def test_tracking_numbers(self, term):
+        assert looks_like_tracking_number(term)
+
+    @pytest.mark.parametrize("term", ["water leak", "pothole", "krag onderbreking"])
+    async def test_words(self, term):
+        assert not looks_like_tracking_number(term)
+
+
+    @pytest.mark.parametrize("term, expected", [
+        ("20260301", "TKT-20260301"),
+        ("tkt20260301-a1b2", "TKT-20260301-A1B2"),
+        ("TKT-20260301", "TKT-20260301"),
+        ("TKT", "TKT"),
+    ])
+    async def test_normalize(self, term, expected):
+        assert normalize_tracking_number(term) == expected
+
+
+class TestPostgresQuery:
+    """Test the generated PostgreSQL search SQL."""
+
+    async def test_text_search_uses_both_configs_and_ranks(self):
+        query, rank = apply_ticket_search(select(Ticket), "water leak", "postgresql")
+
+        sql = compile_pg(query)
+        assert "tickets.search_vector @@" in sql
+        assert "websearch_to_tsquery('english'::regconfig" in sql
+        assert "websearch_to_tsquery('afrikaans'::regconfig" in sql
+        assert "ILIKE" not in sql
+        assert "ts_rank_cd" in compile_pg(select(rank))
+
+    async def test_tracking_number_uses_prefix_and_trigram(self):
+        query, rank = apply_ticket_search(select(Ticket), "TKT-202603", "postgresql")
+
+        sql = compile_pg(query)
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert "tickets.tracking_number ILIKE" in sql
+        assert "tickets.tracking_number %%" in sql
+        assert "TKT-202603%" in params.values()
+        assert "similarity" in compile_pg(select(rank))
+
+    async def test_bare_number_gets_tkt_prefix(self):
+        query, _ = apply_ticket_search(select(Ticket), "20260301", "postgresql")
+
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert "TKT-20260301%" in params.values()
+        assert "20260301%" not in params.values()
+
+    async def test_blank_term_is_ignored(self):
+        query, rank = apply_ticket_search(select(Ticket), "   ", "postgresql")
+
+        assert rank is None
+        assert "WHERE" not in compile_pg(query)
+
+
+def _make_manager(tenant_id: str) -> User:
+    user = MagicMock(spec=User)
+    user.id = uuid4()
+    user.role = UserRole.MANAGER
+    user.tenant_id = tenant_id
+    user.ward_id = None
+    return user
+
+
+def _make_request():
+    from starlette.requests import Request
+    return Request(scope={
+        "type": "http", "method": "GET", "path": "/test",
+        "headers": [], "query_string": b"", "client": ("127.0.0.1", 0),
+    })
+
+
+class TestSqliteFallback:
+    """Test search against SQLite."""
+
+    async def test_substring_match_escapes_wildcards(self, db_session):
+        tenant_id = str(uuid4())
+        set_tenant_context(tenant_id)
+        try:
+            db_session.add_all([
+                Ticket(tenant_id=tenant_id, category="water", user_id=uuid4(),
+                       description="Pipe burst, 100% loss of pressure"),
+                Ticket(tenant_id=tenant_id, category="water", user_id=uuid4(),
+                       description="Pipe burst, 100 litres lost"),
+            ])
+            await db_session.commit()
+
+            query, rank = apply_ticket_search(select(Ticket), "100%", "sqlite")
+            result = await db_session.execute(query)
+            tickets = result.scalars().all()
+        finally:
+            clear_tenant_context()
+
+        assert rank is None
+        assert [t.description for t in tickets] == ["Pipe burst, 100% loss of pressure"]
+
+    async def test_list_tickets_search_newest_first(self, db_session):
+        from src.api.v1.tickets import list_tickets
+
+        user = _make_manager(str(uuid4()))
+        set_tenant_context(user.tenant_id)
+        try:
+            db_session.add_all([
+                Ticket(tenant_id=user.tenant_id, category="water", user_id=uuid4(),
+                       description=f"Water leak {i}", created_at=BASE + timedelta(hours=i))
+                for i in range(3)
+            ] + [
+                Ticket(tenant_id=user.tenant_id, category="roads", user_id=uuid4(),
+                       description="Pothole", created_at=BASE)
+            ])
+            await db_session.commit()
+
+            response = await list_tickets(
+                request=_make_request(), current_user=user, db=db_session,
+                search="leak",
+            )
+        finally:
+            clear_tenant_context()
+
+        assert response.total == 3
+        assert [t.description for t in response.tickets] == [
+            "Water leak 2", "Water leak 1", "Water leak 0",
+        ]
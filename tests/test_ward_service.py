@@ -0,0 +1,155 @@
+"""Unit tests for WardService (ward boundaries and ticket ward attribution).
+
+Tests:
+- ward_number_from_label: parsing legacy "Ward N" User.ward_id labels
+- backfill_ticket_wards: SQLite no-op, id-keyset chunking with a commit per
+  chunk, and the only_missing filter (PostGIS path with a mocked session)
+- remap_user_wards: councillor labels rewritten to ward codes (SQLite)
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from src.core.tenant import clear_tenant_context, set_tenant_context
+from src.models.user import User, UserRole
+from src.models.ward import Ward
+from src.services.ward_service import WardService, ward_number_from_label
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_ids_result(ids):
+    """Mock result for a `select(Ticket.id)` chunk query."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = ids
+    return result
+
+
+class TestWardNumberFromLabel:
+    """Test parsing of legacy ward labels."""
+
+    @pytest.mark.parametrize("label,expected", [
+        ("Ward 5", 5),
+        ("ward 05", 5),
+        ("WARD12", 12),
+        ("Ward No. 3", 3),
+        (" 7 ", 7),
+        ("Ward Five", None),
+        ("79800005x", None),
+    ])
+    async def test_parses_ward_number(self, label, expected):
+        assert ward_number_from_label(label) == expected
+
+
+class TestBackfillTicketWards:
+    """Test WardService.backfill_ticket_wards."""
+
+    async def test_noop_without_postgis(self):
+        """SQLite has no boundaries to resolve against: nothing is touched."""
+        mock_db = AsyncMock()
+
+        processed = await WardService().backfill_ticket_wards("tenant-1", mock_db)
+
+        assert processed == 0
+        mock_db.execute.assert_not_called()
+        mock_db.commit.assert_not_called()
+
+    async def test_chunks_by_id_keyset_and_commits_each_chunk(self):
+        """Each chunk is one UPDATE + commit; the next chunk starts after the last id."""
+        ids = sorted(uuid4() for _ in range(3))
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock(side_effect=[
+            make_ids_result(ids[:2]), None,
+            make_ids_result(ids[2:]), None,
+            make_ids_result([]),
+        ])
+
+        with patch("src.services.ward_service.USE_POSTGIS", True):
+            processed = await WardService().backfill_ticket_wards(
+                "tenant-1", mock_db, chunk_size=2
+            )
+
+        assert processed == 3
+        assert mock_db.commit.await_count == 2
+
+        calls = mock_db.execute.call_args_list
+        first_select, first_update, second_select = (c.args[0] for c in calls[:3])
+        assert first_select._limit == 2
+        assert "tickets.id >" not in str(first_select)
+        assert "tickets.id >" in str(second_select)
+        assert ids[1] in second_select.compile().params.values()
+        assert "UPDATE tickets SET ward_id=" in str(first_update)
+
+    async def test_only_missing_filters_unattributed_tickets(self):
+        """Default run only picks tickets with no ward_id yet."""
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock(return_value=make_ids_result([]))
+
+        with patch("src.services.ward_service.USE_POSTGIS", True):
+            await WardService().backfill_ticket_wards("tenant-1", mock_db)
+
+        query = mock_db.execute.call_args.args[0]
+        assert "tickets.ward_id IS NULL" in str(query)
+
+    async def test_reresolve_all_includes_attributed_tickets(self):
+        """only_missing=False re-resolves every located ticket."""
+        mock_db = AsyncMock()
+        mock_db.execute = AsyncMock(return_value=make_ids_result([]))
+
+        with patch("src.services.ward_service.USE_POSTGIS", True):
+            await WardService().backfill_ticket_wards(
+                "tenant-1", mock_db, only_missing=False
+            )
+
+        query = mock_db.execute.call_args.args[0]
+        assert "tickets.ward_id IS NULL" not in str(query)
+        assert "tickets.location IS NOT NULL" in str(query)
+
+
+class TestRemapUserWards:
+    """Test WardService.remap_user_wards against the SQLite test database."""
+
+    async def test_labels_are_rewritten_to_ward_codes(self, db_session, test_municipality):
+        tenant_id = str(test_municipality.id)
+        set_tenant_context(tenant_id)
+        try:
+            db_session.add_all([
+                Ward(tenant_id=tenant_id, ward_code="79800005", ward_number=5, name="Ward 5"),
+                Ward(tenant_id=tenant_id, ward_code="79800012", ward_number=12, name="Ward 12"),
+            ])
+            users = {
+                label: User(
+                    email=f"councillor-{index}@example.com",
+                    hashed_password="supabase_managed",
+                    full_name=f"Councillor {index}",
+                    tenant_id=tenant_id,
+                    municipality_id=test_municipality.id,
+                    role=UserRole.WARD_COUNCILLOR,
+                    is_active=True,
+                    ward_id=label,
+                )
+                for index, label in enumerate(["ward 05", "Ward 12", "79800005", "Ward 40"])
+            }
+            db_session.add_all(users.values())
+            await db_session.commit()
+
+            summary = await WardService().remap_user_wards(tenant_id, db_session)
+            await db_session.commit()
+
+            result = await db_session.execute(
+                select(User.email, User.ward_id).where(User.role == UserRole.WARD_COUNCILLOR)
+            )
+            ward_ids = dict(result.all())
+        finally:
+            clear_tenant_context()
+
+        assert summary["remapped"] == 2
+        assert summary["unmatched"] == [str(users["Ward 40"].id)]
+        assert ward_ids == {
+            users["ward 05"].email: "79800005",
+            users["Ward 12"].email: "79800012",
+            users["79800005"].email: "79800005",
+            users["Ward 40"].email: "Ward 40",
+        }
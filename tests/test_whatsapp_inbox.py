@@ -0,0 +1,179 @@
+"""Unit tests for asynchronous WhatsApp processing using fakeredis.
+
+Tests:
+- WhatsAppInbox: MessageSid dedupe and per-phone FIFO order
+- process_whatsapp_inbox: drains a phone's inbox in order, skips when
+  another worker holds the phone's lock
+- Webhook in async mode: empty TwiML, no inline agent turn, retries dropped
+"""
+import time
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+import pytest
+from fakeredis import aioredis
+
+from src.services.whatsapp_inbox import WhatsAppInbox
+
+PHONE = "+27123456789"
+
+
+def make_inbox(server: fakeredis.FakeServer | None = None) -> WhatsAppInbox:
+    """Create an inbox backed by fake Redis."""
+    inbox = WhatsAppInbox(redis_url="redis://fake", dedupe_ttl=60)
+    inbox._redis = aioredis.FakeRedis(server=server, decode_responses=True)
+    return inbox
+
+
+def make_message(sid: str, body: str) -> dict:
+    return {
+        "message_sid": sid,
+        "user_id": "00000000-0000-0000-0000-000000000001",
+        "tenant_id": "tenant-1",
+        "phone": PHONE,
+        "session_id": f"wa-{PHONE}",
+        "body": body,
+        "media_items": [],
+        "received_at": time.time(),
+    }
+
+
+@pytest.mark.asyncio
+class TestWhatsAppInbox:
+    """Test the Redis inbox."""
+
+    async def test_messages_pop_in_arrival_order(self):
+        inbox = make_inbox()
+
+        for index in range(3):
+            assert await inbox.enqueue(f"SM{index}", PHONE, make_message(f"SM{index}", str(index)))
+
+        assert await inbox.pending(PHONE) == 3
+        bodies = [(await inbox.pop(PHONE))["body"] for _ in range(3)]
+        assert bodies == ["0", "1", "2"]
+        assert await inbox.pop(PHONE) is None
+
+    async def test_duplicate_message_sid_is_dropped(self):
+        inbox = make_inbox()
+
+        assert await inbox.enqueue("SM1", PHONE, make_message("SM1", "hello")) is True
+        assert await inbox.enqueue("SM1", PHONE, make_message("SM1", "hello")) is False
+
+        assert await inbox.pending(PHONE) == 1
+
+    async def test_phones_have_separate_inboxes(self):
+        inbox = make_inbox()
+
+        await inbox.enqueue("SM1", PHONE, make_message("SM1", "a"))
+        await inbox.enqueue("SM2", "+27000000000", make_message("SM2", "b"))
+
+        assert await inbox.pending(PHONE) == 1
+        assert await inbox.pending("+27000000000") == 1
+
+
+class TestProcessWhatsAppInbox:
+    """Test the inbox-draining Celery task (synchronous: it calls asyncio.run)."""
+
+    def _run_task(self, inbox, acquired=True):
+        from contextlib import asynccontextmanager
+
+        from src.tasks import whatsapp_inbox_task
+
+        processed = []
+
+        async def fake_process(service, message):
+            processed.append(message["body"])
+
+        @asynccontextmanager
+        async def fake_lock(name, namespace="task"):
+            assert (name, namespace) == (PHONE, "whatsapp_inbox")
+            yield acquired
+
+        with patch("src.services.whatsapp_inbox.WhatsAppInbox", return_value=inbox), \
+             patch("src.services.whatsapp_service.WhatsAppService"), \
+             patch("src.services.storage_service.StorageService"), \
+             patch("src.core.distributed_lock.distributed_lock", fake_lock), \
+             patch.object(whatsapp_inbox_task, "_process_message", fake_process), \
+             patch.object(whatsapp_inbox_task.process_whatsapp_inbox, "delay") as mock_delay:
+            result = whatsapp_inbox_task.process_whatsapp_inbox(PHONE)
+
+        return result, processed, mock_delay
+
+    def _seeded_inbox(self, bodies: list[str]) -> WhatsAppInbox:
+        """Queue messages with a sync client sharing the inbox's fake server."""
+        import json
+
+        server = fakeredis.FakeServer()
+        seeder = fakeredis.FakeStrictRedis(server=server, decode_responses=True)
+        for index, body in enumerate(bodies):
+            seeder.rpush(
+                f"{WhatsAppInbox.INBOX_PREFIX}{PHONE}",
+                json.dumps(make_message(f"SM{index}", body)),
+            )
+        return make_inbox(server)
+
+    def test_drains_inbox_in_order(self):
+        inbox = self._seeded_inbox(["0", "1", "2"])
+
+        result, processed, mock_delay = self._run_task(inbox)
+
+        assert result == {"processed": 3}
+        assert processed == ["0", "1", "2"]
+        mock_delay.assert_not_called()
+
+    def test_skips_when_phone_locked(self):
+        inbox = self._seeded_inbox(["a"])
+
+        result, processed, mock_delay = self._run_task(inbox, acquired=False)
+
+        assert result == {"processed": 0, "skipped": True}
+        assert processed == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.integration
+class TestAsyncWebhook:
+    """Webhook behaviour with WHATSAPP_ASYNC_PROCESSING enabled."""
+
+    async def test_async_mode_returns_empty_twiml_and_enqueues(self, client, test_user):
+        form_data = {
+            "From": f"whatsapp:{PHONE}",
+            "To": "whatsapp:+14155551234",
+            "Body": "There is a pothole on Main Street",
+            "MessageSid": "SM-async-1",
+            "NumMedia": "0",
+        }
+
+        with patch("src.api.v1.whatsapp.settings.WHATSAPP_ASYNC_PROCESSING", True), \
+             patch("src.api.v1.whatsapp.validate_twilio_request", new_callable=AsyncMock) as mock_validate, \
+             patch("src.api.v1.whatsapp.lookup_user_by_phone", new_callable=AsyncMock) as mock_lookup, \
+             patch("src.api.v1.whatsapp.enqueue_for_worker", new_callable=AsyncMock) as mock_enqueue, \
+             patch("src.api.v1.whatsapp.WhatsAppService") as mock_service_class:
+            mock_validate.return_value = form_data
+            mock_lookup.return_value = test_user
+
+            response = await client.post("/api/v1/whatsapp/webhook", data=form_data)
+
+        assert response.status_code == 200
+        assert "<Message>" not in response.text
+        mock_enqueue.assert_awaited_once()
+        assert mock_enqueue.call_args.args[3] == PHONE
+        mock_service_class.assert_not_called()
+
+    async def test_enqueue_for_worker_dispatches_only_new_messages(self, test_user):
+        from src.api.v1.whatsapp import enqueue_for_worker
+        from src.schemas.whatsapp import WhatsAppWebhookPayload
+
+        inbox = make_inbox()
+        payload = WhatsAppWebhookPayload(
+            From=f"whatsapp:{PHONE}", Body="hello", MessageSid="SM-retry", NumMedia=0
+        )
+
+        with patch("src.api.v1.whatsapp.WhatsAppInbox", return_value=inbox), \
+             patch("src.tasks.whatsapp_inbox_task.process_whatsapp_inbox.delay") as mock_delay:
+            inbox.close = AsyncMock()  # Reused across both calls
+            await enqueue_for_worker(test_user, payload, [], PHONE, f"wa-{PHONE}")
+            await enqueue_for_worker(test_user, payload, [], PHONE, f"wa-{PHONE}")
+
+        mock_delay.assert_called_once_with(PHONE)
+        assert await inbox.pending(PHONE) == 1